@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Convenience script to run the Reporter app benchmarks from project root.
+Arguments are passed through, e.g. `python3 bench.py --update-baseline`.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+def main():
+    """Run the benchmark suite"""
+    bench_runner = Path(__file__).parent / 'scripts' / 'benchmarks' / 'run_benchmarks.py'
+    
+    if not bench_runner.exists():
+        print("❌ Benchmark runner not found!")
+        return 1
+    
+    try:
+        result = subprocess.run([sys.executable, str(bench_runner)] + sys.argv[1:],
+                              cwd=Path(__file__).parent)
+        return result.returncode
+    except KeyboardInterrupt:
+        print("\n⚠️  Benchmark run interrupted by user")
+        return 1
+    except Exception as e:
+        print(f"❌ Error running benchmarks: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
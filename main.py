@@ -6,17 +6,183 @@ Track your work in 25-minute increments and generate daily standup reports.
 
 import sys
 import argparse
+from datetime import date
 from pathlib import Path
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
 
+# Imported first so startup timings are measured from launch
+import startup_trace
+
+def add_entry(text, organization='', issue=''):
+    """Log an entry from the command line, through the running app if there is one"""
+    from instance import forward_entry
+    
+    reply = forward_entry(organization, issue, text)
+    if reply is not None:
+        if not reply.get('ok'):
+            print(f"Error adding entry: {reply.get('error', 'unknown error')}")
+        return bool(reply.get('ok'))
+    
+    # No running instance, append to today's log directly
+    from worklog_io import save_worklog_entry
+    return save_worklog_entry(organization, issue, text)
+
+def worklog_cli(accept=None, dismiss=None):
+    """List entries suggested from new git commits, logging or dismissing the chosen ones"""
+    from git_harvester import GitHarvester, configured_repos, format_suggestion
+    
+    if not configured_repos():
+        print("No git_repos in context.yml, nothing to suggest")
+        return True
+    harvester = GitHarvester()
+    suggestions = harvester.harvest()
+    
+    chosen = accept or dismiss
+    if chosen:
+        picked = suggestions if chosen == ['all'] else []
+        if not picked:
+            try:
+                picked = [suggestions[int(number) - 1] for number in chosen]
+            except (ValueError, IndexError):
+                print(f"Error: choose suggestions by number (1-{len(suggestions)}) or 'all'")
+                return False
+        for suggestion in picked:
+            if accept and not add_entry(suggestion['text'], suggestion['organization'], suggestion['issue']):
+                return False
+            harvester.remove(suggestion['sha'])
+            print(f"{'Logged' if accept else 'Dismissed'}: {format_suggestion(suggestion)}")
+        return True
+    
+    if not suggestions:
+        print("No new commits to log")
+    for number, suggestion in enumerate(suggestions, 1):
+        print(f"{number:3}. {format_suggestion(suggestion)}")
+    return True
+
+def standup_cli(day=None, fmt=None, llm=False):
+    """Print a day's work log as a template standup report, optionally polished by the LLM"""
+    from standup import read_worklog, render_standup
+    from github_items import get_github_data
+    
+    worklog = read_worklog(day)
+    github_data = get_github_data()
+    if llm:
+        from llm import process_worklog_with_llm
+        report = render_standup(worklog, 'markdown', github_data, day and day.isoformat())
+        print(process_worklog_with_llm(report, prerendered=True))
+    else:
+        print(render_standup(worklog, fmt, github_data, day and day.isoformat()))
+    return True
+
+def team_cli(sources=None, day=None, days=1, by='person', fmt=None, llm=False, export=None):
+    """Print a standup merged from several people's work logs, or export yours for a lead"""
+    from datetime import timedelta
+    from team import merge_worklogs, render_team_standup, parse_source, configured_team, export_bundle
+    
+    end = day or date.today()
+    start = end - timedelta(days=max(days, 1) - 1)
+    if export:
+        added = export_bundle(export, start, end)
+        print(f"Exported {added} day(s) to {export}")
+        return True
+    team = [parse_source(source) for source in sources] if sources else configured_team()
+    if not team:
+        print("No team in context.yml, use --team PATH [PATH ...] (PATH or NAME=PATH, folders or .zip bundles)")
+        return False
+    
+    from github_items import get_github_data
+    title = end.isoformat() if start == end else f"{start.isoformat()} – {end.isoformat()}"
+    if llm:
+        from llm import process_worklog_with_llm
+        report = render_team_standup(merge_worklogs(team, start, end), by, 'markdown', get_github_data(), title)
+        print(process_worklog_with_llm(report, prerendered=True))
+    else:
+        print(render_team_standup(merge_worklogs(team, start, end), by, fmt, get_github_data(), title))
+    return True
+
+def sync_cli(target=None, serve_peer=False, host=None):
+    """Sync work logs with a shared folder or another device, or serve them to other devices"""
+    from sync import SyncEngine, configured_peer, make_peer, serve
+    
+    if serve_peer:
+        return serve(host=host)
+    peer = make_peer(target) if target else configured_peer()
+    if peer is None:
+        print("No sync folder or peer in context.yml, use --peer PATH or --peer HOST:PORT")
+        return False
+    try:
+        result = SyncEngine().sync(peer)
+    except (OSError, RuntimeError) as e:
+        print(f"Error syncing with {peer.key}: {e}")
+        return False
+    finally:
+        peer.close()
+    print(f"Synced {len(result['changed'])} day(s) with {peer.key}: "
+          f"{result['sent']} bytes sent, {result['received']} bytes received")
+    for name in result['changed']:
+        print(f"  {name}")
+    return True
+
 def main():
     parser = argparse.ArgumentParser(description='Reporter - Work tracking and standup report generator')
-    parser.add_argument('--cli', choices=['github', 'worklog'], 
-                       help='Run in CLI mode (github: collect GitHub data, worklog: manage work logs)')
+    parser.add_argument('--cli', choices=['github', 'worklog', 'standup', 'team', 'sync'], 
+                       help='Run in CLI mode (github: collect GitHub data, worklog: manage work logs, '
+                            'standup: print a standup report, team: merge several work logs into one standup, '
+                            'sync: sync work logs between devices)')
+    parser.add_argument('--accept', nargs='+', metavar='N',
+                       help="With --cli worklog: log these suggestions (numbers or 'all')")
+    parser.add_argument('--dismiss', nargs='+', metavar='N',
+                       help="With --cli worklog: drop these suggestions (numbers or 'all')")
+    parser.add_argument('--date', type=date.fromisoformat, metavar='YYYY-MM-DD',
+                       help='With --cli standup/team: report on this day instead of today')
+    parser.add_argument('--format', dest='standup_format', metavar='NAME',
+                       help='With --cli standup/team: markdown, google_chat or a format from context.yml')
+    parser.add_argument('--llm', action='store_true',
+                       help='With --cli standup/team: have the local LLM rewrite the report')
+    parser.add_argument('--team', nargs='+', metavar='SOURCE',
+                       help='With --cli team: work log folders or .zip bundles, optionally as NAME=PATH')
+    parser.add_argument('--days', type=int, default=1,
+                       help='With --cli team: number of days up to --date (e.g. 10 for a sprint)')
+    parser.add_argument('--by', choices=['person', 'organization'], default='person',
+                       help='With --cli team: group the report by person or by organization')
+    parser.add_argument('--export', metavar='FILE',
+                       help='With --cli team: zip your work logs for those days for a team lead instead')
+    parser.add_argument('--peer', metavar='TARGET',
+                       help='With --cli sync: shared folder or HOST:PORT to sync with instead of context.yml')
+    parser.add_argument('--serve', action='store_true',
+                       help='With --cli sync: serve this computer\'s work logs to other devices')
+    parser.add_argument('--host', metavar='ADDRESS',
+                       help='With --cli sync --serve: address to listen on (default 127.0.0.1; '
+                            'others need sync.secret in context.yml)')
+    parser.add_argument('--trace-startup', action='store_true',
+                       help='Print import and startup stage timings to stderr')
+    parser.add_argument('--add', metavar='TEXT',
+                       help='Add a work log entry (through the running app if there is one) and exit')
+    parser.add_argument('--org', default='', help='Organization for --add')
+    parser.add_argument('--issue', default='', help='Issue/PR for --add')
+    parser.add_argument('--quick', action='store_true',
+                       help='Open the quick entry popup (in the running app if there is one)')
+    parser.add_argument('--watch-stalls', nargs='?', const=100, type=int, metavar='MS',
+                       help='Log every UI freeze longer than MS milliseconds (default 100) with its stack')
+    parser.add_argument('--trace-summary', action='store_true',
+                       help='Print per-operation p50/p95 timings recorded with REPORTER_TRACE=1 and exit')
     
     args = parser.parse_args()
+    if args.trace_startup:
+        startup_trace.enable()
+    
+    if args.trace_summary:
+        from profiling import print_summary
+        print_summary()
+        sys.exit(0)
+    
+    if args.add is not None:
+        if not args.add.strip():
+            print("Error: --add needs a work description")
+            sys.exit(1)
+        sys.exit(0 if add_entry(args.add.strip(), args.org, args.issue) else 1)
     
     if args.cli == 'github':
         # Run GitHub data collection
@@ -27,15 +193,31 @@ def main():
             print(f"Error importing GitHub data module: {e}")
             sys.exit(1)
     elif args.cli == 'worklog':
-        # Future: worklog CLI functionality
-        print("Worklog CLI functionality coming soon!")
+        sys.exit(0 if worklog_cli(args.accept, args.dismiss) else 1)
+    elif args.cli == 'team':
+        sys.exit(0 if team_cli(args.team, args.date, args.days, args.by, args.standup_format, args.llm,
+                               args.export) else 1)
+    elif args.cli == 'sync':
+        sys.exit(0 if sync_cli(args.peer, args.serve, args.host) else 1)
+    elif args.cli == 'standup':
+        sys.exit(0 if standup_cli(args.date, args.standup_format, args.llm) else 1)
     else:
         # Default: Launch PyQt GUI
+        # Single instance: bring the running app to the front instead of starting another
+        from instance import send_request, socket_path
+        if send_request({'cmd': 'quick' if args.quick else 'show'}) is not None:
+            sys.exit(0)
+        
         try:
-            from PyQt5.QtWidgets import QApplication
-            from ui.dashboard import Dashboard
+            with startup_trace.stage('import PyQt5'):
+                from PyQt5.QtWidgets import QApplication
+            with startup_trace.stage('import dashboard'):
+                from ui.dashboard import Dashboard
+                from ui.capture_server import CaptureServer
+                from ui.quick_entry import QuickEntryPopup, create_tray
             
-            app = QApplication(sys.argv)
+            with startup_trace.stage('create QApplication'):
+                app = QApplication(sys.argv)
             app.setApplicationName('Reporter')
             app.setApplicationDisplayName('Reporter - Work Tracker')
             
@@ -43,11 +225,38 @@ def main():
             if hasattr(app, 'AA_MacDontSwapCtrlAndMeta'):
                 app.setAttribute(app.AA_MacDontSwapCtrlAndMeta, True)
             
-            dashboard = Dashboard()
-            dashboard.show()
+            # Only the entry field is built up front, the rest loads once it's shown,
+            # from the last session's snapshot where the source files haven't changed
+            dashboard = Dashboard(staged=True, warm_start=True)
+            dashboard.startup_finished.connect(startup_trace.report)
+            
+            # Preloaded quick entry popup, opened from the tray icon or `main.py --quick`
+            popup = QuickEntryPopup(dashboard)
+            tray = create_tray(dashboard, popup)
+            if tray is not None:
+                # Closing the dashboard keeps the app in the tray for quick entries
+                app.setQuitOnLastWindowClosed(False)
+            app.aboutToQuit.connect(dashboard.save_warm_snapshot)
+            
+            if args.quick:
+                popup.open_popup()
+            else:
+                with startup_trace.stage('show window'):
+                    dashboard.show()
+                
+                # Ensure the input field gets focus when app starts
+                dashboard.entry_field.setFocus()
+            
+            # Later launches (e.g. `main.py --add` from a hotkey) hand their entries to this one
+            server = CaptureServer(dashboard.add_entry, dashboard.bring_to_front, popup.open_popup, dashboard)
+            server.listen(socket_path())
+            app.aboutToQuit.connect(server.close)
             
-            # Ensure the input field gets focus when app starts
-            dashboard.entry_field.setFocus()
+            if args.watch_stalls:
+                from ui.stall_watchdog import StallWatchdog
+                watchdog = StallWatchdog(args.watch_stalls, parent=app)
+                app.aboutToQuit.connect(watchdog.report)
+                watchdog.start()
             
             sys.exit(app.exec_())
             
@@ -21,6 +21,7 @@ a = Analysis(
         'PyQt5.QtCore',
         'PyQt5.QtGui', 
         'PyQt5.QtWidgets',
+        'PyQt5.QtNetwork',
         'PyQt5.sip',
         # YAML support
         'yaml',
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generators for the Reporter benchmarks
+Builds large `gh status` output, multi-year work log directories and GitHub
+caches so timings reflect a heavy user rather than the sample files.
+Every generator is seeded so repeated runs measure the same data.
+"""
+
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+REPOS = [
+    'Achoobert/time_assist', 'CruGlobal/appbuilder_platform_pwa', 'CruGlobal/appbuilder_docs',
+    'digi-serve/ab_platform_web', 'digi-serve/ab_service_appbuilder', 'example-org/infrastructure',
+]
+WORDS = [
+    'fix', 'add', 'update', 'remove', 'refactor', 'login', 'report', 'expense', 'theme', 'build',
+    'tests', 'workflow', 'dashboard', 'sync', 'cache', 'docs', 'mobile', 'offline', 'export', 'bug',
+    'เพิ่ม', 'แก้ไข', '报告', '修复',
+]
+ORGANIZATIONS = ['Work', 'Personal', 'CruGlobal', 'digi-serve', 'Other']
+
+# Width of the left column in `gh status` tables
+COLUMN_WIDTH = 45
+
+def title(rng, words=5):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+def gh_cell(rng, number):
+    return f"{rng.choice(REPOS)}#{number}  {title(rng)}"
+
+def generate_gh_status(issues=1000, prs=1000, reviews=500, seed=1):
+    """`gh status` output with the given number of issues, PRs and reviews"""
+    rng = random.Random(seed)
+    numbers = iter(range(1, issues + prs + reviews + 1))
+    lines = [f"{'Assigned Issues':<{COLUMN_WIDTH}}│ Assigned Pull Requests"]
+    for row in range(max(issues, prs)):
+        left = gh_cell(rng, next(numbers)) if row < issues else ''
+        right = gh_cell(rng, next(numbers)) if row < prs else ''
+        lines.append(f"{left:<{COLUMN_WIDTH}}│ {right}")
+    if not issues and not prs:
+        lines.append(f"{'Nothing here ^_^':<{COLUMN_WIDTH}}│ Nothing here ^_^")
+    lines.append(f"{'':<{COLUMN_WIDTH}}│")
+    lines.append(f"{'Review Requests':<{COLUMN_WIDTH}}│ Mentions")
+    for _ in range(reviews):
+        lines.append(f"{gh_cell(rng, next(numbers)):<{COLUMN_WIDTH}}│ {gh_cell(rng, 0)}")
+    lines.append(f"{'':<{COLUMN_WIDTH}}│")
+    lines.append("Repository Activity")
+    lines.append(gh_cell(rng, 0))
+    return '\n'.join(lines)
+
+def generate_github_data(items=20000, seed=1):
+    """github_data.yml contents with items spread over issues, PRs and reviews"""
+    rng = random.Random(seed)
+    data = {'account name': 'benchmark', 'my_issues': {}, 'my_prs': {}, 'my_reviews': {}}
+    sections = ['my_issues', 'my_prs', 'my_reviews']
+    kinds = {'my_issues': 'issues', 'my_prs': 'pull', 'my_reviews': 'pull'}
+    for number in range(1, items + 1):
+        section = sections[number % 3]
+        repo = rng.choice(REPOS)
+        data[section][str(number)] = f"{title(rng)} [https://github.com/{repo}/{kinds[section]}/{number}]"
+    return data
+
+def generate_github_cache(path, items=20000, seed=1):
+    """Write a large github_data.yml plus its JSON sidecar, returns the data"""
+    from yaml_io import write_cache
+
+    data = generate_github_data(items, seed)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    write_cache(data, path)
+    return data
+
+def worklog_line(rng, day, minutes):
+    organization = rng.choice(ORGANIZATIONS)
+    issue = f"[{rng.randint(1, 999)}# {title(rng, 3)}]" if rng.random() < 0.7 else ''
+    return f"{day.isoformat()} {minutes // 60:02d}:{minutes % 60:02d} [{organization}] {issue} - {title(rng, 10)}\n"
+
+def generate_worklog_dir(data_dir, years=3, entries_per_day=12, end=None, seed=1):
+    """Write a work log file for every weekday over the given years, ending today
+
+    Returns the number of files written.
+    """
+    rng = random.Random(seed)
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    end = end or date.today()
+    day = end - timedelta(days=365 * years)
+    written = 0
+    while day <= end:
+        if day.weekday() < 5 or day == end:
+            start = 8 * 60
+            lines = [worklog_line(rng, day, start + i * 40) for i in range(entries_per_day)]
+            (data_dir / f'worklog_{day.isoformat()}.txt').write_text(''.join(lines), encoding='utf-8')
+            written += 1
+        day += timedelta(days=1)
+    return written
+
+def generate_worklog_text(entries=500, seed=1):
+    """One long day of work log entries, as sent to the LLM"""
+    rng = random.Random(seed)
+    today = date.today()
+    return ''.join(worklog_line(rng, today, (i * 3) % (24 * 60)) for i in range(entries))
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for Reporter app
+Times the hot paths against large synthetic data, writes the results as JSON
+and compares them with a stored baseline. Exits non-zero if any benchmark got
+slower than the baseline by more than the regression threshold.
+
+Baseline times are scaled by a calibration loop timed on both machines, so a
+baseline recorded elsewhere still applies, and differences within the noise
+of either run are not reported.
+
+Everything runs in a temporary home directory, so the real ~/.reporter and
+context.yml are never touched.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import random
+import statistics
+import threading
+from datetime import datetime
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generators import (
+    generate_gh_status, generate_github_cache, generate_worklog_dir, generate_worklog_text, ORGANIZATIONS
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+BASELINE_FILE = Path(__file__).parent / 'baseline.json'
+RESULTS_FILE = PROJECT_ROOT / 'bench_results.json'
+
+# A benchmark regresses when its median is this much slower than the baseline (0.5 = 50%)...
+DEFAULT_THRESHOLD = 0.5
+# ...and at least this many milliseconds slower, so timer noise on tiny benchmarks is ignored
+DEFAULT_MIN_DELTA_MS = 1.0
+# ...and slower by more than this many median absolute deviations of either run
+NOISE_MADS = 3.0
+
+DEFAULT_REPEAT = 15
+
+BENCHMARKS = []
+
+def benchmark(name, repeat=DEFAULT_REPEAT):
+    """Register a benchmark; the decorated function does the setup and returns the callable to time"""
+    def register(setup):
+        BENCHMARKS.append((name, setup, repeat))
+        return setup
+    return register
+
+class BenchEnv:
+    """Temporary home directory with generated data and a context.yml"""
+
+    def __init__(self):
+        self.home = Path(tempfile.mkdtemp(prefix='reporter-bench-'))
+        self.data_dir = self.home / '.reporter'
+        self.context_file = self.home / 'context.yml'
+        self.llm_url = None
+        self.llm_server = None
+
+    def write_context(self):
+        projects = ''.join(f"  {name}:\n    description: benchmark project\n" for name in ORGANIZATIONS[:3])
+        self.context_file.write_text(
+            "ui:\n  language: en\n"
+            f"projects:\n{projects}"
+            "local_llm:\n  enabled: true\n"
+            f"  api: {self.llm_url}\n  model: benchmark\n  chunk_size: 4000\n",
+            encoding='utf-8'
+        )
+
+    def cleanup(self):
+        shutil.rmtree(self.home, ignore_errors=True)
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    """Answers Ollama generate requests immediately"""
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        body = json.dumps({'model': request.get('model'), 'response': 'Yesterday: benchmarks.', 'done': True})
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode('utf-8'))
+
+    def log_message(self, format, *args):
+        pass
+
+def start_mock_llm():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockLLMHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# Benchmarks
+
+@benchmark('parse_gh_status_table')
+def bench_parse_gh_status(env):
+    from github_data import parse_gh_status_table
+    output = generate_gh_status(issues=1500, prs=1500, reviews=1000)
+    return lambda: parse_gh_status_table(output)
+
+@benchmark('get_github_data')
+def bench_get_github_data(env):
+    from github_items import get_github_data
+    generate_github_cache(env.data_dir / 'github_data.yml', items=20000)
+    return get_github_data
+
+@benchmark('save_worklog_entry x100')
+def bench_save_worklog_entry(env):
+    from worklog_io import save_worklog_entry
+
+    def save():
+        for i in range(100):
+            save_worklog_entry('Work', f'#{i}', 'benchmark entry with a reasonably long description')
+    return save
+
+@benchmark('get_today_worklog')
+def bench_get_today_worklog(env):
+    from ui.dashboard import get_today_worklog
+    return get_today_worklog
+
+@benchmark('tr x10000')
+def bench_tr(env):
+    from localization import tr, TRANSLATIONS
+    keys = list(TRANSLATIONS['en'])
+
+    def translate():
+        for i in range(10000):
+            tr(keys[i % len(keys)])
+    return translate
+
+@benchmark('process_worklog_with_llm')
+def bench_process_worklog_with_llm(env):
+    from llm import process_worklog_with_llm
+    worklog = generate_worklog_text(entries=2000)
+    return lambda: process_worklog_with_llm(worklog)
+
+@benchmark('render_standup')
+def bench_render_standup(env):
+    from standup import render_standup
+    from github_items import get_github_data
+    worklog = generate_worklog_text(entries=2000)
+    github_data = get_github_data()
+    return lambda: render_standup(worklog, 'markdown', github_data)
+
+@benchmark('team merge 20x sprint')
+def bench_team_merge(env):
+    from datetime import date, timedelta
+    from team import merge_worklogs
+    end = date.today()
+    sources = []
+    for person in range(20):
+        path = env.home / 'team' / f'person{person:02}'
+        generate_worklog_dir(path, years=14 / 365, entries_per_day=20, end=end, seed=person)
+        sources.append((f'person{person:02}', path))
+    return lambda: sum(1 for _ in merge_worklogs(sources, end - timedelta(days=13), end))
+
+@benchmark('dashboard construction', repeat=9)
+def bench_dashboard(env):
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtCore import QThread
+    except ImportError:
+        return None
+    from unittest.mock import patch
+    from ui.dashboard import Dashboard
+
+    app = QApplication.instance() or QApplication([])
+
+    def construct():
+        # Compaction and commit harvesting start once built and would overlap the next run
+        with patch.object(Dashboard, 'compact_worklogs', lambda self: None), \
+             patch.object(Dashboard, 'harvest_commits', lambda self: None):
+            dashboard = Dashboard()
+        for worker in dashboard.findChildren(QThread):
+            worker.wait()
+        dashboard.deleteLater()
+        app.processEvents()
+    return construct
+
+# Running and comparing
+
+def time_callable(func, repeat):
+    # One untimed call so imports and first-use caches don't count
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    median = statistics.median(times)
+    return {
+        'median_ms': round(median, 3),
+        'mad_ms': round(statistics.median(abs(t - median) for t in times), 3),
+        'min_ms': round(min(times), 3),
+        'max_ms': round(max(times), 3),
+        'repeat': repeat,
+    }
+
+def calibration_workload():
+    """Fixed pure-Python work whose time stands for the speed of the machine"""
+    rng = random.Random(0)
+    values = sorted(rng.random() for _ in range(20000))
+    total = sum(i * i % 7 for i in range(100000))
+    return total + ' '.join(f'{value:.6f}' for value in values[:5000]).count('.')
+
+def calibrate(repeat=31):
+    """Fastest ms of the calibration workload on this machine, the run least disturbed by other load"""
+    return time_callable(calibration_workload, repeat)['min_ms']
+
+def prepare_env():
+    """Point the app at a temporary home with generated data"""
+    env = BenchEnv()
+    os.environ['HOME'] = str(env.home)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    env.llm_server = start_mock_llm()
+    env.llm_url = f"http://127.0.0.1:{env.llm_server.server_address[1]}/api/generate"
+    env.write_context()
+    files = generate_worklog_dir(env.data_dir, years=3)
+    print(f"Generated {files} work log files in {env.data_dir}")
+
+    import config_service
+    import localization
+    config_service._service = config_service.ConfigService([env.context_file])
+    localization.invalidate_language_cache()
+    return env
+
+def run_benchmarks(only=None, repeat=None):
+    """Run the registered benchmarks, returns ({name: timings}, calibration ms)
+
+    The machine is calibrated before every benchmark and the median is kept,
+    so a burst of load or a clock change during the run doesn't skew it.
+    """
+    env = prepare_env()
+    results = {}
+    calibrations = []
+    try:
+        for name, setup, default_repeat in BENCHMARKS:
+            if only and not any(pattern in name for pattern in only):
+                continue
+            func = setup(env)
+            if func is None:
+                print(f"⚠️  {name}: skipped (dependency not available)")
+                continue
+            calibrations.append(calibrate())
+            results[name] = time_callable(func, repeat or default_repeat)
+            print(f"⏱️  {name:<28} {results[name]['median_ms']:>10.3f} ms  "
+                  f"(±{results[name]['mad_ms']:.3f}, min {results[name]['min_ms']:.3f}, max {results[name]['max_ms']:.3f})")
+    finally:
+        env.llm_server.shutdown()
+        env.cleanup()
+    return results, round(statistics.median(calibrations), 3) if calibrations else None
+
+def compare_results(results, baseline, threshold=None, min_delta_ms=DEFAULT_MIN_DELTA_MS, calibration_ms=None):
+    """Compare results with a baseline, returns [(name, status, current_ms, baseline_ms)]
+
+    status is 'ok', 'regression', 'improved' or 'new'. A per-benchmark 'threshold'
+    in the baseline file overrides the file's default; an explicit threshold overrides both.
+    baseline_ms is scaled to this machine when both runs have a calibration time.
+    """
+    default_threshold = baseline.get('threshold', DEFAULT_THRESHOLD)
+    saved = baseline.get('benchmarks', {})
+    scale = calibration_ms / baseline['calibration_ms'] if calibration_ms and baseline.get('calibration_ms') else 1.0
+    comparison = []
+    for name, timings in results.items():
+        current = timings['median_ms']
+        if name not in saved:
+            comparison.append((name, 'new', current, None))
+            continue
+        base = round(saved[name]['median_ms'] * scale, 3)
+        limit = threshold if threshold is not None else saved[name].get('threshold', default_threshold)
+        noise = NOISE_MADS * max(timings.get('mad_ms', 0), saved[name].get('mad_ms', 0) * scale)
+        margin = max(min_delta_ms, noise)
+        if current > base * (1 + limit) and current - base > margin:
+            status = 'regression'
+        elif current < base / (1 + limit) and base - current > margin:
+            status = 'improved'
+        else:
+            status = 'ok'
+        comparison.append((name, status, current, base))
+    return comparison
+
+def load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        print(f"Error reading {path}: {e}")
+        return default
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def main():
+    parser = argparse.ArgumentParser(description='Reporter performance benchmarks')
+    parser.add_argument('--output', default=str(RESULTS_FILE), help='Where to write the results JSON')
+    parser.add_argument('--baseline', default=str(BASELINE_FILE), help='Baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, help='Allowed slowdown as a fraction, e.g. 0.5 for 50%%')
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help='Ignore slowdowns smaller than this many milliseconds')
+    parser.add_argument('--repeat', type=int, help='Timed runs per benchmark')
+    parser.add_argument('--only', action='append', help='Only run benchmarks whose name contains this')
+    parser.add_argument('--update-baseline', action='store_true', help='Save these results as the new baseline')
+    args = parser.parse_args()
+
+    if args.update_baseline and args.only:
+        print("Error: --update-baseline records every benchmark in one run, it can't be combined with --only")
+        return False
+
+    print("🚀 REPORTER APP - BENCHMARKS")
+    print("=" * 80)
+    results, calibration_ms = run_benchmarks(args.only, args.repeat)
+    print(f"⏱️  {'calibration':<28} {calibration_ms or 0:>10.3f} ms")
+    write_json(args.output, {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'calibration_ms': calibration_ms,
+        'benchmarks': results,
+    })
+    print(f"\nResults written to {args.output}")
+
+    baseline = load_json(args.baseline, {})
+    if args.update_baseline:
+        saved = baseline.get('benchmarks', {})
+        benchmarks = {}
+        for name, timings in results.items():
+            entry = {'median_ms': timings['median_ms'], 'mad_ms': timings['mad_ms']}
+            # Keep hand-tuned per-benchmark thresholds
+            if 'threshold' in saved.get(name, {}):
+                entry['threshold'] = saved[name]['threshold']
+            benchmarks[name] = entry
+        write_json(args.baseline, {
+            'threshold': baseline.get('threshold', DEFAULT_THRESHOLD),
+            'calibration_ms': calibration_ms,
+            'benchmarks': benchmarks,
+        })
+        print(f"Baseline updated: {args.baseline}")
+        return True
+
+    if not baseline:
+        print("⚠️  No baseline to compare against, run with --update-baseline to create one")
+        return True
+
+    print(f"\n{'='*80}")
+    print("📊 COMPARISON WITH BASELINE")
+    print(f"{'='*80}")
+    if calibration_ms and baseline.get('calibration_ms'):
+        print(f"Baseline scaled by {calibration_ms / baseline['calibration_ms']:.2f} for the speed of this machine")
+    icons = {'ok': '✅', 'regression': '❌', 'improved': '🚀', 'new': '🆕'}
+    comparison = compare_results(results, baseline, args.threshold, args.min_delta_ms, calibration_ms)
+    for name, status, current, base in comparison:
+        change = f"{(current / base - 1) * 100:+.1f}%" if base else ''
+        base_text = f"{base:.3f} ms" if base is not None else '-'
+        print(f"{icons[status]} {name:<28} {current:>10.3f} ms  baseline {base_text:>12}  {change}")
+
+    regressions = [name for name, status, _, _ in comparison if status == 'regression']
+    if regressions:
+        print(f"\n💥 {len(regressions)} BENCHMARK(S) REGRESSED: {', '.join(regressions)}")
+        return False
+    print("\n🎉 No performance regressions")
+    return True
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
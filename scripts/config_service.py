@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Centralized access to context.yml for Reporter app
+The file is located once, parsed once and cached by mtime/size; lookups
+only stat the file. Listeners are told when its contents change so the
+dashboard can apply edits without a restart.
+"""
+
+import os
+from pathlib import Path
+from yaml_io import load_yaml
+from profiling import span
+
+# Where context.yml is looked for, in order
+CONTEXT_CANDIDATES = [
+    Path(__file__).parent.parent / 'context.yml',  # Project directory
+    Path.cwd() / 'context.yml',  # Current working directory
+]
+
+# Expected type of each known setting; nested dicts describe sections.
+# Unknown keys are kept as-is so new settings don't need a schema change first.
+SCHEMA = {
+    'projects': dict,
+    'git_repos': list,
+    'local_llm': {
+        'enabled': bool,
+        'prompt': str,
+        'chunk_size': int,
+        'model': str,
+        'api': str,
+        'start_command': str,
+        'input': str,
+        'embed_model': str,
+        'embed_api': str,
+    },
+    'standup': {
+        'format': str,
+        'templates': dict,
+    },
+    'team': dict,
+    'sync': {
+        'folder': str,
+        'peer': str,
+        'port': int,
+        'secret': str,
+    },
+    'ui': {
+        'language': str,
+        'available_languages': dict,
+    },
+}
+
+def validate_config(data, schema=SCHEMA, prefix=''):
+    """Return (config, errors) with values of the wrong type dropped so defaults apply"""
+    if not isinstance(data, dict):
+        return {}, [f"{prefix or 'context.yml'}: expected a mapping, got {type(data).__name__}"]
+    config = {}
+    errors = []
+    for key, value in data.items():
+        expected = schema.get(key)
+        name = f"{prefix}{key}"
+        if isinstance(expected, dict):
+            if value is None:
+                continue
+            config[key], section_errors = validate_config(value, expected, f"{name}.")
+            errors.extend(section_errors)
+        elif expected is not None and value is not None and not isinstance(value, expected):
+            errors.append(f"{name}: expected {expected.__name__}, got {type(value).__name__}")
+        else:
+            config[key] = value
+    return config, errors
+
+class ConfigService:
+    """Cached, validated view of context.yml with change notifications"""
+
+    def __init__(self, candidates=None):
+        self.candidates = [Path(p) for p in (candidates or CONTEXT_CANDIDATES)]
+        self._path = None
+        self._stamp = None
+        self._config = {}
+        self._loaded = False
+        self._listeners = []
+
+    @property
+    def path(self):
+        """Resolved context.yml path, or None if there isn't one"""
+        if self._path is None:
+            self._path = next((p for p in self.candidates if p.exists()), None)
+        return self._path
+
+    def get(self):
+        """Current config dict, re-parsed only when the file changed"""
+        self._refresh()
+        return self._config
+
+    def section(self, name):
+        """A top-level section such as 'local_llm' or 'ui', {} if missing"""
+        return self.get().get(name) or {}
+
+    def reload(self):
+        """Force a re-check of the file, e.g. from a file watcher"""
+        self._stamp = None
+        self._path = None
+        self._refresh()
+
+    def seed(self, config):
+        """Use config already parsed from the current file, e.g. from a warm-start snapshot"""
+        if self._loaded:
+            return
+        path, stat = self._stat()
+        if stat is None:
+            return
+        self._stamp = (str(path), stat.st_mtime_ns, stat.st_size)
+        self._config = config
+        self._loaded = True
+
+    def add_listener(self, callback):
+        """Call callback(config) whenever the file contents change"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _stat(self):
+        # Resolve again if the file moved or was deleted since it was found
+        for _ in range(2):
+            path = self.path
+            if path is None:
+                return None, None
+            try:
+                return path, os.stat(path)
+            except OSError:
+                self._path = None
+        return None, None
+
+    def _refresh(self):
+        path, stat = self._stat()
+        stamp = (str(path), stat.st_mtime_ns, stat.st_size) if stat else None
+        if self._loaded and stamp == self._stamp:
+            return
+
+        config = {}
+        if stat:
+            try:
+                with span('config.load'):
+                    config, errors = validate_config(load_yaml(path, {}))
+                for error in errors:
+                    print(f"Invalid setting in {path.name}: {error}")
+            except Exception as e:
+                print(f"Error loading {path}: {e}")
+        changed = self._loaded and config != self._config
+        self._stamp = stamp
+        self._config = config
+        self._loaded = True
+        if changed:
+            for callback in list(self._listeners):
+                try:
+                    callback(config)
+                except Exception as e:
+                    print(f"Error applying config change: {e}")
+
+_service = None
+
+def get_config_service():
+    """Shared ConfigService instance"""
+    global _service
+    if _service is None:
+        _service = ConfigService()
+    return _service
+
+def get_config():
+    """Current context.yml contents"""
+    return get_config_service().get()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Parsed work log days for the history browser
+Keeps the most recently viewed days parsed in a bounded LRU cache, so going
+back and forth between days doesn't read the files again, while a long
+session of browsing can't grow memory without limit. A cached day is checked
+against the size and mtime of its file and edits before it's used, so days
+appended to or edited since are read again.
+
+The cache is shared by the UI thread and the prefetch thread; files are read
+outside the lock so a prefetch never blocks showing a day.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from pathlib import Path
+from profiling import span
+from standup import parse_line
+from worklog_edits import edits_path, read_text
+from worklog_io import get_data_dir
+
+# Days kept parsed, a month of browsing plus the neighbours being prefetched
+DEFAULT_CAPACITY = 40
+
+# Days around the one shown that are loaded in the background
+PREFETCH_BACK = 7
+PREFETCH_FORWARD = 2
+
+def neighbours(day, back=PREFETCH_BACK, forward=PREFETCH_FORWARD, today=None):
+    """Days around day, nearest first and earlier days first on a tie, never after today"""
+    today = today or date.today()
+    days = []
+    for distance in range(1, max(back, forward) + 1):
+        if distance <= back:
+            days.append(day - timedelta(days=distance))
+        if distance <= forward and day + timedelta(days=distance) <= today:
+            days.append(day + timedelta(days=distance))
+    return days
+
+class DayCache:
+    """LRU cache of day -> [entry, ...] as parsed by standup.parse_line, edits applied"""
+
+    def __init__(self, data_dir=None, capacity=DEFAULT_CAPACITY):
+        self.data_dir = Path(data_dir or get_data_dir())
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._days = OrderedDict()  # day -> (stamp, entries), least recently used first
+        self._lock = threading.Lock()
+
+    def path(self, day):
+        return self.data_dir / f'worklog_{day.isoformat()}.txt'
+
+    def stamp(self, day):
+        """Size and mtime of the day file and its edits, None if nothing was logged"""
+        path = self.path(day)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        try:
+            edits = edits_path(path).stat()
+            stamp += (edits.st_mtime_ns, edits.st_size)
+        except FileNotFoundError:
+            pass
+        return stamp
+
+    def __contains__(self, day):
+        with self._lock:
+            return day in self._days
+
+    def __len__(self):
+        return len(self._days)
+
+    def get(self, day):
+        """Entries of a day, from the cache if the files haven't changed"""
+        stamp = self.stamp(day)
+        with self._lock:
+            cached = self._days.get(day)
+            if cached is not None and cached[0] == stamp:
+                self._days.move_to_end(day)
+                self.hits += 1
+                return cached[1]
+        with span('history.load_day', day=day.isoformat()):
+            entries = [] if stamp is None else [
+                entry for entry in map(parse_line, read_text(self.path(day)).splitlines()) if entry is not None
+            ]
+        with self._lock:
+            self.misses += 1
+            self._days[day] = (stamp, entries)
+            self._days.move_to_end(day)
+            while len(self._days) > self.capacity:
+                self._days.popitem(last=False)
+        return entries
+
+    def prefetch(self, days, cancelled=None):
+        """Load days that aren't cached yet, stopping early when cancelled() is true; returns how many were read"""
+        loaded = 0
+        for day in days:
+            if cancelled is not None and cancelled():
+                break
+            with self._lock:
+                cached = self._days.get(day)
+            if cached is not None and cached[0] == self.stamp(day):
+                continue
+            self.get(day)
+            loaded += 1
+        return loaded
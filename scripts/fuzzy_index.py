@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Fuzzy search index for picking issues/PRs by typing
+Trigram index for substring matches, subsequence scoring as a fallback,
+and recently used items ranked first
+"""
+
+from collections import defaultdict
+
+def trigrams(text):
+    """Set of 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def subsequence_gaps(token, text):
+    """Number of skipped characters if token is a subsequence of text, else None"""
+    pos = 0
+    gaps = 0
+    for char in token:
+        found = text.find(char, pos)
+        if found < 0:
+            return None
+        gaps += found - pos
+        pos = found + 1
+    return gaps
+
+def score_token(token, text):
+    """Score a single query token against lowered text, None if it doesn't match"""
+    pos = text.find(token)
+    if pos >= 0:
+        score = 100
+        if pos == 0 or not text[pos - 1].isalnum():
+            score += 50  # starts a word, e.g. '126' in '#126' or 'add' in 'add tests'
+        end = pos + len(token)
+        if end == len(text) or not text[end].isalnum():
+            score += 25  # whole word
+        return score
+    gaps = subsequence_gaps(token, text)
+    if gaps is None:
+        return None
+    return max(1, 50 - gaps)
+
+class FuzzyIndex:
+    """Incrementally maintained fuzzy index over (key, text) entries"""
+
+    def __init__(self, recent=None, recent_limit=50):
+        self._texts = {}  # key -> lowered search text
+        self._order = {}  # key -> insertion order, used as tie breaker
+        self._next_order = 0
+        self._trigrams = defaultdict(set)
+        self.recent_limit = recent_limit
+        self._recent = list(recent or [])[-recent_limit:]  # most recent last
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __contains__(self, key):
+        return key in self._texts
+
+    def add(self, key, text=None):
+        """Add or update one entry"""
+        lowered = (text if text is not None else key).lower()
+        if self._texts.get(key) == lowered:
+            return
+        if key in self._texts:
+            self._drop_trigrams(key)
+        else:
+            self._order[key] = self._next_order
+            self._next_order += 1
+        self._texts[key] = lowered
+        for gram in trigrams(lowered):
+            self._trigrams[gram].add(key)
+
+    def remove(self, key):
+        if key not in self._texts:
+            return
+        self._drop_trigrams(key)
+        del self._texts[key]
+        del self._order[key]
+
+    def _drop_trigrams(self, key):
+        for gram in trigrams(self._texts[key]):
+            keys = self._trigrams.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._trigrams[gram]
+
+    def update(self, entries):
+        """Make the index match entries (a dict of key -> text), touching only what changed"""
+        for key in [key for key in self._texts if key not in entries]:
+            self.remove(key)
+        for key, text in entries.items():
+            self.add(key, text)
+
+    def mark_used(self, key):
+        """Record that key was picked so it ranks first next time"""
+        if key in self._recent:
+            self._recent.remove(key)
+        self._recent.append(key)
+        del self._recent[:-self.recent_limit]
+
+    def recent(self):
+        """Recently used keys, most recent first"""
+        return list(reversed(self._recent))
+
+    def _candidates(self, tokens):
+        # Keys containing every trigram of every token, i.e. all substring matches
+        result = None
+        for token in tokens:
+            for gram in trigrams(token):
+                keys = self._trigrams.get(gram, set())
+                result = set(keys) if result is None else result & keys
+                if not result:
+                    return set()
+        return result
+
+    def search(self, query, limit=50):
+        """Return up to limit keys ranked by match quality, recently used first"""
+        tokens = query.lower().split()
+        recency = {key: i for i, key in enumerate(self._recent)}
+        if not tokens:
+            recent = [key for key in self.recent() if key in self._texts]
+            rest = sorted((key for key in self._texts if key not in recency), key=self._order.get)
+            return (recent + rest)[:limit]
+
+        # Substring matches found through the trigram index always outrank
+        # subsequence-only matches, so only scan everything when they run short
+        candidates = None
+        if all(len(token) >= 3 for token in tokens):
+            candidates = self._candidates(tokens)
+            if len(candidates) < limit:
+                candidates = None
+        keys = candidates if candidates is not None else self._texts
+
+        scored = []
+        for key in keys:
+            text = self._texts[key]
+            score = 0
+            for token in tokens:
+                token_score = score_token(token, text)
+                if token_score is None:
+                    break
+                score += token_score
+            else:
+                scored.append((-(key in recency), -recency.get(key, 0), -score, self._order[key], key))
+        scored.sort()
+        return [entry[-1] for entry in scored[:limit]]
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Local git commit harvester for Reporter app
+Scans the repositories listed under `git_repos` in context.yml and turns your
+new commits into suggested work log entries, mapped to an organization and
+any `#123` issue reference in the message.
+
+Branch tips are read straight from .git (loose refs and packed-refs) and
+compared with the tips seen on the last run, so `git log` only runs for
+repositories that actually have new commits. An unchanged repository costs a
+few small file reads.
+
+context.yml:
+    git_repos:
+      - ~/code/time_assist
+      - path: ~/work/appbuilder
+        organization: CruGlobal
+"""
+
+import re
+import json
+import threading
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from config_service import get_config_service
+from yaml_io import atomic_write
+from profiling import span
+from worklog_io import get_data_dir
+
+STATE_NAME = 'git_harvest.json'
+
+# Suggestions not acted on within this many days are dropped
+PENDING_DAYS = 3
+
+# Commit hashes remembered per repository, so a commit seen on one branch isn't suggested again from another
+SEEN_LIMIT = 500
+
+MAX_WORKERS = 8
+
+ISSUE_REF_RE = re.compile(r'(?<![\w/])#(\d+)\b')
+REMOTE_OWNER_RE = re.compile(r'github\.com[:/]([^/\s]+)/')
+# Object names are SHA-1 or, in SHA-256 repositories, SHA-256 hex digests
+SHA_RE = re.compile(r'^(?:[0-9a-f]{40}|[0-9a-f]{64})$')
+
+def configured_repos():
+    """[(path, organization)] from context.yml's git_repos"""
+    repos = []
+    for entry in get_config_service().get().get('git_repos') or []:
+        if isinstance(entry, str):
+            path, organization = entry, ''
+        elif isinstance(entry, dict) and entry.get('path'):
+            path, organization = entry['path'], entry.get('organization') or ''
+        else:
+            print(f"Ignoring git_repos entry: {entry!r}")
+            continue
+        repos.append((str(Path(path).expanduser()), str(organization)))
+    return repos
+
+def find_git_dir(repo):
+    """The .git directory of a work tree, following `gitdir:` files used by worktrees"""
+    git_path = Path(repo) / '.git'
+    if git_path.is_file():
+        text = git_path.read_text(encoding='utf-8').strip()
+        if text.startswith('gitdir:'):
+            git_dir = Path(text[len('gitdir:'):].strip())
+            return git_dir if git_dir.is_absolute() else (Path(repo) / git_dir).resolve()
+        return None
+    return git_path if git_path.is_dir() else None
+
+def common_dir(git_dir):
+    """Where refs live; a worktree's git dir points back to the main repository"""
+    commondir = git_dir / 'commondir'
+    if commondir.is_file():
+        return (git_dir / commondir.read_text(encoding='utf-8').strip()).resolve()
+    return git_dir
+
+def read_branch_tips(git_dir):
+    """{branch: sha} for local branches, read from packed-refs and loose refs without running git"""
+    refs_dir = common_dir(git_dir)
+    tips = {}
+    try:
+        with open(refs_dir / 'packed-refs', 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith(('#', '^')):
+                    continue
+                sha, _, ref = line.strip().partition(' ')
+                if ref.startswith('refs/heads/'):
+                    tips[ref[len('refs/heads/'):]] = sha
+    except FileNotFoundError:
+        pass
+    # Loose refs are newer than packed ones
+    heads = refs_dir / 'refs' / 'heads'
+    for ref_file in heads.rglob('*'):
+        if ref_file.is_file():
+            sha = ref_file.read_text(encoding='utf-8').strip()
+            if SHA_RE.match(sha):
+                tips[ref_file.relative_to(heads).as_posix()] = sha
+    return tips
+
+def remote_owner(git_dir):
+    """Owner of the repository's GitHub remote, e.g. 'CruGlobal', or ''"""
+    try:
+        match = REMOTE_OWNER_RE.search((common_dir(git_dir) / 'config').read_text(encoding='utf-8'))
+    except OSError:
+        return ''
+    return match.group(1) if match else ''
+
+def issue_reference(message):
+    """First `#123` reference in a commit message, as used in the Issue/PR field"""
+    match = ISSUE_REF_RE.search(message)
+    return f"#{match.group(1)}" if match else ''
+
+def run_git(repo, args):
+    result = subprocess.run(['git', '-C', repo] + args, capture_output=True, text=True, timeout=30)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout
+
+def author_email(repo):
+    try:
+        return run_git(repo, ['config', 'user.email']).strip()
+    except RuntimeError:
+        return ''
+
+def author_args(email):
+    """git log arguments limiting commits to an author email, matched literally"""
+    # --author is a regex; in extended syntax every escaped character is literal
+    return ['--extended-regexp', f'--author=<{re.escape(email)}>']
+
+def new_commits(repo, tips, old_tips, email, since):
+    """[(sha, timestamp, subject)] of your commits on tips that weren't on old_tips, oldest first"""
+    args = ['log', '--no-merges', '--topo-order', '--format=%H%x1f%at%x1f%s']
+    if email:
+        args += author_args(email)
+    old = sorted(set(old_tips.values()))
+    if old:
+        args += sorted(set(tips.values())) + ['--not'] + old
+    else:
+        # First scan of this repository: only today's commits, not its whole history
+        args += [f'--since={since.isoformat()}'] + sorted(set(tips.values()))
+    try:
+        output = run_git(repo, args)
+    except RuntimeError:
+        if not old:
+            raise
+        # An old tip was garbage collected after a rebase, fall back to today's commits
+        return new_commits(repo, tips, {}, email, since)
+    commits = []
+    for line in output.splitlines():
+        sha, timestamp, subject = line.split('\x1f', 2)
+        commits.append((sha, int(timestamp), subject))
+    commits.reverse()
+    return commits
+
+def scan_repo(repo, organization, repo_state, organizations, since):
+    """Scan one repository, returns (new repo_state, [suggestion, ...])"""
+    git_dir = find_git_dir(repo)
+    if git_dir is None:
+        raise RuntimeError('not a git repository')
+    tips = read_branch_tips(git_dir)
+    old_tips = repo_state.get('tips', {})
+    if tips == old_tips and repo_state:
+        return repo_state, []
+
+    changed = {branch: sha for branch, sha in tips.items() if old_tips.get(branch) != sha}
+    state = dict(repo_state, tips=tips)
+    if not changed:
+        # Only deleted branches
+        return state, []
+
+    if 'email' not in state:
+        state['email'] = author_email(repo)
+    if not organization:
+        owner = remote_owner(git_dir)
+        organization = owner if owner in organizations else ''
+
+    seen = list(state.get('seen', []))
+    seen_set = set(seen)
+    suggestions = []
+    for sha, timestamp, subject in new_commits(repo, changed, old_tips, state['email'], since):
+        if sha in seen_set:
+            continue
+        seen_set.add(sha)
+        seen.append(sha)
+        suggestions.append({
+            'sha': sha,
+            'repo': repo,
+            'time': datetime.fromtimestamp(timestamp).isoformat(timespec='minutes'),
+            'organization': organization,
+            'issue': issue_reference(subject),
+            'text': subject,
+        })
+    state['seen'] = seen[-SEEN_LIMIT:]
+    return state, suggestions
+
+class GitHarvester:
+    """Suggested work log entries from new local commits, kept between runs in the data directory"""
+
+    def __init__(self, state_file=None, repos=None):
+        self.state_file = Path(state_file) if state_file else get_data_dir() / STATE_NAME
+        self.repos = repos
+        self.state = self.load_state()
+        # harvest() runs on a worker thread in the dashboard while remove() runs on the UI thread
+        self.lock = threading.Lock()
+
+    def load_state(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if isinstance(state, dict):
+                state.setdefault('repos', {})
+                state.setdefault('pending', [])
+                return state
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable {self.state_file.name}: {e}")
+        return {'repos': {}, 'pending': []}
+
+    def save_state(self):
+        try:
+            atomic_write(self.state_file, json.dumps(self.state, ensure_ascii=False))
+        except Exception as e:
+            print(f"Error saving {self.state_file.name}: {e}")
+
+    @property
+    def pending(self):
+        return self.state['pending']
+
+    def harvest(self, organizations=None):
+        """Scan every repository in parallel and return all pending suggestions
+
+        A repository's GitHub owner is used as the organization when it is one
+        of organizations (the context.yml projects by default).
+        """
+        repos = self.repos if self.repos is not None else configured_repos()
+        since = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if organizations is None:
+            organizations = get_config_service().section('projects').keys()
+        organizations = set(organizations)
+        with self.lock:
+            repo_states = {repo: self.state['repos'].get(repo, {}) for repo, _ in repos}
+
+        # The lock isn't held while git runs, so remove() on the UI thread never waits for a scan
+        with span('git.harvest', repos=len(repos)) as timing:
+            with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(repos)))) as pool:
+                futures = [
+                    (repo, pool.submit(scan_repo, repo, organization, repo_states[repo], organizations, since))
+                    for repo, organization in repos
+                ]
+            results = []
+            for repo, future in futures:
+                try:
+                    results.append((repo, future.result()))
+                except Exception as e:
+                    print(f"Error scanning {repo}: {e}")
+            timing.set(new=sum(len(suggestions) for _, (_, suggestions) in results))
+
+        with self.lock:
+            changed = False
+            for repo, (repo_state, suggestions) in results:
+                if repo_state is not repo_states[repo]:
+                    self.state['repos'][repo] = repo_state
+                    changed = True
+                self.pending.extend(suggestions)
+
+            cutoff = (datetime.now() - timedelta(days=PENDING_DAYS)).isoformat(timespec='minutes')
+            fresh = [suggestion for suggestion in self.pending if suggestion['time'] >= cutoff]
+            if changed or len(fresh) != len(self.pending):
+                self.state['pending'] = fresh
+                self.save_state()
+            return list(self.pending)
+
+    def remove(self, sha):
+        """Drop a suggestion once it has been logged or dismissed"""
+        with self.lock:
+            self.state['pending'] = [suggestion for suggestion in self.pending if suggestion['sha'] != sha]
+            self.save_state()
+
+def format_suggestion(suggestion):
+    """One line for lists, e.g. '14:05 [CruGlobal] [#46] Fix login redirect'"""
+    parts = [suggestion['time'][11:16]]
+    if suggestion['organization']:
+        parts.append(f"[{suggestion['organization']}]")
+    if suggestion['issue']:
+        parts.append(f"[{suggestion['issue']}]")
+    parts.append(suggestion['text'])
+    return ' '.join(parts)
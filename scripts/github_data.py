@@ -1,19 +1,47 @@
 # get and store the info from `gh status`
 # make clickable links to save user time 
+import json
 import subprocess
-import re
-import yaml
+from datetime import datetime
 from pathlib import Path
+from github_items import GitHubItem, GITHUB_SECTIONS, GH_CELL_RE
+from yaml_io import write_cache, atomic_write
+from profiling import span
 
 # Path to the YAML file
 YAML_PATH = Path(__file__).parent.parent / 'user_data' / 'github_data.yml'
 
+# Item kind -> github_data.yml section
+YAML_SECTIONS = {kind: section for section, kind in GITHUB_SECTIONS.items()}
+
+# Command used to fetch the status table
+GH_STATUS_COMMAND = ['gh', 'status']
+
+# Mentions and Repository Activity lines, with the time they were first seen, for the timeline
+EVENTS_NAME = 'github_events.jsonl'
+
+def stream_gh_status(command=None):
+    """Run `gh status` and yield its output line by line as it arrives."""
+    proc = subprocess.Popen(command or GH_STATUS_COMMAND, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, text=True, bufsize=1)
+    try:
+        for line in proc.stdout:
+            yield line.rstrip('\n')
+    except GeneratorExit:
+        # Consumer stopped early, don't leave gh running
+        proc.kill()
+        raise
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"gh status failed: {stderr}")
+
 def run_gh_status():
     """Run `gh status` and return its output as a string."""
-    result = subprocess.run(['gh', 'status'], capture_output=True, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"gh status failed: {result.stderr}")
-    return result.stdout
+    return '\n'.join(stream_gh_status())
 
 def parse_table_line(line):
     # Split by the vertical bar, handle lines with one or two columns
@@ -24,30 +52,24 @@ def parse_table_line(line):
 
 def parse_issue_or_pr(text):
     # Example: CruGlobal/appbuilder_platform_pwa#46  As a user I can create an expense report
-    m = re.match(r'([^#]+)#(\d+)\s+(.*)', text)
-    if m:
-        repo, num, title = m.groups()
-        url = f"https://github.com/{repo.strip()}/issues/{num}"
-        return num, f"{title} [{url}]"
+    item = GitHubItem.from_gh_cell('issues', text)
+    if item:
+        return item.number, item.yaml_value()
     return None, None
 
 def parse_pr(text):
     # Example: CruGlobal/appbuilder_docs#15  [WIP] update theme and build
-    m = re.match(r'([^#]+)#(\d+)\s+(.*)', text)
-    if m:
-        repo, num, title = m.groups()
-        url = f"https://github.com/{repo.strip()}/pull/{num}"
-        return num, f"{title} [{url}]"
+    item = GitHubItem.from_gh_cell('prs', text)
+    if item:
+        return item.number, item.yaml_value()
     return None, None
 
-def parse_gh_status_table(output):
-    data = {
-        'account name': None,
-        'my_issues': {},
-        'my_prs': {},
-        'my_reviews': {},
-    }
-    lines = output.splitlines()
+def iter_gh_status(lines, activity=None):
+    """Yield a GitHubItem for each issue, PR or review as its table line is read
+
+    Mentions and Repository Activity lines are appended to activity as
+    (section, line) when a list is given, e.g. ('mentions', 'owner/repo#70  @you can you look').
+    """
     section = None
     for line in lines:
         if 'Assigned Issues' in line and 'Assigned Pull Requests' in line:
@@ -57,37 +79,124 @@ def parse_gh_status_table(output):
             section = 'reviews_mentions'
             continue
         if 'Repository Activity' in line:
-            section = None
+            section = 'activity'
             continue
         if section == 'issues_prs':
             left, right = parse_table_line(line)
             # Issues (left column)
             if left and not left.startswith('Nothing here'):
-                num, val = parse_issue_or_pr(left)
-                if num:
-                    data['my_issues'][num] = val
+                item = GitHubItem.from_gh_cell('issues', left)
+                if item:
+                    yield item
             # PRs (right column)
             if right and not right.startswith('Nothing here'):
-                num, val = parse_pr(right)
-                if num:
-                    data['my_prs'][num] = val
+                item = GitHubItem.from_gh_cell('prs', right)
+                if item:
+                    yield item
         elif section == 'reviews_mentions':
             left, right = parse_table_line(line)
             # Reviews (left column)
             if left and not left.startswith('Nothing here'):
-                num, val = parse_pr(left)
-                if num:
-                    data['my_reviews'][num] = val
-    return data
+                item = GitHubItem.from_gh_cell('reviews', left)
+                if item:
+                    yield item
+            # Mentions (right column)
+            if activity is not None and GH_CELL_RE.match(right):
+                activity.append(('mentions', right))
+        elif section == 'activity' and activity is not None:
+            # Continuation lines (comment snippets) don't start with repo#number
+            if GH_CELL_RE.match(line.strip()):
+                activity.append(('activity', line.strip()))
+
+def empty_gh_data():
+    return {
+        'account name': None,
+        'my_issues': {},
+        'my_prs': {},
+        'my_reviews': {},
+        'mentions': [],
+        'activity': [],
+    }
+
+def parse_gh_status_table(output):
+    """Parse `gh status` output (a string or an iterable of lines)"""
+    with span('github.parse'):
+        data = empty_gh_data()
+        if isinstance(output, str):
+            output = output.splitlines()
+        activity = []
+        for item in iter_gh_status(output, activity):
+            data[YAML_SECTIONS[item.kind]][item.number] = item.yaml_value()
+        for section, line in activity:
+            data[section].append(line)
+        return data
 
 def write_yaml(data):
-    with open(YAML_PATH, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+    """Write github_data.yml atomically, plus its fast-loading JSON sidecar"""
+    with span('github.write'):
+        write_cache(data, YAML_PATH)
 
-def main():
-    output = run_gh_status()
-    data = parse_gh_status_table(output)
+def fetch_github_data(on_item=None, command=None):
+    """Stream `gh status`, publish each parsed item as it arrives and write the YAML.
+
+    on_item is called with each GitHubItem before the command has finished,
+    so callers can show results progressively.
+    """
+    # Includes waiting for gh, which dominates; parsing happens as lines arrive
+    with span('github.fetch') as timing:
+        data = empty_gh_data()
+        items = 0
+        activity = []
+        for item in iter_gh_status(stream_gh_status(command), activity):
+            data[YAML_SECTIONS[item.kind]][item.number] = item.yaml_value()
+            items += 1
+            if on_item:
+                on_item(item)
+        for section, line in activity:
+            data[section].append(line)
+        timing.set(items=items)
     write_yaml(data)
+    record_events(data)
+    return data
+
+def record_events(data, path=None, now=None):
+    """Append mentions and activity that the previous refresh didn't show, returns how many were new
+
+    `gh status` has no times, so an event is dated when a refresh first shows it.
+    Only the previous refresh's lines are kept, in a small sidecar, so the
+    growing events file is never read back.
+    """
+    path = Path(path) if path else YAML_PATH.with_name(EVENTS_NAME)
+    last_path = path.with_name(f'.{path.stem}.last.json')
+    now = (now or datetime.now()).isoformat(timespec='seconds')
+    current = [[section, line] for section in ('mentions', 'activity') for line in data.get(section, [])]
+    try:
+        with open(last_path, 'r', encoding='utf-8') as f:
+            last = json.load(f)
+    except FileNotFoundError:
+        last = []
+    except ValueError as e:
+        print(f"Ignoring unreadable {last_path.name}: {e}")
+        last = []
+    seen = {tuple(event) for event in last if isinstance(event, list)}
+    new = [{'time': now, 'kind': section, 'text': line} for section, line in current if (section, line) not in seen]
+    if new:
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                for event in new:
+                    f.write(json.dumps(event, ensure_ascii=False) + '\n')
+        except Exception as e:
+            print(f"Error saving GitHub events: {e}")
+            return 0
+    if current != last:
+        try:
+            atomic_write(last_path, json.dumps(current, ensure_ascii=False))
+        except Exception as e:
+            print(f"Error saving {last_path.name}: {e}")
+    return len(new)
+
+def main():
+    fetch_github_data()
     print(f"Updated {YAML_PATH}")
 
 if __name__ == '__main__':
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory representation of GitHub issues, PRs and reviews
+Items keep only kind, number, repo and title; URLs and display strings are
+built on demand and repo strings are interned so they are shared.
+Loading github_data.yml lives here too, free of Qt, so the command line
+reports can use it without importing the dashboard.
+"""
+
+import re
+import sys
+from pathlib import Path
+from profiling import span
+from worklog_io import get_data_dir
+from yaml_io import load_cache
+
+# github_data.yml section -> item kind (also the dashboard tab key)
+GITHUB_SECTIONS = {'my_issues': 'issues', 'my_prs': 'prs', 'my_reviews': 'reviews'}
+
+# Prefix shown in the Issue/PR combo box for each kind
+COMBO_PREFIXES = {'issues': 'Issue', 'prs': 'PR', 'reviews': 'Review'}
+
+# `gh status` table cell, e.g. 'CruGlobal/appbuilder_docs#15  [WIP] update theme and build'
+GH_CELL_RE = re.compile(r'([^#]+)#(\d+)\s+(.*)')
+
+# github_data.yml value, e.g. 'update theme [https://github.com/owner/repo/pull/15]'
+# Only the trailing bracket is the URL so titles like '[WIP] ...' survive intact
+YAML_VALUE_RE = re.compile(
+    r'^(?P<title>.*?)\s*\[(?P<url>https?://(?:github\.com/(?P<repo>[^/\]\s]+/[^/\]\s]+)'
+    r'/(?:issues|pull)/\d+|[^\]]*))\]\s*$'
+)
+
+class GitHubItem:
+    """One issue, PR or review request"""
+    __slots__ = ('kind', 'number', 'repo', 'title', '_url')
+
+    def __init__(self, kind, number, title, repo='', url=None):
+        self.kind = sys.intern(kind)
+        self.number = str(number)
+        self.repo = sys.intern(repo)
+        self.title = title
+        # Only kept when the URL can't be rebuilt from repo and number
+        self._url = url
+
+    @classmethod
+    def from_gh_cell(cls, kind, text):
+        """Parse a `gh status` table cell, or return None if it isn't an item"""
+        match = GH_CELL_RE.match(text)
+        if not match:
+            return None
+        repo, number, title = match.groups()
+        return cls(kind, number, title, repo.strip())
+
+    @classmethod
+    def from_yaml_value(cls, kind, number, value):
+        """Parse a github_data.yml value like 'title [url]'"""
+        value = str(value)
+        match = YAML_VALUE_RE.match(value)
+        if not match:
+            return cls(kind, number, value)
+        repo = match.group('repo')
+        if repo:
+            return cls(kind, number, match.group('title'), repo)
+        return cls(kind, number, match.group('title'), url=match.group('url'))
+
+    @property
+    def url(self):
+        if self._url:
+            return self._url
+        if not self.repo:
+            return None
+        path = 'issues' if self.kind == 'issues' else 'pull'
+        return f"https://github.com/{self.repo}/{path}/{self.number}"
+
+    @property
+    def org(self):
+        return sys.intern(self.repo.partition('/')[0])
+
+    @property
+    def text(self):
+        """Display text, e.g. '#126: add tests'"""
+        return f"#{self.number}: {self.title}"
+
+    @property
+    def combo_text(self):
+        """Issue/PR combo box entry, e.g. 'Issue: #126: add tests'"""
+        return f"{COMBO_PREFIXES[self.kind]}: {self.text}"
+
+    @property
+    def search_text(self):
+        """Text matched when searching: number, title and repo"""
+        return f"{self.combo_text} {self.repo}"
+
+    def yaml_value(self):
+        """Value stored in github_data.yml"""
+        url = self.url
+        return f"{self.title} [{url}]" if url else self.title
+
+    def _key(self):
+        return (self.kind, self.number, self.repo, self.title, self._url)
+
+    def __eq__(self, other):
+        return isinstance(other, GitHubItem) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __reduce__(self):
+        # Pickled as constructor arguments so strings are re-interned on load
+        return (GitHubItem, (self.kind, self.number, self.title, self.repo, self._url))
+
+    def __repr__(self):
+        return f"GitHubItem({self.kind!r}, {self.number!r}, {self.title!r}, repo={self.repo!r})"
+
+def items_from_yaml(data):
+    """Build {kind: [GitHubItem, ...]} from loaded github_data.yml contents"""
+    result = {kind: [] for kind in COMBO_PREFIXES}
+    for section, kind in GITHUB_SECTIONS.items():
+        for number, value in (data.get(section) or {}).items():
+            result[kind].append(GitHubItem.from_yaml_value(kind, number, value))
+    return result
+
+def find_github_data_file(data_dir=None):
+    """Path of the GitHub data file in use, or None if there isn't one"""
+    # Try multiple locations for the GitHub data file
+    possible_locations = [
+        Path(data_dir or get_data_dir()) / 'github_data.yml',  # User's home directory
+        Path(__file__).parent.parent / 'user_data' / 'github_data.yml',  # Project directory
+        Path.cwd() / 'user_data' / 'github_data.yml',  # Current working directory
+    ]
+    return next((path for path in possible_locations if path.exists()), None)
+
+def get_github_data(data_dir=None):
+    """Load GitHub data from YAML file as {kind: [GitHubItem, ...]}"""
+    try:
+        github_file = find_github_data_file(data_dir)
+        if github_file is not None:
+            with span('github.load') as timing:
+                items = items_from_yaml(load_cache(github_file, {}))
+                timing.set(items=sum(len(kind_items) for kind_items in items.values()))
+            return items
+
+    except Exception as e:
+        print(f"Error loading GitHub data: {e}")
+
+    # Empty tabs show "No GitHub data available"
+    return {kind: [] for kind in COMBO_PREFIXES}
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Search over every work log day for the history browser
+Keeps every entry parsed and lowercased, a day file at a time: a refresh only
+re-reads days whose file or edits changed size or mtime since the last one.
+Queries match entries containing every word of the query and return them
+newest first, in batches, so results can be shown as they are found and a
+search can be dropped as soon as a newer one starts. A plain scan over years
+of entries takes milliseconds, less than building a trigram index would.
+"""
+
+import threading
+from datetime import date
+from pathlib import Path
+from profiling import span
+from standup import parse_line
+from worklog_edits import edits_path, read_text
+from worklog_io import get_data_dir
+
+BATCH_SIZE = 50
+
+def entry_search_text(entry):
+    return ' '.join(part for part in (entry['organization'], entry['issue'], entry['text']) if part).lower()
+
+def match_spans(text, query):
+    """[(start, end)] of every word of query in text, merged, for highlighting"""
+    lowered = text.lower()
+    spans = []
+    for token in set(query.lower().split()):
+        start = lowered.find(token)
+        while start >= 0:
+            spans.append((start, start + len(token)))
+            start = lowered.find(token, start + 1)
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+class HistoryIndex:
+    """Entries of every day file, searchable by words they contain"""
+
+    def __init__(self, data_dir=None):
+        self.data_dir = Path(data_dir or get_data_dir())
+        self._days = {}  # day -> (stamp, [(entry, lowered text), ...] newest first)
+        self._order = []  # days, newest first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(entries) for _, entries in self._days.values())
+
+    def stamps(self):
+        """{day: stamp} of every day file, from one directory listing"""
+        stamps = {}
+        for path in self.data_dir.glob('worklog_*.txt'):
+            try:
+                day = date.fromisoformat(path.stem[len('worklog_'):])
+                stat = path.stat()
+            except (ValueError, OSError):
+                continue
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            try:
+                edits = edits_path(path).stat()
+                stamp += (edits.st_mtime_ns, edits.st_size)
+            except FileNotFoundError:
+                pass
+            stamps[day] = stamp
+        return stamps
+
+    def refresh(self):
+        """Re-read days that changed since the last refresh, returns how many were read"""
+        with self._lock, span('history.index') as timing:
+            stamps = self.stamps()
+            for day in [day for day in self._days if day not in stamps]:
+                del self._days[day]
+            changed = [day for day, stamp in stamps.items() if self._days.get(day, (None,))[0] != stamp]
+            for day in changed:
+                path = self.data_dir / f'worklog_{day.isoformat()}.txt'
+                entries = [entry for entry in map(parse_line, read_text(path).splitlines()) if entry is not None]
+                # Stable sort keeps entries logged in the same minute in file order
+                entries.sort(key=lambda entry: entry['time'])
+                self._days[day] = (stamps[day], [(entry, entry_search_text(entry)) for entry in reversed(entries)])
+            if changed or len(self._order) != len(self._days):
+                self._order = sorted(self._days, reverse=True)
+            timing.set(days=len(changed))
+        return len(changed)
+
+    def entries(self):
+        """[(day, entry)] of every indexed entry, newest first"""
+        with self._lock:
+            return [(day, entry) for day in self._order for entry, _ in self._days[day][1]]
+
+    def search(self, query, cancelled=None, batch_size=BATCH_SIZE):
+        """Yield lists of (day, entry) containing every word of query, newest first
+
+        Days are scanned newest first, so the first batch comes from recent
+        days without looking at older ones. Stops between batches and days
+        once cancelled() is true.
+        """
+        tokens = query.lower().split()
+        if not tokens:
+            return
+        with self._lock:
+            days = [(day, self._days[day][1]) for day in self._order]
+        batch = []
+        for day, entries in days:
+            if cancelled is not None and cancelled():
+                return
+            for entry, text in entries:
+                if all(token in text for token in tokens):
+                    batch.append((day, entry))
+                    if len(batch) >= batch_size:
+                        if cancelled is not None and cancelled():
+                            return
+                        yield batch
+                        batch = []
+        if batch and not (cancelled is not None and cancelled()):
+            yield batch
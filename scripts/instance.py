@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Single-instance client for Reporter app
+The running dashboard listens on a local socket in the data directory; later
+launches (e.g. `main.py --add "text"` from a hotkey) hand their work to it over
+one JSON line instead of starting a second app. Only the standard library and
+the Qt-free worklog_io are imported here so forwarding an entry stays fast.
+"""
+
+import json
+import socket
+from worklog_io import get_data_dir
+
+SOCKET_NAME = 'reporter.sock'
+
+def socket_path():
+    """Local socket the running instance listens on"""
+    return get_data_dir() / SOCKET_NAME
+
+def send_request(request, path=None, timeout=2.0):
+    """Send a request to the running instance and return its reply
+
+    Returns None if no instance is listening, so the caller can do the work itself.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    path = str(path or socket_path())
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(path)
+        except OSError:
+            # No socket file, or a stale one left by a crashed instance
+            return None
+
+        # From here the instance may act on the request, so never report "not running"
+        try:
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            reply = b''
+            while not reply.endswith(b'\n'):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                reply += chunk
+            return json.loads(reply.decode('utf-8')) if reply else {'ok': False, 'error': 'no reply'}
+        except (OSError, ValueError) as e:
+            return {'ok': False, 'error': str(e)}
+    finally:
+        sock.close()
+
+def forward_entry(organization, issue, text, path=None):
+    """Hand a work log entry to the running instance, None if there isn't one"""
+    return send_request({'cmd': 'add', 'organization': organization, 'issue': issue, 'text': text}, path)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Automatic issue linking for free-text work log entries
+One Aho-Corasick automaton over every `#number`, repository name and title
+keyword from the GitHub data finds all of them in an entry in a single pass,
+so "fixed #126" or "worked on the expense report" can be tagged with the
+matching issue without using the Issue/PR combo. Items are added and removed
+incrementally; only the automaton's failure links are recomputed afterwards.
+"""
+
+import re
+
+# Words too common in titles and entries to say which issue is meant
+STOPWORDS = frozenset('''
+    the and for with from into that this have has was were are not but can all any out off
+    use using add added fix fixed update updated make made new more when then than also
+    work worked working issue issues pull request requests review reviews
+'''.split())
+
+NUMBER_WEIGHT = 3.0
+REPO_WEIGHT = 1.0
+# A keyword found in n titles adds 1/n, so rare words count most
+MIN_SCORE = 2.0
+# Links made from title words alone need at least this many of them
+MIN_KEYWORDS = 2
+# Words in more titles than this don't identify an issue, and skipping them keeps matching fast
+MAX_KEYWORD_ITEMS = 50
+
+WORD_RE = re.compile(r'\w+')
+
+def title_keywords(title):
+    return {word for word in WORD_RE.findall(title.lower())
+            if len(word) >= 3 and not word.isdigit() and word not in STOPWORDS}
+
+def is_word_char(char):
+    return char.isalnum() or char == '_'
+
+class AhoCorasick:
+    """Multi-pattern substring matcher; patterns can be added at any time"""
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        # Pattern ending at each node, and the nearest node on the failure chain that ends one
+        self.output = [None]
+        self.output_link = [0]
+        self.linked = True
+
+    def __len__(self):
+        return sum(1 for pattern in self.output if pattern is not None)
+
+    def add(self, pattern):
+        node = 0
+        for char in pattern:
+            next_node = self.goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto[node][char] = next_node
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(None)
+                self.output_link.append(0)
+                self.linked = False
+            node = next_node
+        if self.output[node] is None:
+            self.output[node] = pattern
+            # Nodes whose failure chain passes here need their output links refreshed
+            self.linked = False
+
+    def link(self):
+        """Compute failure and output links breadth first"""
+        queue = []
+        for node in self.goto[0].values():
+            self.fail[node] = 0
+            self.output_link[node] = 0
+            queue.append(node)
+        for node in queue:
+            for char, child in self.goto[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output_link[child] = target if self.output[target] is not None else self.output_link[target]
+                queue.append(child)
+        self.linked = True
+
+    def find(self, text):
+        """Yield (start, end, pattern) for every occurrence of every pattern in text"""
+        if not self.linked:
+            self.link()
+        goto, fail, output, output_link = self.goto, self.fail, self.output, self.output_link
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            match = node if output[node] is not None else output_link[node]
+            while match:
+                pattern = output[match]
+                yield end - len(pattern), end, pattern
+                match = output_link[match]
+
+class IssueLinker:
+    """Finds the GitHub item an entry is about from the numbers, repositories and title words in it"""
+
+    def __init__(self):
+        self.matcher = AhoCorasick()
+        # pattern -> {item key}; patterns stay in the automaton when their last item goes
+        self.numbers = {}
+        self.repos = {}
+        self.keywords = {}
+        self.items = {}  # key -> (number pattern, repo patterns, keywords)
+        self.sources = {}  # key -> GitHubItem the patterns came from
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def add(self, key, item):
+        """Add or replace one GitHub item, keyed by its Issue/PR combo text"""
+        if self.sources.get(key) == item:
+            return
+        self.remove(key)
+        repo = item.repo.lower()
+        patterns = (f"#{item.number}", {repo, repo.partition('/')[2]} - {''}, title_keywords(item.title))
+        self.items[key] = patterns
+        self.sources[key] = item
+        number, repos, keywords = patterns
+        for index, pattern in [(self.numbers, number)] + [(self.repos, r) for r in repos] + \
+                [(self.keywords, k) for k in keywords]:
+            if pattern not in index:
+                index[pattern] = set()
+                self.matcher.add(pattern)
+            index[pattern].add(key)
+
+    def remove(self, key):
+        patterns = self.items.pop(key, None)
+        if patterns is None:
+            return
+        del self.sources[key]
+        number, repos, keywords = patterns
+        for index, pattern in [(self.numbers, number)] + [(self.repos, r) for r in repos] + \
+                [(self.keywords, k) for k in keywords]:
+            keys = index.get(pattern)
+            if keys is not None:
+                keys.discard(key)
+
+    def update(self, items):
+        """Make the linker match {key: GitHubItem}, touching only what changed"""
+        for key in [key for key in self.items if key not in items]:
+            self.remove(key)
+        for key, item in items.items():
+            self.add(key, item)
+
+    def scores(self, text):
+        """{key: score} for every item mentioned in text"""
+        lowered = text.lower()
+        numbers = set()
+        repos = set()
+        keywords = set()
+        for start, end, pattern in self.matcher.find(lowered):
+            after = lowered[end] if end < len(lowered) else ''
+            if pattern in self.numbers:
+                # '#12' must not be the start of '#123'
+                if not after.isdigit():
+                    numbers.add(pattern)
+                continue
+            if (start and is_word_char(lowered[start - 1])) or (after and is_word_char(after)):
+                continue
+            if pattern in self.repos:
+                repos.add(pattern)
+            if pattern in self.keywords:
+                keywords.add(pattern)
+
+        scores = {}
+        for pattern in numbers:
+            for key in self.numbers[pattern]:
+                scores[key] = scores.get(key, 0.0) + NUMBER_WEIGHT
+        for pattern in repos:
+            for key in self.repos[pattern]:
+                # Only helps pick between items that are mentioned some other way
+                if key in scores:
+                    scores[key] += REPO_WEIGHT
+        matched_words = {}
+        for pattern in keywords:
+            keys = self.keywords[pattern]
+            if not keys or len(keys) > MAX_KEYWORD_ITEMS:
+                continue
+            for key in keys:
+                scores[key] = scores.get(key, 0.0) + 1.0 / len(keys)
+                matched_words[key] = matched_words.get(key, 0) + 1
+        return {
+            key: score for key, score in scores.items()
+            if self.items[key][0] in numbers or matched_words.get(key, 0) >= MIN_KEYWORDS
+        }
+
+    def match(self, text, limit=3):
+        """Best matching item keys for text, highest score first"""
+        ranked = sorted(self.scores(text).items(), key=lambda entry: entry[1], reverse=True)
+        return [key for key, score in ranked if score >= MIN_SCORE][:limit]
+
+    def best(self, text):
+        """The item text is clearly about, or None if there isn't exactly one"""
+        ranked = sorted(self.scores(text).items(), key=lambda entry: entry[1], reverse=True)
+        if not ranked or ranked[0][1] < MIN_SCORE:
+            return None
+        if len(ranked) > 1 and ranked[1][1] == ranked[0][1]:
+            # e.g. '#12' in two repositories and nothing else to tell them apart
+            return None
+        return ranked[0][0]
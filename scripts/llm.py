@@ -5,44 +5,45 @@ Sends daily work logs to local LLM for processing into standup reports
 """
 
 import requests
-import yaml
 import json
-from pathlib import Path
 from datetime import datetime
+from config_service import get_config_service
+from profiling import span
+from standup import render_standup
 
 def get_llm_config():
     """Load LLM configuration from context.yml"""
-    try:
-        context_file = Path(__file__).parent.parent / 'context.yml'
-        if context_file.exists():
-            with open(context_file, 'r') as f:
-                data = yaml.safe_load(f) or {}
-                return data.get('local_llm', {})
-    except Exception as e:
-        print(f"Error loading LLM config: {e}")
-    
-    return {}
+    return dict(get_config_service().section('local_llm'))
+
+def process_worklog_with_llm(worklog_text, github_data=None, prerendered=False):
+    """Send worklog to LLM and return processed standup report
 
-def process_worklog_with_llm(worklog_text):
-    """Send worklog to LLM and return processed standup report"""
+    With `input: standup` in local_llm the template report, grouped and with
+    issue links from github_data, is sent instead of the raw log. Pass
+    prerendered=True when worklog_text already is such a report.
+    """
     config = get_llm_config()
     
     if not config.get('enabled', False):
         return "LLM processing is disabled in context.yml"
     
+    if config.get('input') == 'standup' and not prerendered:
+        worklog_text = render_standup(worklog_text, 'markdown', github_data)
+    
     api_url = config.get('api', 'http://localhost:11434/api/generate')
     model = config.get('model', 'llama3:8b')
     prompt = config.get('prompt', 'Convert these work logs into a daily standup report. Only return the report:')
     chunk_size = config.get('chunk_size', 4000)
     
-    # Prepare the full prompt
-    full_prompt = f"{prompt}\n\nWork logs:\n{worklog_text}"
-    
-    # Chunk the text if it's too long
-    if len(full_prompt) > chunk_size:
-        # Take the most recent entries (end of the log)
-        truncated_logs = worklog_text[-chunk_size + len(prompt) - 100:]
-        full_prompt = f"{prompt}\n\nWork logs (most recent):\n{truncated_logs}"
+    with span('llm.prompt'):
+        # Prepare the full prompt
+        full_prompt = f"{prompt}\n\nWork logs:\n{worklog_text}"
+        
+        # Chunk the text if it's too long
+        if len(full_prompt) > chunk_size:
+            # Take the most recent entries (end of the log)
+            truncated_logs = worklog_text[-chunk_size + len(prompt) - 100:]
+            full_prompt = f"{prompt}\n\nWork logs (most recent):\n{truncated_logs}"
     
     # Prepare request payload for Ollama API
     payload = {
@@ -52,10 +53,12 @@ def process_worklog_with_llm(worklog_text):
     }
     
     try:
-        response = requests.post(api_url, json=payload, timeout=30)
-        response.raise_for_status()
+        with span('llm.request', model=model, prompt_chars=len(full_prompt)):
+            response = requests.post(api_url, json=payload, timeout=30)
+            response.raise_for_status()
         
-        result = response.json()
+        with span('llm.decode'):
+            result = response.json()
         return result.get('response', 'No response from LLM')
         
     except requests.exceptions.ConnectionError:
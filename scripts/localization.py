@@ -4,8 +4,8 @@ Simple localization system for Reporter app
 Supports English, Thai, and Chinese UI translations
 """
 
-import yaml
-from pathlib import Path
+from yaml_io import load_yaml, dump_yaml
+from config_service import get_config_service
 
 # Translation dictionaries
 TRANSLATIONS = {
@@ -23,6 +23,7 @@ TRANSLATIONS = {
         # Work Log Panel
         'todays_work_log': "Today's Work Log:",
         'copy_to_clipboard': 'Copy to Clipboard',
+        'copy_standup': 'Copy Standup',
         'generate_llm_report': 'Generate LLM Report',
         
         # LLM Panel
@@ -33,11 +34,46 @@ TRANSLATIONS = {
         # Buttons
         'refresh_github_data': 'Refresh GitHub Data',
         'open_context_yml': 'Open context.yml',
+        'open_data_directory': 'Open Data Directory',
+        'copy_data_path': 'Copy Data Path',
+        'quick_entry': 'Quick Entry',
+        'open_dashboard': 'Open Dashboard',
+        'quit': 'Quit',
+        'commit_suggestions': 'Suggested from commits',
+        'log_suggestion': 'Log',
+        'dismiss_suggestion': 'Dismiss',
+        'linked_issue': 'Will be linked to',
+        'edit_entry': 'Edit entry',
+        'delete_entry': 'Delete entry',
+        'entry_text': 'Entry:',
+        'confirm_delete_entry': 'Delete this entry?\n{entry}',
+        
+        # GitHub Panel
+        'filter_github_items': 'Filter GitHub items...',
+        'tab_issues': 'Issues',
+        'tab_prs': 'PRs',
+        'tab_reviews': 'Reviews',
+        'sort_as_listed': 'As listed',
+        'sort_newest': 'Number (newest)',
+        'sort_oldest': 'Number (oldest)',
+        'sort_title': 'Title',
+        'no_github_data': 'No GitHub data available',
+        'tab_timeline': 'Timeline',
+        'no_activity': 'No activity yet',
+        'tab_history': 'History',
+        'today': 'Today',
+        'nothing_logged': 'Nothing logged on this day',
+        'search_history': 'Search all work logs...',
+        'searching': 'Searching...',
+        'no_search_results': 'No entries found',
+        'search_by_meaning': 'By meaning',
+        'embeddings_unavailable': 'Cannot reach the local embeddings server',
         
         # Messages
         'copied': 'Copied',
         'work_log_copied': 'Work log copied to clipboard!',
         'llm_report_copied': 'LLM report copied to clipboard!',
+        'standup_copied': 'Standup report copied to clipboard!',
         'success': 'Success',
         'github_data_refreshed': 'GitHub data refreshed successfully!',
         'error': 'Error',
@@ -46,6 +82,16 @@ TRANSLATIONS = {
         'no_data': 'No Data',
         'no_worklog_entries': 'No work log entries to process.',
         'processing_llm': '🤖 Processing work log with LLM... This may take a moment...',
+        'failed_to_save_entry': 'Failed to save entry.',
+        'error_refreshing_github': 'Error refreshing GitHub data: {error}',
+        'llm_disabled': 'LLM Disabled',
+        'llm_disabled_message': 'LLM functionality is disabled in context.yml',
+        'llm_module_unavailable': 'LLM module not available: {error}',
+        'error_generating_llm_report': 'Error generating LLM report: {error}',
+        'not_found': 'Not found',
+        'context_yml_not_found': 'context.yml not found.',
+        'could_not_open_directory': 'Could not open directory.',
+        'data_path_copied': 'Data directory path copied to clipboard:\n{path}',
         
         # Language Selection
         'language': 'Language',
@@ -66,6 +112,7 @@ TRANSLATIONS = {
         # Work Log Panel
         'todays_work_log': 'บันทึกงานวันนี้:',
         'copy_to_clipboard': 'คัดลอกไปยังคลิปบอร์ด',
+        'copy_standup': 'คัดลอกสแตนด์อัพ',
         'generate_llm_report': 'สร้างรายงาน LLM',
         
         # LLM Panel
@@ -76,11 +123,46 @@ TRANSLATIONS = {
         # Buttons
         'refresh_github_data': 'รีเฟรชข้อมูล GitHub',
         'open_context_yml': 'เปิด context.yml',
+        'open_data_directory': 'เปิดโฟลเดอร์ข้อมูล',
+        'copy_data_path': 'คัดลอกที่อยู่ข้อมูล',
+        'quick_entry': 'บันทึกด่วน',
+        'open_dashboard': 'เปิดแดชบอร์ด',
+        'quit': 'ออก',
+        'commit_suggestions': 'คำแนะนำจากคอมมิต',
+        'log_suggestion': 'บันทึก',
+        'dismiss_suggestion': 'ละเว้น',
+        'linked_issue': 'จะเชื่อมโยงกับ',
+        'edit_entry': 'แก้ไขรายการ',
+        'delete_entry': 'ลบรายการ',
+        'entry_text': 'รายการ:',
+        'confirm_delete_entry': 'ลบรายการนี้?\n{entry}',
+        
+        # GitHub Panel
+        'filter_github_items': 'กรองรายการ GitHub...',
+        'tab_issues': 'Issues',
+        'tab_prs': 'PRs',
+        'tab_reviews': 'รีวิว',
+        'sort_as_listed': 'ตามลำดับเดิม',
+        'sort_newest': 'หมายเลข (ใหม่สุด)',
+        'sort_oldest': 'หมายเลข (เก่าสุด)',
+        'sort_title': 'ชื่อเรื่อง',
+        'no_github_data': 'ไม่มีข้อมูล GitHub',
+        'tab_timeline': 'ไทม์ไลน์',
+        'no_activity': 'ยังไม่มีกิจกรรม',
+        'tab_history': 'ประวัติ',
+        'today': 'วันนี้',
+        'nothing_logged': 'ไม่มีบันทึกในวันนี้',
+        'search_history': 'ค้นหาบันทึกงานทั้งหมด...',
+        'searching': 'กำลังค้นหา...',
+        'no_search_results': 'ไม่พบรายการ',
+        'search_by_meaning': 'ตามความหมาย',
+        'embeddings_unavailable': 'ไม่สามารถเชื่อมต่อเซิร์ฟเวอร์ embeddings ในเครื่อง',
         
         # Messages
         'copied': 'คัดลอกแล้ว',
         'work_log_copied': 'คัดลอกบันทึกงานไปยังคลิปบอร์ดแล้ว!',
         'llm_report_copied': 'คัดลอกรายงาน LLM ไปยังคลิปบอร์ดแล้ว!',
+        'standup_copied': 'คัดลอกรายงานสแตนด์อัพไปยังคลิปบอร์ดแล้ว!',
         'success': 'สำเร็จ',
         'github_data_refreshed': 'รีเฟรชข้อมูล GitHub สำเร็จแล้ว!',
         'error': 'ข้อผิดพลาด',
@@ -89,6 +171,16 @@ TRANSLATIONS = {
         'no_data': 'ไม่มีข้อมูล',
         'no_worklog_entries': 'ไม่มีบันทึกงานให้ประมวลผล',
         'processing_llm': '🤖 กำลังประมวลผลบันทึกงานด้วย LLM... กรุณารอสักครู่...',
+        'failed_to_save_entry': 'บันทึกไม่สำเร็จ',
+        'error_refreshing_github': 'รีเฟรชข้อมูล GitHub ไม่สำเร็จ: {error}',
+        'llm_disabled': 'ปิดใช้งาน LLM',
+        'llm_disabled_message': 'LLM ถูกปิดใช้งานใน context.yml',
+        'llm_module_unavailable': 'ไม่พบโมดูล LLM: {error}',
+        'error_generating_llm_report': 'สร้างรายงาน LLM ไม่สำเร็จ: {error}',
+        'not_found': 'ไม่พบ',
+        'context_yml_not_found': 'ไม่พบ context.yml',
+        'could_not_open_directory': 'ไม่สามารถเปิดโฟลเดอร์ได้',
+        'data_path_copied': 'คัดลอกที่อยู่โฟลเดอร์ข้อมูลไปยังคลิปบอร์ดแล้ว:\n{path}',
         
         # Language Selection
         'language': 'ภาษา',
@@ -109,6 +201,7 @@ TRANSLATIONS = {
         # Work Log Panel
         'todays_work_log': '今日工作日志:',
         'copy_to_clipboard': '复制到剪贴板',
+        'copy_standup': '复制站会报告',
         'generate_llm_report': '生成 LLM 报告',
         
         # LLM Panel
@@ -119,11 +212,46 @@ TRANSLATIONS = {
         # Buttons
         'refresh_github_data': '刷新 GitHub 数据',
         'open_context_yml': '打开 context.yml',
+        'open_data_directory': '打开数据目录',
+        'copy_data_path': '复制数据路径',
+        'quick_entry': '快速记录',
+        'open_dashboard': '打开主窗口',
+        'quit': '退出',
+        'commit_suggestions': '来自提交的建议',
+        'log_suggestion': '记录',
+        'dismiss_suggestion': '忽略',
+        'linked_issue': '将关联到',
+        'edit_entry': '编辑条目',
+        'delete_entry': '删除条目',
+        'entry_text': '条目:',
+        'confirm_delete_entry': '删除此条目?\n{entry}',
+        
+        # GitHub Panel
+        'filter_github_items': '筛选 GitHub 条目...',
+        'tab_issues': 'Issues',
+        'tab_prs': 'PRs',
+        'tab_reviews': '评审',
+        'sort_as_listed': '原始顺序',
+        'sort_newest': '编号 (最新)',
+        'sort_oldest': '编号 (最早)',
+        'sort_title': '标题',
+        'no_github_data': '没有 GitHub 数据',
+        'tab_timeline': '时间线',
+        'no_activity': '暂无活动',
+        'tab_history': '历史',
+        'today': '今天',
+        'nothing_logged': '这一天没有记录',
+        'search_history': '搜索所有工作日志...',
+        'searching': '正在搜索...',
+        'no_search_results': '未找到条目',
+        'search_by_meaning': '按含义',
+        'embeddings_unavailable': '无法连接本地嵌入服务器',
         
         # Messages
         'copied': '已复制',
         'work_log_copied': '工作日志已复制到剪贴板!',
         'llm_report_copied': 'LLM 报告已复制到剪贴板!',
+        'standup_copied': '站会报告已复制到剪贴板!',
         'success': '成功',
         'github_data_refreshed': 'GitHub 数据刷新成功!',
         'error': '错误',
@@ -132,6 +260,16 @@ TRANSLATIONS = {
         'no_data': '无数据',
         'no_worklog_entries': '没有工作日志可处理',
         'processing_llm': '🤖 正在用 LLM 处理工作日志... 请稍候...',
+        'failed_to_save_entry': '保存记录失败',
+        'error_refreshing_github': '刷新 GitHub 数据出错: {error}',
+        'llm_disabled': 'LLM 已禁用',
+        'llm_disabled_message': 'LLM 功能已在 context.yml 中禁用',
+        'llm_module_unavailable': 'LLM 模块不可用: {error}',
+        'error_generating_llm_report': '生成 LLM 报告出错: {error}',
+        'not_found': '未找到',
+        'context_yml_not_found': '未找到 context.yml',
+        'could_not_open_directory': '无法打开目录',
+        'data_path_copied': '数据目录路径已复制到剪贴板:\n{path}',
         
         # Language Selection
         'language': '语言',
@@ -139,65 +277,101 @@ TRANSLATIONS = {
     }
 }
 
+# Active language, resolved from context.yml on first use
+_active_language = None
+_watching_config = False
+
+# Flat per-language lookup tables with the English fallback merged in
+_catalogs = {}
+
 def get_language_from_config():
     """Get current language from context.yml"""
-    try:
-        context_file = Path(__file__).parent.parent / 'context.yml'
-        if context_file.exists():
-            with open(context_file, 'r') as f:
-                data = yaml.safe_load(f) or {}
-                ui_config = data.get('ui', {})
-                return ui_config.get('language', 'en')
-    except Exception as e:
-        print(f"Error loading language config: {e}")
-    return 'en'
+    return get_config_service().section('ui').get('language', 'en')
 
 def get_available_languages():
     """Get available languages from context.yml"""
-    try:
-        context_file = Path(__file__).parent.parent / 'context.yml'
-        if context_file.exists():
-            with open(context_file, 'r') as f:
-                data = yaml.safe_load(f) or {}
-                ui_config = data.get('ui', {})
-                return ui_config.get('available_languages', {'en': 'English'})
-    except Exception as e:
-        print(f"Error loading available languages: {e}")
-    return {'en': 'English'}
+    return get_config_service().section('ui').get('available_languages', {'en': 'English'})
 
 def set_language(language_code):
     """Set language in context.yml"""
     try:
-        context_file = Path(__file__).parent.parent / 'context.yml'
-        if context_file.exists():
-            with open(context_file, 'r') as f:
-                data = yaml.safe_load(f) or {}
+        config = get_config_service()
+        context_file = config.path
+        if context_file is not None:
+            data = load_yaml(context_file, {})
             
             if 'ui' not in data:
                 data['ui'] = {}
             data['ui']['language'] = language_code
             
-            with open(context_file, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            dump_yaml(data, context_file)
+            config.reload()
+            set_active_language(language_code)
             return True
     except Exception as e:
         print(f"Error setting language: {e}")
     return False
 
+def get_active_language():
+    """Current UI language, read from context.yml only once"""
+    global _active_language, _watching_config
+    if _active_language is None:
+        if not _watching_config:
+            # Pick up hand edits of ui.language
+            get_config_service().add_listener(invalidate_language_cache)
+            _watching_config = True
+        _active_language = get_language_from_config()
+    return _active_language
+
+def set_active_language(language_code):
+    """Switch the language used by tr() without touching context.yml"""
+    global _active_language
+    _active_language = language_code
+
+def invalidate_language_cache(config=None):
+    """Forget the active language so the next tr() reads context.yml again"""
+    global _active_language
+    _active_language = None
+
+def get_catalog(language):
+    """Lookup table for a language with English fallbacks merged in, built on first use"""
+    catalog = _catalogs.get(language)
+    if catalog is None:
+        catalog = dict(TRANSLATIONS['en'])
+        catalog.update(TRANSLATIONS.get(language, {}))
+        _catalogs[language] = catalog
+    return catalog
+
 def tr(key, language=None):
     """Translate a key to the current or specified language"""
-    if language is None:
-        language = get_language_from_config()
-    
-    if language in TRANSLATIONS and key in TRANSLATIONS[language]:
-        return TRANSLATIONS[language][key]
-    
-    # Fallback to English
-    if key in TRANSLATIONS['en']:
-        return TRANSLATIONS['en'][key]
-    
-    # Fallback to key itself
-    return key
+    # Falls back to English, then to the key itself
+    return get_catalog(language or get_active_language()).get(key, key)
+
+class TranslationRegistry:
+    """Translation keys bound to widget setters so a language switch relabels in place"""
+
+    def __init__(self):
+        self._bindings = []
+
+    def bind(self, key, setter):
+        """Call setter(tr(key)) now and again on every retranslate()"""
+        setter(tr(key))
+        self._bindings.append((key, setter))
+
+    def retranslate(self):
+        """Re-apply every binding in the active language"""
+        live = []
+        for key, setter in self._bindings:
+            try:
+                setter(tr(key))
+            except RuntimeError:
+                # The underlying Qt widget has been deleted
+                continue
+            live.append((key, setter))
+        self._bindings = live
+
+    def __len__(self):
+        return len(self._bindings)
 
 # Convenience function for common usage
 def _(key):
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Timing spans for Reporter app
+Hot paths are wrapped in `with span('worklog.save'):`. With REPORTER_TRACE=1
+every span is appended as one JSON line to ~/.reporter/trace.jsonl (rotated
+when it gets large); with REPORTER_PROFILE=worklog.save (comma-separated names)
+those spans also run under cProfile and the stats are saved next to the trace.
+When both are off a span is a shared no-op object, so the cost is one call.
+
+`python3 main.py --trace-summary` prints per-operation p50/p95 from the trace.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import threading
+from datetime import datetime
+from pathlib import Path
+
+TRACE_ENV = 'REPORTER_TRACE'
+PROFILE_ENV = 'REPORTER_PROFILE'
+
+TRACE_NAME = 'trace.jsonl'
+PROFILE_DIR_NAME = 'profiles'
+
+# Rotate the trace at this size, keeping this many old files (trace.jsonl.1 is the newest)
+MAX_TRACE_BYTES = 1024 * 1024
+TRACE_BACKUPS = 3
+
+_enabled = os.environ.get(TRACE_ENV, '') not in ('', '0')
+_profiled = frozenset(name.strip() for name in os.environ.get(PROFILE_ENV, '').split(',') if name.strip())
+_trace_file = None
+_write_lock = threading.Lock()
+_profiling = threading.Lock()
+
+def trace_path():
+    """JSONL file spans are written to"""
+    if _trace_file:
+        return Path(_trace_file)
+    # worklog_io records spans, so it is imported here rather than at the top
+    from worklog_io import get_data_dir
+    return get_data_dir() / TRACE_NAME
+
+def enable(trace_file=None):
+    """Record spans, to trace_file or the default trace in the data directory"""
+    global _enabled, _trace_file
+    _enabled = True
+    _trace_file = trace_file
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    return _enabled
+
+def set_profiled(names):
+    """Span names to run under cProfile, like REPORTER_PROFILE"""
+    global _profiled
+    _profiled = frozenset(names)
+
+class _NullSpan:
+    """Stands in for a span when tracing is off"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **fields):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    """Times a block of work and records it when the block ends"""
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.profiler = None
+
+    def set(self, **fields):
+        """Attach extra fields, e.g. item counts only known at the end"""
+        self.fields.update(fields)
+
+    def __enter__(self):
+        # Only one cProfile can run at a time, nested or concurrent spans are just timed
+        if self.name in _profiled and _profiling.acquire(blocking=False):
+            import cProfile
+            self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+            except ValueError:
+                # Another profiler or debugger is already active
+                self.profiler = None
+                _profiling.release()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        if self.profiler is not None:
+            self.profiler.disable()
+            _profiling.release()
+            save_profile(self.name, self.profiler)
+        if _enabled:
+            record = {'ts': round(time.time(), 3), 'op': self.name, 'ms': round(elapsed, 3),
+                      'thread': threading.current_thread().name}
+            record.update(self.fields)
+            if exc_type is not None:
+                record['error'] = exc_type.__name__
+            write_record(record)
+        return False
+
+def span(name, **fields):
+    """Context manager timing a named operation; a shared no-op when tracing is off"""
+    if not _enabled and name not in _profiled:
+        return _NULL_SPAN
+    return Span(name, fields)
+
+def rotate(path):
+    """trace.jsonl -> trace.jsonl.1 -> ... -> trace.jsonl.N, dropping the oldest"""
+    for index in range(TRACE_BACKUPS - 1, 0, -1):
+        older = path.with_name(f'{path.name}.{index}')
+        if older.exists():
+            os.replace(older, path.with_name(f'{path.name}.{index + 1}'))
+    os.replace(path, path.with_name(f'{path.name}.1'))
+
+def write_record(record):
+    try:
+        path = trace_path()
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with _write_lock:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                size = f.tell()
+            if size > MAX_TRACE_BYTES:
+                rotate(path)
+    except Exception as e:
+        print(f"Error writing trace: {e}")
+
+def save_profile(name, profiler):
+    """Save cProfile stats for a span and print the top functions to stderr"""
+    try:
+        import pstats
+        profile_dir = trace_path().parent / PROFILE_DIR_NAME
+        profile_dir.mkdir(exist_ok=True)
+        stats_file = profile_dir / f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.prof"
+        profiler.dump_stats(str(stats_file))
+        print(f"Profile of {name} saved to {stats_file}", file=sys.stderr)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(15)
+    except Exception as e:
+        print(f"Error saving profile for {name}: {e}")
+
+def read_records(path=None):
+    """Spans from the trace and its rotated files, oldest first"""
+    path = Path(path) if path else trace_path()
+    files = [path.with_name(f'{path.name}.{index}') for index in range(TRACE_BACKUPS, 0, -1)] + [path]
+    for trace_file in files:
+        try:
+            with open(trace_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # Line cut short by a crash
+                        continue
+        except FileNotFoundError:
+            continue
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+def summarize(records):
+    """{op: {'count', 'p50', 'p95', 'max'}} in milliseconds"""
+    durations = {}
+    for record in records:
+        if 'op' in record and 'ms' in record:
+            durations.setdefault(record['op'], []).append(record['ms'])
+    summary = {}
+    for op, values in durations.items():
+        values.sort()
+        summary[op] = {'count': len(values), 'p50': percentile(values, 0.5),
+                       'p95': percentile(values, 0.95), 'max': values[-1]}
+    return summary
+
+def format_summary(summary):
+    if not summary:
+        return f"No spans recorded yet, run the app with {TRACE_ENV}=1"
+    lines = [f"{'operation':<24} {'count':>7} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}"]
+    for op, stats in sorted(summary.items(), key=lambda item: item[1]['p95'], reverse=True):
+        lines.append(f"{op:<24} {stats['count']:>7} {stats['p50']:>10.2f} {stats['p95']:>10.2f} {stats['max']:>10.2f}")
+    return "\n".join(lines)
+
+def print_summary(path=None):
+    print(format_summary(summarize(read_records(path))))
+
+if __name__ == '__main__':
+    print_summary(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Search the work log history by meaning rather than by words
+Entries are embedded by the local Ollama embeddings endpoint of the local_llm
+block in context.yml, so "auth bug" also finds "fix login redirect". Nothing
+leaves the computer.
+
+Vectors are kept normalised in a float32 matrix on disk next to the work
+logs, one row per entry, with the entry of each row in a JSON lines file
+beside it. Both files are only appended to: a refresh embeds entries that
+have no row yet, a batch at a time, and rows of edited or deleted entries
+are skipped until a fifth of the matrix is stale and it is rewritten. A query
+is one matrix-vector product and a partial sort, tens of ms over 50k entries.
+
+context.yml:
+    local_llm:
+      embed_model: nomic-embed-text              # default
+      embed_api: http://localhost:11434/api/embed   # default: next to `api`
+
+numpy is optional; without it semantic search is unavailable and the history
+browser only offers keyword search.
+"""
+
+import json
+import threading
+import requests
+from pathlib import Path
+from config_service import get_config_service
+from history_search import HistoryIndex
+from profiling import span
+from worklog_io import get_data_dir
+from yaml_io import atomic_write
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+VECTORS_NAME = 'semantic_index.f32'
+KEYS_NAME = 'semantic_index.jsonl'
+DEFAULT_EMBED_MODEL = 'nomic-embed-text'
+
+# Entries sent to the embeddings endpoint per request
+EMBED_BATCH = 64
+TOP_K = 20
+
+# Share of stale rows at which the matrix is rewritten without them
+COMPACT_RATIO = 0.2
+
+def available():
+    return np is not None
+
+def embedding_config(config=None):
+    """(endpoint, model) for embeddings from local_llm in context.yml"""
+    if config is None:
+        config = get_config_service().section('local_llm')
+    api = config.get('embed_api')
+    if not api:
+        # Ollama serves /api/embed next to /api/generate
+        generate = config.get('api', 'http://localhost:11434/api/generate')
+        api = generate.rsplit('/api/', 1)[0] + '/api/embed'
+    return api, config.get('embed_model', DEFAULT_EMBED_MODEL)
+
+def embed_texts(texts, api, model, timeout=60):
+    """Embedding vectors of texts from an Ollama /api/embed endpoint, in order"""
+    with span('semantic.embed', count=len(texts)):
+        response = requests.post(api, json={'model': model, 'input': list(texts)}, timeout=timeout)
+        response.raise_for_status()
+        embeddings = response.json().get('embeddings') or []
+    if len(embeddings) != len(texts):
+        raise ValueError(f"{api} returned {len(embeddings)} embeddings for {len(texts)} texts")
+    return embeddings
+
+def entry_key(day, entry):
+    return (day.isoformat(), entry['time'], entry['organization'], entry['issue'], entry['text'])
+
+def embedding_text(entry):
+    return ' '.join(part for part in (entry['organization'], entry['issue'], entry['text']) if part)
+
+def normalised(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+class SemanticIndex:
+    """Embeddings of every work log entry, searchable by cosine similarity"""
+
+    def __init__(self, data_dir=None, history=None, api=None, model=None, batch_size=EMBED_BATCH):
+        if np is None:
+            raise RuntimeError("Semantic search needs numpy: pip install numpy")
+        self.data_dir = Path(data_dir or get_data_dir())
+        self.history = history or HistoryIndex(self.data_dir)
+        self.api = api
+        self.model = model
+        self.batch_size = batch_size
+        self.vectors_path = self.data_dir / VECTORS_NAME
+        self.keys_path = self.data_dir / KEYS_NAME
+        self._keys = []  # key of each row
+        self._rows = {}  # key -> row
+        self._matrix = None  # (rows, dim) float32, rows normalised
+        self._dim = None
+        self._stored_model = None
+        self._entries = {}  # key -> (day, entry) of rows still in the work logs
+        self._live = None  # bool per row, False for rows of edited or deleted entries
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def endpoint(self):
+        api, model = embedding_config()
+        return self.api or api, self.model or model
+
+    def _load(self, model):
+        """Read the stored matrix, dropping it if it was made by another model"""
+        self._loaded = True
+        keys = []
+        try:
+            with open(self.keys_path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or '{}')
+                if header.get('model') == model:
+                    keys = [tuple(json.loads(line)) for line in f if line.strip()]
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Error reading {self.keys_path.name}, embedding entries again: {e}")
+            header = {}
+        if not keys:
+            self._reset(model)
+            return
+        dim = header['dim']
+        try:
+            vectors = np.fromfile(self.vectors_path, dtype=np.float32)
+        except OSError:
+            vectors = np.empty(0, dtype=np.float32)
+        rows = min(len(keys), vectors.size // dim)
+        self._stored_model, self._dim = model, dim
+        self._keys = keys[:rows]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._matrix = vectors[:rows * dim].reshape(rows, dim)
+        if rows != len(keys) or vectors.size != rows * dim:
+            # Interrupted while appending: keep the rows both files have
+            self._rewrite(np.ones(rows, dtype=bool))
+
+    def _reset(self, model):
+        self._stored_model, self._dim = model, None
+        self._keys, self._rows, self._matrix = [], {}, None
+        for path in (self.vectors_path, self.keys_path):
+            path.unlink(missing_ok=True)
+
+    def _rewrite(self, keep):
+        """Rewrite both files with only the rows in keep"""
+        with span('semantic.compact', rows=int(keep.sum()), dropped=int((~keep).sum())):
+            self._matrix = np.ascontiguousarray(self._matrix[keep])
+            self._keys = [key for key, kept in zip(self._keys, keep) if kept]
+            self._rows = {key: row for row, key in enumerate(self._keys)}
+            atomic_write(self.vectors_path, self._matrix.tobytes())
+            header = json.dumps({'model': self._stored_model, 'dim': self._dim})
+            atomic_write(self.keys_path, ''.join([header + '\n'] + [json.dumps(key) + '\n' for key in self._keys]))
+
+    def _append(self, keys, vectors):
+        if self._dim is None:
+            self._dim = vectors.shape[1]
+            atomic_write(self.keys_path, json.dumps({'model': self._stored_model, 'dim': self._dim}) + '\n')
+            atomic_write(self.vectors_path, b'')
+        elif vectors.shape[1] != self._dim:
+            raise ValueError(f"Embeddings of {vectors.shape[1]} dimensions, the index has {self._dim}")
+        # Vectors first: rows without a key are dropped on load
+        with open(self.vectors_path, 'ab') as f:
+            f.write(vectors.tobytes())
+        with open(self.keys_path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(key) + '\n' for key in keys))
+        first = len(self._keys)
+        self._keys.extend(keys)
+        self._rows.update((key, first + offset) for offset, key in enumerate(keys))
+
+    def refresh(self, cancelled=None):
+        """Embed entries that have no row yet, returns how many were embedded
+
+        Each batch is written to disk as soon as it is embedded, so a refresh
+        that is cancelled or fails part way keeps what it did.
+        """
+        api, model = self.endpoint()
+        with self._lock, span('semantic.refresh') as timing:
+            if not self._loaded or model != self._stored_model:
+                self._load(model)
+            self.history.refresh()
+            entries = {}
+            for day, entry in self.history.entries():
+                entries.setdefault(entry_key(day, entry), (day, entry))
+            stale = sum(1 for key in self._keys if key not in entries)
+            if self._keys and stale / len(self._keys) >= COMPACT_RATIO:
+                self._rewrite(np.array([key in entries for key in self._keys], dtype=bool))
+            missing = [key for key in entries if key not in self._rows]
+            embedded = []
+            try:
+                for start in range(0, len(missing), self.batch_size):
+                    if cancelled is not None and cancelled():
+                        break
+                    keys = missing[start:start + self.batch_size]
+                    vectors = normalised(embed_texts([embedding_text(entries[key][1]) for key in keys], api, model))
+                    self._append(keys, vectors)
+                    embedded.append(vectors)
+            finally:
+                if embedded:
+                    new = np.concatenate(embedded)
+                    self._matrix = new if self._matrix is None or not len(self._matrix) else \
+                        np.concatenate([self._matrix, new])
+                self._entries = {key: entries[key] for key in entries if key in self._rows}
+                self._live = np.fromiter((key in entries for key in self._keys), dtype=bool, count=len(self._keys))
+            count = sum(len(vectors) for vectors in embedded)
+            timing.set(embedded=count, rows=len(self._keys))
+        return count
+
+    def search(self, query, k=TOP_K):
+        """[(day, entry)] of the k entries closest in meaning to query, closest first"""
+        query = query.strip()
+        if not query:
+            return []
+        api, model = self.endpoint()
+        vector = normalised(embed_texts([query], api, model))[0]
+        with self._lock, span('semantic.search', rows=len(self._keys)):
+            if self._matrix is None or not len(self._entries):
+                return []
+            if vector.shape[0] != self._matrix.shape[1]:
+                raise ValueError(f"Query embedding of {vector.shape[0]} dimensions, the index has {self._dim}")
+            scores = self._matrix @ vector
+            scores[~self._live] = -np.inf
+            k = min(k, len(self._entries))
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best])]
+            return [self._entries[self._keys[row]] for row in best]
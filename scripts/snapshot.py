@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Warm-start snapshot of the dashboard state for Reporter app
+The last rendered state (parsed context.yml, GitHub items, the Issue/PR combo
+entries and search index, and today's log) is pickled into the data directory. On the next launch
+each section is used only if the file it came from is unchanged, so the UI can be
+painted without re-parsing context.yml or github_data.yml. Sections are pickled
+separately so the large ones are only unpickled when the stage that shows them runs.
+"""
+
+import pickle
+from pathlib import Path
+from yaml_io import atomic_write
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_NAME = 'dashboard.snapshot'
+
+# Bytes before the saved log offset that must still match for the log to count as appended to
+LOG_TAIL_BYTES = 64
+
+def file_stamp(path):
+    """(mtime_ns, size) of a file, or None if it doesn't exist"""
+    if path is None:
+        return None
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def read_appended(path, offset, tail):
+    """Bytes appended to a file after offset, or None if the part before offset changed"""
+    try:
+        with open(path, 'rb') as f:
+            size = f.seek(0, 2)
+            if size < offset:
+                return None
+            f.seek(offset - len(tail))
+            if f.read(len(tail)) != tail:
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+def save_snapshot(snapshot_file, sections, log_path=None):
+    """Write {name: (source_path, value)} sections plus the raw log contents"""
+    try:
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'sections': {
+                name: (str(source) if source else None, file_stamp(source),
+                       pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+                for name, (source, value) in sections.items()
+            },
+            'log': None,
+        }
+        if log_path is not None and Path(log_path).exists():
+            data['log'] = (str(log_path), Path(log_path).read_bytes())
+        atomic_write(snapshot_file, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        return True
+    except Exception as e:
+        print(f"Error saving snapshot: {e}")
+        return False
+
+class Snapshot:
+    """Previously saved dashboard state, handing out only sections that are still valid"""
+
+    def __init__(self, data):
+        self.sections = data.get('sections', {})
+        self.log = data.get('log')
+
+    def get(self, name, source):
+        """Saved value for a section, or None if its source file has changed since"""
+        saved = self.sections.get(name)
+        if saved is None:
+            return None
+        saved_source, stamp, blob = saved
+        if saved_source != (str(source) if source else None) or stamp != file_stamp(source):
+            return None
+        try:
+            return pickle.loads(blob)
+        except Exception as e:
+            print(f"Ignoring unreadable snapshot section {name}: {e}")
+            return None
+
+    def log_bytes(self, log_path):
+        """Current contents of the log, reading only what was appended since the snapshot"""
+        if self.log is None or self.log[0] != str(log_path):
+            return None
+        raw = self.log[1]
+        appended = read_appended(log_path, len(raw), raw[-LOG_TAIL_BYTES:])
+        if appended is None:
+            return None
+        return raw + appended
+
+def load_snapshot(snapshot_file):
+    """Load a snapshot, or None if it is missing, unreadable or from another version"""
+    try:
+        with open(snapshot_file, 'rb') as f:
+            data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable snapshot: {e}")
+        return None
+    if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+        return None
+    return Snapshot(data)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Template standup reports for Reporter app
+Parses a day's work log, groups the entries by organization and issue, links
+issues to GitHub from github_data.yml and renders the result with a template,
+without the LLM. Rendering takes milliseconds and works when Ollama is down;
+the rendered report can also be sent to the LLM instead of the raw log.
+
+Templates can be changed, or new formats added, in context.yml:
+    standup:
+      format: google_chat
+      templates:
+        google_chat:
+          header: "*Daily update {date}*"
+        plain:
+          header: "Standup {date}"
+          issue_link: "- {issue} ({url})"
+"""
+
+import re
+from datetime import date
+from config_service import get_config_service
+from profiling import span
+from worklog_io import get_data_dir
+from worklog_edits import read_text
+
+# Work log line written by save_worklog_entry:
+# 2025-01-24 09:00 [Organization] [#126: add tests] - Entry text
+# Either bracket may be missing, the separating spaces are always written
+ENTRY_RE = re.compile(
+    r'^(?P<date>\d{4}-\d{2}-\d{2}) (?P<time>\d{2}:\d{2}) '
+    r'(?:\[(?P<organization>[^\]]*)\])? (?:\[(?P<issue>.*?)\])? - (?P<text>.*)$'
+)
+
+# '#126: add tests' from the Issue/PR combo, or '126# add tests' in older logs
+ISSUE_NUMBER_RE = re.compile(r'#(\d+)|(\d+)#')
+
+DEFAULT_FORMAT = 'markdown'
+
+# Fields: header/empty/footer {date} {count}; person {person} (team reports); organization {organization};
+# issue/issue_link {issue} {number} {url}; issue_entry/entry {text} {time}
+DEFAULT_TEMPLATES = {
+    'markdown': {
+        'header': '**Standup {date}**',
+        'person': '\n### {person}',
+        'organization': '\n**{organization}**',
+        'issue_link': '- [{issue}]({url})',
+        'issue': '- {issue}',
+        'issue_entry': '  - {text}',
+        'entry': '- {text}',
+        'footer': '',
+        'empty': 'No work logged on {date}',
+        'no_organization': 'General',
+    },
+    'google_chat': {
+        'header': '*Standup {date}*',
+        'person': '\n*— {person} —*',
+        'organization': '\n*{organization}*',
+        'issue_link': '• <{url}|{issue}>',
+        'issue': '• {issue}',
+        'issue_entry': '    ◦ {text}',
+        'entry': '• {text}',
+        'footer': '',
+        'empty': 'No work logged on {date}',
+        'no_organization': 'General',
+    },
+}
+
+def read_worklog(day=None):
+    """Work log text for a date (today by default) with edits applied, '' if nothing was logged"""
+    day = day or date.today()
+    return read_text(get_data_dir() / f'worklog_{day.isoformat()}.txt')
+
+def parse_line(line):
+    """{'date', 'time', 'organization', 'issue', 'text'} for an entry line, None for other lines"""
+    match = ENTRY_RE.match(line.strip())
+    if not match:
+        return None
+    entry = match.groupdict()
+    entry['organization'] = (entry['organization'] or '').strip()
+    entry['issue'] = (entry['issue'] or '').strip()
+    entry['text'] = entry['text'].strip()
+    return entry
+
+def parse_worklog(text):
+    """Entries of a work log, other lines are skipped"""
+    return [entry for entry in map(parse_line, text.splitlines()) if entry is not None]
+
+def issue_number(issue):
+    match = ISSUE_NUMBER_RE.search(issue)
+    return (match.group(1) or match.group(2)) if match else None
+
+def link_index(github_data):
+    """number -> [GitHubItem] from {kind: [GitHubItem, ...]}"""
+    index = {}
+    for items in (github_data or {}).values():
+        for item in items:
+            index.setdefault(item.number, []).append(item)
+    return index
+
+def resolve_url(issue, index):
+    """GitHub URL for an issue string, or None if it can't be told apart from other items"""
+    number = issue_number(issue)
+    candidates = [item for item in index.get(number, []) if item.url]
+    if len(candidates) > 1:
+        # Same number in several repositories, the title in the entry decides
+        candidates = [item for item in candidates if item.title and item.title in issue]
+    return candidates[0].url if len(candidates) == 1 else None
+
+def group_entries(entries, github_data=None):
+    """[(organization, [(issue, url, [entry, ...]), ...])] in the order they were first logged
+
+    Entries without an issue are grouped under issue ''. Repeated entries are kept once.
+    """
+    index = link_index(github_data)
+    organizations = {}
+    for entry in entries:
+        issues = organizations.setdefault(entry['organization'], {})
+        if entry['issue'] not in issues:
+            issues[entry['issue']] = (resolve_url(entry['issue'], index) if entry['issue'] else None, [])
+        logged = issues[entry['issue']][1]
+        if all(previous['text'] != entry['text'] for previous in logged):
+            logged.append(entry)
+    return [
+        (organization, [(issue, url, logged) for issue, (url, logged) in issues.items()])
+        for organization, issues in organizations.items()
+    ]
+
+def get_templates(fmt):
+    """Template for a format, with context.yml overrides on top of the built-in one"""
+    custom = (get_config_service().section('standup').get('templates') or {}).get(fmt) or {}
+    if fmt not in DEFAULT_TEMPLATES and not custom:
+        print(f"Unknown standup format '{fmt}', using {DEFAULT_FORMAT}")
+    templates = dict(DEFAULT_TEMPLATES.get(fmt, DEFAULT_TEMPLATES[DEFAULT_FORMAT]))
+    for key, value in custom.items():
+        if isinstance(value, str):
+            templates[key] = value
+        else:
+            print(f"Ignoring standup template {fmt}.{key}: expected text")
+    return templates
+
+def available_formats():
+    custom = get_config_service().section('standup').get('templates') or {}
+    return list(DEFAULT_TEMPLATES) + [fmt for fmt in custom if fmt not in DEFAULT_TEMPLATES]
+
+def fill(templates, fmt, key, **fields):
+    """One template line; a broken custom template falls back to the built-in one"""
+    try:
+        return templates[key].format(**fields)
+    except (KeyError, IndexError, ValueError) as e:
+        print(f"Error in standup template {fmt}.{key}: {e}")
+        default = DEFAULT_TEMPLATES.get(fmt, DEFAULT_TEMPLATES[DEFAULT_FORMAT])
+        return default[key].format(**fields)
+
+def configured_format():
+    return get_config_service().section('standup').get('format') or DEFAULT_FORMAT
+
+def render_body(entries, templates, fmt, github_data=None):
+    """Lines for entries grouped by organization and issue, without header and footer"""
+    lines = []
+    for organization, issues in group_entries(entries, github_data):
+        organization = organization or templates['no_organization']
+        lines.append(fill(templates, fmt, 'organization', organization=organization))
+        for issue, url, logged in issues:
+            if not issue:
+                lines.extend(fill(templates, fmt, 'entry', text=entry['text'], time=entry['time'])
+                             for entry in logged)
+                continue
+            key = 'issue_link' if url else 'issue'
+            lines.append(fill(templates, fmt, key, issue=issue, number=issue_number(issue) or '', url=url or ''))
+            lines.extend(fill(templates, fmt, 'issue_entry', text=entry['text'], time=entry['time'])
+                         for entry in logged)
+    return lines
+
+def render_standup(worklog_text, fmt=None, github_data=None, day=None):
+    """Render a work log as a standup report in a format such as 'markdown' or 'google_chat'
+
+    github_data is {kind: [GitHubItem, ...]} used to link issues.
+    """
+    with span('standup.render') as timing:
+        fmt = fmt or configured_format()
+        templates = get_templates(fmt)
+        entries = parse_worklog(worklog_text)
+        timing.set(entries=len(entries))
+        day = day or (entries[0]['date'] if entries else date.today().isoformat())
+        if not entries:
+            return fill(templates, fmt, 'empty', date=day, count=0)
+
+        lines = [fill(templates, fmt, 'header', date=day, count=len(entries))]
+        lines.extend(render_body(entries, templates, fmt, github_data))
+        lines.append(fill(templates, fmt, 'footer', date=day, count=len(entries)))
+        return '\n'.join(lines).strip()
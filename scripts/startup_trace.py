@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Startup tracing for Reporter app
+Records per-module import times and startup stage timings when turned on
+with `main.py --trace-startup`; every call is a no-op otherwise
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+
+# Reference point for all timings, as close to launch as main.py can get
+_launched = time.perf_counter()
+
+_enabled = False
+_finder = None
+
+# (name, start_ms, duration_ms or None for a point-in-time mark)
+_events = []
+
+# module -> (cumulative_ms, self_ms)
+_imports = {}
+_import_stack = []
+
+def since_launch():
+    """Milliseconds since this module was imported"""
+    return (time.perf_counter() - _launched) * 1000
+
+def _timed(method, name_of):
+    """Wrap a loader method so the time spent loading each module is recorded"""
+    def call_and_time(arg):
+        if not _enabled:
+            return method(arg)
+        start = time.perf_counter()
+        _import_stack.append(0.0)
+        try:
+            return method(arg)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            children = _import_stack.pop()
+            if _import_stack:
+                _import_stack[-1] += elapsed
+            # Extension modules do their work in create_module, others in exec_module
+            cumulative, own = _imports.get(name_of(arg), (0.0, 0.0))
+            _imports[name_of(arg)] = (cumulative + elapsed, own + elapsed - children)
+    call_and_time.startup_timed = True
+    return call_and_time
+
+class ImportTimer:
+    """Meta path finder that lets the real finders locate a module, then times its loader"""
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        # Built-in and frozen modules use class-level loaders, leave those alone
+        if loader is None or isinstance(loader, type) or not hasattr(loader, 'exec_module'):
+            return spec
+        if not getattr(loader.exec_module, 'startup_timed', False):
+            try:
+                loader.exec_module = _timed(loader.exec_module, lambda module: module.__name__)
+                if hasattr(loader, 'create_module'):
+                    loader.create_module = _timed(loader.create_module, lambda spec: spec.name)
+            except AttributeError:
+                pass
+        return spec
+
+def enable():
+    """Start recording imports and stages"""
+    global _enabled, _finder
+    _enabled = True
+    if _finder is None:
+        _finder = ImportTimer()
+        sys.meta_path.insert(0, _finder)
+
+def disable():
+    """Stop recording, keeping what was recorded so far"""
+    global _enabled, _finder
+    _enabled = False
+    if _finder is not None:
+        if _finder in sys.meta_path:
+            sys.meta_path.remove(_finder)
+        _finder = None
+
+def is_enabled():
+    return _enabled
+
+@contextmanager
+def stage(name):
+    """Time a block of startup work"""
+    if not _enabled:
+        yield
+        return
+    start = since_launch()
+    try:
+        yield
+    finally:
+        _events.append((name, start, since_launch() - start))
+
+def mark(name):
+    """Record a point in time, e.g. when the entry field first takes input"""
+    if _enabled:
+        _events.append((name, since_launch(), None))
+
+def format_report(limit=15):
+    """Slowest imports and the stage timeline as text"""
+    lines = ["Startup trace (ms since launch)", "  Slowest imports (self / cumulative):"]
+    slowest = sorted(_imports.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    for module, (cumulative, own) in slowest:
+        lines.append(f"    {own:8.1f} / {cumulative:8.1f}  {module}")
+    lines.append("  Stages:")
+    for name, start, duration in sorted(_events, key=lambda event: event[1]):
+        took = f"+{duration:7.1f}" if duration is not None else " " * 8
+        lines.append(f"    {start:8.1f} {took}  {name}")
+    return "\n".join(lines)
+
+def report(file=None):
+    """Print the trace to stderr"""
+    if _enabled:
+        print(format_report(), file=file or sys.stderr)
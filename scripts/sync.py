@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Multi-device sync of work log day files for Reporter app
+Keeps the worklog_YYYY-MM-DD.txt files of two data directories the same, e.g.
+a laptop and a desktop, through a shared folder (Dropbox, a network drive) or
+another Reporter serving its data directory on a socket.
+
+Day files are append-only, so for every file the size and a hash of its
+contents at the last sync are kept. A file whose size and mtime haven't moved
+on either side is skipped after one directory listing; otherwise only the
+bytes appended since the last sync are read and sent. Entries appended on
+both sides are merged in timestamp order, so both devices end up with the
+same file. No entry is ever dropped.
+
+Edits and deletions live in append-only worklog_YYYY-MM-DD.edits sidecars,
+which are synced the same way; their JSON lines start with the time they were
+made, so merged records stay in the order they were made.
+
+context.yml:
+    sync:
+      folder: ~/Dropbox/reporter    # or
+      peer: 127.0.0.1:8765          # another device running `main.py --cli sync --serve`
+      port: 8765                    # port used by --serve
+      secret: some-long-phrase      # shared by both devices, needed to serve beyond localhost
+
+A served directory can be rewritten by its peers, so `--serve` only listens
+on localhost unless a secret is set. Every connection must send the secret
+first; it is not encrypted, so use a network you trust or an SSH tunnel.
+"""
+
+import os
+import re
+import json
+import socket
+import hmac
+import hashlib
+import threading
+import socketserver
+from collections import Counter
+from pathlib import Path
+from config_service import get_config_service
+from yaml_io import atomic_write
+from profiling import span
+from worklog_io import get_data_dir, locked_append
+
+STATE_NAME = 'sync_state.json'
+# State key under which a serving device lists the files it served
+SERVED_KEY = 'served'
+DEFAULT_PORT = 8765
+
+# Only day files and their edits are synced; names coming from a peer are checked against this too
+WORKLOG_RE = re.compile(r'^worklog_\d{4}-\d{2}-\d{2}\.(?:txt|edits)$')
+PEER_RE = re.compile(r'^([\w.-]+):(\d+)$')
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost')
+
+def check_name(name):
+    if not WORKLOG_RE.match(str(name)):
+        raise ValueError(f"not a work log file: {name!r}")
+    return name
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+def read_state(state_file):
+    """{peer key: {name: state entry}} from a sync state file, {} if missing or unreadable"""
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if isinstance(state, dict):
+            return state
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable {Path(state_file).name}: {e}")
+    return {}
+
+def synced_names(data_dir):
+    """Names of the files in data_dir that were ever synced with or served to another device"""
+    state = read_state(Path(data_dir) / STATE_NAME)
+    return {name for files in state.values() if isinstance(files, dict) for name in files}
+
+def entry_key(line):
+    """Sort key putting entries in timestamp order, 'YYYY-MM-DD HH:MM' then the text"""
+    return line[:16], line
+
+def merge_lines(ours, theirs):
+    """Merge two runs of appended entries (bytes), None if ours already has all of theirs
+
+    Entries only one side has are kept once; when neither side has all the
+    other's entries the result is every entry in timestamp order.
+    """
+    ours_lines = ours.splitlines(keepends=True)
+    theirs_lines = theirs.splitlines(keepends=True)
+    # A last line still being written has no newline yet
+    ours_lines = [line if line.endswith(b'\n') else line + b'\n' for line in ours_lines]
+    theirs_lines = [line if line.endswith(b'\n') else line + b'\n' for line in theirs_lines]
+    ours_count, theirs_count = Counter(ours_lines), Counter(theirs_lines)
+    if not theirs_count - ours_count:
+        return None
+    if not ours_count - theirs_count:
+        return theirs
+    return b''.join(sorted((ours_count | theirs_count).elements(), key=entry_key))
+
+class FolderPeer:
+    """Work log files in a directory: the data directory itself or a shared folder"""
+
+    def __init__(self, path):
+        self.path = Path(path).expanduser()
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.lock = threading.Lock()
+
+    @property
+    def key(self):
+        return f"folder:{self.path.resolve()}"
+
+    def close(self):
+        pass
+
+    def files(self):
+        """{name: [size, mtime_ns]} of the work log files"""
+        try:
+            with os.scandir(self.path) as entries:
+                return {
+                    entry.name: [stat.st_size, stat.st_mtime_ns]
+                    for entry in entries if WORKLOG_RE.match(entry.name) and entry.is_file()
+                    for stat in [entry.stat()]
+                }
+        except FileNotFoundError:
+            return {}
+
+    def stat(self, name):
+        try:
+            stat = os.stat(self.path / check_name(name))
+        except FileNotFoundError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def read(self, name, start=0):
+        """Contents of a file from byte start, b'' if it doesn't exist"""
+        try:
+            with open(self.path / check_name(name), 'rb') as f:
+                f.seek(start)
+                data = f.read()
+        except FileNotFoundError:
+            return b''
+        self.bytes_read += len(data)
+        return data
+
+    def prefix_hash(self, name, size):
+        """Hash of the first size bytes, None if the file is shorter"""
+        try:
+            with open(self.path / check_name(name), 'rb') as f:
+                data = f.read(size)
+        except FileNotFoundError:
+            return None
+        return content_hash(data) if len(data) == size else None
+
+    def write_tail(self, name, offset, data, size):
+        """Replace everything after offset with data, if the file is still size bytes long"""
+        path = self.path / check_name(name)
+        self.path.mkdir(parents=True, exist_ok=True)
+        # The app appends under the same lock, so no entry lands between the check and the write
+        with self.lock, locked_append(path) as f:
+            current = os.fstat(f.fileno()).st_size
+            if current != size:
+                # Appended to since it was read, e.g. by the app; picked up on the next sync
+                raise RuntimeError(f"{name} changed during sync")
+            if offset == current:
+                # Appending never rewrites entries that are already there
+                f.write(data)
+            else:
+                with open(path, 'rb') as prefix_file:
+                    prefix = prefix_file.read(offset)
+                atomic_write(path, prefix + data)
+        self.bytes_written += len(data)
+
+class SocketPeer:
+    """Another device's data directory served by `main.py --cli sync --serve`"""
+
+    def __init__(self, host, port, timeout=10.0, secret=None):
+        self.host = host
+        self.port = int(port)
+        self.timeout = timeout
+        self.secret = secret
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.connection = None
+
+    @property
+    def key(self):
+        return f"socket:{self.host}:{self.port}"
+
+    def request(self, request):
+        """Send one JSON line and return the reply, reusing the connection"""
+        if self.connection is None:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            self.connection = (sock, sock.makefile('rb'))
+            if self.secret:
+                try:
+                    self.request({'cmd': 'auth', 'secret': self.secret})
+                except RuntimeError:
+                    self.close()
+                    raise
+        sock, reader = self.connection
+        try:
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            line = reader.readline()
+        except OSError:
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise RuntimeError('peer closed the connection')
+        reply = json.loads(line.decode('utf-8'))
+        if not reply.get('ok'):
+            raise RuntimeError(reply.get('error', 'request failed'))
+        return reply
+
+    def close(self):
+        if self.connection is not None:
+            sock, reader = self.connection
+            reader.close()
+            sock.close()
+            self.connection = None
+
+    def files(self):
+        return self.request({'cmd': 'files'})['files']
+
+    def stat(self, name):
+        return self.request({'cmd': 'stat', 'name': name})['stat']
+
+    def read(self, name, start=0):
+        data = self.request({'cmd': 'read', 'name': name, 'start': start})['data']
+        data = data.encode('utf-8', errors='surrogateescape')
+        self.bytes_read += len(data)
+        return data
+
+    def prefix_hash(self, name, size):
+        return self.request({'cmd': 'hash', 'name': name, 'size': size})['hash']
+
+    def write_tail(self, name, offset, data, size):
+        self.request({'cmd': 'write_tail', 'name': name, 'offset': offset, 'size': size,
+                      'data': data.decode('utf-8', errors='surrogateescape')})
+        self.bytes_written += len(data)
+
+class SyncRequestHandler(socketserver.StreamRequestHandler):
+    """One JSON line per request, e.g. {"cmd": "read", "name": "worklog_2025-01-24.txt", "start": 120}"""
+
+    def handle(self):
+        authorized = not self.server.secret
+        for line in self.rfile:
+            if authorized:
+                reply = self.server.handle_request_line(line)
+            else:
+                authorized = self.server.authorize(line)
+                reply = {'ok': True} if authorized else {'ok': False, 'error': 'wrong or missing sync secret'}
+            self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+            if not authorized:
+                return
+
+class SyncServer(socketserver.ThreadingTCPServer):
+    """Serves a data directory's work log files to SocketPeer clients"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, data_dir, host='127.0.0.1', port=DEFAULT_PORT, secret=None):
+        if not secret and host not in LOOPBACK_HOSTS:
+            raise ValueError(f"Set sync.secret in context.yml to serve on {host}")
+        self.secret = secret
+        self.folder = FolderPeer(data_dir)
+        self.state_file = self.folder.path / STATE_NAME
+        self.served = set(read_state(self.state_file).get(SERVED_KEY) or {})
+        self.served_lock = threading.Lock()
+        super().__init__((host, port), SyncRequestHandler)
+
+    def mark_served(self, name):
+        """Remember that another device has a copy of a file, so it is never rewritten locally"""
+        with self.served_lock:
+            if name in self.served:
+                return
+            self.served.add(name)
+            state = read_state(self.state_file)
+            state.setdefault(SERVED_KEY, {})[name] = True
+            try:
+                atomic_write(self.state_file, json.dumps(state))
+            except Exception as e:
+                print(f"Error saving {self.state_file.name}: {e}")
+
+    def authorize(self, line):
+        """Whether the first line of a connection carries the secret"""
+        try:
+            request = json.loads(line.decode('utf-8'))
+        except ValueError:
+            return False
+        if not isinstance(request, dict) or request.get('cmd') != 'auth':
+            return False
+        secret = request.get('secret')
+        return isinstance(secret, str) and hmac.compare_digest(secret.encode('utf-8'), self.secret.encode('utf-8'))
+
+    def handle_request_line(self, line):
+        try:
+            request = json.loads(line.decode('utf-8'))
+            command = request.get('cmd')
+            if command == 'files':
+                return {'ok': True, 'files': self.folder.files()}
+            if command == 'stat':
+                return {'ok': True, 'stat': self.folder.stat(request['name'])}
+            if command == 'read':
+                data = self.folder.read(request['name'], int(request.get('start', 0)))
+                self.mark_served(request['name'])
+                return {'ok': True, 'data': data.decode('utf-8', errors='surrogateescape')}
+            if command == 'hash':
+                return {'ok': True, 'hash': self.folder.prefix_hash(request['name'], int(request['size']))}
+            if command == 'write_tail':
+                data = str(request['data']).encode('utf-8', errors='surrogateescape')
+                self.folder.write_tail(request['name'], int(request['offset']), data, int(request['size']))
+                self.mark_served(request['name'])
+                return {'ok': True}
+            return {'ok': False, 'error': f'unknown command: {command}'}
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
+def make_peer(target, secret=None):
+    """SocketPeer for 'host:port', FolderPeer for a directory"""
+    target = str(target)
+    match = PEER_RE.match(target)
+    if match and not Path(target).expanduser().exists():
+        if secret is None:
+            secret = get_config_service().section('sync').get('secret')
+        return SocketPeer(match.group(1), match.group(2), secret=secret)
+    return FolderPeer(target)
+
+def configured_peer():
+    """Peer from context.yml's sync section, or None"""
+    config = get_config_service().section('sync')
+    target = config.get('peer') or config.get('folder')
+    return make_peer(target) if target else None
+
+def sync_file(name, local, remote, local_stat, remote_stat, entry):
+    """Bring one day file up to date on both sides, returns its new state entry"""
+    def changes(peer, stat):
+        # (offset, bytes after offset) since the last sync, or the whole file if it was rewritten
+        if entry and stat and stat[0] >= entry['size'] and peer.prefix_hash(name, entry['size']) == entry['hash']:
+            return entry['size'], peer.read(name, entry['size'])
+        return 0, peer.read(name) if stat else b''
+
+    local_offset, local_data = changes(local, local_stat)
+    remote_offset, remote_data = changes(remote, remote_stat)
+    if local_offset != remote_offset:
+        # One side no longer has the synced contents, merge the whole files
+        if local_offset:
+            local_offset, local_data = 0, local.read(name) if local_stat else b''
+        if remote_offset:
+            remote_offset, remote_data = 0, remote.read(name) if remote_stat else b''
+    offset = local_offset
+
+    merged = remote_data
+    to_remote = merge_lines(remote_data, local_data)
+    if to_remote is not None:
+        remote.write_tail(name, offset, to_remote, offset + len(remote_data))
+        merged = to_remote
+    to_local = merge_lines(local_data, merged)
+    if to_local is not None:
+        local.write_tail(name, offset, to_local, offset + len(local_data))
+
+    size = offset + len(merged)
+    local_stat, remote_stat = local.stat(name), remote.stat(name)
+    return {
+        'size': size,
+        'hash': local.prefix_hash(name, size),
+        # A side appended to again since has to be checked next time
+        'local': local_stat if local_stat and local_stat[0] == size else None,
+        'remote': remote_stat if remote_stat and remote_stat[0] == size else None,
+    }
+
+class SyncEngine:
+    """Syncs the data directory with peers, remembering per-peer file state in the data directory"""
+
+    def __init__(self, data_dir=None, state_file=None):
+        self.local = FolderPeer(data_dir or get_data_dir())
+        self.state_file = Path(state_file) if state_file else self.local.path / STATE_NAME
+        self.state = self.load_state()
+
+    def load_state(self):
+        return read_state(self.state_file)
+
+    def save_state(self):
+        try:
+            atomic_write(self.state_file, json.dumps(self.state))
+        except Exception as e:
+            print(f"Error saving {self.state_file.name}: {e}")
+
+    def sync(self, peer):
+        """Sync every day file with peer, returns {'changed': [names], 'sent': bytes, 'received': bytes}"""
+        files = self.state.setdefault(peer.key, {})
+        sent, received = peer.bytes_written, peer.bytes_read
+        changed = []
+        with span('sync.run', peer=peer.key) as timing:
+            local_files = self.local.files()
+            remote_files = peer.files()
+            for name in sorted(set(local_files) | set(remote_files)):
+                entry = files.get(name)
+                local_stat, remote_stat = local_files.get(name), remote_files.get(name)
+                if entry and local_stat == entry['local'] and remote_stat == entry['remote']:
+                    continue
+                try:
+                    new_entry = sync_file(name, self.local, peer, local_stat, remote_stat, entry)
+                except (RuntimeError, OSError, ValueError) as e:
+                    print(f"Error syncing {name}: {e}")
+                    continue
+                if entry is None or new_entry['size'] != entry['size'] or new_entry['hash'] != entry['hash']:
+                    changed.append(name)
+                files[name] = new_entry
+            result = {'changed': changed, 'sent': peer.bytes_written - sent, 'received': peer.bytes_read - received}
+            timing.set(files=len(changed), sent=result['sent'], received=result['received'])
+        self.save_state()
+        return result
+
+def serve(data_dir=None, port=None, host=None, secret=None):
+    """Serve the data directory to other devices until interrupted"""
+    config = get_config_service().section('sync')
+    port = port or config.get('port') or DEFAULT_PORT
+    host = host or '127.0.0.1'
+    try:
+        server = SyncServer(data_dir or get_data_dir(), host, port, secret or config.get('secret'))
+    except ValueError as e:
+        print(f"Error: {e}")
+        return False
+    print(f"Serving work logs on {host}:{server.server_address[1]}, Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return True
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Team standups for Reporter app
+Merges several people's work logs into one time-ordered stream. Each source
+is a data directory (someone's ~/.reporter, or a synced copy of it) or a zip
+bundle made with `main.py --cli team --export`. Every source yields its
+entries day file by day file, line by line, and heapq.merge interleaves them,
+so only one line per person is held while merging.
+
+context.yml:
+    team:
+      alice: ~/Dropbox/team/alice
+      bob: ~/bundles/bob.zip
+"""
+
+import io
+import heapq
+import zipfile
+from datetime import date, timedelta
+from pathlib import Path
+from config_service import get_config_service
+from profiling import span
+from worklog_edits import edits_path, read_entries, read_text
+from worklog_io import get_data_dir
+from standup import (
+    parse_line, get_templates, fill, render_body, configured_format
+)
+
+ROLLUPS = ('person', 'organization')
+
+def day_range(start, end):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+def worklog_name(day):
+    return f'worklog_{day.isoformat()}.txt'
+
+def person_name(path):
+    """Name shown for a source: the bundle name, or the folder holding .reporter"""
+    path = Path(path)
+    if path.suffix == '.zip':
+        return path.stem
+    return path.parent.name if path.name == '.reporter' else path.name
+
+def parse_source(source):
+    """(person, path) from 'NAME=PATH' or just PATH"""
+    name, separator, path = str(source).partition('=')
+    if separator and name and not Path(source).expanduser().exists():
+        return name, Path(path).expanduser()
+    path = Path(source).expanduser()
+    return person_name(path), path
+
+def configured_team():
+    """[(person, path)] from context.yml's team section"""
+    return [(str(person), Path(str(path)).expanduser())
+            for person, path in get_config_service().section('team').items() if path]
+
+def read_lines(path, start, end):
+    """Lines of the day files from start to end, oldest first, read lazily"""
+    path = Path(path)
+    if path.suffix == '.zip':
+        with zipfile.ZipFile(path) as bundle:
+            # Bundles may keep the files in a folder
+            names = {Path(name).name: name for name in bundle.namelist()}
+            for day in day_range(start, end):
+                name = names.get(worklog_name(day))
+                if name is not None:
+                    with bundle.open(name) as f:
+                        yield from io.TextIOWrapper(f, encoding='utf-8', errors='replace')
+        return
+    for day in day_range(start, end):
+        log_file = path / worklog_name(day)
+        if edits_path(log_file).exists():
+            yield from (line for _, line in read_entries(log_file))
+            continue
+        try:
+            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                yield from f
+        except FileNotFoundError:
+            continue
+
+def person_entries(person, path, start, end):
+    """Entries of one person's work logs, tagged with their name"""
+    for line in read_lines(path, start, end):
+        entry = parse_line(line)
+        if entry is not None:
+            entry['person'] = person
+            yield entry
+
+def merge_worklogs(sources, start, end=None):
+    """Every entry of [(person, path)] between two dates, in time order
+
+    A k-way merge over one lazy stream per person; entries logged at the
+    same minute keep the order of sources.
+    """
+    end = end or start
+    streams = [person_entries(person, path, start, end) for person, path in sources]
+    return heapq.merge(*streams, key=lambda entry: (entry['date'], entry['time']))
+
+def rollup(entries, by='person'):
+    """{group: [entry, ...]} by 'person' or 'organization', groups in order of their first entry"""
+    if by not in ROLLUPS:
+        raise ValueError(f"unknown rollup: {by}")
+    groups = {}
+    for entry in entries:
+        groups.setdefault(entry[by], []).append(entry)
+    return groups
+
+def render_team_standup(entries, by='person', fmt=None, github_data=None, title=None):
+    """Team standup from merged entries, by person (each with their organizations and issues) or by organization"""
+    with span('team.render') as timing:
+        fmt = fmt or configured_format()
+        templates = get_templates(fmt)
+        if by == 'organization':
+            # Organizations and issues already group the entries, name who did each one
+            groups = {'': [dict(entry, text=f"{entry['text']} ({entry['person']})") for entry in entries]}
+        else:
+            groups = rollup(entries, by)
+        count = sum(len(grouped) for grouped in groups.values())
+        timing.set(entries=count, groups=len(groups))
+        title = title or date.today().isoformat()
+        if not count:
+            return fill(templates, fmt, 'empty', date=title, count=0)
+
+        lines = [fill(templates, fmt, 'header', date=title, count=count)]
+        for person, grouped in groups.items():
+            if person:
+                lines.append(fill(templates, fmt, 'person', person=person))
+            lines.extend(render_body(grouped, templates, fmt, github_data))
+        lines.append(fill(templates, fmt, 'footer', date=title, count=count))
+        return '\n'.join(lines).strip()
+
+def export_bundle(output, start, end, data_dir=None):
+    """Zip your day files between two dates for a lead to merge, returns how many were added"""
+    data_dir = Path(data_dir or get_data_dir())
+    added = 0
+    with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+        for day in day_range(start, end):
+            path = data_dir / worklog_name(day)
+            if path.exists():
+                # Bundles carry the entries as edited
+                bundle.writestr(worklog_name(day), read_text(path))
+                added += 1
+    return added
@@ -66,6 +66,28 @@ def main():
     test_files = [
         test_dir / 'test_llm_functionality.py',
         test_dir / 'test_llm_integration.py', 
+        test_dir / 'test_github_streaming.py',
+        test_dir / 'test_fuzzy_index.py',
+        test_dir / 'test_yaml_io.py',
+        test_dir / 'test_config_service.py',
+        test_dir / 'test_localization.py',
+        test_dir / 'test_startup.py',
+        test_dir / 'test_snapshot.py',
+        test_dir / 'test_single_instance.py',
+        test_dir / 'test_quick_entry.py',
+        test_dir / 'test_benchmarks.py',
+        test_dir / 'test_profiling.py',
+        test_dir / 'test_stall_watchdog.py',
+        test_dir / 'test_git_harvester.py',
+        test_dir / 'test_issue_linker.py',
+        test_dir / 'test_standup.py',
+        test_dir / 'test_sync.py',
+        test_dir / 'test_team.py',
+        test_dir / 'test_timeline.py',
+        test_dir / 'test_worklog_edits.py',
+        test_dir / 'test_history.py',
+        test_dir / 'test_history_search.py',
+        test_dir / 'test_semantic_search.py',
         test_dir / 'test_worklog_preservation.py',
         test_dir / 'test_ui_llm_disabled.py',
         test_dir / 'test_ui_visual.py'
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the benchmark data generators and regression gate.
+The benchmarks themselves are run with `python3 bench.py`.
+"""
+
+import sys
+import tempfile
+import shutil
+from datetime import date
+from pathlib import Path
+
+# Add scripts and benchmarks directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+def test_generated_gh_status_parses():
+    """Test that generated `gh status` output parses into the requested items"""
+    print("🧪 Testing generated gh status output...")
+
+    from generators import generate_gh_status
+    from github_data import parse_gh_status_table
+
+    data = parse_gh_status_table(generate_gh_status(issues=30, prs=20, reviews=10))
+    counts = {section: len(data[section]) for section in ('my_issues', 'my_prs', 'my_reviews')}
+    assert counts == {'my_issues': 30, 'my_prs': 20, 'my_reviews': 10}, f"❌ Unexpected counts: {counts}"
+    assert generate_gh_status(5, 5, 5) == generate_gh_status(5, 5, 5), "❌ Generator should be deterministic"
+    print("✅ Generated output parses to the requested items")
+    return True
+
+def test_generated_files():
+    """Test the work log directory and GitHub cache generators"""
+    print("🧪 Testing generated files...")
+
+    from generators import generate_worklog_dir, generate_github_cache
+    from github_items import items_from_yaml
+    from yaml_io import load_cache
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        written = generate_worklog_dir(temp_dir, years=1, entries_per_day=3, end=date(2026, 3, 6))
+        logs = sorted(temp_dir.glob('worklog_*.txt'))
+        assert written == len(logs) and 250 < written < 265, f"❌ Expected a year of weekdays, got {written}"
+        assert logs[-1].name == 'worklog_2026-03-06.txt', "❌ Last log should be the end date"
+        assert len(logs[-1].read_text(encoding='utf-8').splitlines()) == 3, "❌ Wrong number of entries"
+
+        cache_file = temp_dir / 'github_data.yml'
+        generate_github_cache(cache_file, items=300)
+        items = items_from_yaml(load_cache(cache_file, {}))
+        assert sum(len(kind_items) for kind_items in items.values()) == 300, "❌ Cache should hold 300 items"
+        print("✅ Work logs and GitHub cache generated")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_regression_gate():
+    """Test that slowdowns past the threshold are reported as regressions"""
+    print("🧪 Testing regression gate...")
+
+    from run_benchmarks import compare_results
+
+    baseline = {'threshold': 0.5, 'benchmarks': {
+        'steady': {'median_ms': 10.0},
+        'slower': {'median_ms': 10.0},
+        'tiny': {'median_ms': 0.1},
+        'tuned': {'median_ms': 10.0, 'threshold': 2.0},
+    }}
+    results = {name: {'median_ms': ms} for name, ms in
+               [('steady', 12.0), ('slower', 20.0), ('tiny', 0.5), ('tuned', 20.0), ('added', 1.0)]}
+
+    status = {name: result for name, result, _, _ in compare_results(results, baseline)}
+    assert status == {'steady': 'ok', 'slower': 'regression', 'tiny': 'ok', 'tuned': 'ok', 'added': 'new'}, \
+        f"❌ Unexpected statuses: {status}"
+    print("✅ Thresholds, noise floor and per-benchmark overrides applied")
+
+    status = {name: result for name, result, _, _ in compare_results(results, baseline, threshold=3.0)}
+    assert status['slower'] == 'ok', "❌ Explicit threshold should override the baseline"
+    status = {name: result for name, result, _, _ in
+              compare_results({'steady': {'median_ms': 5.0}}, baseline)}
+    assert status['steady'] == 'improved', "❌ Large speedups should be reported"
+    print("✅ Threshold override and improvements reported")
+
+    # A baseline from a machine twice as fast is scaled before comparing
+    calibrated = dict(baseline, calibration_ms=50.0)
+    status = {name: result for name, result, _, _ in
+              compare_results({'slower': {'median_ms': 20.0}}, calibrated, calibration_ms=100.0)}
+    assert status['slower'] == 'ok', "❌ Baseline should be scaled to this machine's speed"
+    status = {name: result for name, result, _, _ in
+              compare_results({'slower': {'median_ms': 40.0}}, calibrated, calibration_ms=100.0)}
+    assert status['slower'] == 'regression', "❌ Slowdowns beyond the machine difference should be reported"
+    print("✅ Baseline scaled by the calibration time")
+
+    # Slowdowns within the noise of the runs are not regressions
+    noisy = {'slower': {'median_ms': 20.0, 'mad_ms': 4.0}}
+    status = {name: result for name, result, _, _ in compare_results(noisy, baseline)}
+    assert status['slower'] == 'ok', "❌ Slowdown within 3 MADs should be ignored"
+    noisy = {'slower': {'median_ms': 30.0, 'mad_ms': 4.0}}
+    status = {name: result for name, result, _, _ in compare_results(noisy, baseline)}
+    assert status['slower'] == 'regression', "❌ Slowdown beyond the noise should be reported"
+    print("✅ Noise margin applied")
+    return True
+
+def run_all_tests():
+    """Run all benchmark suite tests"""
+    print("🚀 Starting benchmark suite tests...\n")
+
+    tests = [
+        test_generated_gh_status_parses,
+        test_generated_files,
+        test_regression_gate
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL BENCHMARK SUITE TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the cached context.yml config service.
+Tests parse-once caching, change detection, validation and listeners.
+"""
+
+import os
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+CONTEXT = """projects:
+  my_side_projects: https://github.com/users/Achoobert/projects/7
+local_llm:
+  enabled: true
+  model: "llama3:8b"
+  chunk_size: 4000
+ui:
+  language: "en"
+"""
+
+def test_parse_once_and_reload_on_change():
+    """Test that lookups reuse the parsed file until it changes"""
+    print("🧪 Testing config caching...")
+
+    import config_service
+    from config_service import ConfigService
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / 'context.yml'
+        path.write_text(CONTEXT, encoding='utf-8')
+        service = ConfigService([temp_dir / 'missing.yml', path])
+        assert service.path == path, "❌ Should resolve the first existing candidate"
+
+        with patch.object(config_service, 'load_yaml', wraps=config_service.load_yaml) as load:
+            for _ in range(100):
+                assert service.section('local_llm')['model'] == 'llama3:8b'
+            assert load.call_count == 1, f"❌ Expected 1 parse, got {load.call_count}"
+            print("✅ 100 lookups parsed the file once")
+
+            path.write_text(CONTEXT.replace('llama3:8b', 'mistral:7b-instruct'), encoding='utf-8')
+            assert service.section('local_llm')['model'] == 'mistral:7b-instruct', "❌ Change not picked up"
+            assert load.call_count == 2, "❌ Changed file should be parsed again"
+            print("✅ Changed file re-parsed")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def test_validation():
+    """Test that settings of the wrong type are dropped"""
+    print("🧪 Testing config validation...")
+
+    from config_service import validate_config
+
+    config, errors = validate_config({
+        'projects': ['not', 'a', 'mapping'],
+        'local_llm': {'enabled': 'yes', 'chunk_size': 2000},
+        'ui': None,
+        'future_setting': 1,
+    })
+    assert 'projects' not in config, "❌ Invalid projects should be dropped"
+    assert config['local_llm'] == {'chunk_size': 2000}, "❌ Invalid enabled should be dropped"
+    assert config['future_setting'] == 1, "❌ Unknown keys should be kept"
+    assert len(errors) == 2, f"❌ Expected 2 errors, got {errors}"
+    print("✅ Invalid settings dropped with errors reported")
+
+    return True
+
+def test_change_listeners():
+    """Test that listeners are notified only when the contents change"""
+    print("🧪 Testing change notifications...")
+
+    from config_service import ConfigService
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / 'context.yml'
+        path.write_text(CONTEXT, encoding='utf-8')
+        service = ConfigService([path])
+        service.get()
+
+        changes = []
+        service.add_listener(changes.append)
+
+        # Touching the file without changing it doesn't notify
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        service.reload()
+        assert changes == [], "❌ Unchanged contents should not notify"
+
+        path.write_text(CONTEXT.replace('language: "en"', 'language: "th"'), encoding='utf-8')
+        service.reload()
+        assert len(changes) == 1 and changes[0]['ui']['language'] == 'th', "❌ Listener not notified"
+        print("✅ Listener notified once with the new config")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def run_all_tests():
+    """Run all config service tests"""
+    print("🚀 Starting config service tests...\n")
+
+    tests = [
+        test_parse_once_and_reload_on_change,
+        test_validation,
+        test_change_listeners
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL CONFIG SERVICE TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the fuzzy Issue/PR search index.
+Tests ranking, incremental updates, recency and per-keystroke speed.
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+ENTRIES = {
+    'Issue: #126: add tests': 'Issue: #126: add tests Achoobert/time_assist',
+    'PR: #76: update workflow': 'PR: #76: update workflow Achoobert/time_assist',
+    'Issue: #46: As a user I can create an expense report': 'Issue: #46: As a user I can create an expense report CruGlobal/appbuilder_platform_pwa',
+    'Review: #15: [WIP] update theme and build': 'Review: #15: [WIP] update theme and build CruGlobal/appbuilder_docs',
+}
+
+def test_ranking():
+    """Test substring, number, repo and subsequence matching"""
+    print("🧪 Testing fuzzy ranking...")
+
+    from fuzzy_index import FuzzyIndex
+
+    index = FuzzyIndex()
+    index.update(ENTRIES)
+
+    assert index.search('126')[0] == 'Issue: #126: add tests', "❌ Number should match"
+    assert index.search('expense')[0].startswith('Issue: #46'), "❌ Title word should match"
+    assert index.search('appbuilder_docs') == ['Review: #15: [WIP] update theme and build'], "❌ Repo should match"
+    assert index.search('updt wrkflw')[0] == 'PR: #76: update workflow', "❌ Subsequence should match"
+    assert index.search('update')[0] in ('PR: #76: update workflow', 'Review: #15: [WIP] update theme and build')
+    assert index.search('zzz') == [], "❌ Non-matching query should return nothing"
+    assert len(index.search('')) == len(ENTRIES), "❌ Empty query should list everything"
+
+    print("✅ Fuzzy ranking works")
+    return True
+
+def test_incremental_update_and_recency():
+    """Test that updates only touch changed entries and recent items rank first"""
+    print("🧪 Testing incremental updates and recency...")
+
+    from fuzzy_index import FuzzyIndex
+
+    index = FuzzyIndex()
+    index.update(ENTRIES)
+
+    changed = dict(ENTRIES)
+    del changed['PR: #76: update workflow']
+    changed['Issue: #200: update docs'] = 'Issue: #200: update docs Achoobert/time_assist'
+    index.update(changed)
+
+    assert 'PR: #76: update workflow' not in index, "❌ Removed entry still indexed"
+    assert index.search('workflow') == [], "❌ Removed entry still searchable"
+    assert index.search('#200') == ['Issue: #200: update docs'], "❌ New entry not searchable"
+
+    index.mark_used('Review: #15: [WIP] update theme and build')
+    assert index.search('update')[0] == 'Review: #15: [WIP] update theme and build', "❌ Recent item should rank first"
+    assert index.search('')[0] == 'Review: #15: [WIP] update theme and build', "❌ Recent item should lead empty query"
+    assert index.recent() == ['Review: #15: [WIP] update theme and build']
+
+    print("✅ Incremental updates and recency work")
+    return True
+
+def test_keystroke_speed():
+    """Test that each keystroke over thousands of items stays within a frame"""
+    print("🧪 Testing per-keystroke search speed...")
+
+    from fuzzy_index import FuzzyIndex
+
+    random.seed(42)
+    words = "add tests fix login auth bug dashboard refresh github yaml parse build release update theme docs".split()
+    entries = {}
+    for i in range(5000):
+        text = f"Issue: #{i}: " + " ".join(random.choices(words, k=5))
+        entries[text] = f"{text} org{i % 7}/repo{i % 13}"
+
+    index = FuzzyIndex()
+    index.update(entries)
+
+    query = 'login auth'
+    timings = []
+    for end in range(1, len(query) + 1):
+        start = time.perf_counter()
+        index.search(query[:end])
+        timings.append((time.perf_counter() - start) * 1000)
+
+    worst = max(timings)
+    print(f"   Worst keystroke over 5000 items: {worst:.1f} ms")
+    # Generous bound so slow CI machines don't flake, target is 16 ms
+    assert worst < 50, f"❌ Keystroke search too slow: {worst:.1f} ms"
+
+    print("✅ Keystroke search is fast")
+    return True
+
+def run_all_tests():
+    """Run all fuzzy index tests"""
+    print("🚀 Starting fuzzy index tests...\n")
+
+    tests = [
+        test_ranking,
+        test_incremental_update_and_recency,
+        test_keystroke_speed
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL FUZZY INDEX TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the git commit harvester.
+Tests that new commits become suggested entries and unchanged repositories
+are skipped without running git.
+"""
+
+import io
+import os
+import sys
+import time
+import tempfile
+import shutil
+import subprocess
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+def git(repo, *args):
+    subprocess.run(['git', '-C', str(repo)] + list(args), check=True, capture_output=True, text=True)
+
+def make_repo(path, email='me@example.com', remote=None):
+    path.mkdir(parents=True)
+    git(path, 'init', '-q', '-b', 'main')
+    git(path, 'config', 'user.email', email)
+    git(path, 'config', 'user.name', 'Me')
+    if remote:
+        git(path, 'remote', 'add', 'origin', remote)
+    return path
+
+def commit(repo, message, email=None):
+    args = ['commit', '-q', '--allow-empty', '-m', message]
+    if email:
+        args = ['-c', f'user.email={email}'] + args
+    git(repo, *args)
+
+def git_available():
+    return shutil.which('git') is not None
+
+def test_new_commits_suggested():
+    """Test that today's commits become suggestions with organization and issue"""
+    print("🧪 Testing commit suggestions...")
+
+    from git_harvester import GitHarvester
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        repo = make_repo(temp_dir / 'app', remote='git@github.com:CruGlobal/app.git')
+        commit(repo, 'Fix login redirect (#46)')
+        commit(repo, 'Someone else\'s change', email='other@example.com')
+        other = make_repo(temp_dir / 'docs')
+        commit(other, 'Update theme')
+
+        harvester = GitHarvester(temp_dir / 'state.json', [(str(repo), ''), (str(other), 'Personal')])
+        suggestions = harvester.harvest(organizations=['CruGlobal'])
+        found = [(s['organization'], s['issue'], s['text']) for s in suggestions]
+        assert found == [('CruGlobal', '#46', 'Fix login redirect (#46)'), ('Personal', '', 'Update theme')], \
+            f"❌ Unexpected suggestions: {found}"
+        print("✅ Own commits suggested with organization and issue")
+
+        # Only commits made since the last scan, on any branch
+        commit(repo, 'Add tests')
+        git(repo, 'checkout', '-q', '-b', 'feature')
+        commit(repo, 'Start feature #12')
+        harvester = GitHarvester(temp_dir / 'state.json', [(str(repo), ''), (str(other), 'Personal')])
+        texts = [s['text'] for s in harvester.harvest(organizations=['CruGlobal'])]
+        assert texts == ['Fix login redirect (#46)', 'Update theme', 'Add tests', 'Start feature #12'], \
+            f"❌ Unexpected suggestions: {texts}"
+
+        # A new branch with already seen commits adds nothing
+        git(repo, 'branch', 'copy')
+        assert len(harvester.harvest(organizations=['CruGlobal'])) == 4, "❌ Seen commits suggested again"
+        print("✅ Later scans only add new commits")
+
+        harvester.remove(suggestions[1]['sha'])
+        reloaded = GitHarvester(temp_dir / 'state.json', [(str(repo), ''), (str(other), 'Personal')])
+        assert [s['text'] for s in reloaded.pending] == ['Fix login redirect (#46)', 'Add tests', 'Start feature #12'], \
+            "❌ Removed suggestion not saved"
+        print("✅ Logged or dismissed suggestions stay removed")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_literal_author_and_sha256_refs():
+    """Test that emails with regex characters match literally and SHA-256 refs are read"""
+    print("🧪 Testing author matching and SHA-256 refs...")
+
+    from git_harvester import GitHarvester, read_branch_tips
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        repo = make_repo(temp_dir / 'app', email='me+work@example.com')
+        commit(repo, 'Mine')
+        commit(repo, 'Looks like mine to a regex', email='meework@example.com')
+        commit(repo, 'Also looks like mine', email='me+work@exampleXcom')
+        harvester = GitHarvester(temp_dir / 'state.json', [(str(repo), 'Work')])
+        texts = [s['text'] for s in harvester.harvest()]
+        assert texts == ['Mine'], f"❌ Author not matched literally: {texts}"
+        print("✅ Only commits by the exact email suggested")
+
+        git_dir = temp_dir / 'sha256.git'
+        (git_dir / 'refs' / 'heads').mkdir(parents=True)
+        sha256 = 'a' * 64
+        (git_dir / 'refs' / 'heads' / 'main').write_text(sha256 + '\n', encoding='utf-8')
+        (git_dir / 'refs' / 'heads' / 'broken').write_text('not a sha\n', encoding='utf-8')
+        assert read_branch_tips(git_dir) == {'main': sha256}, "❌ SHA-256 ref not read"
+        print("✅ SHA-256 branch tips read")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_unchanged_repos_skip_git():
+    """Test that unchanged repositories are checked without running git"""
+    print("🧪 Testing unchanged repositories...")
+
+    from git_harvester import GitHarvester
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        repos = []
+        for i in range(50):
+            repo = make_repo(temp_dir / f'repo{i}')
+            commit(repo, f'Commit {i}')
+            repos.append((str(repo), 'Work'))
+        # Packed refs are read as well as loose ones
+        git(temp_dir / 'repo0', 'pack-refs', '--all')
+
+        harvester = GitHarvester(temp_dir / 'state.json', repos)
+        assert len(harvester.harvest()) == 50, "❌ First scan should suggest every commit"
+
+        harvester = GitHarvester(temp_dir / 'state.json', repos)
+        with patch('subprocess.run', side_effect=AssertionError('git should not run')):
+            start = time.perf_counter()
+            suggestions = harvester.harvest()
+            elapsed = time.perf_counter() - start
+        print(f"   Scanned 50 unchanged repositories in {elapsed*1000:.1f} ms")
+        assert len(suggestions) == 50, "❌ Pending suggestions lost"
+        assert elapsed < 1.0, f"❌ Scan too slow: {elapsed:.2f}s"
+        print("✅ Unchanged repositories skipped without running git")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_dashboard_suggestions():
+    """Test logging and dismissing suggestions from the dashboard"""
+    print("🧪 Testing dashboard suggestions...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping dashboard test")
+        return True
+
+    import ui.dashboard as dashboard_module
+    from git_harvester import GitHarvester
+
+    app = QApplication.instance() or QApplication([])
+    temp_dir = Path(tempfile.mkdtemp())
+    original_get_data_dir = dashboard_module.get_data_dir
+    try:
+        dashboard_module.get_data_dir = lambda: temp_dir
+        repo = make_repo(temp_dir / 'app')
+        commit(repo, 'Fix login redirect #46')
+        commit(repo, 'Write docs')
+
+        dashboard = dashboard_module.Dashboard()
+        assert not dashboard.suggestions_box.isVisibleTo(dashboard), "❌ Suggestions should be hidden when empty"
+        dashboard.harvester = GitHarvester(temp_dir / 'state.json', [(str(repo), 'Work')])
+        dashboard.show_suggestions(dashboard.harvester.harvest())
+        assert dashboard.suggestions_list.count() == 2, "❌ Suggestions not listed"
+        assert dashboard.suggestions_box.isVisibleTo(dashboard), "❌ Suggestions should be shown"
+
+        dashboard.log_suggestion(dashboard.suggestions_list.item(0))
+        assert '[Work] [#46] - Fix login redirect #46' in dashboard.worklog_text.toPlainText(), "❌ Suggestion not logged"
+        dashboard.suggestions_list.setCurrentRow(0)
+        dashboard.dismiss_selected_suggestion()
+        assert dashboard.suggestions_list.count() == 0 and dashboard.harvester.pending == [], "❌ Suggestions not removed"
+        assert not dashboard.suggestions_box.isVisibleTo(dashboard), "❌ Empty suggestions should be hidden"
+        assert 'Write docs' not in dashboard.worklog_text.toPlainText(), "❌ Dismissed suggestion logged"
+        print("✅ Suggestions logged and dismissed from the dashboard")
+        dashboard.deleteLater()
+    finally:
+        dashboard_module.get_data_dir = original_get_data_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_worklog_cli():
+    """Test `--cli worklog` listing and logging suggestions"""
+    print("🧪 Testing worklog CLI...")
+
+    import config_service
+    from config_service import ConfigService
+
+    temp_home = Path(tempfile.mkdtemp())
+    original_service = config_service._service
+    original_home = os.environ.get('HOME')
+    try:
+        repo = make_repo(temp_home / 'app')
+        commit(repo, 'Fix login redirect #46')
+        commit(repo, 'Write docs')
+        context = temp_home / 'context.yml'
+        context.write_text(f"git_repos:\n  - path: {repo}\n    organization: Work\n", encoding='utf-8')
+        config_service._service = ConfigService([context])
+        os.environ['HOME'] = str(temp_home)
+
+        sys.path.insert(0, str(PROJECT_ROOT))
+        import main
+        with redirect_stdout(io.StringIO()) as output:
+            assert main.worklog_cli(), "❌ Listing failed"
+        assert '  1. ' in output.getvalue() and '[Work] [#46] Fix login redirect #46' in output.getvalue(), \
+            f"❌ Unexpected listing: {output.getvalue()}"
+
+        with redirect_stdout(io.StringIO()) as output:
+            assert main.worklog_cli(accept=['1']), "❌ Accepting failed"
+        logs = list((temp_home / '.reporter').glob('worklog_*.txt'))
+        assert len(logs) == 1 and '[Work] [#46] - Fix login redirect #46' in logs[0].read_text(), "❌ Entry not logged"
+
+        with redirect_stdout(io.StringIO()) as output:
+            assert main.worklog_cli(dismiss=['all']), "❌ Dismissing failed"
+            main.worklog_cli()
+        assert 'No new commits to log' in output.getvalue(), "❌ Suggestions not cleared"
+        assert 'Write docs' not in logs[0].read_text(), "❌ Dismissed entry should not be logged"
+        print("✅ Suggestions listed, logged and dismissed")
+    finally:
+        config_service._service = original_service
+        if original_home is None:
+            os.environ.pop('HOME', None)
+        else:
+            os.environ['HOME'] = original_home
+        shutil.rmtree(temp_home, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all git harvester tests"""
+    print("🚀 Starting git harvester tests...\n")
+
+    if not git_available():
+        print("⚠️  git not available, skipping git harvester tests")
+        return True
+
+    tests = [
+        test_new_commits_suggested,
+        test_literal_author_and_sha256_refs,
+        test_unchanged_repos_skip_git,
+        test_dashboard_suggestions,
+        test_worklog_cli
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL GIT HARVESTER TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
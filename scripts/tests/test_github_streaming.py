@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Test script to verify `gh status` output is parsed as it streams in
+and that the GitHub tabs' list model is updated in place on refresh.
+"""
+
+import sys
+import time
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SAMPLE_GH_STATUS = """Assigned Issues                              │ Assigned Pull Requests
+CruGlobal/appbuilder_platform_pwa#46  As a user I can create an expense report │ CruGlobal/appbuilder_docs#15  [WIP] update theme and build
+Achoobert/time_assist#126  add tests         │ Nothing here ^_^
+                                             │
+Review Requests                              │ Mentions
+Achoobert/time_assist#76  update workflow    │ Achoobert/time_assist#70  @you can you look
+                                             │
+Repository Activity
+Achoobert/time_assist#80  comment on tests"""
+
+def test_parse_table():
+    """Test that the full table parses into the expected sections"""
+    print("🧪 Testing gh status table parsing...")
+
+    from github_data import parse_gh_status_table
+
+    data = parse_gh_status_table(SAMPLE_GH_STATUS)
+    assert set(data['my_issues']) == {'46', '126'}, "❌ Issues not parsed"
+    assert set(data['my_prs']) == {'15'}, "❌ PRs not parsed"
+    assert set(data['my_reviews']) == {'76'}, "❌ Reviews not parsed"
+    assert data['my_issues']['126'] == 'add tests [https://github.com/Achoobert/time_assist/issues/126]', "❌ Issue value wrong"
+    assert data['my_prs']['15'].endswith('[https://github.com/CruGlobal/appbuilder_docs/pull/15]'), "❌ PR URL wrong"
+
+    # Same result from an iterable of lines
+    assert parse_gh_status_table(iter(SAMPLE_GH_STATUS.splitlines())) == data, "❌ Line iterable parsed differently"
+
+    print("✅ gh status table parsed correctly")
+    return True
+
+def test_item_model():
+    """Test the compact GitHubItem representation"""
+    print("🧪 Testing GitHubItem parsing and lazy URLs...")
+
+    from github_items import GitHubItem, items_from_yaml
+
+    item = GitHubItem.from_yaml_value('prs', '15', '[WIP] update theme [https://github.com/CruGlobal/appbuilder_docs/pull/15]')
+    assert item.title == '[WIP] update theme', "❌ Bracketed title prefix should be kept"
+    assert item.repo == 'CruGlobal/appbuilder_docs', "❌ Repo not parsed"
+    assert item.url == 'https://github.com/CruGlobal/appbuilder_docs/pull/15', "❌ URL not rebuilt"
+    assert item.combo_text == 'PR: #15: [WIP] update theme', "❌ Combo text wrong"
+    assert not hasattr(item, '__dict__'), "❌ Items should use __slots__"
+
+    # Non-standard URLs are kept as-is, plain titles have no URL
+    odd = GitHubItem.from_yaml_value('issues', '126', 'add tests [https://github.com/]')
+    assert odd.title == 'add tests' and odd.url == 'https://github.com/', "❌ Odd URL not kept"
+    plain = GitHubItem.from_yaml_value('issues', '1', 'no link here')
+    assert plain.url is None and plain.yaml_value() == 'no link here', "❌ Plain title mishandled"
+
+    data = items_from_yaml({
+        'my_issues': {'1': 'a [https://github.com/o/r/issues/1]', '2': 'b [https://github.com/o/r/issues/2]'},
+        'my_reviews': None,
+    })
+    assert data['reviews'] == [], "❌ Empty section should give no items"
+    assert data['issues'][0].repo is data['issues'][1].repo, "❌ Repo strings should be interned"
+
+    print("✅ GitHubItem parsing works")
+    return True
+
+def test_items_model_refresh():
+    """Test that a refresh updates rows in place, appends new ones and prunes the rest"""
+    print("🧪 Testing GitHub list model refresh...")
+
+    try:
+        from PyQt5.QtCore import QCoreApplication
+        from ui.github_model import GitHubItemsModel
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping list model test")
+        return True
+
+    from github_items import GitHubItem
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    first = GitHubItem('issues', 1, 'first', 'o/r')
+    second = GitHubItem('issues', 2, 'second', 'o/r')
+    third = GitHubItem('issues', 3, 'third', 'o/r')
+    model = GitHubItemsModel([first, second, third])
+    changed, inserted, removed = [], [], []
+    model.dataChanged.connect(lambda top, bottom: changed.append((top.row(), bottom.row())))
+    model.rowsInserted.connect(lambda parent, start, end: inserted.append((start, end)))
+    model.rowsRemoved.connect(lambda parent, start, end: removed.append((start, end)))
+
+    model.begin_refresh()
+    model.upsert_item(GitHubItem('issues', 2, 'second, renamed', 'o/r'))
+    model.upsert_item(first)
+    model.upsert_item(GitHubItem('issues', 4, 'fourth', 'o/r'))
+    assert changed == [(1, 1)], f"❌ Renamed item should change its own row: {changed}"
+    assert model.index(1).data() == '#2: second, renamed', "❌ Row not updated in place"
+    assert inserted == [(3, 3)] and model.rowCount() == 4, f"❌ New item not appended: {inserted}"
+    model.end_refresh()
+    assert removed == [(2, 2)], f"❌ Item gone from the refresh not pruned: {removed}"
+    assert [item.number for item in model.items()] == ['1', '2', '4'], "❌ Wrong rows after the refresh"
+
+    # Rows keep their new positions for the next refresh
+    model.upsert_item(GitHubItem('issues', 4, 'fourth, renamed', 'o/r'))
+    assert changed[-1] == (2, 2), f"❌ Row index not rebuilt after pruning: {changed}"
+
+    # A failed refresh keeps what was shown
+    model.begin_refresh()
+    model.upsert_item(first)
+    model.end_refresh(prune=False)
+    assert model.rowCount() == 3 and len(removed) == 1, "❌ prune=False should keep unseen rows"
+    print("✅ Rows updated in place, appended and pruned")
+    return True
+
+def test_first_item_before_command_exits():
+    """Test that items are published before the command finishes"""
+    print("🧪 Testing progressive publishing of items...")
+
+    import github_data
+
+    # Print the header and one issue, then stall before the rest
+    script = (
+        "import sys, time\n"
+        "lines = open(sys.argv[1], encoding='utf-8').read().splitlines()\n"
+        "print(lines[0], flush=True)\n"
+        "print(lines[1], flush=True)\n"
+        "time.sleep(1.0)\n"
+        "print('\\n'.join(lines[2:]), flush=True)\n"
+    )
+    temp_dir = Path(tempfile.mkdtemp())
+    original_yaml_path = github_data.YAML_PATH
+    try:
+        sample_file = temp_dir / 'gh_status.txt'
+        sample_file.write_text(SAMPLE_GH_STATUS, encoding='utf-8')
+        command = [sys.executable, '-c', script, str(sample_file)]
+        github_data.YAML_PATH = temp_dir / 'github_data.yml'
+
+        start = time.monotonic()
+        arrivals = []
+        data = github_data.fetch_github_data(
+            on_item=lambda item: arrivals.append((time.monotonic() - start, item.kind, item.number)),
+            command=command)
+        total = time.monotonic() - start
+
+        assert arrivals, "❌ No items published"
+        assert arrivals[0][1:] == ('issues', '46'), "❌ First item should be the first issue"
+        assert arrivals[0][0] < total - 0.5, "❌ First item should arrive before the command finishes"
+        assert len(arrivals) == 4, f"❌ Expected 4 items, got {len(arrivals)}"
+        assert github_data.YAML_PATH.exists(), "❌ YAML not written"
+        assert data['my_reviews'] == {'76': 'update workflow [https://github.com/Achoobert/time_assist/pull/76]'}
+        print(f"✅ First item after {arrivals[0][0]*1000:.0f} ms, last after {total*1000:.0f} ms")
+    finally:
+        github_data.YAML_PATH = original_yaml_path
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def test_command_failure():
+    """Test that a failing command raises after its output is consumed"""
+    print("🧪 Testing gh failure handling...")
+
+    from github_data import stream_gh_status
+
+    command = [sys.executable, '-c', "import sys; sys.stderr.write('not logged in'); sys.exit(1)"]
+    try:
+        list(stream_gh_status(command))
+    except RuntimeError as e:
+        assert 'not logged in' in str(e), "❌ Error should include stderr"
+        print("✅ Failure reported with stderr")
+        return True
+    assert False, "❌ Failing command should raise RuntimeError"
+
+def run_all_tests():
+    """Run all GitHub streaming tests"""
+    print("🚀 Starting GitHub streaming tests...\n")
+
+    tests = [
+        test_parse_table,
+        test_item_model,
+        test_items_model_refresh,
+        test_first_item_before_command_exits,
+        test_command_failure
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL GITHUB STREAMING TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the history browser.
+Tests the bounded LRU cache of parsed days, that changed days are read again,
+that neighbouring days are prefetched in the background and that flipping
+back through two weeks only shows days that are already parsed.
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+DAY = date(2025, 1, 24)
+
+def write_day(data_dir, day, *texts):
+    with open(Path(data_dir) / f'worklog_{day.isoformat()}.txt', 'a', encoding='utf-8') as f:
+        for hour, text in enumerate(texts, 9):
+            f.write(f'{day.isoformat()} {hour:02}:00 [Work]  - {text}\n')
+
+def test_lru_cache():
+    """Test that the cache keeps only the most recently used days"""
+    print("🧪 Testing LRU cache of days...")
+
+    from day_cache import DayCache
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        days = [DAY - timedelta(days=offset) for offset in range(4)]
+        for day in days:
+            write_day(temp_dir, day, f'work on {day}')
+        cache = DayCache(temp_dir, capacity=3)
+        for day in days[:3]:
+            assert cache.get(day)[0]['text'] == f'work on {day}', "❌ Day not parsed"
+        cache.get(days[0])  # now the most recently used
+        cache.get(days[3])
+        assert len(cache) == 3 and days[1] not in cache, "❌ Least recently used day should be evicted"
+        assert days[0] in cache and days[2] in cache and days[3] in cache, "❌ Wrong day evicted"
+        assert (cache.hits, cache.misses) == (1, 4), f"❌ Unexpected hits/misses: {cache.hits}/{cache.misses}"
+        assert cache.get(DAY + timedelta(days=30)) == [], "❌ Day without a log should be empty"
+        print("✅ Only the most recently used days kept")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_changed_days_reloaded():
+    """Test that entries added or edited since a day was cached are shown"""
+    print("🧪 Testing cache invalidation...")
+
+    from day_cache import DayCache
+    from worklog_edits import read_entries, delete_entry
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        write_day(temp_dir, DAY, 'first')
+        cache = DayCache(temp_dir)
+        assert len(cache.get(DAY)) == 1, "❌ Day not parsed"
+        write_day(temp_dir, DAY, 'second')
+        assert [e['text'] for e in cache.get(DAY)] == ['first', 'second'], "❌ Appended entry not shown"
+        log_file = temp_dir / f'worklog_{DAY.isoformat()}.txt'
+        delete_entry(log_file, read_entries(log_file)[0][0])
+        assert [e['text'] for e in cache.get(DAY)] == ['second'], "❌ Deleted entry still shown"
+        print("✅ Appended and edited days read again")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_prefetch():
+    """Test neighbour order, cancelling and prefetching while the UI thread reads"""
+    print("🧪 Testing prefetch...")
+
+    from day_cache import DayCache, neighbours
+
+    assert neighbours(DAY, back=2, forward=1, today=DAY + timedelta(days=5)) == \
+        [DAY - timedelta(days=1), DAY + timedelta(days=1), DAY - timedelta(days=2)], "❌ Wrong neighbour order"
+    assert neighbours(DAY, back=1, forward=2, today=DAY) == [DAY - timedelta(days=1)], "❌ Days after today"
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        days = [DAY - timedelta(days=offset) for offset in range(30)]
+        for day in days:
+            write_day(temp_dir, day, *(f'task {n}' for n in range(10)))
+        cache = DayCache(temp_dir)
+        assert cache.prefetch(days, cancelled=lambda: True) == 0, "❌ Cancelled prefetch loaded days"
+
+        errors = []
+        def reader():
+            try:
+                for day in reversed(days):
+                    assert len(cache.get(day)) == 10
+            except Exception as e:
+                errors.append(e)
+        thread = threading.Thread(target=cache.prefetch, args=(days,))
+        readers = [threading.Thread(target=reader) for _ in range(3)]
+        for started in [thread] + readers:
+            started.start()
+        for started in [thread] + readers:
+            started.join()
+        assert not errors, f"❌ Reads failed while prefetching: {errors}"
+        assert all(day in cache for day in days), "❌ Days missing after prefetch"
+        assert cache.prefetch(days) == 0, "❌ Cached days prefetched again"
+        print("✅ Neighbours prefetched safely alongside reads")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_flip_two_weeks():
+    """Test that flipping back through two weeks in the panel only shows prefetched days"""
+    print("🧪 Testing history panel...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.history_view import HistoryPanel
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping history panel test")
+        return True
+
+    from generators import generate_worklog_dir
+    from localization import TranslationRegistry
+
+    app = QApplication.instance() or QApplication([])
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        generate_worklog_dir(temp_dir, years=1, entries_per_day=30)
+        panel = HistoryPanel(TranslationRegistry(), temp_dir)
+        today = date.today()
+        panel.show_day(today)
+        panel.wait()
+        flips = []
+        for _ in range(14):
+            misses = panel.cache.misses
+            started = time.perf_counter()
+            panel.show_day(panel.day - timedelta(days=1))
+            flips.append(time.perf_counter() - started)
+            assert panel.cache.misses == misses, f"❌ {panel.day} was not prefetched"
+            assert panel.model.rowCount() == len(panel.cache.get(panel.day)), "❌ Model not showing the day"
+            panel.wait()
+            app.processEvents()
+        assert panel.day == today - timedelta(days=14), f"❌ Wrong day: {panel.day}"
+        assert panel.date_edit.date().toPyDate() == panel.day, "❌ Calendar not following"
+        print(f"   Slowest flip {max(flips)*1000:.2f} ms")
+        assert max(flips) < 0.05, "❌ Flipping days too slow"
+
+        panel.show_day(today + timedelta(days=3))
+        assert panel.day == today and not panel.next_btn.isEnabled(), "❌ Days after today shown"
+        panel.wait()
+        print("✅ Two weeks flipped through prefetched days")
+        panel.deleteLater()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all history tests"""
+    print("🚀 Starting history tests...\n")
+
+    tests = [
+        test_lru_cache,
+        test_changed_days_reloaded,
+        test_prefetch,
+        test_flip_two_weeks
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL HISTORY TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Test script to verify search over the work log history.
+Tests the incrementally refreshed index, newest-first streamed results,
+cancelling superseded searches and that typing in the search box never
+runs a search on the UI thread.
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+DAY = date(2025, 1, 24)
+
+def write_day(data_dir, day, *lines):
+    with open(Path(data_dir) / f'worklog_{day.isoformat()}.txt', 'a', encoding='utf-8') as f:
+        for line in lines:
+            f.write(line + '\n')
+
+def make_history(data_dir):
+    write_day(data_dir, DAY, '2025-01-24 09:00 [Work] [#46: Login] - fix login redirect',
+              '2025-01-24 15:00 [Work]  - review login tests')
+    write_day(data_dir, DAY - timedelta(days=1), '2025-01-23 10:00 [Personal]  - read about login flows')
+    write_day(data_dir, DAY - timedelta(days=7), '2025-01-17 11:00 [Work]  - expense report totals')
+
+def test_index_and_order():
+    """Test that every word must match and results come newest first"""
+    print("🧪 Testing history index...")
+
+    from history_search import HistoryIndex
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        make_history(temp_dir)
+        index = HistoryIndex(temp_dir)
+        assert index.refresh() == 3 and len(index) == 4, "❌ Days not indexed"
+        results = [entry['text'] for batch in index.search('LOGIN') for _, entry in batch]
+        assert results == ['review login tests', 'fix login redirect', 'read about login flows'], \
+            f"❌ Unexpected order: {results}"
+        assert [entry['text'] for batch in index.search('login test') for _, entry in batch] == \
+            ['review login tests'], "❌ Every word should have to match"
+        assert [day for batch in index.search('#46') for day, _ in batch] == [DAY], "❌ Issue not searchable"
+        assert [e['text'] for b in index.search('personal') for _, e in b] == ['read about login flows'], \
+            "❌ Organization not searchable"
+        assert list(index.search('  ')) == [], "❌ Empty query should find nothing"
+        print("✅ Entries with every word found, newest first")
+
+        assert index.refresh() == 0, "❌ Unchanged days read again"
+        write_day(temp_dir, DAY, '2025-01-24 17:00 [Work]  - deploy login fix')
+        (temp_dir / f'worklog_{(DAY - timedelta(days=7)).isoformat()}.txt').unlink()
+        assert index.refresh() == 1, "❌ Only the changed day should be read"
+        assert [e['text'] for b in index.search('deploy') for _, e in b] == ['deploy login fix'], "❌ New entry missing"
+        assert list(index.search('expense')) == [], "❌ Removed day still searchable"
+        print("✅ Refresh re-reads only changed days")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_streaming_and_highlighting():
+    """Test batches, cancelling between batches and highlighted matches"""
+    print("🧪 Testing streamed results...")
+
+    from history_search import HistoryIndex, match_spans
+    from ui.history_view import highlighted
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        write_day(temp_dir, DAY, *(f'2025-01-24 {m // 60:02}:{m % 60:02} [Work]  - task {m}' for m in range(120)))
+        index = HistoryIndex(temp_dir)
+        index.refresh()
+        batches = list(index.search('task', batch_size=50))
+        assert [len(batch) for batch in batches] == [50, 50, 20], f"❌ Unexpected batches: {[len(b) for b in batches]}"
+        assert batches[0][0][1]['text'] == 'task 119', "❌ Newest entry should come first"
+        # A newer search starts once the first batch arrives
+        received = []
+        for batch in index.search('task', lambda: bool(received), batch_size=50):
+            received.append(batch)
+        assert len(received) == 1, "❌ Search not cancelled"
+
+        assert match_spans('Fix Login redirect', 'login re') == [(4, 9), (10, 12), (14, 16)], "❌ Wrong spans"
+        assert match_spans('aaa', 'aa') == [(0, 3)], "❌ Overlapping spans not merged"
+        marked = highlighted('fix <login>', 'login')
+        assert marked.startswith('fix &lt;<span') and 'login</span>&gt;' in marked, f"❌ Bad highlight: {marked}"
+        print("✅ Results streamed in batches, cancellable and highlighted")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_years_of_history():
+    """Test indexing and querying years of entries"""
+    print("🧪 Testing search over years of history...")
+
+    from generators import generate_worklog_dir
+    from history_search import HistoryIndex
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        generate_worklog_dir(temp_dir, years=3, entries_per_day=20)
+        index = HistoryIndex(temp_dir)
+        started = time.perf_counter()
+        index.refresh()
+        index_time = time.perf_counter() - started
+        started = time.perf_counter()
+        refresh_time = (index.refresh(), time.perf_counter() - started)[1]
+
+        word = next(iter(index.search('a')))[0][1]['text'].split()[-1]
+        started = time.perf_counter()
+        first = next(index.search(word))
+        first_batch = time.perf_counter() - started
+        print(f"   {len(index)} entries indexed in {index_time*1000:.0f} ms, refresh {refresh_time*1000:.1f} ms, "
+              f"first results for '{word}' in {first_batch*1000:.1f} ms")
+        assert len(index) > 10000 and first, "❌ Expected years of entries"
+        assert refresh_time < 0.2 and first_batch < 0.2, "❌ Search too slow"
+        print("✅ Years of history searched quickly")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_typing_stays_responsive():
+    """Test that keystrokes only restart the debounce timer and results arrive from the worker"""
+    print("🧪 Testing search box...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.history_view import HistoryPanel
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping search box test")
+        return True
+
+    from localization import TranslationRegistry
+    import ui.history_view as history_view
+
+    app = QApplication.instance() or QApplication([])
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        make_history(temp_dir)
+        panel = HistoryPanel(TranslationRegistry(), temp_dir)
+        panel.show_day(date.today())
+        started_workers = []
+        original_start = history_view.QThread.start
+        history_view.SearchWorker.start = lambda worker: (started_workers.append(worker.query),
+                                                          original_start(worker))
+        try:
+            slowest = 0
+            for char in 'login':
+                started = time.perf_counter()
+                panel.search_field.insert(char)
+                slowest = max(slowest, time.perf_counter() - started)
+            assert started_workers == [], "❌ Search ran before typing paused"
+            deadline = time.time() + 5
+            while time.time() < deadline and panel.results_model.rowCount() < 3:
+                app.processEvents()
+                time.sleep(0.01)
+        finally:
+            del history_view.SearchWorker.start
+        panel.wait()
+        app.processEvents()
+        print(f"   Slowest keystroke {slowest*1000:.2f} ms")
+        assert started_workers == ['login'], f"❌ Expected one debounced search: {started_workers}"
+        assert slowest < 0.005, "❌ Keystrokes should stay within a few ms"
+        assert panel.results_model.rowCount() == 3, f"❌ Results not streamed: {panel.results_model.rowCount()}"
+
+        panel.open_result(panel.results_model.index(2))
+        assert panel.day == DAY - timedelta(days=1), f"❌ Didn't jump to the day: {panel.day}"
+        assert panel.view.currentIndex().row() == 0, "❌ Entry not selected"
+        assert panel.stack.currentWidget() is panel.view, "❌ Day not shown"
+        print("✅ Typing debounced, results streamed, result opens its day")
+        panel.deleteLater()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all history search tests"""
+    print("🚀 Starting history search tests...\n")
+
+    tests = [
+        test_index_and_order,
+        test_streaming_and_highlighting,
+        test_years_of_history,
+        test_typing_stays_responsive
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL HISTORY SEARCH TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
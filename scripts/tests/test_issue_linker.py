@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Test script to verify automatic issue linking of work log entries.
+Tests the multi-pattern matcher, how entries are scored against issues,
+incremental updates and that the dashboard tags entries saved without an issue.
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def sample_items():
+    from github_items import GitHubItem
+    items = [
+        GitHubItem('issues', 12, 'Login redirect loops on mobile', 'CruGlobal/appbuilder_platform_pwa'),
+        GitHubItem('issues', 123, 'Expense report totals are wrong', 'Achoobert/time_assist'),
+        GitHubItem('prs', 126, 'Add offline cache for dashboard', 'Achoobert/time_assist'),
+        GitHubItem('reviews', 7, 'Theme colors for dark mode', 'digi-serve/ab_platform_web'),
+        GitHubItem('reviews', 7, 'Update docs index', 'digi-serve/ab_service_appbuilder'),
+    ]
+    return {item.combo_text + ' ' + item.repo: item for item in items}
+
+def test_aho_corasick_finds_all_patterns():
+    """Test that every occurrence of every pattern is found, including overlaps"""
+    print("🧪 Testing Aho-Corasick matcher...")
+
+    from issue_linker import AhoCorasick
+
+    matcher = AhoCorasick()
+    for pattern in ['he', 'she', 'his', 'hers']:
+        matcher.add(pattern)
+    found = sorted(matcher.find('ushers'))
+    assert found == [(1, 4, 'she'), (2, 4, 'he'), (2, 6, 'hers')], f"❌ Wrong matches: {found}"
+
+    # Patterns added after matching are picked up
+    matcher.add('us')
+    found = sorted(matcher.find('ushers'))
+    assert (0, 2, 'us') in found and len(found) == 4, f"❌ Added pattern not matched: {found}"
+    assert len(matcher) == 5, "❌ Pattern count wrong"
+    print("✅ All overlapping matches found")
+    return True
+
+def test_number_and_keyword_linking():
+    """Test that '#123' and title words link to the right issue"""
+    print("🧪 Testing entry linking...")
+
+    from issue_linker import IssueLinker
+
+    items = sample_items()
+
+    def key(number, repo):
+        return next(key for key, item in items.items() if item.number == number and item.repo.endswith(repo))
+
+    linker = IssueLinker()
+    linker.update(items)
+
+    assert linker.best('fixed #123 totals') == key('123', 'time_assist'), "❌ #123 not linked"
+    assert linker.best('looked at #12.') == key('12', 'pwa'), "❌ #12 not linked"
+    assert linker.best('#1234 is unrelated') is None, "❌ #1234 should not match #123 or #12"
+    assert linker.best('fixed the expense report totals') == key('123', 'time_assist'), "❌ Title words not linked"
+    assert linker.best('wrote a report') is None, "❌ One common word should not link"
+    assert linker.best('reviewing') is None, "❌ Partial words should not match"
+    print("✅ Numbers and title words linked")
+
+    # '#7' is in two repositories, only the repo name tells them apart
+    assert linker.best('reviewed #7') is None, "❌ Ambiguous number should not link"
+    assert len(linker.match('reviewed #7')) == 2, "❌ Both candidates expected"
+    assert linker.best('reviewed #7 in ab_platform_web') == key('7', 'ab_platform_web'), \
+        "❌ Repository name should break the tie"
+    print("✅ Ambiguous entries are left unlinked")
+    return True
+
+def test_incremental_updates():
+    """Test that items can be added and removed without rebuilding"""
+    print("🧪 Testing incremental updates...")
+
+    from github_items import GitHubItem
+    from issue_linker import IssueLinker
+
+    items = sample_items()
+    linker = IssueLinker()
+    linker.update(items)
+    patterns = len(linker.matcher)
+
+    linker.update(dict(items))
+    assert len(linker.matcher) == patterns, "❌ Unchanged update should not add patterns"
+
+    new_item = GitHubItem('issues', 200, 'Calendar sync drops events', 'Achoobert/time_assist')
+    linker.add('new', new_item)
+    assert linker.best('calendar sync #200') == 'new', "❌ Added item not linked"
+
+    del items[next(key for key, item in items.items() if item.number == '123')]
+    linker.update(items)
+    assert 'new' not in linker, "❌ Item missing from update should be removed"
+    assert linker.best('fixed #123') is None, "❌ Removed item still linked"
+    assert linker.best('fixed #126') is not None, "❌ Remaining item no longer linked"
+    print("✅ Items added and removed in place")
+    return True
+
+def test_matching_speed():
+    """Test that matching stays fast enough to run on every keystroke"""
+    print("🧪 Testing matching speed with 20k items...")
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+    from generators import generate_github_data
+    from github_items import items_from_yaml
+    from issue_linker import IssueLinker
+
+    data = items_from_yaml(generate_github_data(items=20000))
+    items = {item.combo_text + item.repo: item for kind in data.values() for item in kind}
+    linker = IssueLinker()
+    start = time.perf_counter()
+    linker.update(items)
+    build = time.perf_counter() - start
+
+    text = 'Fixed the login redirect and updated the expense report export #4521'
+    start = time.perf_counter()
+    for _ in range(100):
+        linker.best(text)
+    per_match = (time.perf_counter() - start) / 100
+    print(f"   Built in {build*1000:.0f} ms, {per_match*1000:.3f} ms per match")
+    assert per_match < 0.01, f"❌ Matching too slow: {per_match*1000:.1f} ms"
+    assert linker.best(text) is not None, "❌ #4521 should link"
+    print("✅ Matching is fast enough for every keystroke")
+    return True
+
+def test_dashboard_links_entries():
+    """Test that entries saved without an issue are tagged with the linked one"""
+    print("🧪 Testing dashboard entry linking...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping dashboard test")
+        return True
+
+    import ui.dashboard as dashboard_module
+    from github_items import GitHubItem
+
+    app = QApplication.instance() or QApplication([])
+    temp_dir = Path(tempfile.mkdtemp())
+    original_get_data_dir = dashboard_module.get_data_dir
+    dashboard_module.get_data_dir = lambda: temp_dir
+    try:
+        dashboard = dashboard_module.Dashboard()
+        dashboard.finish_startup()
+        dashboard.add_github_item(GitHubItem('issues', 4242, 'Payroll export crashes', 'Achoobert/time_assist'))
+
+        dashboard.entry_field.setText('fixed #4242 export')
+        dashboard.suggest_issue_link(dashboard.entry_field.text())
+        assert not dashboard.link_hint.isHidden() and '#4242' in dashboard.link_hint.text(), "❌ Link hint not shown"
+
+        dashboard.save_entry()
+        saved = next(temp_dir.glob('worklog_*.txt')).read_text(encoding='utf-8')
+        assert '[#4242: Payroll export crashes]' in saved, f"❌ Entry not tagged: {saved}"
+        assert dashboard.link_hint.isHidden(), "❌ Hint should hide after saving"
+
+        # A half-typed filter that was never picked is not an issue and doesn't block linking
+        dashboard.issue_combo.setEditText('Payr')
+        dashboard.entry_field.setText('more work on #4242')
+        dashboard.save_entry()
+        last = next(temp_dir.glob('worklog_*.txt')).read_text(encoding='utf-8').splitlines()[-1]
+        assert '[Payr]' not in last and '[#4242: Payroll export crashes]' in last, f"❌ Typed filter saved: {last}"
+
+        dashboard.add_entry('', '', 'planning meeting')
+        saved = next(temp_dir.glob('worklog_*.txt')).read_text(encoding='utf-8')
+        assert saved.splitlines()[-1].endswith('planning meeting') and '#' not in saved.splitlines()[-1], \
+            "❌ Unrelated entry should not be tagged"
+        print("✅ Entries tagged with the linked issue")
+        dashboard.deleteLater()
+    finally:
+        dashboard_module.get_data_dir = original_get_data_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def run_all_tests():
+    """Run all issue linker tests"""
+    print("🚀 Starting issue linker tests...\n")
+
+    tests = [
+        test_aho_corasick_finds_all_patterns,
+        test_number_and_keyword_linking,
+        test_incremental_updates,
+        test_matching_speed,
+        test_dashboard_links_entries
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL ISSUE LINKER TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -309,7 +309,7 @@ def test_clipboard_functionality():
             assert 'self.llm_text.toPlainText()' in dashboard_code, "❌ Should get text from llm_text widget"
             
             # Check that copy buttons exist
-            assert 'Copy LLM Report' in dashboard_code, "❌ Copy LLM Report button should exist"
+            assert "bind('copy_llm_report', copy_llm_btn.setText)" in dashboard_code, "❌ Copy LLM Report button should exist"
             assert 'copy_llm_btn.clicked.connect(self.copy_llm_report)' in dashboard_code, "❌ Copy button should be connected"
             
             print("✅ Clipboard functionality structure verified in code")
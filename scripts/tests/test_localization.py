@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Test script to verify cached translation lookups.
+Tests fallbacks, language caching, invalidation on set_language and
+relabeling the dashboard in place when the language changes.
+"""
+
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def test_fallbacks():
+    """Test English and key fallbacks"""
+    print("🧪 Testing translation fallbacks...")
+
+    import localization
+    from localization import tr
+
+    assert tr('save_entry', 'th') == 'บันทึก (Enter)', "❌ Thai lookup failed"
+    assert tr('save_entry', 'fr') == 'Save Entry (Enter)', "❌ Unknown language should fall back to English"
+    assert tr('no_such_key', 'zh') == 'no_such_key', "❌ Unknown key should fall back to itself"
+
+    with patch.dict(localization.TRANSLATIONS['en'], {'only_in_english': 'English only'}):
+        localization._catalogs.clear()
+        assert tr('only_in_english', 'th') == 'English only', "❌ Missing Thai key should use English"
+    localization._catalogs.clear()
+
+    print("✅ Fallbacks work")
+    return True
+
+def test_language_resolved_once():
+    """Test that tr() doesn't read context.yml on every lookup"""
+    print("🧪 Testing language caching...")
+
+    import localization
+
+    localization.invalidate_language_cache()
+    with patch.object(localization, 'get_language_from_config', return_value='zh') as get_language:
+        for _ in range(200):
+            assert localization._('save_entry') == '保存 (Enter)'
+        assert get_language.call_count == 1, f"❌ Language read {get_language.call_count} times"
+    localization.invalidate_language_cache()
+
+    print("✅ 200 lookups resolved the language once")
+    return True
+
+def test_set_language_invalidates():
+    """Test that set_language switches tr() immediately"""
+    print("🧪 Testing set_language invalidation...")
+
+    import localization
+    import config_service
+    from config_service import ConfigService
+
+    temp_dir = Path(tempfile.mkdtemp())
+    original_service = config_service._service
+    try:
+        path = temp_dir / 'context.yml'
+        path.write_text('ui:\n  language: en\n', encoding='utf-8')
+        config_service._service = ConfigService([path])
+        localization.invalidate_language_cache()
+        localization._watching_config = False
+
+        assert localization.tr('language') == 'Language', "❌ Should start in English"
+        assert localization.set_language('th'), "❌ set_language failed"
+        assert localization.tr('language') == 'ภาษา', "❌ Language not switched"
+        assert 'language: th' in path.read_text(encoding='utf-8'), "❌ context.yml not updated"
+
+        # A hand edit of context.yml is picked up too
+        path.write_text('ui:\n  language: zh\n', encoding='utf-8')
+        config_service._service.reload()
+        assert localization.tr('language') == '语言', "❌ Edited language not picked up"
+        print("✅ Language switches without stale lookups")
+    finally:
+        config_service._service = original_service
+        localization.invalidate_language_cache()
+        localization._watching_config = False
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def test_registry_retranslates():
+    """Test that bound setters are re-applied and deleted widgets are dropped"""
+    print("🧪 Testing translation registry...")
+
+    import localization
+    from localization import TranslationRegistry
+
+    class Widget:
+        deleted = False
+        def setText(self, text):
+            if self.deleted:
+                raise RuntimeError("wrapped C/C++ object has been deleted")
+
+    labels = []
+    widget = Widget()
+    registry = TranslationRegistry()
+    registry.bind('save_entry', labels.append)
+    registry.bind('language', widget.setText)
+    assert len(labels) == 1 and len(registry) == 2, "❌ Bindings not applied"
+    widget.deleted = True
+
+    try:
+        localization.set_active_language('zh')
+        registry.retranslate()
+        assert labels[-1] == '保存 (Enter)', "❌ Binding not retranslated"
+        assert len(registry) == 1, "❌ Deleted widget should be dropped"
+    finally:
+        localization.invalidate_language_cache()
+
+    print("✅ Bindings retranslated, deleted widgets dropped")
+    return True
+
+def test_dashboard_switches_in_place():
+    """Test that switching language relabels the dashboard and keeps typed text"""
+    print("🧪 Testing live dashboard language switch...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping dashboard test")
+        return True
+
+    import time
+    import localization
+    import config_service
+    from config_service import ConfigService
+
+    app = QApplication.instance() or QApplication([])
+    temp_dir = Path(tempfile.mkdtemp())
+    original_service = config_service._service
+    try:
+        path = temp_dir / 'context.yml'
+        path.write_text('ui:\n  language: en\n  available_languages:\n    en: English\n    th: ไทย\n    zh: 中文\n',
+                        encoding='utf-8')
+        config_service._service = ConfigService([path])
+        localization.invalidate_language_cache()
+        localization._watching_config = False
+
+        from ui.dashboard import Dashboard
+        dashboard = Dashboard()
+        dashboard.entry_field.setText('half typed entry')
+        dashboard.issue_combo.setEditText('#12')
+        entry_widget = dashboard.entry_field
+
+        start = time.perf_counter()
+        dashboard.language_combo.setCurrentIndex(dashboard.language_combo.findData('th'))
+        elapsed = time.perf_counter() - start
+        print(f"   Switched to Thai in {elapsed*1000:.1f} ms")
+
+        assert dashboard.windowTitle() == 'Reporter - เครื่องมือติดตามงาน', "❌ Window title not relabeled"
+        assert dashboard.entry_field is entry_widget, "❌ Entry field should not be rebuilt"
+        assert dashboard.entry_field.text() == 'half typed entry', "❌ Typed entry text was lost"
+        assert dashboard.entry_field.placeholderText() == 'ใส่รายละเอียดงาน... (กด Enter เพื่อบันทึก)', "❌ Placeholder not relabeled"
+        assert dashboard.issue_combo.currentText() == '#12', "❌ Typed Issue/PR text was lost"
+        assert dashboard.org_combo.itemText(0) == 'เลือกองค์กร...', "❌ Organization placeholder not relabeled"
+        assert dashboard.github_panel.tabText(2) == 'รีวิว', "❌ Tab title not relabeled"
+        assert 'language: th' in path.read_text(encoding='utf-8'), "❌ Language not saved to context.yml"
+        print("✅ Dashboard relabeled in place with typed text kept")
+
+        # A hand edit of ui.language is applied too
+        path.write_text(path.read_text(encoding='utf-8').replace('language: th', 'language: zh'), encoding='utf-8')
+        config_service._service.reload()
+        assert dashboard.windowTitle() == 'Reporter - 工作跟踪器', "❌ Edited language not applied"
+        assert dashboard.language_combo.currentData() == 'zh', "❌ Selector not synced with context.yml"
+        print("✅ Edited ui.language applied")
+        dashboard.deleteLater()
+    finally:
+        config_service._service = original_service
+        localization.invalidate_language_cache()
+        localization._watching_config = False
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def run_all_tests():
+    """Run all localization tests"""
+    print("🚀 Starting localization tests...\n")
+
+    tests = [
+        test_fallbacks,
+        test_language_resolved_once,
+        test_set_language_invalidates,
+        test_registry_retranslates,
+        test_dashboard_switches_in_place
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL LOCALIZATION TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
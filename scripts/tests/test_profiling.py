@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Test script to verify timing spans, the rotating trace file and the summary.
+Tests that spans are free when tracing is off and recorded when it is on.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import tempfile
+import shutil
+import subprocess
+from contextlib import redirect_stderr
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+def reset(profiling):
+    profiling.disable()
+    profiling.set_profiled(())
+    profiling._trace_file = None
+
+def test_disabled_spans_are_free():
+    """Test that spans do nothing and write nothing when tracing is off"""
+    print("🧪 Testing disabled spans...")
+
+    import profiling
+
+    reset(profiling)
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        profiling._trace_file = temp_dir / 'trace.jsonl'
+        assert profiling.span('worklog.save') is profiling.span('github.fetch'), "❌ Disabled spans should be shared"
+
+        count = 100000
+        start = time.perf_counter()
+        for _ in range(count):
+            with profiling.span('worklog.save') as timing:
+                timing.set(items=1)
+        elapsed = time.perf_counter() - start
+        print(f"   {elapsed / count * 1e9:.0f} ns per disabled span")
+        assert elapsed < 1.0, f"❌ Disabled spans too slow: {elapsed:.2f}s for {count}"
+        assert not (temp_dir / 'trace.jsonl').exists(), "❌ Nothing should be written when disabled"
+        print("✅ Disabled spans are no-ops")
+    finally:
+        reset(profiling)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_enabled_spans_recorded():
+    """Test that spans are written as JSON lines with their fields"""
+    print("🧪 Testing recorded spans...")
+
+    import profiling
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        trace_file = temp_dir / 'trace.jsonl'
+        profiling.enable(trace_file)
+        with profiling.span('github.fetch', source='test') as timing:
+            time.sleep(0.01)
+            timing.set(items=3)
+        try:
+            with profiling.span('llm.request'):
+                raise ConnectionError('refused')
+        except ConnectionError:
+            pass
+
+        records = [json.loads(line) for line in trace_file.read_text(encoding='utf-8').splitlines()]
+        assert [record['op'] for record in records] == ['github.fetch', 'llm.request'], f"❌ Wrong spans: {records}"
+        assert records[0]['ms'] >= 10 and records[0]['items'] == 3 and records[0]['source'] == 'test', \
+            f"❌ Timing or fields missing: {records[0]}"
+        assert records[0]['thread'] == 'MainThread', "❌ Thread not recorded"
+        assert records[1]['error'] == 'ConnectionError', "❌ Failed span should record the error"
+        print("✅ Spans recorded with timings, fields and errors")
+    finally:
+        reset(profiling)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_trace_rotation():
+    """Test that the trace is rotated and old files are read back in order"""
+    print("🧪 Testing trace rotation...")
+
+    import profiling
+
+    temp_dir = Path(tempfile.mkdtemp())
+    original_max = profiling.MAX_TRACE_BYTES
+    try:
+        trace_file = temp_dir / 'trace.jsonl'
+        profiling.MAX_TRACE_BYTES = 2000
+        profiling.enable(trace_file)
+        for i in range(200):
+            with profiling.span('worklog.save', n=i):
+                pass
+
+        names = sorted(path.name for path in temp_dir.iterdir())
+        assert names == ['trace.jsonl', 'trace.jsonl.1', 'trace.jsonl.2', 'trace.jsonl.3'], f"❌ Unexpected files: {names}"
+        assert all(path.stat().st_size <= 2200 for path in temp_dir.iterdir()), "❌ Trace grew past the limit"
+        numbers = [record['n'] for record in profiling.read_records(trace_file)]
+        assert numbers == sorted(numbers) and numbers[-1] == 199, "❌ Records not read oldest first"
+        assert len(numbers) < 200, "❌ Oldest file should have been dropped"
+        print(f"✅ Trace rotated, {len(numbers)} most recent spans kept")
+    finally:
+        profiling.MAX_TRACE_BYTES = original_max
+        reset(profiling)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_summary_percentiles():
+    """Test per-operation p50/p95 and the --trace-summary command"""
+    print("🧪 Testing trace summary...")
+
+    import profiling
+
+    records = [{'op': 'worklog.save', 'ms': float(ms)} for ms in range(100, 0, -1)]
+    records.append({'op': 'github.load', 'ms': 7.0})
+    summary = profiling.summarize(records)
+    assert summary['worklog.save'] == {'count': 100, 'p50': 50.0, 'p95': 95.0, 'max': 100.0}, \
+        f"❌ Wrong percentiles: {summary['worklog.save']}"
+    assert summary['github.load']['p95'] == 7.0, "❌ Single value should be its own percentile"
+    print("✅ Percentiles computed")
+
+    temp_home = Path(tempfile.mkdtemp())
+    try:
+        (temp_home / '.reporter').mkdir()
+        trace_file = temp_home / '.reporter' / 'trace.jsonl'
+        trace_file.write_text(''.join(json.dumps(record) + '\n' for record in records) + '{"op": "cut',
+                              encoding='utf-8')
+        env = dict(os.environ, HOME=str(temp_home))
+        result = subprocess.run([sys.executable, str(PROJECT_ROOT / 'main.py'), '--trace-summary'],
+                                env=env, capture_output=True, text=True, timeout=30)
+        assert result.returncode == 0, f"❌ --trace-summary failed: {result.stderr}"
+        lines = result.stdout.splitlines()
+        assert lines[1].split()[:4] == ['worklog.save', '100', '50.00', '95.00'], f"❌ Unexpected summary: {result.stdout}"
+        print("✅ main.py --trace-summary prints the summary")
+    finally:
+        shutil.rmtree(temp_home, ignore_errors=True)
+    return True
+
+def test_profile_switch():
+    """Test that a chosen span runs under cProfile and its stats are saved"""
+    print("🧪 Testing cProfile switch...")
+
+    import profiling
+    import pstats
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        profiling._trace_file = temp_dir / 'trace.jsonl'
+        profiling.set_profiled({'github.parse'})
+        from github_data import parse_gh_status_table
+        with redirect_stderr(io.StringIO()) as output:
+            parse_gh_status_table("Assigned Issues │ Assigned Pull Requests\no/r#1  title │")
+            with profiling.span('worklog.save'):
+                pass
+
+        profiles = list((temp_dir / 'profiles').glob('*.prof'))
+        assert len(profiles) == 1 and profiles[0].name.startswith('github.parse-'), f"❌ Profile not saved: {profiles}"
+        stats = pstats.Stats(str(profiles[0]))
+        assert any(function == 'iter_gh_status' for _, _, function in stats.stats), "❌ Profile missing parser calls"
+        assert 'iter_gh_status' in output.getvalue(), "❌ Top functions not printed"
+        assert not (temp_dir / 'trace.jsonl').exists(), "❌ Profiling alone should not write the trace"
+        print("✅ Chosen span profiled, others untouched")
+    finally:
+        reset(profiling)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_hot_paths_instrumented():
+    """Test that saving and reloading the work log records spans"""
+    print("🧪 Testing instrumented hot paths...")
+
+    import profiling
+    import ui.dashboard as dashboard_module
+
+    temp_dir = Path(tempfile.mkdtemp())
+    original_get_data_dir = dashboard_module.get_data_dir
+    try:
+        dashboard_module.get_data_dir = lambda: temp_dir
+        profiling.enable(temp_dir / 'trace.jsonl')
+        dashboard_module.save_worklog_entry('Work', '#1', 'traced entry', temp_dir)
+        dashboard_module.get_today_worklog()
+
+        ops = [record['op'] for record in profiling.read_records(temp_dir / 'trace.jsonl')]
+        assert ops == ['worklog.save', 'worklog.read'], f"❌ Unexpected spans: {ops}"
+        print("✅ Work log save and read traced")
+    finally:
+        dashboard_module.get_data_dir = original_get_data_dir
+        reset(profiling)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all profiling tests"""
+    print("🚀 Starting profiling tests...\n")
+
+    tests = [
+        test_disabled_spans_are_free,
+        test_enabled_spans_recorded,
+        test_trace_rotation,
+        test_summary_percentiles,
+        test_profile_switch,
+        test_hot_paths_instrumented
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL PROFILING TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
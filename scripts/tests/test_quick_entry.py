@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the quick entry popup and tray icon.
+Tests that the popup shares the dashboard's data, opens without disk reads,
+and saves entries through the same path as the dashboard.
+"""
+
+import sys
+import builtins
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def make_dashboard():
+    from ui.dashboard import Dashboard
+    dashboard = Dashboard()
+    dashboard.org_combo.addItem('Work')
+    return dashboard
+
+def test_popup_shares_dashboard_data():
+    """Test that the popup uses the dashboard's combo models and search index"""
+    print("🧪 Testing popup shares dashboard data...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.quick_entry import QuickEntryPopup
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping popup test")
+        return True
+
+    app = QApplication.instance() or QApplication([])
+    dashboard = make_dashboard()
+    popup = QuickEntryPopup(dashboard)
+
+    assert popup.org_combo.model() is dashboard.org_combo.model(), "❌ Organization model not shared"
+    assert popup.issue_combo.model() is dashboard.issue_combo.model(), "❌ Issue/PR model not shared"
+    assert popup.org_combo.findText('Work') > 0, "❌ Organization added to the dashboard not in popup"
+    assert popup.entry_field.placeholderText() == dashboard.entry_field.placeholderText(), "❌ Placeholder not set"
+    print("✅ Popup shares the dashboard's models")
+
+    popup.deleteLater()
+    dashboard.deleteLater()
+    return True
+
+def test_popup_opens_without_disk_reads():
+    """Test that opening the popup only shows an already built window"""
+    print("🧪 Testing popup opens without disk reads...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.quick_entry import QuickEntryPopup
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping popup test")
+        return True
+
+    import time
+
+    app = QApplication.instance() or QApplication([])
+    dashboard = make_dashboard()
+    popup = QuickEntryPopup(dashboard)
+
+    def no_open(*args, **kwargs):
+        raise AssertionError(f"disk read while opening popup: {args[0] if args else ''}")
+
+    original_open = builtins.open
+    builtins.open = no_open
+    try:
+        start = time.perf_counter()
+        popup.open_popup()
+        elapsed = time.perf_counter() - start
+    finally:
+        builtins.open = original_open
+
+    print(f"   Popup opened in {elapsed*1000:.1f} ms")
+    assert popup.isVisible(), "❌ Popup not shown"
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtTest import QTest
+    QTest.keyClick(popup, Qt.Key_Escape)
+    assert not popup.isVisible(), "❌ Escape should hide the popup"
+    print("✅ Popup opened without touching the disk")
+
+    popup.deleteLater()
+    dashboard.deleteLater()
+    return True
+
+def test_popup_saves_through_dashboard():
+    """Test that Enter in the popup writes the entry like the dashboard does"""
+    print("🧪 Testing popup saves entries...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.quick_entry import QuickEntryPopup
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping popup test")
+        return True
+
+    import ui.dashboard as dashboard_module
+
+    app = QApplication.instance() or QApplication([])
+    temp_dir = Path(tempfile.mkdtemp())
+    original_get_data_dir = dashboard_module.get_data_dir
+    dashboard_module.get_data_dir = lambda: temp_dir
+    try:
+        dashboard = make_dashboard()
+        popup = QuickEntryPopup(dashboard)
+        popup.open_popup()
+        popup.org_combo.setCurrentIndex(popup.org_combo.findText('Work'))
+        popup.entry_field.setText('reviewed release notes')
+        popup.entry_field.returnPressed.emit()
+
+        logs = list(temp_dir.glob('worklog_*.txt'))
+        assert len(logs) == 1, "❌ Work log not written"
+        saved = logs[0].read_text(encoding='utf-8')
+        assert '[Work]' in saved and 'reviewed release notes' in saved, "❌ Entry not saved"
+        assert 'reviewed release notes' in dashboard.worklog_text.toPlainText(), "❌ Dashboard log not refreshed"
+        assert popup.entry_field.text() == '' and not popup.isVisible(), "❌ Popup should clear and hide after saving"
+        print("✅ Entry saved through the dashboard and popup hidden")
+
+        # Text typed into the Issue/PR box without picking an item is not saved as the issue
+        popup.open_popup()
+        popup.issue_combo.setEditText('tes')
+        popup.entry_field.setText('half-typed issue')
+        popup.entry_field.returnPressed.emit()
+        last = logs[0].read_text(encoding='utf-8').splitlines()[-1]
+        assert last.endswith('half-typed issue') and '[tes]' not in last, f"❌ Typed filter saved: {last}"
+
+        # Empty entries are ignored
+        popup.open_popup()
+        popup.entry_field.returnPressed.emit()
+        assert popup.isVisible(), "❌ Empty entry should keep the popup open"
+        popup.hide()
+        popup.deleteLater()
+        dashboard.deleteLater()
+    finally:
+        dashboard_module.get_data_dir = original_get_data_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def test_tray_without_system_tray():
+    """Test that a missing system tray does not stop the app"""
+    print("🧪 Testing tray icon...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
+        from ui.quick_entry import QuickEntryPopup, create_tray
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping tray test")
+        return True
+
+    app = QApplication.instance() or QApplication([])
+    dashboard = make_dashboard()
+    popup = QuickEntryPopup(dashboard)
+    tray = create_tray(dashboard, popup)
+    if QSystemTrayIcon.isSystemTrayAvailable():
+        assert tray is not None and tray.contextMenu().actions()[0].text() == 'Quick Entry', "❌ Tray menu not labeled"
+        tray.hide()
+        print("✅ Tray icon created")
+    else:
+        assert tray is None, "❌ No tray should be created without a system tray"
+        print("✅ No system tray, app runs without the icon")
+
+    popup.deleteLater()
+    dashboard.deleteLater()
+    return True
+
+def run_all_tests():
+    """Run all quick entry tests"""
+    print("🚀 Starting quick entry tests...\n")
+
+    tests = [
+        test_popup_shares_dashboard_data,
+        test_popup_opens_without_disk_reads,
+        test_popup_saves_through_dashboard,
+        test_tray_without_system_tray
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL QUICK ENTRY TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
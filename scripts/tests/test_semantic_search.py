@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Test script to verify searching the work log history by meaning.
+Runs a stub of the Ollama embeddings endpoint on localhost, so no model or
+network is needed. Tests that only new entries are embedded, in batches, that
+the matrix on disk survives restarts, edits and an unreachable server, and
+that a query over 50k entries answers in tens of ms.
+"""
+
+import os
+import sys
+import json
+import subprocess
+import time
+import zlib
+import shutil
+import tempfile
+import threading
+from datetime import date, timedelta
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+DAY = date(2025, 1, 24)
+
+# Words the stub treats as meaning the same thing
+CONCEPTS = {
+    'login': 0, 'auth': 0, 'sign-in': 0, 'password': 0,
+    'fix': 1, 'bug': 1, 'broken': 1, 'redirect': 1,
+    'expense': 2, 'report': 2, 'totals': 2,
+    'deploy': 3, 'release': 3,
+}
+
+class StubEmbeddings:
+    """Ollama /api/embed on a local port, with vectors made from CONCEPTS"""
+
+    def __init__(self, dim=16):
+        self.dim = dim
+        self.requests = []  # input texts of every request
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                stub.requests.append((body['model'], body['input']))
+                payload = json.dumps({'model': body['model'],
+                                      'embeddings': [stub.vector(text) for text in body['input']]}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(('127.0.0.1', 0), Handler)
+        self.api = f'http://127.0.0.1:{self.server.server_port}/api/embed'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def vector(self, text):
+        vector = [0.0] * self.dim
+        for word in text.lower().split():
+            concept = CONCEPTS.get(word)
+            if concept is None:
+                concept = len(CONCEPTS) + zlib.crc32(word.encode()) % (self.dim - len(CONCEPTS))
+                vector[concept] += 0.3
+            else:
+                vector[concept] += 1.0
+        return vector
+
+    def embedded(self):
+        return sum(len(texts) for _, texts in self.requests)
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def write_day(data_dir, day, *lines):
+    with open(Path(data_dir) / f'worklog_{day.isoformat()}.txt', 'a', encoding='utf-8') as f:
+        for line in lines:
+            f.write(line + '\n')
+
+def make_history(data_dir):
+    write_day(data_dir, DAY, '2025-01-24 09:00 [Work]  - fix login redirect',
+              '2025-01-24 15:00 [Work]  - release notes for the deploy')
+    write_day(data_dir, DAY - timedelta(days=1), '2025-01-23 10:00 [Work]  - expense report totals')
+    write_day(data_dir, DAY - timedelta(days=7), '2025-01-17 11:00 [Work]  - broken password reset')
+
+def numpy_missing():
+    from semantic_search import available
+    if not available():
+        print("⚠️  numpy not available, skipping semantic search test")
+        return True
+    return False
+
+def test_embedding_endpoint():
+    """Test the endpoint taken from local_llm and batched requests to it"""
+    print("🧪 Testing embeddings endpoint...")
+
+    from semantic_search import embedding_config, embed_texts, DEFAULT_EMBED_MODEL
+
+    assert embedding_config({'api': 'http://gpu-box:11434/api/generate'}) == \
+        ('http://gpu-box:11434/api/embed', DEFAULT_EMBED_MODEL), "❌ Endpoint not derived from api"
+    assert embedding_config({'embed_api': 'http://x/embed', 'embed_model': 'all-minilm'}) == \
+        ('http://x/embed', 'all-minilm'), "❌ Configured endpoint ignored"
+
+    stub = StubEmbeddings()
+    try:
+        vectors = embed_texts(['fix login', 'auth bug'], stub.api, 'all-minilm')
+        assert len(vectors) == 2 and len(vectors[0]) == stub.dim, "❌ Wrong embeddings"
+        assert stub.requests == [('all-minilm', ['fix login', 'auth bug'])], "❌ Texts not sent in one request"
+        print("✅ Endpoint configured and texts embedded in one request")
+    finally:
+        stub.stop()
+    return True
+
+def test_incremental_embedding():
+    """Test that only new entries are embedded, in batches, and paraphrases are found"""
+    print("🧪 Testing incremental embedding...")
+
+    if numpy_missing():
+        return True
+    from semantic_search import SemanticIndex
+    from worklog_edits import read_entries, delete_entry
+
+    stub = StubEmbeddings()
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        make_history(temp_dir)
+        index = SemanticIndex(temp_dir, api=stub.api, model='stub', batch_size=3)
+        assert index.refresh() == 4, "❌ Entries not embedded"
+        assert [len(texts) for _, texts in stub.requests] == [3, 1], "❌ Entries not embedded in batches"
+        results = {entry['text'] for _, entry in index.search('auth bug', k=2)}
+        assert results == {'fix login redirect', 'broken password reset'}, f"❌ Paraphrase not found: {results}"
+        print("✅ Entries embedded in batches, paraphrases found")
+
+        requests_made = len(stub.requests)
+        assert index.refresh() == 0 and len(stub.requests) == requests_made, "❌ Unchanged entries embedded again"
+        write_day(temp_dir, DAY, '2025-01-24 17:00 [Work]  - sign-in broken on mobile')
+        assert index.refresh() == 1 and stub.requests[-1][1] == ['Work sign-in broken on mobile'], \
+            "❌ Only the new entry should be embedded"
+
+        # A restart reads the matrix back instead of embedding again
+        restarted = SemanticIndex(temp_dir, api=stub.api, model='stub')
+        embedded = stub.embedded()
+        assert restarted.refresh() == 0 and stub.embedded() == embedded, "❌ Stored embeddings not reused"
+        assert len(restarted) == 5, f"❌ Expected 5 entries: {len(restarted)}"
+        print("✅ Only new entries embedded, stored matrix reused after a restart")
+
+        log_file = temp_dir / f'worklog_{DAY.isoformat()}.txt'
+        delete_entry(log_file, read_entries(log_file)[0][0])
+        vectors_size = index.vectors_path.stat().st_size
+        assert index.refresh() == 0, "❌ Deleting shouldn't embed anything"
+        results = [entry['text'] for _, entry in index.search('login fix')]
+        assert 'fix login redirect' not in results and len(results) == 4, f"❌ Deleted entry found: {results}"
+        assert index.vectors_path.stat().st_size == vectors_size * 4 // 5, "❌ Stale rows not compacted"
+
+        index.model = 'other-model'
+        assert index.refresh() == 4, "❌ Entries should be embedded again by another model"
+        assert stub.requests[-1][0] == 'other-model', "❌ New model not used"
+        print("✅ Deleted entries dropped, another model starts over")
+    finally:
+        stub.stop()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_offline_and_cancelled():
+    """Test that an unreachable server or a cancelled refresh keeps what was embedded"""
+    print("🧪 Testing offline embedding server...")
+
+    if numpy_missing():
+        return True
+    import requests
+    from semantic_search import SemanticIndex
+
+    stub = StubEmbeddings()
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        make_history(temp_dir)
+        index = SemanticIndex(temp_dir, api=stub.api, model='stub', batch_size=1)
+        assert index.refresh(cancelled=lambda: stub.embedded() >= 2) == 2, "❌ Refresh not cancelled between batches"
+        api = stub.api
+        stub.stop()
+        stub = None
+
+        restarted = SemanticIndex(temp_dir, api=api, model='stub', batch_size=1)
+        try:
+            restarted.refresh()
+            assert False, "❌ Unreachable server should raise"
+        except requests.exceptions.ConnectionError:
+            pass
+        assert len(restarted) == 2, f"❌ Embedded batches lost: {len(restarted)}"
+        print("✅ Cancelled and failed refreshes keep the batches already embedded")
+    finally:
+        if stub is not None:
+            stub.stop()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_fifty_thousand_entries():
+    """Test a query over 50k stored embeddings of 768 dimensions"""
+    print("🧪 Testing semantic search over 50k entries...")
+
+    if numpy_missing():
+        return True
+    import numpy as np
+    from generators import generate_worklog_dir
+    from history_search import HistoryIndex
+    from semantic_search import SemanticIndex, entry_key, KEYS_NAME, VECTORS_NAME
+
+    stub = StubEmbeddings(dim=768)
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        generate_worklog_dir(temp_dir, years=10, entries_per_day=20)
+        history = HistoryIndex(temp_dir)
+        history.refresh()
+        # Store embeddings as an earlier refresh would have, without sending 50k texts to the stub
+        keys = list(dict.fromkeys(entry_key(day, entry) for day, entry in history.entries()))
+        vectors = np.random.default_rng(1).standard_normal((len(keys), 768)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors.tofile(temp_dir / VECTORS_NAME)
+        with open(temp_dir / KEYS_NAME, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'model': 'stub', 'dim': 768}) + '\n')
+            f.writelines(json.dumps(key) + '\n' for key in keys)
+
+        index = SemanticIndex(temp_dir, history=history, api=stub.api, model='stub')
+        started = time.perf_counter()
+        assert index.refresh() == 0, "❌ Stored embeddings not reused"
+        load_time = time.perf_counter() - started
+        timings = []
+        for query in ('login fix', 'auth bug', 'expense report', 'deploy release', 'code review'):
+            started = time.perf_counter()
+            results = index.search(query)
+            timings.append(time.perf_counter() - started)
+            assert len(results) == 20, "❌ Expected the top 20 entries"
+        print(f"   {len(index)} entries loaded in {load_time*1000:.0f} ms, "
+              f"slowest query {max(timings)*1000:.1f} ms (including the stub request)")
+        assert len(index) >= 50000, f"❌ Expected 50k entries: {len(index)}"
+        assert max(timings) < 0.1, "❌ Query too slow"
+        print("✅ 50k entries searched in tens of ms")
+    finally:
+        stub.stop()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_search_by_meaning_in_panel():
+    """Test that the history panel searches by meaning when asked to"""
+    print("🧪 Testing search by meaning in the history panel...")
+
+    if numpy_missing():
+        return True
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.history_view import HistoryPanel
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping history panel test")
+        return True
+
+    from localization import TranslationRegistry, tr
+    from semantic_search import SemanticIndex
+
+    # Startup pays for numpy and requests only once "By meaning" is checked
+    loaded = subprocess.run(
+        [sys.executable, '-c', "import sys; import ui.dashboard; "
+         "print(sorted({'numpy', 'requests', 'semantic_search'} & set(sys.modules)))"],
+        cwd=Path(__file__).parent.parent, capture_output=True, text=True, timeout=60,
+        env=dict(os.environ, QT_QPA_PLATFORM='offscreen'))
+    assert loaded.stdout.strip() == '[]', f"❌ Loaded by the dashboard import: {loaded.stdout}{loaded.stderr}"
+
+    app = QApplication.instance() or QApplication([])
+    stub = StubEmbeddings()
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        make_history(temp_dir)
+        panel = HistoryPanel(TranslationRegistry(), temp_dir)
+        panel.semantic_index = SemanticIndex(temp_dir, panel.index, api=stub.api, model='stub')
+        panel.meaning_box.setChecked(True)
+        panel.search_field.setText('auth bug')
+        panel.run_search()
+        panel.wait()
+        app.processEvents()
+        assert panel.results_model.rowCount() == 4, f"❌ Results missing: {panel.results_model.rowCount()}"
+        assert {panel.results_model.result(row)[1]['text'] for row in range(2)} == \
+            {'fix login redirect', 'broken password reset'}, "❌ Closest entries not first"
+
+        panel.semantic_index.api = 'http://127.0.0.1:9/api/embed'
+        panel.search_field.setText('auth bugs')
+        panel.run_search()
+        panel.wait()
+        app.processEvents()
+        assert panel.results_model.rowCount() == 0, "❌ Results shown without a server"
+        assert panel.results_view.empty_text == tr('embeddings_unavailable'), "❌ Offline server not reported"
+        print("✅ Closest entries listed, unreachable server reported")
+        panel.deleteLater()
+    finally:
+        stub.stop()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all semantic search tests"""
+    print("🚀 Starting semantic search tests...\n")
+
+    tests = [
+        test_embedding_endpoint,
+        test_incremental_embedding,
+        test_offline_and_cancelled,
+        test_fifty_thousand_entries,
+        test_search_by_meaning_in_panel
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL SEMANTIC SEARCH TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
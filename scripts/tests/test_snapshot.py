@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the warm-start dashboard snapshot.
+Tests validation against source files, appended log reads and warm launches.
+"""
+
+import os
+import sys
+import time
+import pickle
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def test_sections_validated_against_sources():
+    """Test that a section is only used while its source file is unchanged"""
+    print("🧪 Testing snapshot validation...")
+
+    from snapshot import save_snapshot, load_snapshot
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        source = temp_dir / 'github_data.yml'
+        source.write_text('my_issues: {}\n', encoding='utf-8')
+        snapshot_file = temp_dir / 'dashboard.snapshot'
+
+        assert load_snapshot(snapshot_file) is None, "❌ Missing snapshot should load as None"
+        assert save_snapshot(snapshot_file, {'github_data': (source, ['item']), 'none': (None, 1)})
+
+        snapshot = load_snapshot(snapshot_file)
+        assert snapshot.get('github_data', source) == ['item'], "❌ Fresh section not returned"
+        assert snapshot.get('none', None) == 1, "❌ Section without a source file not returned"
+        assert snapshot.get('github_data', temp_dir / 'other.yml') is None, "❌ Different source should be stale"
+
+        source.write_text('my_issues: {1: changed}\n', encoding='utf-8')
+        assert snapshot.get('github_data', source) is None, "❌ Changed source should be stale"
+        print("✅ Sections validated against their source files")
+
+        # Corrupt or outdated snapshots are ignored
+        snapshot_file.write_bytes(b'not a pickle')
+        assert load_snapshot(snapshot_file) is None, "❌ Corrupt snapshot should be ignored"
+        snapshot_file.write_bytes(pickle.dumps({'version': 0}))
+        assert load_snapshot(snapshot_file) is None, "❌ Old snapshot version should be ignored"
+        print("✅ Corrupt and outdated snapshots ignored")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def test_log_reads_only_appended_bytes():
+    """Test that today's log is extended from the saved offset, or re-read if rewritten"""
+    print("🧪 Testing appended log reads...")
+
+    from snapshot import save_snapshot, load_snapshot
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        log = temp_dir / 'worklog_2024-01-01.txt'
+        log.write_bytes(b'2024-01-01 09:00 [Work]  - first\n')
+        snapshot_file = temp_dir / 'dashboard.snapshot'
+        save_snapshot(snapshot_file, {}, log)
+
+        with open(log, 'ab') as f:
+            f.write(b'2024-01-01 09:30 [Work]  - second\n')
+        snapshot = load_snapshot(snapshot_file)
+        assert snapshot.log_bytes(log) == log.read_bytes(), "❌ Appended entry missing"
+        assert snapshot.log_bytes(temp_dir / 'worklog_2024-01-02.txt') is None, "❌ Another day's log should not match"
+
+        log.write_bytes(b'rewritten by hand\n')
+        assert snapshot.log_bytes(log) is None, "❌ Rewritten log should be read from scratch"
+        print("✅ Only appended bytes are trusted")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def test_github_items_pickle_compactly():
+    """Test that GitHubItem round trips through pickle"""
+    print("🧪 Testing GitHubItem pickling...")
+
+    from github_items import GitHubItem
+
+    items = [GitHubItem('prs', 15, '[WIP] update theme', 'CruGlobal/appbuilder_docs'),
+             GitHubItem('issues', 3, 'odd url', url='https://example.com/3')]
+    loaded = pickle.loads(pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL))
+    assert loaded == items, "❌ Items changed in the round trip"
+    assert loaded[0].repo is sys.intern('CruGlobal/appbuilder_docs'), "❌ Repo should be interned on load"
+    assert loaded[1].url == 'https://example.com/3', "❌ Explicit URL lost"
+    print("✅ GitHubItem pickles round trip")
+    return True
+
+def test_warm_dashboard_launch():
+    """Test that a second launch paints from the snapshot without parsing GitHub data"""
+    print("🧪 Testing warm dashboard launch...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping warm launch test")
+        return True
+
+    import ui.dashboard as dashboard_module
+    from ui.dashboard import Dashboard, save_worklog_entry
+    from yaml_io import write_cache, load_cache
+    from github_items import items_from_yaml
+
+    app = QApplication.instance() or QApplication([])
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        with patch.object(dashboard_module, 'get_data_dir', return_value=temp_dir):
+            github_file = temp_dir / 'github_data.yml'
+            write_cache({'my_issues': {str(i): f"issue {i} [https://github.com/o/r/issues/{i}]"
+                                       for i in range(20000)}}, github_file)
+            save_worklog_entry('Work', '', 'before the snapshot', temp_dir)
+
+            # First launch loads everything and saves the snapshot
+            cold = Dashboard(warm_start=True)
+            assert (temp_dir / 'dashboard.snapshot').exists(), "❌ Snapshot not saved after a cold start"
+            cold.deleteLater()
+
+            save_worklog_entry('Work', '', 'after the snapshot', temp_dir)
+
+            start = time.perf_counter()
+            with patch.object(dashboard_module, 'get_github_data', side_effect=AssertionError('parsed')), \
+                 patch.object(dashboard_module, 'get_today_worklog', side_effect=AssertionError('read')):
+                warm = Dashboard(warm_start=True)
+            warm_time = time.perf_counter() - start
+            assert len(warm.github_models['issues'].items()) == 20000, "❌ Items not loaded from snapshot"
+            assert warm.issue_combo.count() == 20001, "❌ Issue combo not filled from snapshot"
+            log_text = warm.worklog_text.toPlainText()
+            assert 'before the snapshot' in log_text and 'after the snapshot' in log_text, "❌ Log not extended"
+            assert not warm.loaded_cold, "❌ Nothing should have been loaded cold"
+            warm.deleteLater()
+
+            start = time.perf_counter()
+            items_from_yaml(load_cache(github_file, {}))
+            parse_time = time.perf_counter() - start
+            print(f"   20000 items: warm launch {warm_time*1000:.0f} ms, parsing GitHub data alone {parse_time*1000:.0f} ms")
+            print("✅ Warm launch used the snapshot")
+
+            # A newer GitHub file is loaded instead of the stale snapshot
+            write_cache({'my_issues': {'1': 'only one [https://github.com/o/r/issues/1]'}}, github_file)
+            stat = github_file.stat()
+            os.utime(github_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            fresh = Dashboard(warm_start=True)
+            assert len(fresh.github_models['issues'].items()) == 1, "❌ Stale snapshot used"
+            fresh.deleteLater()
+            print("✅ Changed GitHub data loaded fresh")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def run_all_tests():
+    """Run all snapshot tests"""
+    print("🚀 Starting snapshot tests...\n")
+
+    tests = [
+        test_sections_validated_against_sources,
+        test_log_reads_only_appended_bytes,
+        test_github_items_pickle_compactly,
+        test_warm_dashboard_launch
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL SNAPSHOT TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
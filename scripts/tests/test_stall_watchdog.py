@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the UI stall watchdog.
+Tests that blocking the event loop is recorded with the blocking code's stack.
+"""
+
+import io
+import sys
+import time
+import tempfile
+import shutil
+from contextlib import redirect_stderr
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def run_loop(app, ms, actions=()):
+    """Run the event loop for ms milliseconds, running each (delay_ms, func) on the way"""
+    from PyQt5.QtCore import QEventLoop, QTimer
+
+    loop = QEventLoop()
+    for delay, func in actions:
+        QTimer.singleShot(delay, func)
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+
+def slow_handler():
+    """Stands in for a dashboard action that blocks the UI thread"""
+    time.sleep(0.3)
+
+def test_stall_recorded_with_stack():
+    """Test that a blocked event loop is recorded with the blocking function"""
+    print("🧪 Testing stall detection...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.stall_watchdog import StallWatchdog
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping watchdog test")
+        return True
+
+    app = QApplication.instance() or QApplication([])
+    watchdog = StallWatchdog(threshold_ms=100)
+    detected = []
+    watchdog.stall_detected.connect(detected.append)
+    with redirect_stderr(io.StringIO()) as log:
+        watchdog.start()
+        run_loop(app, 700, [(100, slow_handler)])
+        watchdog.report()
+
+    assert len(watchdog.stalls) == 1, f"❌ Expected one stall, got {watchdog.stalls}"
+    stall = watchdog.stalls[0]
+    print(f"   Stall of {stall['ms']:.0f} ms in {stall['culprit']}")
+    # Measured from when the heartbeat was due, so up to one interval less than the block
+    assert 200 <= stall['ms'] <= 600, f"❌ Stall duration off: {stall['ms']}"
+    assert stall['culprit'].startswith('test_stall_watchdog.py:') and stall['culprit'].endswith('in slow_handler'), \
+        f"❌ Culprit not found: {stall['culprit']}"
+    assert detected == [stall], "❌ stall_detected not emitted"
+    assert 'UI stall #1' in log.getvalue() and '1 UI stall(s) over 100 ms' in log.getvalue(), "❌ Stall not logged"
+    print("✅ Stall recorded with the blocking function")
+    return True
+
+def test_idle_loop_has_no_stalls():
+    """Test that a responsive event loop records nothing"""
+    print("🧪 Testing idle event loop...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.stall_watchdog import StallWatchdog
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping watchdog test")
+        return True
+
+    app = QApplication.instance() or QApplication([])
+    watchdog = StallWatchdog(threshold_ms=100)
+    watchdog.start()
+    # Short blocks under the threshold don't count
+    run_loop(app, 400, [(100, lambda: time.sleep(0.02)), (200, lambda: time.sleep(0.02))])
+    watchdog.stop()
+
+    assert watchdog.stalls == [], f"❌ Unexpected stalls: {watchdog.stalls}"
+    assert not watchdog.monitor_thread, "❌ Monitor thread not stopped"
+    assert watchdog.format_summary() == 'No UI stalls over 100 ms', "❌ Unexpected summary"
+    print("✅ No stalls recorded for a responsive loop")
+    return True
+
+def test_stalls_grouped_and_traced():
+    """Test the per-culprit summary and the ui.stall trace records"""
+    print("🧪 Testing stall summary and trace...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from ui.stall_watchdog import StallWatchdog
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping watchdog test")
+        return True
+
+    import profiling
+
+    app = QApplication.instance() or QApplication([])
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        profiling.enable(temp_dir / 'trace.jsonl')
+        watchdog = StallWatchdog(threshold_ms=100)
+        with redirect_stderr(io.StringIO()):
+            watchdog.record(150, [])
+            watchdog.record(400, [])
+            watchdog.record(120, [])
+
+        summary = watchdog.format_summary().splitlines()
+        assert summary[0] == '3 UI stall(s) over 100 ms:', f"❌ Unexpected summary: {summary}"
+        assert summary[1].split()[:4] == ['3x', 'worst', '400', 'ms'], f"❌ Stalls not grouped: {summary}"
+        ops = [record['op'] for record in profiling.read_records(temp_dir / 'trace.jsonl')]
+        assert ops == ['ui.stall'] * 3, f"❌ Stalls not traced: {ops}"
+        print("✅ Stalls grouped by culprit and written to the trace")
+    finally:
+        profiling.disable()
+        profiling._trace_file = None
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all stall watchdog tests"""
+    print("🚀 Starting stall watchdog tests...\n")
+
+    tests = [
+        test_stall_recorded_with_stack,
+        test_idle_loop_has_no_stalls,
+        test_stalls_grouped_and_traced
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL STALL WATCHDOG TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
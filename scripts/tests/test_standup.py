@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the template standup renderer.
+Tests work log parsing, grouping with GitHub links, the built-in and
+context.yml templates, and the `--cli standup` command.
+"""
+
+import io
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+SAMPLE_LOG = """Work log for 2025-01-24:
+2025-01-24 09:00 [CruGlobal] [#46: Login redirect] - Fixed the redirect loop
+2025-01-24 09:30 [CruGlobal] [#46: Login redirect] - Fixed the redirect loop
+2025-01-24 10:30 [CruGlobal]  - Team meeting
+2025-01-24 11:00  [#15: [WIP] update theme] - Reviewed theme - looks good
+2025-01-24 14:00 [Personal] [123# fix bug] - Older log format
+"""
+
+def sample_github_data():
+    from github_items import GitHubItem
+    return {
+        'issues': [GitHubItem('issues', 46, 'Login redirect', 'CruGlobal/appbuilder_platform_pwa')],
+        'prs': [
+            GitHubItem('prs', 15, '[WIP] update theme', 'CruGlobal/appbuilder_docs'),
+            GitHubItem('prs', 15, 'Unrelated change', 'example-org/infrastructure'),
+        ],
+        'reviews': [],
+    }
+
+def with_context(text):
+    """Use a temporary context.yml, returns a function restoring the previous one"""
+    import config_service
+    from config_service import ConfigService
+
+    temp_dir = Path(tempfile.mkdtemp())
+    context = temp_dir / 'context.yml'
+    context.write_text(text, encoding='utf-8')
+    original_service = config_service._service
+    config_service._service = ConfigService([context])
+
+    def restore():
+        config_service._service = original_service
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return restore
+
+def test_parse_worklog():
+    """Test that entries are read with or without organization and issue"""
+    print("🧪 Testing work log parsing...")
+
+    from standup import parse_worklog
+
+    entries = parse_worklog(SAMPLE_LOG)
+    assert len(entries) == 5, f"❌ Expected 5 entries, got {len(entries)}"
+    assert entries[0]['organization'] == 'CruGlobal' and entries[0]['issue'] == '#46: Login redirect', \
+        f"❌ Wrong first entry: {entries[0]}"
+    assert entries[2]['issue'] == '' and entries[2]['text'] == 'Team meeting', f"❌ Wrong entry: {entries[2]}"
+    assert entries[3]['organization'] == '' and entries[3]['issue'] == '#15: [WIP] update theme', \
+        f"❌ Brackets in titles not handled: {entries[3]}"
+    assert entries[3]['text'] == 'Reviewed theme - looks good', "❌ ' - ' in the entry text split"
+    assert entries[4]['issue'] == '123# fix bug', "❌ Older issue format not read"
+    print("✅ Entry lines parsed, other lines skipped")
+    return True
+
+def test_render_formats():
+    """Test grouping, links and the built-in Markdown and Google Chat formats"""
+    print("🧪 Testing standup rendering...")
+
+    from standup import render_standup
+
+    restore = with_context("ui:\n  language: en\n")
+    try:
+        markdown = render_standup(SAMPLE_LOG, 'markdown', sample_github_data())
+        expected = """**Standup 2025-01-24**
+
+**CruGlobal**
+- [#46: Login redirect](https://github.com/CruGlobal/appbuilder_platform_pwa/issues/46)
+  - Fixed the redirect loop
+- Team meeting
+
+**General**
+- [#15: [WIP] update theme](https://github.com/CruGlobal/appbuilder_docs/pull/15)
+  - Reviewed theme - looks good
+
+**Personal**
+- 123# fix bug
+  - Older log format"""
+        assert markdown == expected, f"❌ Unexpected Markdown:\n{markdown}"
+        print("✅ Markdown grouped by organization and issue, with links")
+
+        chat = render_standup(SAMPLE_LOG, 'google_chat', sample_github_data())
+        assert '*CruGlobal*' in chat and \
+            '• <https://github.com/CruGlobal/appbuilder_platform_pwa/issues/46|#46: Login redirect>' in chat, \
+            f"❌ Unexpected Google Chat report:\n{chat}"
+        print("✅ Google Chat format rendered")
+
+        assert render_standup('', 'markdown', day='2025-01-25') == 'No work logged on 2025-01-25', \
+            "❌ Empty log message wrong"
+
+        big_log = SAMPLE_LOG * 200
+        start = time.perf_counter()
+        render_standup(big_log, 'markdown', sample_github_data())
+        elapsed = time.perf_counter() - start
+        print(f"   1000 entries rendered in {elapsed*1000:.1f} ms")
+        assert elapsed < 0.5, f"❌ Rendering too slow: {elapsed*1000:.0f} ms"
+    finally:
+        restore()
+    return True
+
+def test_context_templates():
+    """Test template overrides, new formats and broken templates from context.yml"""
+    print("🧪 Testing context.yml templates...")
+
+    from standup import render_standup, available_formats
+
+    restore = with_context(
+        "standup:\n"
+        "  format: plain\n"
+        "  templates:\n"
+        "    markdown:\n"
+        "      header: '# Daily update {date} ({count} entries)'\n"
+        "      entry: '- {time} {text}'\n"
+        "    plain:\n"
+        "      header: 'Standup {date}'\n"
+        "      organization: '{organization}:'\n"
+        "      issue_link: '  {issue} {url}'\n"
+        "      issue_entry: '    {text}'\n"
+        "      entry: '  {text} {missing}'\n"
+    )
+    try:
+        markdown = render_standup(SAMPLE_LOG, 'markdown', sample_github_data())
+        assert markdown.startswith('# Daily update 2025-01-24 (5 entries)'), f"❌ Header not overridden:\n{markdown}"
+        assert '- 10:30 Team meeting' in markdown, "❌ Entry template not overridden"
+        assert '  - Fixed the redirect loop' in markdown, "❌ Built-in templates should fill the rest"
+
+        assert 'plain' in available_formats(), "❌ Format from context.yml not listed"
+        with redirect_stdout(io.StringIO()) as output:
+            plain = render_standup(SAMPLE_LOG, github_data=sample_github_data())
+        assert plain.startswith('Standup 2025-01-24\nCruGlobal:'), f"❌ Configured format not used:\n{plain}"
+        assert '  #46: Login redirect https://github.com/' in plain, "❌ Custom link template not used"
+        assert '- Team meeting' in plain and 'standup template plain.entry' in output.getvalue(), \
+            "❌ Broken template should fall back to the built-in one with a message"
+        print("✅ Templates overridden and added in context.yml")
+    finally:
+        restore()
+    return True
+
+def test_standup_cli():
+    """Test `--cli standup` for a given day"""
+    print("🧪 Testing standup CLI...")
+
+    temp_home = Path(tempfile.mkdtemp())
+    original_home = os.environ.get('HOME')
+    restore = with_context("ui:\n  language: en\n")
+    try:
+        os.environ['HOME'] = str(temp_home)
+        data_dir = temp_home / '.reporter'
+        data_dir.mkdir()
+        (data_dir / 'worklog_2025-01-24.txt').write_text(SAMPLE_LOG, encoding='utf-8')
+
+        sys.path.insert(0, str(PROJECT_ROOT))
+        import main
+        with redirect_stdout(io.StringIO()) as output:
+            assert main.standup_cli(date(2025, 1, 24), 'google_chat'), "❌ Standup CLI failed"
+        assert output.getvalue().startswith('*Standup 2025-01-24*'), f"❌ Unexpected output: {output.getvalue()}"
+        assert '• Team meeting' in output.getvalue(), "❌ Entries missing"
+
+        with redirect_stdout(io.StringIO()) as output:
+            main.standup_cli(date(2025, 1, 25))
+        assert 'No work logged on 2025-01-25' in output.getvalue(), "❌ Empty day not reported"
+        print("✅ Standup printed for a given day")
+
+        # The report loads GitHub data without importing Qt or the dashboard
+        loaded = subprocess.run(
+            [sys.executable, '-c', "import sys, main; main.standup_cli(); "
+             "print(sorted(name for name in sys.modules if name.startswith(('PyQt5', 'ui'))))"],
+            cwd=PROJECT_ROOT, env=os.environ.copy(), capture_output=True, text=True, timeout=30
+        )
+        assert loaded.stdout.strip().endswith('[]'), f"❌ Standup CLI loaded the UI: {loaded.stdout}{loaded.stderr}"
+        print("✅ Standup printed without importing Qt")
+
+        # The report is rendered once, not rendered again from the report by llm.py
+        restore()
+        restore = with_context("local_llm:\n  enabled: true\n  input: standup\n")
+        with patch('requests.post') as mock_post:
+            mock_post.return_value = MagicMock(**{'json.return_value': {'response': 'polished'}})
+            with redirect_stdout(io.StringIO()) as output:
+                main.standup_cli(date(2025, 1, 24), llm=True)
+        prompt = mock_post.call_args.kwargs['json']['prompt']
+        assert 'Team meeting' in prompt and 'No work logged' not in prompt, f"❌ LLM got an empty report: {prompt}"
+        assert output.getvalue().strip() == 'polished', "❌ LLM reply not printed"
+        print("✅ Standup sent to the LLM rendered once")
+    finally:
+        restore()
+        if original_home is None:
+            os.environ.pop('HOME', None)
+        else:
+            os.environ['HOME'] = original_home
+        shutil.rmtree(temp_home, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all standup tests"""
+    print("🚀 Starting standup tests...\n")
+
+    tests = [
+        test_parse_worklog,
+        test_render_formats,
+        test_context_templates,
+        test_standup_cli
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL STANDUP TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the staged dashboard startup and startup tracing.
+Tests that only the entry field is built up front and the rest follows.
+"""
+
+import sys
+import time
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def test_trace_records_imports_and_stages():
+    """Test that the startup trace times imports and stages"""
+    print("🧪 Testing startup trace...")
+
+    import startup_trace
+
+    temp_dir = Path(tempfile.mkdtemp())
+    sys.path.insert(0, str(temp_dir))
+    try:
+        (temp_dir / 'slow_startup_module.py').write_text('import time\ntime.sleep(0.02)\n', encoding='utf-8')
+
+        # Nothing is recorded unless tracing is turned on
+        with startup_trace.stage('not traced'):
+            pass
+        assert 'not traced' not in startup_trace.format_report(), "❌ Disabled trace recorded a stage"
+
+        startup_trace.enable()
+        import slow_startup_module
+        with startup_trace.stage('build widgets'):
+            time.sleep(0.01)
+        startup_trace.mark('ready for input')
+        startup_trace.disable()
+
+        report = startup_trace.format_report()
+        print(report)
+        assert 'slow_startup_module' in report, "❌ Import not timed"
+        assert 'build widgets' in report and 'ready for input' in report, "❌ Stages not recorded"
+        cumulative, own = startup_trace._imports['slow_startup_module']
+        assert cumulative >= 20 and own >= 20, f"❌ Import time too small: {cumulative:.1f} ms"
+        assert not any(isinstance(f, startup_trace.ImportTimer) for f in sys.meta_path), "❌ Import hook not removed"
+        print("✅ Imports and stages traced, hook removed")
+    finally:
+        startup_trace.disable()
+        sys.path.remove(str(temp_dir))
+        sys.modules.pop('slow_startup_module', None)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def test_staged_dashboard():
+    """Test that a staged dashboard shows the entry field first and loads the rest later"""
+    print("🧪 Testing staged dashboard startup...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping staged startup test")
+        return True
+
+    from ui.dashboard import Dashboard
+
+    app = QApplication.instance() or QApplication([])
+
+    start = time.perf_counter()
+    dashboard = Dashboard(staged=True)
+    elapsed = time.perf_counter() - start
+    print(f"   Entry field ready in {elapsed*1000:.1f} ms")
+
+    assert hasattr(dashboard, 'entry_field'), "❌ Entry field should be built up front"
+    assert not hasattr(dashboard, 'worklog_text'), "❌ Work log should be deferred"
+    assert not hasattr(dashboard, 'github_panel'), "❌ GitHub tabs should be deferred"
+    assert not dashboard.started, "❌ Startup should still be in progress"
+
+    # Typing before the deferred stages run is kept
+    dashboard.entry_field.setText('first keystrokes')
+    dashboard.issue_combo.setEditText('#1')
+
+    finished = []
+    dashboard.startup_finished.connect(lambda: finished.append(True))
+    deadline = time.time() + 5
+    while not finished and time.time() < deadline:
+        app.processEvents()
+
+    assert finished == [True], "❌ startup_finished not emitted"
+    assert hasattr(dashboard, 'worklog_text') and hasattr(dashboard, 'github_panel'), "❌ Deferred panels missing"
+    # Issues, PRs, Reviews, the timeline and history
+    assert dashboard.github_panel.count() == 5, "❌ GitHub tabs not built"
+    assert dashboard.org_combo.count() > 1, "❌ Organizations not loaded"
+    assert dashboard.entry_field.text() == 'first keystrokes', "❌ Typed entry text was lost"
+    assert dashboard.issue_combo.currentText() == '#1', "❌ Typed Issue/PR text was lost"
+    print("✅ Deferred stages loaded without losing typed text")
+
+    dashboard.deleteLater()
+    return True
+
+def test_finish_startup_flushes_stages():
+    """Test that remaining stages can be run right away, e.g. on an early save"""
+    print("🧪 Testing finish_startup...")
+
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        print("⚠️  PyQt5 not available, skipping finish_startup test")
+        return True
+
+    from ui.dashboard import Dashboard
+
+    app = QApplication.instance() or QApplication([])
+    dashboard = Dashboard(staged=True)
+    finished = []
+    dashboard.startup_finished.connect(lambda: finished.append(True))
+
+    dashboard.finish_startup()
+    assert dashboard.startup_stages == [], "❌ Stages left over"
+    assert hasattr(dashboard, 'worklog_text'), "❌ Work log not built"
+
+    # The queued timer must not emit a second time
+    for _ in range(20):
+        app.processEvents()
+    assert finished == [True], f"❌ startup_finished emitted {len(finished)} times"
+    print("✅ Pending stages flushed once")
+
+    dashboard.deleteLater()
+    return True
+
+def run_all_tests():
+    """Run all startup tests"""
+    print("🚀 Starting startup tests...\n")
+
+    tests = [
+        test_trace_records_imports_and_stages,
+        test_staged_dashboard,
+        test_finish_startup_flushes_stages
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL STARTUP TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
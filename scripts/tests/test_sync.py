@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Test script to verify work log sync between devices.
+Tests that two local data directories converge through a shared folder and a
+socket peer, that a served directory needs the shared secret, that concurrent
+appends merge in timestamp order, and that only changed days are transferred.
+"""
+
+import io
+import sys
+import time
+import shutil
+import tempfile
+import threading
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+DAY = 'worklog_2025-01-24.txt'
+
+def append(data_dir, name, *lines):
+    with open(Path(data_dir) / name, 'a', encoding='utf-8') as f:
+        for line in lines:
+            f.write(line + '\n')
+
+def read(data_dir, name=DAY):
+    return (Path(data_dir) / name).read_text(encoding='utf-8')
+
+def make_dirs():
+    temp_dir = Path(tempfile.mkdtemp())
+    laptop, desktop, shared = temp_dir / 'laptop', temp_dir / 'desktop', temp_dir / 'shared'
+    for path in (laptop, desktop, shared):
+        path.mkdir()
+    return temp_dir, laptop, desktop, shared
+
+def test_merge_lines():
+    """Test that merging keeps every entry once, in timestamp order"""
+    print("🧪 Testing entry merging...")
+
+    from sync import merge_lines
+
+    a = b"2025-01-24 09:00 [Work]  - a\n2025-01-24 11:00 [Work]  - c\n"
+    b = b"2025-01-24 10:00 [Work]  - b\n"
+    assert merge_lines(a, a) is None, "❌ Nothing to merge expected"
+    assert merge_lines(a, b"") is None, "❌ Empty side should change nothing"
+    assert merge_lines(b"", a) == a, "❌ Other side's entries should be taken as-is"
+    merged = merge_lines(a, b)
+    assert merged == b"2025-01-24 09:00 [Work]  - a\n2025-01-24 10:00 [Work]  - b\n2025-01-24 11:00 [Work]  - c\n", \
+        f"❌ Wrong merge: {merged!r}"
+    assert merge_lines(b, a) == merged, "❌ Merge should not depend on which side is which"
+    print("✅ Entries merged deterministically by timestamp")
+    return True
+
+def test_folder_sync():
+    """Test two devices syncing through a shared folder, with concurrent appends"""
+    print("🧪 Testing sync through a shared folder...")
+
+    from sync import SyncEngine, FolderPeer
+
+    temp_dir, laptop, desktop, shared = make_dirs()
+    try:
+        append(laptop, DAY, '2025-01-24 09:00 [Work] [#46: Login] - laptop morning')
+        append(desktop, 'worklog_2025-01-23.txt', '2025-01-23 16:00 [Work]  - desktop yesterday')
+        laptop_engine, desktop_engine = SyncEngine(laptop), SyncEngine(desktop)
+
+        laptop_engine.sync(FolderPeer(shared))
+        desktop_engine.sync(FolderPeer(shared))
+        laptop_engine.sync(FolderPeer(shared))
+        assert read(desktop) == read(laptop) == '2025-01-24 09:00 [Work] [#46: Login] - laptop morning\n', \
+            "❌ Day file not copied to the desktop"
+        assert read(laptop, 'worklog_2025-01-23.txt') == '2025-01-23 16:00 [Work]  - desktop yesterday\n', \
+            "❌ Desktop's day not copied to the laptop"
+        print("✅ Day files copied both ways")
+
+        # Both devices log while offline
+        append(laptop, DAY, '2025-01-24 11:00 [Work]  - laptop late morning')
+        append(desktop, DAY, '2025-01-24 10:00 [Work]  - desktop meeting', '2025-01-24 12:00 [Work]  - desktop lunch')
+        laptop_engine.sync(FolderPeer(shared))
+        desktop_engine.sync(FolderPeer(shared))
+        laptop_engine.sync(FolderPeer(shared))
+        expected = ('2025-01-24 09:00 [Work] [#46: Login] - laptop morning\n'
+                    '2025-01-24 10:00 [Work]  - desktop meeting\n'
+                    '2025-01-24 11:00 [Work]  - laptop late morning\n'
+                    '2025-01-24 12:00 [Work]  - desktop lunch\n')
+        assert read(laptop) == read(desktop) == read(shared) == expected, \
+            f"❌ Concurrent appends not merged:\n{read(laptop)}\n{read(desktop)}"
+        print("✅ Concurrent appends merged in timestamp order on both devices")
+
+        result = laptop_engine.sync(FolderPeer(shared))
+        assert result == {'changed': [], 'sent': 0, 'received': 0}, f"❌ Nothing should change: {result}"
+        print("✅ Second sync transfers nothing")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_socket_peer():
+    """Test syncing directly with another device's served data directory"""
+    print("🧪 Testing sync with a socket peer...")
+
+    from sync import SyncEngine, SyncServer, make_peer, SocketPeer
+
+    temp_dir, laptop, desktop, _ = make_dirs()
+    server = SyncServer(desktop, '127.0.0.1', 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        append(laptop, DAY, '2025-01-24 09:00 [Work]  - laptop ภาษาไทย 中文')
+        append(desktop, DAY, '2025-01-24 10:00 [Work]  - desktop')
+        peer = make_peer(f"127.0.0.1:{server.server_address[1]}")
+        assert isinstance(peer, SocketPeer), "❌ HOST:PORT should be a socket peer"
+        result = SyncEngine(laptop).sync(peer)
+        assert result['changed'] == [DAY], f"❌ Unexpected result: {result}"
+        assert read(laptop) == read(desktop) == \
+            '2025-01-24 09:00 [Work]  - laptop ภาษาไทย 中文\n2025-01-24 10:00 [Work]  - desktop\n', \
+            f"❌ Not merged over the socket:\n{read(desktop)}"
+
+        try:
+            peer.read('../sync_state.json')
+            assert False, "❌ Files other than work logs must not be served"
+        except RuntimeError:
+            pass
+        peer.close()
+        print("✅ Synced over the socket, other files refused")
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_served_with_secret():
+    """Test that a server with a secret refuses peers without it, and needs one beyond localhost"""
+    print("🧪 Testing the sync secret...")
+
+    from sync import SyncEngine, SyncServer, SocketPeer
+
+    temp_dir, laptop, desktop, _ = make_dirs()
+    server = SyncServer(desktop, '127.0.0.1', 0, secret='correct horse')
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        append(desktop, DAY, '2025-01-24 10:00 [Work]  - desktop')
+        port = server.server_address[1]
+        for secret in (None, 'wrong'):
+            peer = SocketPeer('127.0.0.1', port, secret=secret)
+            try:
+                SyncEngine(laptop).sync(peer)
+                assert False, f"❌ Peer with secret {secret!r} should be refused"
+            except RuntimeError as e:
+                assert 'secret' in str(e), f"❌ Unexpected error: {e}"
+            finally:
+                peer.close()
+        assert not (laptop / DAY).exists(), "❌ Nothing should be synced without the secret"
+
+        peer = SocketPeer('127.0.0.1', port, secret='correct horse')
+        result = SyncEngine(laptop).sync(peer)
+        peer.close()
+        assert result['changed'] == [DAY] and read(laptop) == read(desktop), f"❌ Not synced: {result}"
+        print("✅ Only peers with the secret are served")
+
+        try:
+            SyncServer(desktop, '0.0.0.0', 0)
+            assert False, "❌ Serving beyond localhost without a secret should be refused"
+        except ValueError:
+            pass
+        print("✅ Serving beyond localhost needs a secret")
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_only_changed_days_transferred():
+    """Test that years of history cost one listing and only changed days are read"""
+    print("🧪 Testing sync of years of history...")
+
+    from generators import generate_worklog_dir
+    from sync import SyncEngine, FolderPeer
+
+    temp_dir, laptop, desktop, shared = make_dirs()
+    try:
+        files = generate_worklog_dir(laptop, years=3, entries_per_day=12)
+        engine = SyncEngine(laptop)
+        start = time.perf_counter()
+        first = engine.sync(FolderPeer(shared))
+        print(f"   First sync of {files} days in {(time.perf_counter() - start)*1000:.0f} ms")
+        assert len(first['changed']) == files, "❌ Every day should be copied on the first sync"
+
+        days = sorted(path.name for path in laptop.glob('worklog_*.txt'))
+        append(laptop, days[-1], f"{days[-1][8:18]} 23:00 [Work]  - new on the laptop")
+        append(shared, days[10], f"{days[10][8:18]} 23:00 [Work]  - new from the desktop")
+        before = {day: (laptop / day).stat().st_mtime_ns for day in days}
+
+        peer = FolderPeer(shared)
+        start = time.perf_counter()
+        result = engine.sync(peer)
+        elapsed = time.perf_counter() - start
+        print(f"   Incremental sync in {elapsed*1000:.1f} ms, {result['sent']} bytes sent, "
+              f"{result['received']} bytes received")
+        assert result['changed'] == sorted([days[10], days[-1]]), f"❌ Unexpected days: {result['changed']}"
+        assert result['sent'] < 100 and result['received'] < 100, "❌ Only the new entries should be transferred"
+        rewritten = [day for day in days if (laptop / day).stat().st_mtime_ns != before[day]]
+        assert rewritten == [days[10]], f"❌ Only the changed day should be written locally: {rewritten}"
+        assert read(laptop, days[10]) == read(shared, days[10]), "❌ Day not merged"
+        print("✅ Only the changed days were transferred and rewritten")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_append_during_rewrite():
+    """Test that an entry saved while sync rewrites a day file is not lost"""
+    print("🧪 Testing an entry saved during a sync rewrite...")
+
+    from unittest.mock import patch
+    import sync
+    from sync import FolderPeer
+    from worklog_io import save_worklog_entry, fcntl
+
+    if fcntl is None:
+        print("⚠️  No file locks on this platform, skipping")
+        return True
+
+    temp_dir, laptop, _, _ = make_dirs()
+    try:
+        today = time.strftime('%Y-%m-%d')
+        name = f'worklog_{today}.txt'
+        append(laptop, name, f'{today} 09:00 [Work]  - b')
+        size = (laptop / name).stat().st_size
+        saver = threading.Thread(target=save_worklog_entry, args=('Work', '', 'saved meanwhile', laptop))
+        real_write = sync.atomic_write
+
+        def slow_write(path, content):
+            # The app saves an entry while the merged file is being written
+            saver.start()
+            time.sleep(0.2)
+            real_write(path, content)
+
+        merged = f'{today} 08:00 [Work]  - a\n{today} 09:00 [Work]  - b\n'.encode('utf-8')
+        with patch.object(sync, 'atomic_write', slow_write):
+            FolderPeer(laptop).write_tail(name, 0, merged, size)
+        saver.join()
+        text = read(laptop, name)
+        assert text.startswith(merged.decode('utf-8')), f"❌ Merged entries missing: {text}"
+        assert 'saved meanwhile' in text, f"❌ Entry saved during the rewrite was lost: {text}"
+        print("✅ Entry saved during the rewrite kept")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_sync_cli():
+    """Test `--cli sync --peer FOLDER`"""
+    print("🧪 Testing sync CLI...")
+
+    from unittest.mock import patch
+    import sync
+
+    temp_dir, laptop, _, shared = make_dirs()
+    try:
+        append(laptop, DAY, '2025-01-24 09:00 [Work]  - from the cli')
+        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+        import main
+        with patch.object(sync, 'get_data_dir', lambda: laptop), redirect_stdout(io.StringIO()) as output:
+            assert main.sync_cli(str(shared)), "❌ Sync CLI failed"
+        assert 'Synced 1 day(s)' in output.getvalue() and DAY in output.getvalue(), \
+            f"❌ Unexpected output: {output.getvalue()}"
+        assert read(shared) == '2025-01-24 09:00 [Work]  - from the cli\n', "❌ Day not copied"
+        print("✅ Synced from the command line")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all sync tests"""
+    print("🚀 Starting sync tests...\n")
+
+    tests = [
+        test_merge_lines,
+        test_folder_sync,
+        test_socket_peer,
+        test_served_with_secret,
+        test_only_changed_days_transferred,
+        test_append_during_rewrite,
+        test_sync_cli
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL SYNC TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
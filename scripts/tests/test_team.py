@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Test script to verify team standups merged from several work logs.
+Tests the time-ordered k-way merge, zip bundles, person and organization
+rollups and merging a 20-person sprint quickly.
+"""
+
+import io
+import sys
+import time
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import redirect_stdout
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+DAY = date(2025, 1, 24)
+
+def write_log(data_dir, day, *lines):
+    data_dir.mkdir(parents=True, exist_ok=True)
+    with open(data_dir / f'worklog_{day.isoformat()}.txt', 'a', encoding='utf-8') as f:
+        for line in lines:
+            f.write(line + '\n')
+
+def with_context(text):
+    """Use a temporary context.yml, returns a function restoring the previous one"""
+    import config_service
+    from config_service import ConfigService
+
+    temp_dir = Path(tempfile.mkdtemp())
+    context = temp_dir / 'context.yml'
+    context.write_text(text, encoding='utf-8')
+    original_service = config_service._service
+    config_service._service = ConfigService([context])
+
+    def restore():
+        config_service._service = original_service
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return restore
+
+def make_team(temp_dir):
+    alice, bob = temp_dir / 'alice' / '.reporter', temp_dir / 'bob'
+    write_log(alice, DAY, '2025-01-24 09:00 [Work] [#46: Login] - alice fixes login',
+              '2025-01-24 11:00 [Work]  - alice reviews')
+    write_log(bob, DAY, '2025-01-24 08:30 [Personal]  - bob reads docs',
+              '2025-01-24 10:00 [Work] [#46: Login] - bob tests login')
+    write_log(bob, DAY + timedelta(days=1), '2025-01-25 09:00 [Work]  - bob next day')
+    return alice, bob
+
+def test_merge_order():
+    """Test that entries from several people come out in time order, lazily"""
+    print("🧪 Testing k-way merge...")
+
+    from team import merge_worklogs, parse_source
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        alice, bob = make_team(temp_dir)
+        sources = [parse_source(str(alice)), parse_source(f'robert={bob}')]
+        assert sources[0][0] == 'alice' and sources[1][0] == 'robert', f"❌ Wrong names: {sources}"
+
+        merged = merge_worklogs(sources, DAY, DAY + timedelta(days=1))
+        assert isinstance(merged, Iterator), "❌ Merge should be a stream"
+        first = next(merged)
+        # Later day files are only opened when the merge reaches them
+        write_log(bob, DAY + timedelta(days=1), '2025-01-25 17:00 [Work]  - bob added later')
+        entries = [first] + list(merged)
+        order = [(entry['time'], entry['person']) for entry in entries]
+        assert order == [('08:30', 'robert'), ('09:00', 'alice'), ('10:00', 'robert'), ('11:00', 'alice'),
+                         ('09:00', 'robert'), ('17:00', 'robert')], f"❌ Wrong order: {order}"
+        print("✅ Entries merged in time order without loading the logs first")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_bundles_and_rollups():
+    """Test exported bundles and the person and organization reports"""
+    print("🧪 Testing bundles and rollups...")
+
+    from team import export_bundle, merge_worklogs, render_team_standup, parse_source, rollup
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        alice, bob = make_team(temp_dir)
+        bundle = temp_dir / 'bob.zip'
+        assert export_bundle(bundle, DAY, DAY, data_dir=bob) == 1, "❌ Day not exported"
+        sources = [parse_source(str(alice)), parse_source(str(bundle))]
+
+        groups = rollup(merge_worklogs(sources, DAY), 'organization')
+        assert list(groups) == ['Personal', 'Work'] and len(groups['Work']) == 3, f"❌ Wrong rollup: {groups}"
+
+        report = render_team_standup(merge_worklogs(sources, DAY), 'person', 'markdown', title='2025-01-24')
+        expected = """**Standup 2025-01-24**
+
+### bob
+
+**Personal**
+- bob reads docs
+
+**Work**
+- #46: Login
+  - bob tests login
+
+### alice
+
+**Work**
+- #46: Login
+  - alice fixes login
+- alice reviews"""
+        assert report == expected, f"❌ Unexpected team report:\n{report}"
+        print("✅ Bundle merged and grouped by person")
+
+        report = render_team_standup(merge_worklogs(sources, DAY), 'organization', 'google_chat', title='2025-01-24')
+        assert '• #46: Login\n    ◦ alice fixes login (alice)\n    ◦ bob tests login (bob)' in report, \
+            f"❌ Unexpected organization report:\n{report}"
+        assert 'bob next day' not in report, "❌ Entries outside the dates included"
+        print("✅ Grouped by organization with who did each entry")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_sprint_merge_speed():
+    """Test that a 20-person team over a sprint merges in well under a second"""
+    print("🧪 Testing a 20-person sprint...")
+
+    from generators import generate_worklog_dir
+    from team import merge_worklogs, render_team_standup
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        end = date(2025, 1, 24)
+        start = end - timedelta(days=13)
+        sources = []
+        for person in range(20):
+            path = temp_dir / f'person{person:02}'
+            generate_worklog_dir(path, years=14 / 365, entries_per_day=20, end=end, seed=person)
+            sources.append((f'person{person:02}', path))
+
+        started = time.perf_counter()
+        count = 0
+        previous = ('', '')
+        for entry in merge_worklogs(sources, start, end):
+            key = (entry['date'], entry['time'])
+            assert key >= previous, "❌ Entries out of order"
+            previous = key
+            count += 1
+        merge_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        render_team_standup(merge_worklogs(sources, start, end), 'person', 'markdown')
+        render_time = time.perf_counter() - started
+        print(f"   {count} entries merged in {merge_time*1000:.0f} ms, report in {render_time*1000:.0f} ms")
+        assert count >= 20 * 10 * 20, f"❌ Expected a sprint of entries, got {count}"
+        assert merge_time < 1.0 and render_time < 1.0, "❌ Team merge too slow"
+        print("✅ Sprint merged in well under a second")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_team_cli():
+    """Test `--cli team` with sources on the command line"""
+    print("🧪 Testing team CLI...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        alice, bob = make_team(temp_dir)
+        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+        import main
+        with redirect_stdout(io.StringIO()) as output:
+            assert main.team_cli([str(alice), str(bob)], DAY + timedelta(days=1), days=2, fmt='markdown'), \
+                "❌ Team CLI failed"
+        report = output.getvalue()
+        assert report.startswith('**Standup 2025-01-24 – 2025-01-25**'), f"❌ Unexpected report: {report}"
+        assert 'bob next day' in report and 'alice reviews' in report, "❌ Entries missing"
+        print("✅ Team report printed")
+
+        restore = with_context("local_llm:\n  enabled: true\n  input: standup\n")
+        try:
+            with patch('requests.post') as mock_post:
+                mock_post.return_value = MagicMock(**{'json.return_value': {'response': 'polished'}})
+                with redirect_stdout(io.StringIO()):
+                    main.team_cli([str(alice), str(bob)], DAY + timedelta(days=1), days=2, llm=True)
+        finally:
+            restore()
+        prompt = mock_post.call_args.kwargs['json']['prompt']
+        assert 'bob next day' in prompt and 'alice reviews' in prompt, f"❌ LLM got an empty report: {prompt}"
+        print("✅ Team report sent to the LLM rendered once")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all team tests"""
+    print("🚀 Starting team tests...\n")
+
+    tests = [
+        test_merge_order,
+        test_bundles_and_rollups,
+        test_sprint_merge_speed,
+        test_team_cli
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TEAM TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
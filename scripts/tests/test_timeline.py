@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the activity timeline.
+Tests that gh status mentions and activity are recorded, that work log
+entries, commits and GitHub events merge newest first one window at a time,
+and that unchanged windows are served from the sources' caches.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+SAMPLE_GH_STATUS = """Assigned Issues                              │ Assigned Pull Requests
+Achoobert/time_assist#126  add tests         │ Nothing here ^_^
+                                             │
+Review Requests                              │ Mentions
+Achoobert/time_assist#76  update workflow    │ Achoobert/time_assist#70  @you can you look
+                                             │
+Repository Activity
+Achoobert/time_assist#80  comment on tests
+  Looks good, one question about the fixtures"""
+
+def write_log(data_dir, day, *lines):
+    with open(Path(data_dir) / f'worklog_{day}.txt', 'a', encoding='utf-8') as f:
+        for line in lines:
+            f.write(line + '\n')
+
+def git(repo, *args, env=None):
+    subprocess.run(['git', '-C', str(repo)] + list(args), check=True, capture_output=True, text=True,
+                   env=dict(os.environ, **(env or {})))
+
+def commit_at(repo, message, when):
+    stamp = when.strftime('%Y-%m-%dT%H:%M:%S')
+    git(repo, 'commit', '-q', '--allow-empty', '-m', message,
+        env={'GIT_AUTHOR_DATE': stamp, 'GIT_COMMITTER_DATE': stamp})
+
+def test_gh_activity_recorded():
+    """Test that mentions and repository activity are kept and recorded once with a time"""
+    print("🧪 Testing gh status activity...")
+
+    from github_data import parse_gh_status_table, record_events
+    from timeline import GitHubSource
+
+    data = parse_gh_status_table(SAMPLE_GH_STATUS)
+    assert data['mentions'] == ['Achoobert/time_assist#70  @you can you look'], f"❌ Mentions: {data['mentions']}"
+    assert data['activity'] == ['Achoobert/time_assist#80  comment on tests'], f"❌ Activity: {data['activity']}"
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / 'github_events.jsonl'
+        first = datetime(2025, 1, 24, 9, 30)
+        assert record_events(data, path, first) == 2, "❌ Both events should be new"
+        assert record_events(data, path, first + timedelta(hours=2)) == 0, "❌ Seen events recorded again"
+
+        events = GitHubSource(path).events(datetime(2025, 1, 24), datetime(2025, 1, 25))
+        assert [(e['time'], e['detail']) for e in events] == [(first, 'mentions'), (first, 'activity')], \
+            f"❌ Unexpected events: {events}"
+        assert events[0]['url'] == 'https://github.com/Achoobert/time_assist/issues/70', "❌ Event URL wrong"
+        assert GitHubSource(path).events(datetime(2025, 1, 25), datetime(2025, 1, 26)) == [], \
+            "❌ Events outside the window returned"
+        print("✅ Activity recorded once, dated when first seen")
+
+        # Only the previous refresh counts as seen: a mention that comes back is a new event
+        later = first + timedelta(days=1)
+        assert record_events({'mentions': [], 'activity': data['activity']}, path, later) == 0, \
+            "❌ Activity still shown should not be recorded again"
+        assert record_events(data, path, later + timedelta(hours=1)) == 1, "❌ Returning mention not recorded"
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 3 and '"mentions"' in lines[-1], f"❌ Unexpected events file: {lines}"
+        print("✅ Events compared with the previous refresh only")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_merged_pages():
+    """Test that sources are merged newest first, a window at a time"""
+    print("🧪 Testing timeline pages...")
+
+    from github_data import record_events
+    from timeline import Timeline, WorklogSource, CommitSource, GitHubSource
+
+    if shutil.which('git') is None:
+        print("⚠️ git not installed, skipping")
+        return True
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        data_dir = temp_dir / 'data'
+        data_dir.mkdir()
+        write_log(data_dir, '2025-01-24', '2025-01-24 09:00 [Work] [#46: Login] - fix login',
+                  '2025-01-24 16:00 [Work]  - review')
+        write_log(data_dir, '2025-01-22', '2025-01-22 10:00 [Personal]  - older entry')
+
+        repo = temp_dir / 'app'
+        repo.mkdir()
+        git(repo, 'init', '-q', '-b', 'main')
+        git(repo, 'config', 'user.email', 'me@example.com')
+        git(repo, 'config', 'user.name', 'Me')
+        commit_at(repo, 'Fix login redirect (#46)', datetime(2025, 1, 24, 11, 0))
+        git(repo, '-c', 'user.email=other@example.com', 'commit', '-q', '--allow-empty', '-m', 'Not mine',
+            env={'GIT_AUTHOR_DATE': '2025-01-24T12:00:00', 'GIT_COMMITTER_DATE': '2025-01-24T12:00:00'})
+
+        events_path = temp_dir / 'github_events.jsonl'
+        record_events({'mentions': ['Achoobert/time_assist#70  @you can you look']}, events_path,
+                      datetime(2025, 1, 24, 13, 0))
+
+        timeline = Timeline([WorklogSource(data_dir), CommitSource([(str(repo), 'CruGlobal')]),
+                             GitHubSource(events_path)])
+        pages = timeline.pages(datetime(2025, 1, 25))
+        start, end, events = next(pages)
+        assert (start, end) == (datetime(2025, 1, 24), datetime(2025, 1, 25)), f"❌ Wrong window: {start} {end}"
+        found = [(e['time'].hour, e['source'], e['text']) for e in events]
+        assert found == [(16, 'worklog', 'review'), (13, 'github', 'Achoobert/time_assist#70 @you can you look'),
+                         (11, 'commit', 'Fix login redirect (#46)'), (9, 'worklog', 'fix login')], \
+            f"❌ Unexpected page: {found}"
+        assert events[2]['detail'].startswith('[CruGlobal] '), f"❌ Commit detail: {events[2]['detail']}"
+
+        _, _, events = next(pages)
+        assert events == [], "❌ Nothing happened on the 23rd"
+        start, _, events = next(pages)
+        assert start == datetime(2025, 1, 22) and [e['text'] for e in events] == ['older entry'], \
+            f"❌ Unexpected older page: {events}"
+        print("✅ Pages merged newest first, window by window")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_source_caches():
+    """Test that unchanged days and repositories are not read again"""
+    print("🧪 Testing timeline caches...")
+
+    from timeline import Timeline, WorklogSource, CommitSource
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        write_log(temp_dir, '2025-01-24', '2025-01-24 09:00 [Work]  - first')
+        worklog = WorklogSource(temp_dir)
+        timeline = Timeline([worklog])
+        end = datetime(2025, 1, 25)
+        assert len(timeline.page(end)[0]) == 1, "❌ Entry not read"
+        with patch('builtins.open', side_effect=AssertionError('day file read again')):
+            assert len(timeline.page(end)[0]) == 1, "❌ Cached entry lost"
+        write_log(temp_dir, '2025-01-24', '2025-01-24 10:00 [Work]  - second')
+        assert [e['text'] for e in timeline.page(end)[0]] == ['second', 'first'], "❌ Appended entry not shown"
+        print("✅ Day files re-read only when they change")
+
+        if shutil.which('git') is not None:
+            repo = temp_dir / 'app'
+            repo.mkdir()
+            git(repo, 'init', '-q', '-b', 'main')
+            git(repo, 'config', 'user.email', 'me@example.com')
+            git(repo, 'config', 'user.name', 'Me')
+            commit_at(repo, 'First', datetime(2025, 1, 24, 11, 0))
+            commits = CommitSource([(str(repo), '')])
+            window = (datetime(2025, 1, 24), end)
+            assert [e['text'] for e in commits.events(*window)] == ['First'], "❌ Commit not found"
+            with patch('subprocess.run', side_effect=AssertionError('git should not run')):
+                assert len(commits.events(*window)) == 1, "❌ Cached commits lost"
+            commit_at(repo, 'Second', datetime(2025, 1, 24, 12, 0))
+            assert [e['text'] for e in commits.events(*window)] == ['First', 'Second'], "❌ New commit not found"
+            print("✅ git log runs again only when a branch moves")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_month_scrollback_speed():
+    """Test that a month of a busy work log pages back quickly"""
+    print("🧪 Testing a month of scrollback...")
+
+    from generators import generate_worklog_dir
+    from timeline import Timeline, WorklogSource
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        generate_worklog_dir(temp_dir, years=3, entries_per_day=20)
+        newest = max(path.name for path in temp_dir.glob('worklog_*.txt'))
+        end = datetime.strptime(newest[8:18], '%Y-%m-%d') + timedelta(days=1)
+        timeline = Timeline([WorklogSource(temp_dir)])
+
+        started = time.perf_counter()
+        count = 0
+        pages = timeline.pages(end)
+        first_page = None
+        for _ in range(31):
+            _, _, events = next(pages)
+            count += len(events)
+            if first_page is None:
+                first_page = time.perf_counter() - started
+        elapsed = time.perf_counter() - started
+        print(f"   First day in {first_page*1000:.1f} ms, {count} entries over 31 days in {elapsed*1000:.0f} ms")
+        assert count >= 20 * 20, f"❌ Expected a month of entries, got {count}"
+        assert first_page < 0.05 and elapsed < 1.0, "❌ Timeline paging too slow"
+        print("✅ A month of history pages back in well under a second")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all timeline tests"""
+    print("🚀 Starting timeline tests...\n")
+
+    tests = [
+        test_gh_activity_recorded,
+        test_merged_pages,
+        test_source_caches,
+        test_month_scrollback_speed
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL TIMELINE TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Test script to verify editing and deleting work log entries.
+Tests that edits are appended to a sidecar without touching the day file,
+that every reader applies them, that finished days are compacted only past
+the threshold, never twice and never once synced, and that edits sync
+between devices.
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DAY = date(2025, 1, 24)
+LINES = [
+    '2025-01-24 09:00 [Work] [#46: Login] - fix lgoin',
+    '2025-01-24 10:00 [Work]  - standup',
+    '2025-01-24 10:00 [Work]  - standup',
+    '2025-01-24 11:00 [Personal]  - oops, wrong day',
+    '2025-01-24 12:00 [Work]  - lunch review',
+]
+
+def write_day(data_dir, lines=LINES, day=DAY):
+    path = Path(data_dir) / f'worklog_{day.isoformat()}.txt'
+    with open(path, 'a', encoding='utf-8') as f:
+        for line in lines:
+            f.write(line + '\n')
+    return path
+
+def test_edits_are_appended():
+    """Test that edits and deletions leave the day file alone and are applied on read"""
+    print("🧪 Testing edit and delete records...")
+
+    from worklog_edits import read_entries, read_text, edit_entry, delete_entry, edits_path
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        log_file = write_day(temp_dir)
+        original = log_file.read_bytes()
+        assert read_text(log_file) == original.decode('utf-8'), "❌ Day without edits should read as-is"
+
+        entries = read_entries(log_file)
+        assert edit_entry(log_file, entries[0][0], '2025-01-24 09:00 [Work] [#46: Login] - fix login'), "❌ Edit failed"
+        assert delete_entry(log_file, entries[3][0]), "❌ Delete failed"
+        # The second copy of a repeated entry
+        assert entries[2][0] == (LINES[2], 1), f"❌ Repeated entry key: {entries[2][0]}"
+        assert edit_entry(log_file, entries[2][0], '2025-01-24 10:00 [Work]  - retro'), "❌ Edit failed"
+
+        assert log_file.read_bytes() == original, "❌ Day file must not be rewritten by an edit"
+        assert len(edits_path(log_file).read_text(encoding='utf-8').splitlines()) == 3, "❌ One record per change"
+        expected = ['2025-01-24 09:00 [Work] [#46: Login] - fix login', '2025-01-24 10:00 [Work]  - standup',
+                    '2025-01-24 10:00 [Work]  - retro', '2025-01-24 12:00 [Work]  - lunch review']
+        assert read_text(log_file).splitlines() == expected, f"❌ Edits not applied:\n{read_text(log_file)}"
+
+        # Editing again replaces the earlier edit, keys stay those of the file
+        key = read_entries(log_file)[0][0]
+        assert key == (LINES[0], 0), f"❌ Key should name the written line: {key}"
+        edit_entry(log_file, key, '2025-01-24 09:00 [Work] [#46: Login] - fix login redirect')
+        assert read_text(log_file).splitlines()[0].endswith('fix login redirect'), "❌ Newest edit should win"
+        print("✅ Edits appended to the sidecar and applied on read")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_readers_apply_edits():
+    """Test that standups, team reports and the timeline show entries as edited"""
+    print("🧪 Testing readers...")
+
+    import standup
+    from team import merge_worklogs, export_bundle
+    from timeline import WorklogSource
+    from worklog_edits import read_entries, edit_entry, delete_entry
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        log_file = write_day(temp_dir)
+        entries = read_entries(log_file)
+        edit_entry(log_file, entries[0][0], '2025-01-24 09:00 [Work] [#46: Login] - fix login')
+        delete_entry(log_file, entries[3][0])
+
+        with patch.object(standup, 'get_data_dir', lambda: temp_dir):
+            text = standup.read_worklog(DAY)
+        assert 'fix login' in text and 'lgoin' not in text and 'oops' not in text, f"❌ Standup log: {text}"
+
+        team_texts = [entry['text'] for entry in merge_worklogs([('me', temp_dir)], DAY)]
+        assert team_texts == ['fix login', 'standup', 'standup', 'lunch review'], f"❌ Team entries: {team_texts}"
+
+        bundle = temp_dir / 'me.zip'
+        export_bundle(bundle, DAY, DAY, data_dir=temp_dir)
+        bundled = [entry['text'] for entry in merge_worklogs([('me', bundle)], DAY)]
+        assert bundled == team_texts, f"❌ Bundles should carry the edited entries: {bundled}"
+
+        source = WorklogSource(temp_dir)
+        window = (datetime(2025, 1, 24), datetime(2025, 1, 25))
+        assert [e['text'] for e in source.events(*window)][0] == 'fix login', "❌ Timeline shows the old text"
+        delete_entry(log_file, read_entries(log_file)[0][0])
+        assert [e['text'] for e in source.events(*window)][0] == 'standup', "❌ Timeline cache ignored a new edit"
+        print("✅ Every reader shows the edited entries")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_compaction():
+    """Test that only finished days corrected past the threshold are rewritten"""
+    print("🧪 Testing compaction...")
+
+    from worklog_edits import (
+        read_entries, read_text, edit_entry, delete_entry, compact_closed_days, correction_ratio, edits_path
+    )
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        busy = write_day(temp_dir)
+        entries = read_entries(busy)
+        edit_entry(busy, entries[0][0], '2025-01-24 09:00 [Work] [#46: Login] - fix login')
+        delete_entry(busy, entries[3][0])
+        before = read_text(busy)
+
+        quiet_lines = [f'2025-01-23 {hour:02}:00 [Work]  - task {hour}' for hour in range(8, 18)]
+        quiet = write_day(temp_dir, quiet_lines, DAY - timedelta(days=1))
+        delete_entry(quiet, read_entries(quiet)[0][0])
+        quiet_bytes = quiet.read_bytes()
+
+        today = write_day(temp_dir, LINES, DAY + timedelta(days=1))
+        delete_entry(today, read_entries(today)[0][0])
+        today_bytes = today.read_bytes()
+
+        assert correction_ratio(busy) == 2 / 5, f"❌ Wrong ratio: {correction_ratio(busy)}"
+        compacted = compact_closed_days(temp_dir, today=DAY + timedelta(days=1))
+        assert compacted == [busy.name], f"❌ Unexpected compaction: {compacted}"
+        assert busy.read_text(encoding='utf-8') == before, "❌ Compacted file should hold the edited entries"
+        assert read_text(busy) == before, "❌ Reading after compaction changed"
+        assert correction_ratio(busy) == 0, "❌ Records should no longer apply after compaction"
+        assert not edits_path(busy).exists(), "❌ Sidecar should be retired after compaction"
+        assert quiet.read_bytes() == quiet_bytes, "❌ Day under the threshold rewritten"
+        assert today.read_bytes() == today_bytes, "❌ Today's file must never be rewritten"
+        assert compact_closed_days(temp_dir, today=DAY + timedelta(days=1)) == [], "❌ Compacted twice"
+        print("✅ Only finished, heavily edited days compacted")
+
+        # One deletion among identical lines removes one of them, however often the app starts
+        repeated = write_day(temp_dir, ['2025-01-22 09:00 [Work]  - standup'] * 3, DAY - timedelta(days=2))
+        delete_entry(repeated, read_entries(repeated)[0][0])
+        for _ in range(3):
+            compact_closed_days(temp_dir, today=DAY + timedelta(days=1))
+        assert len(read_text(repeated).splitlines()) == 2, f"❌ Deletion applied again:\n{read_text(repeated)}"
+        assert len(repeated.read_text(encoding='utf-8').splitlines()) == 2, "❌ Day file lost entries"
+        print("✅ Compacted edits never apply twice")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_synced_days_not_compacted():
+    """Test that days another device has a copy of are never rewritten"""
+    print("🧪 Testing compaction of synced days...")
+
+    from sync import SyncEngine, SyncServer, SocketPeer, FolderPeer, synced_names, STATE_NAME
+    from worklog_edits import read_entries, read_text, edit_entry, delete_entry, compact_closed_days
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        laptop, desktop, shared = temp_dir / 'laptop', temp_dir / 'desktop', temp_dir / 'shared'
+        for path in (laptop, desktop, shared):
+            path.mkdir()
+        name = f'worklog_{DAY.isoformat()}.txt'
+        write_day(laptop)
+        SyncEngine(laptop).sync(FolderPeer(shared))
+        SyncEngine(desktop).sync(FolderPeer(shared))
+        entries = read_entries(laptop / name)
+        edit_entry(laptop / name, entries[0][0], '2025-01-24 09:00 [Work] [#46: Login] - fix login')
+        delete_entry(laptop / name, entries[3][0])
+        expected = read_text(laptop / name)
+
+        assert name in synced_names(laptop), "❌ Synced day not recorded"
+        assert compact_closed_days(laptop, today=DAY + timedelta(days=1)) == [], "❌ Synced day compacted"
+        for device in (laptop, desktop, laptop):
+            SyncEngine(device).sync(FolderPeer(shared))
+        for device in (laptop, desktop):
+            text = read_text(device / name)
+            assert text == expected, f"❌ {device.name} shows old or duplicate entries:\n{text}"
+        print("✅ Synced days keep their edits in the sidecar")
+
+        # A device serving its work logs knows which days were copied from it
+        server = SyncServer(desktop, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        other = temp_dir / 'other'
+        other.mkdir()
+        peer = SocketPeer('127.0.0.1', server.server_address[1])
+        try:
+            (desktop / STATE_NAME).unlink()
+            SyncEngine(other).sync(peer)
+        finally:
+            peer.close()
+            server.shutdown()
+            server.server_close()
+        assert name in synced_names(desktop), "❌ Served day not recorded"
+        assert compact_closed_days(desktop, today=DAY + timedelta(days=1)) == [], "❌ Served day compacted"
+        print("✅ Served days never compacted")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_edits_sync():
+    """Test that a deletion on one device hides the entry on the other"""
+    print("🧪 Testing edits sync...")
+
+    from sync import SyncEngine, FolderPeer
+    from worklog_edits import read_entries, read_text, delete_entry
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        laptop, desktop, shared = temp_dir / 'laptop', temp_dir / 'desktop', temp_dir / 'shared'
+        for path in (laptop, desktop, shared):
+            path.mkdir()
+        write_day(laptop)
+        SyncEngine(laptop).sync(FolderPeer(shared))
+        SyncEngine(desktop).sync(FolderPeer(shared))
+
+        name = f'worklog_{DAY.isoformat()}.txt'
+        delete_entry(laptop / name, read_entries(laptop / name)[3][0])
+        SyncEngine(laptop).sync(FolderPeer(shared))
+        SyncEngine(desktop).sync(FolderPeer(shared))
+        text = read_text(desktop / name)
+        assert 'oops' not in text and len(text.splitlines()) == 4, f"❌ Deletion not synced:\n{text}"
+        print("✅ Edits synced with the day files")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def test_edit_speed():
+    """Test that edits are constant-time appends and edited days still read fast"""
+    print("🧪 Testing edit and read speed...")
+
+    from worklog_edits import read_entries, read_text, edit_entry
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        lines = [f'2025-01-24 {minute // 60:02}:{minute % 60:02} [Work]  - entry {minute}' for minute in range(1000)]
+        log_file = write_day(temp_dir, lines)
+        entries = read_entries(log_file)
+        started = time.perf_counter()
+        for key, line in entries[:200]:
+            edit_entry(log_file, key, line + ' (edited)')
+        edit_time = (time.perf_counter() - started) / 200
+        started = time.perf_counter()
+        text = read_text(log_file)
+        read_time = time.perf_counter() - started
+        print(f"   {edit_time*1000:.3f} ms per edit, {read_time*1000:.1f} ms to read 1000 entries with 200 edits")
+        assert text.count('(edited)') == 200, "❌ Edits missing"
+        assert edit_time < 0.01 and read_time < 0.1, "❌ Edits too slow"
+        print("✅ Edits and edited reads are fast")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return True
+
+def run_all_tests():
+    """Run all work log edit tests"""
+    print("🚀 Starting work log edit tests...\n")
+
+    tests = [
+        test_edits_are_appended,
+        test_readers_apply_edits,
+        test_compaction,
+        test_synced_days_not_compacted,
+        test_edits_sync,
+        test_edit_speed
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL WORK LOG EDIT TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -4,11 +4,13 @@ Test script to verify work log files are never erased or overwritten.
 This ensures user data is always preserved.
 """
 
+import os
 import sys
 import tempfile
 import shutil
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -17,19 +19,18 @@ def test_worklog_preservation():
     """Test that work log entries are always appended, never overwritten"""
     
     # Import the dashboard functions
-    from ui.dashboard import save_worklog_entry, get_today_worklog, get_data_dir
+    from ui.dashboard import save_worklog_entry, get_today_worklog
     
     print("🧪 Testing work log preservation...")
     
-    # Create a temporary directory for testing
-    original_data_dir = get_data_dir()
-    temp_dir = Path(tempfile.mkdtemp())
+    # Create a temporary home directory for testing
+    temp_home = Path(tempfile.mkdtemp())
+    temp_dir = temp_home / '.reporter'
     
+    # Every module finds the data directory through worklog_io.get_data_dir
+    home = patch.dict(os.environ, {'HOME': str(temp_home)})
+    home.start()
     try:
-        # Temporarily override the data directory
-        import ui.dashboard
-        ui.dashboard.get_data_dir = lambda: temp_dir
-        
         # Test 1: Save first entry
         result1 = save_worklog_entry("TestOrg", "123# test issue", "First work entry")
         assert result1, "❌ Failed to save first entry"
@@ -81,7 +82,8 @@ def test_worklog_preservation():
         
     finally:
         # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        home.stop()
+        shutil.rmtree(temp_home, ignore_errors=True)
 
 if __name__ == '__main__':
     success = test_worklog_preservation()
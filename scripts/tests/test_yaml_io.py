@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the shared YAML/cache I/O layer.
+Tests atomic writes, crash safety and the fast GitHub cache format.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def test_atomic_write_keeps_old_file_on_failure():
+    """Test that a failed write never corrupts the existing file"""
+    print("🧪 Testing atomic YAML writes...")
+
+    from yaml_io import dump_yaml, load_yaml
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / 'context.yml'
+        dump_yaml({'ui': {'language': 'th'}}, path)
+        assert load_yaml(path) == {'ui': {'language': 'th'}}, "❌ Round trip failed"
+        print("✅ YAML round trip works")
+
+        # An object the safe dumper can't represent fails part way through
+        try:
+            dump_yaml({'ui': {'language': object()}}, path)
+            assert False, "❌ Dumping an unsupported object should fail"
+        except Exception:
+            pass
+        assert load_yaml(path) == {'ui': {'language': 'th'}}, "❌ Original file was corrupted"
+        assert [p.name for p in temp_dir.iterdir()] == ['context.yml'], "❌ Temp file left behind"
+        print("✅ Failed write left the original file intact")
+
+        if os.name == 'posix':
+            path.chmod(0o644)
+            dump_yaml({'ui': {'language': 'zh'}}, path)
+            assert path.stat().st_mode & 0o777 == 0o644, f"❌ Mode changed: {oct(path.stat().st_mode & 0o777)}"
+            print("✅ Rewritten file keeps its permissions")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def test_github_cache_sidecar():
+    """Test that the GitHub cache loads from the JSON sidecar unless the YAML is newer"""
+    print("🧪 Testing GitHub cache sidecar...")
+
+    from yaml_io import write_cache, load_cache, cache_path, dump_yaml
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / 'github_data.yml'
+        data = {'account name': None, 'my_issues': {'126': 'add tests [https://github.com/o/r/issues/126]'}}
+        write_cache(data, path)
+        assert cache_path(path).exists(), "❌ JSON sidecar not written"
+        assert load_cache(path) == data, "❌ Cache round trip failed"
+
+        # A hand edit of the YAML wins over the stale sidecar
+        edited = {'my_issues': {'1': 'edited'}}
+        dump_yaml(edited, path)
+        os.utime(path, ns=(time.time_ns(), cache_path(path).stat().st_mtime_ns + 1))
+        assert load_cache(path) == edited, "❌ Newer YAML should be loaded"
+        assert load_cache(path) == edited, "❌ Regenerated sidecar should match YAML"
+        print("✅ Sidecar used when fresh, YAML when newer")
+
+        # Large caches load faster from the sidecar than through YAML
+        big = {'my_issues': {str(i): f"issue {i} [https://github.com/o/r/issues/{i}]" for i in range(20000)}}
+        write_cache(big, path)
+        start = time.perf_counter()
+        load_cache(path)
+        cache_time = time.perf_counter() - start
+        from yaml_io import load_yaml
+        start = time.perf_counter()
+        load_yaml(path)
+        yaml_time = time.perf_counter() - start
+        print(f"   20000 items: sidecar {cache_time*1000:.0f} ms, YAML {yaml_time*1000:.0f} ms")
+        assert cache_time < yaml_time, "❌ Sidecar should load faster than YAML"
+        print("✅ Large cache loads faster from the sidecar")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return True
+
+def run_all_tests():
+    """Run all YAML I/O tests"""
+    print("🚀 Starting YAML I/O tests...\n")
+
+    tests = [
+        test_atomic_write_keeps_old_file_on_failure,
+        test_github_cache_sidecar
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            print(f"\n{'='*60}")
+            if test():
+                passed += 1
+                print(f"✅ {test.__name__} PASSED")
+            else:
+                failed += 1
+                print(f"❌ {test.__name__} FAILED")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__} FAILED with exception: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*60}")
+    print(f"🏁 Test Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("🎉 ALL YAML I/O TESTS PASSED!")
+        return True
+    else:
+        print("💥 Some tests failed. Please review the output above.")
+        return False
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
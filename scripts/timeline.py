@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Activity timeline for Reporter app
+Merges work log entries, your local git commits and GitHub mentions and
+repository activity into one stream, newest first. The timeline is read one
+time window at a time (a day by default): each source returns only the events
+inside the window, and heapq.merge interleaves them, so scrolling back through
+a month reads a month of day files and one `git log` per repository and day,
+never the whole history.
+
+Every source keeps its own cache. Day files are re-read when their size or
+modification time changes, `git log` runs again only when a branch tip moved,
+and the GitHub events file is re-read when it grows.
+"""
+
+import json
+import heapq
+from bisect import bisect_left
+from datetime import datetime, date, time, timedelta
+from pathlib import Path
+from github_items import GH_CELL_RE
+from git_harvester import configured_repos, find_git_dir, read_branch_tips, run_git, author_email, author_args
+from profiling import span
+from standup import parse_line
+from worklog_edits import edits_path, read_text
+from worklog_io import get_data_dir
+import github_data
+
+DEFAULT_WINDOW = timedelta(days=1)
+
+# Windows remembered per repository before the oldest are dropped
+COMMIT_CACHE_LIMIT = 120
+
+def event(when, source, text, detail='', url=None):
+    return {'time': when, 'source': source, 'text': text, 'detail': detail, 'url': url}
+
+def in_window(events, start, end):
+    """Events of a list sorted by time with start <= time < end"""
+    times = [item['time'] for item in events]
+    return events[bisect_left(times, start):bisect_left(times, end)]
+
+class WorklogSource:
+    """Work log entries, one cached day file at a time"""
+
+    name = 'worklog'
+
+    def __init__(self, data_dir=None):
+        self.data_dir = Path(data_dir or get_data_dir())
+        self._days = {}  # day -> (mtime and size of the file and its edits, [event, ...])
+
+    def day_events(self, day):
+        path = self.data_dir / f'worklog_{day.isoformat()}.txt'
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._days.pop(day, None)
+            return []
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        try:
+            edits = edits_path(path).stat()
+            stamp += (edits.st_mtime_ns, edits.st_size)
+        except FileNotFoundError:
+            pass
+        cached = self._days.get(day)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        events = []
+        for line in read_text(path).splitlines():
+            entry = parse_line(line)
+            if entry is None:
+                continue
+            try:
+                when = datetime.strptime(f"{entry['date']} {entry['time']}", '%Y-%m-%d %H:%M')
+            except ValueError:
+                continue
+            detail = ' '.join(f'[{part}]' for part in (entry['organization'], entry['issue']) if part)
+            events.append(event(when, self.name, entry['text'], detail))
+        events.sort(key=lambda item: item['time'])
+        self._days[day] = (stamp, events)
+        return events
+
+    def events(self, start, end):
+        day, last = start.date(), (end - timedelta(microseconds=1)).date()
+        events = []
+        while day <= last:
+            events.extend(in_window(self.day_events(day), start, end))
+            day += timedelta(days=1)
+        return events
+
+class CommitSource:
+    """Your commits in the repositories listed under git_repos, cached per window until a branch moves"""
+
+    name = 'commit'
+
+    def __init__(self, repos=None):
+        self.repos = [(str(Path(repo).expanduser()), organization)
+                      for repo, organization in (configured_repos() if repos is None else repos)]
+        self._emails = {}
+        self._windows = {}  # repo -> {(start, end): (tips, [event, ...])}
+
+    def repo_events(self, repo, organization, start, end):
+        git_dir = find_git_dir(repo)
+        if git_dir is None:
+            return []
+        tips = read_branch_tips(git_dir)
+        if not tips:
+            return []
+        windows = self._windows.setdefault(repo, {})
+        cached = windows.get((start, end))
+        if cached and cached[0] == tips:
+            return cached[1]
+
+        if repo not in self._emails:
+            self._emails[repo] = author_email(repo)
+        args = ['log', '--no-merges', '--format=%H%x1f%at%x1f%s',
+                f'--since={int(start.timestamp())}', f'--until={int(end.timestamp())}']
+        if self._emails[repo]:
+            args += author_args(self._emails[repo])
+        output = run_git(repo, args + sorted(set(tips.values())))
+        events = []
+        for line in output.splitlines():
+            sha, timestamp, subject = line.split('\x1f', 2)
+            when = datetime.fromtimestamp(int(timestamp))
+            if start <= when < end:
+                detail = f'[{organization or Path(repo).name}] {sha[:7]}'
+                events.append(event(when, self.name, subject, detail))
+        events.sort(key=lambda item: item['time'])
+
+        if len(windows) >= COMMIT_CACHE_LIMIT:
+            windows.pop(next(iter(windows)))
+        windows[(start, end)] = (tips, events)
+        return events
+
+    def events(self, start, end):
+        events = []
+        for repo, organization in self.repos:
+            try:
+                events.extend(self.repo_events(repo, organization, start, end))
+            except Exception as e:
+                print(f"Error reading commits in {repo}: {e}")
+        events.sort(key=lambda item: item['time'])
+        return events
+
+class GitHubSource:
+    """Mentions and repository activity recorded by `gh status` refreshes"""
+
+    name = 'github'
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else github_data.YAML_PATH.with_name(github_data.EVENTS_NAME)
+        self._stamp = None
+        self._events = []
+
+    def load(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._stamp, self._events = None, []
+            return self._events
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stamp:
+            return self._events
+        events = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    recorded = json.loads(line)
+                    when = datetime.fromisoformat(recorded['time'])
+                    text = recorded['text']
+                except (ValueError, KeyError, TypeError):
+                    continue
+                match = GH_CELL_RE.match(text)
+                url = None
+                if match:
+                    repo, number, title = match.group(1).strip(), match.group(2), match.group(3).strip()
+                    # GitHub redirects /issues/N to the pull request when N is one
+                    url = f'https://github.com/{repo}/issues/{number}'
+                    text = f'{repo}#{number} {title}'
+                events.append(event(when, self.name, text, recorded.get('kind', ''), url))
+        events.sort(key=lambda item: item['time'])
+        self._stamp, self._events = stamp, events
+        return events
+
+    def events(self, start, end):
+        return in_window(self.load(), start, end)
+
+def default_sources(data_dir=None):
+    return [WorklogSource(data_dir), CommitSource(), GitHubSource()]
+
+class Timeline:
+    """Newest-first events of several sources, read one window at a time"""
+
+    def __init__(self, sources=None, window=DEFAULT_WINDOW):
+        self.sources = default_sources() if sources is None else sources
+        self.window = window
+
+    def latest_end(self):
+        """End of the newest window: midnight tonight, so daily windows line up with days"""
+        return datetime.combine(date.today() + timedelta(days=1), time())
+
+    def page(self, end=None):
+        """(events newest first, start) for the window ending at end"""
+        end = end or self.latest_end()
+        start = end - self.window
+        with span('timeline.page') as timing:
+            streams = []
+            for source in self.sources:
+                try:
+                    streams.append(reversed(source.events(start, end)))
+                except Exception as e:
+                    print(f"Error reading {source.name} timeline: {e}")
+            events = list(heapq.merge(*streams, key=lambda item: item['time'], reverse=True))
+            timing.set(events=len(events))
+        return events, start
+
+    def pages(self, end=None):
+        """Yield (start, end, events) going back in time, forever; stop when you have enough"""
+        end = end or self.latest_end()
+        while True:
+            events, start = self.page(end)
+            yield start, end, events
+            end = start
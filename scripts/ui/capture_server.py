@@ -0,0 +1,75 @@
+# Local socket server used by the running dashboard in single-instance mode
+# Later launches connect with instance.send_request() and send one JSON line,
+# e.g. {"cmd": "add", "organization": "...", "issue": "...", "text": "..."},
+# and get one JSON line back, e.g. {"ok": true}
+
+import json
+from PyQt5.QtCore import QObject
+from PyQt5.QtNetwork import QLocalServer
+
+class CaptureServer(QObject):
+    """Accepts entries, "show" and "quick" (open the quick entry popup) requests from later launches"""
+
+    def __init__(self, on_add, on_show=None, on_quick=None, parent=None):
+        super().__init__(parent)
+        self.on_add = on_add
+        self.on_show = on_show
+        self.on_quick = on_quick
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.accept_connections)
+
+    def listen(self, path):
+        """Start listening, replacing a stale socket file left by a crashed instance"""
+        # Only call this once nothing answered on path, otherwise a live instance is cut off
+        QLocalServer.removeServer(str(path))
+        if not self.server.listen(str(path)):
+            print(f"Could not listen on {path}: {self.server.errorString()}")
+            return False
+        return True
+
+    def close(self):
+        self.server.close()
+
+    def accept_connections(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self.read_requests(connection))
+            connection.disconnected.connect(connection.deleteLater)
+            # Data may have arrived before readyRead was connected
+            if connection.bytesAvailable():
+                self.read_requests(connection)
+
+    def read_requests(self, connection):
+        while connection.canReadLine():
+            line = bytes(connection.readLine()).decode('utf-8', errors='replace')
+            reply = self.handle(line)
+            connection.write(json.dumps(reply).encode('utf-8') + b'\n')
+            connection.flush()
+
+    def handle(self, line):
+        """Run one request and return the reply dict"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {'ok': False, 'error': 'invalid request'}
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': 'invalid request'}
+
+        command = request.get('cmd')
+        try:
+            if command == 'add':
+                text = str(request.get('text') or '').strip()
+                if not text:
+                    return {'ok': False, 'error': 'empty entry'}
+                ok = self.on_add(str(request.get('organization') or ''), str(request.get('issue') or ''), text)
+                return {'ok': bool(ok)}
+            if command == 'show' and self.on_show is not None:
+                self.on_show()
+                return {'ok': True}
+            if command == 'quick' and self.on_quick is not None:
+                self.on_quick()
+                return {'ok': True}
+        except Exception as e:
+            print(f"Error handling {command} request: {e}")
+            return {'ok': False, 'error': str(e)}
+        return {'ok': False, 'error': f'unknown command: {command}'}
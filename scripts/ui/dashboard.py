@@ -6,371 +6,845 @@
 
 import sys
 import os
-import re
+import json
 import subprocess
-import webbrowser
 from datetime import datetime
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-    QTextEdit, QLineEdit, QTabWidget, QMessageBox, QComboBox
+    QTextEdit, QLineEdit, QTabWidget, QMessageBox, QComboBox, QCompleter, QListWidget, QListWidgetItem,
+    QInputDialog
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QKeySequence, QCursor
-
-# Custom clickable label widget
-class ClickableLabel(QLabel):
-    def __init__(self, text, url=None):
-        super().__init__(text)
-        self.url = url
-        if url:
-            self.setStyleSheet("color: aqua; text-decoration: underline; padding: 4px; border-bottom: 1px solid #eee;")
-            self.setCursor(QCursor(Qt.PointingHandCursor))
-        else:
-            self.setStyleSheet("padding: 4px; border-bottom: 1px solid #eee;")
-        self.setWordWrap(True)
-    
-    def mousePressEvent(self, event):
-        if self.url and event.button() == Qt.LeftButton:
-            webbrowser.open(self.url)
-        super().mousePressEvent(event)
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QStringListModel, QFileSystemWatcher
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ui.github_model import GitHubItemsModel, GitHubFilterProxy, GitHubListView, SORT_OPTIONS
+from ui.timeline_view import TimelineModel, TimelineView
+from ui.history_view import HistoryPanel
+from fuzzy_index import FuzzyIndex
+from issue_linker import IssueLinker
+from github_items import COMBO_PREFIXES, find_github_data_file, get_github_data
+from yaml_io import atomic_write
+from config_service import get_config_service
+from snapshot import SNAPSHOT_NAME, load_snapshot, save_snapshot
+from git_harvester import GitHarvester, configured_repos, format_suggestion
+from standup import render_standup, ENTRY_RE
+from worklog_edits import edits_path, read_text, read_entries, edit_entry, delete_entry, compact_closed_days
+from timeline import Timeline, default_sources
+from worklog_io import get_data_dir, save_worklog_entry
+import startup_trace
+from profiling import span
+from localization import (
+    tr, TranslationRegistry, get_active_language, set_active_language,
+    set_language, get_available_languages
+)
+
+class GitHubFetchWorker(QThread):
+    """Runs `gh status` off the UI thread and emits items as they are parsed"""
+    item_found = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    done = pyqtSignal()
+
+    def run(self):
+        try:
+            sys.path.insert(0, str(Path(__file__).parent.parent))
+            from github_data import fetch_github_data
+            fetch_github_data(on_item=self.item_found.emit)
+            self.done.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+
+class TimelineWorker(QThread):
+    """Reads one window of the activity timeline off the UI thread"""
+    loaded = pyqtSignal(int, object, object, object)
+
+    def __init__(self, timeline, end, generation, parent=None):
+        super().__init__(parent)
+        self.timeline = timeline
+        self.end = end
+        self.generation = generation
+
+    def run(self):
+        end = self.end or self.timeline.latest_end()
+        try:
+            events, start = self.timeline.page(end)
+        except Exception as e:
+            print(f"Error loading timeline: {e}")
+            events, start = [], end - self.timeline.window
+        self.loaded.emit(self.generation, start, end, events)
+
+class CompactWorker(QThread):
+    """Rewrites finished days whose entries were edited a lot, off the UI thread"""
+
+    def run(self):
+        try:
+            compacted = compact_closed_days(get_data_dir())
+            if compacted:
+                print(f"Compacted edited work logs: {', '.join(compacted)}")
+        except Exception as e:
+            print(f"Error compacting work logs: {e}")
+
+class GitHarvestWorker(QThread):
+    """Scans the configured git repositories for new commits off the UI thread"""
+    harvested = pyqtSignal(object)
+
+    def __init__(self, harvester, parent=None):
+        super().__init__(parent)
+        self.harvester = harvester
+
+    def run(self):
+        try:
+            self.harvested.emit(self.harvester.harvest())
+        except Exception as e:
+            print(f"Error harvesting commits: {e}")
+
+# Empty timeline windows in a row after which scrolling back stops loading
+TIMELINE_EMPTY_LIMIT = 31
 
 # Data functions
 
-def get_data_dir():
-    """Get or create the ~/.reporter data directory"""
-    data_dir = Path.home() / '.reporter'
-    data_dir.mkdir(exist_ok=True)
-    return data_dir
-
-def extract_url_from_text(text):
-    """Extract URL from text like 'title [https://github.com/...]'"""
-    url_match = re.search(r'\[([^\]]+)\]', text)
-    if url_match:
-        url = url_match.group(1)
-        # Clean text by removing the URL part
-        clean_text = re.sub(r'\s*\[([^\]]+)\]', '', text)
-        return clean_text.strip(), url
-    return text, None
-
-def get_github_data():
-    """Load GitHub data from YAML file and return with URLs extracted"""
+def picked_issue(combo):
+    """Issue/PR picked in an editable combo, '' for the placeholder or typed text matching no item"""
+    issue = combo.currentText()
+    # Item 0 is the placeholder; a half-typed filter is not an issue
+    return issue if issue and combo.findText(issue) > 0 else ''
+
+def load_recent_issues():
+    """Load the recently used Issue/PR entries, oldest first"""
+    recent_file = get_data_dir() / 'recent_issues.json'
+    if recent_file.exists():
+        try:
+            with open(recent_file, 'r', encoding='utf-8') as f:
+                return list(reversed(json.load(f)))
+        except Exception as e:
+            print(f"Error loading recent issues: {e}")
+    return []
+
+def save_recent_issues(recent):
+    """Save the recently used Issue/PR entries, most recent first"""
     try:
-        import yaml
-        
-        # Try multiple locations for the GitHub data file
-        possible_locations = [
-            get_data_dir() / 'github_data.yml',  # User's home directory
-            Path(__file__).parent.parent.parent / 'user_data' / 'github_data.yml',  # Project directory
-            Path.cwd() / 'user_data' / 'github_data.yml',  # Current working directory
-        ]
-        
-        for github_file in possible_locations:
-            if github_file.exists():
-                with open(github_file, 'r') as f:
-                    data = yaml.safe_load(f) or {}
-                    
-                    result = {'issues': [], 'prs': [], 'reviews': []}
-                    
-                    # Process issues
-                    for k, v in data.get('my_issues', {}).items():
-                        text, url = extract_url_from_text(v)
-                        result['issues'].append({
-                            'text': f"#{k}: {text}",
-                            'url': url,
-                            'raw': f"#{k}: {v}"  # For combo box
-                        })
-                    
-                    # Process PRs
-                    for k, v in data.get('my_prs', {}).items():
-                        text, url = extract_url_from_text(v)
-                        result['prs'].append({
-                            'text': f"#{k}: {text}",
-                            'url': url,
-                            'raw': f"#{k}: {v}"  # For combo box
-                        })
-                    
-                    # Process reviews
-                    for k, v in data.get('my_reviews', {}).items():
-                        text, url = extract_url_from_text(v)
-                        result['reviews'].append({
-                            'text': f"#{k}: {text}",
-                            'url': url,
-                            'raw': f"#{k}: {v}"  # For combo box
-                        })
-                    
-                    return result
-                    
+        atomic_write(get_data_dir() / 'recent_issues.json', json.dumps(recent, ensure_ascii=False))
     except Exception as e:
-        print(f"Error loading GitHub data: {e}")
-    
-    return {
-        'issues': [{'text': 'No GitHub data available', 'url': None, 'raw': 'No GitHub data available'}],
-        'prs': [{'text': 'No GitHub data available', 'url': None, 'raw': 'No GitHub data available'}],
-        'reviews': [{'text': 'No GitHub data available', 'url': None, 'raw': 'No GitHub data available'}],
-    }
+        print(f"Error saving recent issues: {e}")
 
 def get_organizations():
     """Get list of organizations/projects from context.yml"""
-    try:
-        import yaml
-        
-        # Try multiple locations for context.yml
-        possible_locations = [
-            Path(__file__).parent.parent.parent / 'context.yml',  # Project directory
-            Path.cwd() / 'context.yml',  # Current working directory
-        ]
-        
-        for context_file in possible_locations:
-            if context_file.exists():
-                with open(context_file, 'r') as f:
-                    data = yaml.safe_load(f) or {}
-                    projects = data.get('projects', {})
-                    return list(projects.keys()) + ['Personal', 'Other']
-                    
-    except Exception as e:
-        print(f"Error loading organizations: {e}")
-    
-    return ['Personal', 'Work', 'Other']
+    config = get_config_service()
+    if config.path is None:
+        return ['Personal', 'Work', 'Other']
+    projects = config.section('projects')
+    return list(projects.keys()) + ['Personal', 'Other']
+
+def get_today_log_path():
+    """Path of today's work log file"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    return get_data_dir() / f'worklog_{today}.txt'
 
 def get_today_worklog():
     """Load today's work log from file"""
     today = datetime.now().strftime('%Y-%m-%d')
-    log_file = get_data_dir() / f'worklog_{today}.txt'
+    log_file = get_today_log_path()
     
     if log_file.exists():
         try:
-            with open(log_file, 'r') as f:
-                return f.read().strip()
+            with span('worklog.read'):
+                return read_text(log_file).strip()
         except Exception as e:
             print(f"Error reading worklog: {e}")
     
     return f"Work log for {today}:\n(No entries yet)"
 
-def save_worklog_entry(organization, issue, entry_text):
-    """Save a work log entry with organization and issue context"""
-    today = datetime.now().strftime('%Y-%m-%d')
-    now = datetime.now().strftime('%H:%M')
-    log_file = get_data_dir() / f'worklog_{today}.txt'
-    
-    # Format: YYYY-MM-DD HH:MM [Organization] [Issue] - Entry
-    org_part = f"[{organization}]" if organization and organization != "Select organization..." else ""
-    issue_part = f"[{issue}]" if issue and issue != "Select issue/PR..." else ""
-    
-    log_entry = f"{today} {now} {org_part} {issue_part} - {entry_text}\n"
-    
-    try:
-        # CRITICAL: Always use append mode ('a') to preserve existing work log entries
-        # Never use 'w' mode which would overwrite/erase previous entries
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
-        return True
-    except Exception as e:
-        print(f"Error saving worklog entry: {e}")
-        return False
-
 class Dashboard(QWidget):
-    def __init__(self):
+    startup_finished = pyqtSignal()
+
+    def __init__(self, staged=False, warm_start=False):
         super().__init__()
-        self.setWindowTitle('Reporter - Work Tracker')
+        
+        # State saved by the last session, used for sections whose files haven't changed
+        self.warm_start = warm_start
+        self.snapshot = None
+        self.loaded_cold = False
+        if warm_start:
+            with startup_trace.stage('load snapshot'):
+                self.snapshot = load_snapshot(get_data_dir() / SNAPSHOT_NAME)
+            config = self.cached('config', get_config_service().path)
+            if config is not None:
+                get_config_service().seed(config)
+        
+        # Widgets register their labels here so a language switch relabels them in place
+        self.translations = TranslationRegistry()
+        self.language = get_active_language()
+        self.translations.bind('app_title', self.setWindowTitle)
         self.resize(900, 700)
-        self.organizations = get_organizations()
-        self.github_data = get_github_data()
-        self.llm_enabled = False  # Initialize before init_ui
-        self.init_ui()
+        self.organizations = []
+        self.github_data = {kind: [] for kind in COMBO_PREFIXES}
+        self.llm_enabled = False
+        self.llm_panel = None
+        self.github_worker = None
+        self.harvester = None
+        self.harvest_worker = None
+        self.compact_worker = None
+        self.issue_linker = IssueLinker()
+        self.pending_issue = None
+        self.timeline = None
+        self.timeline_worker = None
+        self.timeline_generation = 0
+        self.timeline_end = None
+        self.timeline_empty = 0
+        self.started = False
+        
+        # Everything but the entry field is built after it can take input
+        self.startup_stages = [
+            ('work log', self.build_worklog_panel),
+            ('organizations', self.load_organizations),
+            ('llm panel', self.build_llm_slot),
+            ('github tabs', self.build_github_panel),
+            ('issue linker', self.update_issue_linker),
+            ('controls', self.build_controls),
+            ('config watcher', self.watch_config),
+        ]
+        with startup_trace.stage('entry field'):
+            self.init_ui()
+        if staged:
+            # Runs once the event loop starts, after the window is shown
+            QTimer.singleShot(0, self.start_deferred_stages)
+        else:
+            self.finish_startup()
         
         # Auto-refresh disabled to prevent interrupting user input
         # Users can manually refresh GitHub data when needed
 
     def init_ui(self):
-        layout = QVBoxLayout()
+        """Build the work entry section, the only part needed before the first keystroke"""
+        self.setLayout(QVBoxLayout())
 
         # Work Entry Section (Top Priority - Autofocus)
         entry_section = QVBoxLayout()
-        entry_label = QLabel('Quick Work Entry:')
+        entry_label = QLabel()
+        self.translations.bind('quick_work_entry', entry_label.setText)
         entry_label.setStyleSheet("font-weight: bold; font-size: 14px;")
         entry_section.addWidget(entry_label)
 
         # Organization/Project Selection
         org_layout = QHBoxLayout()
-        org_layout.addWidget(QLabel('Organization:'))
+        org_label = QLabel()
+        self.translations.bind('organization', org_label.setText)
+        org_layout.addWidget(org_label)
         self.org_combo = QComboBox()
-        self.org_combo.addItem("Select organization...")
-        self.org_combo.addItems(self.organizations)
+        self.org_combo.addItem('')
+        self.translations.bind('select_organization', lambda text: self.org_combo.setItemText(0, text))
         self.org_combo.setCurrentIndex(0)
         org_layout.addWidget(self.org_combo)
         entry_section.addLayout(org_layout)
 
         # GitHub Issue/PR Selection
         issue_layout = QHBoxLayout()
-        issue_layout.addWidget(QLabel('Issue/PR:'))
+        issue_label = QLabel()
+        self.translations.bind('issue_pr', issue_label.setText)
+        issue_layout.addWidget(issue_label)
         self.issue_combo = QComboBox()
-        self.issue_combo.addItem("Select issue/PR...")
-        self.update_issue_combo()
+        self.issue_combo.setEditable(True)
+        self.issue_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.issue_combo.addItem('')
+        self.translations.bind('select_issue_pr', self.set_issue_placeholder)
+        
+        # Type-to-filter completer backed by a fuzzy index
+        self.issue_index = FuzzyIndex(recent=load_recent_issues())
+        self.issue_completer = QCompleter(QStringListModel(self), self.issue_combo)
+        self.issue_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.issue_completer.setMaxVisibleItems(15)
+        self.issue_completer.activated[str].connect(self.select_issue)
+        self.issue_combo.setCompleter(self.issue_completer)
+        self.issue_combo.lineEdit().textEdited.connect(self.filter_issue_completions)
         issue_layout.addWidget(self.issue_combo)
         entry_section.addLayout(issue_layout)
 
         # Main text entry (AUTOFOCUS)
         self.entry_field = QLineEdit()
-        self.entry_field.setPlaceholderText('Enter work description... (Press Enter to save)')
+        self.translations.bind('work_description_placeholder', self.entry_field.setPlaceholderText)
         self.entry_field.returnPressed.connect(self.save_entry)
+        self.entry_field.textEdited.connect(self.suggest_issue_link)
         self.entry_field.setStyleSheet("padding: 8px; font-size: 12px;")
         entry_section.addWidget(self.entry_field)
 
+        # Issue the entry will be linked to when none is picked, from what is typed
+        self.link_hint = QLabel()
+        self.link_hint.setStyleSheet("color: gray; font-size: 11px;")
+        self.link_hint.hide()
+        entry_section.addWidget(self.link_hint)
+        self.issue_combo.currentTextChanged.connect(lambda _: self.suggest_issue_link(self.entry_field.text()))
+
         # Save button
-        save_btn = QPushButton('Save Entry (Enter)')
+        save_btn = QPushButton()
+        self.translations.bind('save_entry', save_btn.setText)
         save_btn.clicked.connect(self.save_entry)
         save_btn.setStyleSheet("padding: 6px;")
         entry_section.addWidget(save_btn)
 
-        layout.addLayout(entry_section)
+        self.layout().addLayout(entry_section)
 
         # Separator
-        layout.addWidget(QLabel("─" * 80))
+        self.layout().addWidget(QLabel("─" * 80))
+
+    def start_deferred_stages(self):
+        # The window is up and the entry field takes input from here on
+        startup_trace.mark('ready for input')
+        self.run_next_stage()
+
+    def run_next_stage(self):
+        """Run one deferred startup stage, letting queued input through in between"""
+        if self.startup_stages:
+            name, build = self.startup_stages.pop(0)
+            with startup_trace.stage(name):
+                build()
+        if self.startup_stages:
+            QTimer.singleShot(0, self.run_next_stage)
+        else:
+            self.complete_startup()
+
+    def finish_startup(self):
+        """Run any startup stages still queued, e.g. when an entry is saved right away"""
+        while self.startup_stages:
+            name, build = self.startup_stages.pop(0)
+            with startup_trace.stage(name):
+                build()
+        self.complete_startup()
+
+    def complete_startup(self):
+        if not self.started:
+            self.started = True
+            startup_trace.mark('startup complete')
+            if self.warm_start and self.loaded_cold:
+                # Refresh the snapshot so the next launch is warm even if this one isn't closed cleanly
+                self.save_warm_snapshot()
+            self.snapshot = None
+            self.startup_finished.emit()
+            self.harvest_commits()
+            self.compact_worklogs()
 
+    def cached(self, name, source):
+        """Section of the warm-start snapshot, or None if it's missing or stale"""
+        value = self.snapshot.get(name, source) if self.snapshot is not None else None
+        if value is None:
+            self.loaded_cold = True
+        return value
+
+    def save_warm_snapshot(self):
+        """Save the rendered state for an instant next launch"""
+        if not self.started or (self.github_worker is not None and self.github_worker.isRunning()):
+            # Half-loaded or mid-refresh state would be shown as current next time
+            return False
+        config = get_config_service()
+        github_file = find_github_data_file(get_data_dir())
+        with startup_trace.stage('save snapshot'):
+            return save_snapshot(get_data_dir() / SNAPSHOT_NAME, {
+                'config': (config.path, config.get()),
+                'github_data': (github_file, self.github_data),
+                'issue_entries': (github_file, self.issue_entries()),
+                'issue_index': (github_file, self.issue_index),
+            }, get_today_log_path())
+
+    def closeEvent(self, event):
+        if self.warm_start:
+            self.save_warm_snapshot()
+        super().closeEvent(event)
+
+    def build_worklog_panel(self):
         # Today's Work Log Panel
         worklog_layout = QVBoxLayout()
         worklog_header = QHBoxLayout()
-        worklog_label = QLabel('Today\'s Work Log:')
+        worklog_label = QLabel()
+        self.translations.bind('todays_work_log', worklog_label.setText)
         worklog_label.setStyleSheet("font-weight: bold; font-size: 14px;")
-        copy_btn = QPushButton('Copy to Clipboard')
+        copy_btn = QPushButton()
+        self.translations.bind('copy_to_clipboard', copy_btn.setText)
         copy_btn.clicked.connect(self.copy_worklog)
         copy_btn.setStyleSheet("padding: 4px 12px;")
+        standup_btn = QPushButton()
+        self.translations.bind('copy_standup', standup_btn.setText)
+        standup_btn.clicked.connect(self.copy_standup)
+        standup_btn.setStyleSheet("padding: 4px 12px;")
         worklog_header.addWidget(worklog_label)
         worklog_header.addStretch()
+        worklog_header.addWidget(standup_btn)
         worklog_header.addWidget(copy_btn)
         worklog_layout.addLayout(worklog_header)
 
         self.worklog_text = QTextEdit()
         self.worklog_text.setReadOnly(True)
-        self.worklog_text.setText(get_today_worklog())
+        self.worklog_text.setText(self.load_worklog())
+        # Right-click an entry to edit or delete it
+        self.worklog_text.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.worklog_text.customContextMenuRequested.connect(self.show_worklog_menu)
         self.worklog_text.setStyleSheet("font-family: monospace; font-size: 11px; color: black; background-color: white;")
         worklog_layout.addWidget(self.worklog_text)
-        layout.addLayout(worklog_layout)
+        worklog_layout.addWidget(self.build_suggestions())
+        self.layout().addLayout(worklog_layout)
+
+    def build_suggestions(self):
+        """Entries suggested from new git commits, hidden until there are some"""
+        self.suggestions_box = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        header = QHBoxLayout()
+        label = QLabel()
+        self.translations.bind('commit_suggestions', label.setText)
+        label.setStyleSheet("font-weight: bold;")
+        log_btn = QPushButton()
+        self.translations.bind('log_suggestion', log_btn.setText)
+        log_btn.clicked.connect(self.log_selected_suggestion)
+        dismiss_btn = QPushButton()
+        self.translations.bind('dismiss_suggestion', dismiss_btn.setText)
+        dismiss_btn.clicked.connect(self.dismiss_selected_suggestion)
+        header.addWidget(label)
+        header.addStretch()
+        header.addWidget(log_btn)
+        header.addWidget(dismiss_btn)
+        layout.addLayout(header)
+        self.suggestions_list = QListWidget()
+        self.suggestions_list.setMaximumHeight(90)
+        self.suggestions_list.itemDoubleClicked.connect(self.log_suggestion)
+        layout.addWidget(self.suggestions_list)
+        self.suggestions_box.setLayout(layout)
+        self.suggestions_box.hide()
+        return self.suggestions_box
+
+    def harvest_commits(self):
+        """Look for new commits in the git_repos from context.yml, in the background"""
+        if self.harvest_worker is not None and self.harvest_worker.isRunning():
+            return
+        if not configured_repos():
+            return
+        if self.harvester is None:
+            self.harvester = GitHarvester()
+        self.harvest_worker = GitHarvestWorker(self.harvester, self)
+        self.harvest_worker.harvested.connect(self.show_suggestions)
+        self.harvest_worker.start()
+
+    def show_suggestions(self, suggestions):
+        self.suggestions_list.clear()
+        for suggestion in suggestions:
+            item = QListWidgetItem(format_suggestion(suggestion))
+            item.setData(Qt.UserRole, suggestion)
+            item.setToolTip(f"{suggestion['repo']} {suggestion['sha'][:10]}")
+            self.suggestions_list.addItem(item)
+        self.suggestions_box.setVisible(bool(suggestions))
+
+    def log_suggestion(self, item):
+        """Save a suggested entry to the work log"""
+        suggestion = item.data(Qt.UserRole)
+        if self.add_entry(suggestion['organization'], suggestion['issue'], suggestion['text']):
+            self.remove_suggestion(item)
+
+    def log_selected_suggestion(self):
+        item = self.suggestions_list.currentItem()
+        if item is not None:
+            self.log_suggestion(item)
+
+    def dismiss_selected_suggestion(self):
+        item = self.suggestions_list.currentItem()
+        if item is not None:
+            self.remove_suggestion(item)
+
+    def remove_suggestion(self, item):
+        self.harvester.remove(item.data(Qt.UserRole)['sha'])
+        self.suggestions_list.takeItem(self.suggestions_list.row(item))
+        self.suggestions_box.setVisible(self.suggestions_list.count() > 0)
+
+    def load_worklog(self):
+        """Today's work log, only reading what was appended since the snapshot if there is one"""
+        log_path = get_today_log_path()
+        if not log_path.exists() or edits_path(log_path).exists():
+            # The snapshot holds the file as written, not as edited
+            return get_today_worklog()
+        raw = self.snapshot.log_bytes(log_path) if self.snapshot else None
+        if raw is None:
+            self.loaded_cold = True
+            return get_today_worklog()
+        return raw.decode('utf-8', errors='replace').strip()
+
+    def compact_worklogs(self):
+        if self.compact_worker is None:
+            self.compact_worker = CompactWorker(self)
+            self.compact_worker.start()
+
+    def worklog_entry_at(self, pos):
+        """(key, line) of today's entry under a point in the work log panel, or None"""
+        block = self.worklog_text.cursorForPosition(pos).block()
+        text = block.text().strip()
+        if not text:
+            return None
+        # Which copy of this line it is when the same entry was logged twice
+        copy = 0
+        previous = block.previous()
+        while previous.isValid():
+            copy += previous.text().strip() == text
+            previous = previous.previous()
+        matches = [entry for entry in read_entries(get_today_log_path()) if entry[1].strip() == text]
+        return matches[copy] if copy < len(matches) else None
 
+    def show_worklog_menu(self, pos):
+        menu = self.worklog_text.createStandardContextMenu()
+        entry = self.worklog_entry_at(pos)
+        if entry is not None:
+            menu.addSeparator()
+            menu.addAction(tr('edit_entry'), lambda: self.edit_worklog_entry(*entry))
+            menu.addAction(tr('delete_entry'), lambda: self.delete_worklog_entry(*entry))
+        menu.exec_(self.worklog_text.mapToGlobal(pos))
+
+    def edit_worklog_entry(self, key, line):
+        """Change an entry's text, keeping its time, organization and issue"""
+        match = ENTRY_RE.match(line)
+        start = match.start('text') if match else 0
+        text, ok = QInputDialog.getText(self, tr('edit_entry'), tr('entry_text'), text=line[start:])
+        if not ok or not text.strip() or text.strip() == line[start:].strip():
+            return
+        if edit_entry(get_today_log_path(), key, line[:start] + text.strip()):
+            self.reload_worklog()
+        else:
+            QMessageBox.warning(self, tr('error'), tr('failed_to_save_entry'))
+
+    def delete_worklog_entry(self, key, line):
+        answer = QMessageBox.question(self, tr('delete_entry'), tr('confirm_delete_entry').format(entry=line))
+        if answer != QMessageBox.Yes:
+            return
+        if delete_entry(get_today_log_path(), key):
+            self.reload_worklog()
+        else:
+            QMessageBox.warning(self, tr('error'), tr('failed_to_save_entry'))
+
+    def reload_worklog(self):
+        self.worklog_text.setText(get_today_worklog())
+        self.reload_shown_tab()
+
+    def load_organizations(self):
+        self.organizations = get_organizations()
+        self.org_combo.addItems(self.organizations)
+
+    def build_llm_slot(self):
         # LLM Report Panel (only show if LLM is enabled)
         self.llm_enabled = self.is_llm_enabled()
+        self.llm_slot = QVBoxLayout()
+        self.llm_slot.setContentsMargins(0, 0, 0, 0)
         if self.llm_enabled:
-            llm_layout = QVBoxLayout()
-            llm_header = QHBoxLayout()
-            llm_label = QLabel('LLM Generated Standup Report:')
-            llm_label.setStyleSheet("font-weight: bold; font-size: 14px;")
-            
-            # Move Generate button to LLM section
-            llm_btn = QPushButton('Generate LLM Report')
-            llm_btn.clicked.connect(self.generate_llm_report)
-            llm_btn.setStyleSheet("padding: 4px 12px; background-color: #4CAF50; color: white;")
-            
-            copy_llm_btn = QPushButton('Copy LLM Report')
-            copy_llm_btn.clicked.connect(self.copy_llm_report)
-            copy_llm_btn.setStyleSheet("padding: 4px 12px;")
-            
-            llm_header.addWidget(llm_label)
-            llm_header.addStretch()
-            llm_header.addWidget(llm_btn)
-            llm_header.addWidget(copy_llm_btn)
-            llm_layout.addLayout(llm_header)
-
-            self.llm_text = QTextEdit()
-            self.llm_text.setReadOnly(True)
-            self.llm_text.setPlaceholderText("Click 'Generate LLM Report' to process your work log with AI...")
-            # Fix text visibility with proper colors
-            self.llm_text.setStyleSheet("font-family: system; font-size: 12px; color: black; background-color: #f8f9fa; border: 1px solid #ddd;")
-            llm_layout.addWidget(self.llm_text)
-            layout.addLayout(llm_layout)
-
-        # GitHub Data Panel (Collapsible)
+            self.llm_panel = self.build_llm_panel()
+            self.llm_slot.addWidget(self.llm_panel)
+        self.layout().addLayout(self.llm_slot)
+
+    def build_github_panel(self):
+        # GitHub Data Panel with filter and sort controls
+        github_file = find_github_data_file(get_data_dir())
+        github_data = self.cached('github_data', github_file)
+        self.github_data = github_data if github_data is not None else get_github_data(get_data_dir())
+        github_tools = QHBoxLayout()
+        self.github_filter = QLineEdit()
+        self.translations.bind('filter_github_items', self.github_filter.setPlaceholderText)
+        self.github_filter.textChanged.connect(self.filter_github_items)
+        self.github_sort = QComboBox()
+        for index, key in enumerate(SORT_OPTIONS):
+            self.github_sort.addItem('', key)
+            self.translations.bind(key, lambda text, index=index: self.github_sort.setItemText(index, text))
+        self.github_sort.currentIndexChanged.connect(
+            lambda index: self.sort_github_items(self.github_sort.itemData(index)))
+        github_tools.addWidget(self.github_filter)
+        github_tools.addWidget(self.github_sort)
+        self.layout().addLayout(github_tools)
+
         self.github_panel = QTabWidget()
         self.create_github_tabs()
-        layout.addWidget(self.github_panel)
+        self.layout().addWidget(self.github_panel)
+        if github_data is not None:
+            # The search index is the slowest part to rebuild, reuse it with its recents
+            issue_index = self.cached('issue_index', github_file)
+            if issue_index is not None:
+                self.issue_index = issue_index
+            self.update_issue_combo(self.cached('issue_entries', github_file))
+        else:
+            self.update_issue_combo()
 
+    def build_controls(self):
         # Control buttons
         btn_layout = QHBoxLayout()
-        refresh_btn = QPushButton('Refresh GitHub Data')
+        refresh_btn = QPushButton()
+        self.translations.bind('refresh_github_data', refresh_btn.setText)
         refresh_btn.clicked.connect(self.refresh_github_data)
-        context_btn = QPushButton('Open context.yml')
+        context_btn = QPushButton()
+        self.translations.bind('open_context_yml', context_btn.setText)
         context_btn.clicked.connect(self.open_context_yml)
-        open_data_btn = QPushButton('Open Data Directory')
+        open_data_btn = QPushButton()
+        self.translations.bind('open_data_directory', open_data_btn.setText)
         open_data_btn.clicked.connect(self.open_data_directory)
-        copy_path_btn = QPushButton('Copy Data Path')
+        copy_path_btn = QPushButton()
+        self.translations.bind('copy_data_path', copy_path_btn.setText)
         copy_path_btn.clicked.connect(self.copy_data_path)
         btn_layout.addWidget(refresh_btn)
         btn_layout.addWidget(context_btn)
         btn_layout.addWidget(open_data_btn)
         btn_layout.addWidget(copy_path_btn)
         btn_layout.addStretch()
-        layout.addLayout(btn_layout)
+        
+        # Language selector, switching relabels the UI without a restart
+        language_label = QLabel()
+        self.translations.bind('language', language_label.setText)
+        self.language_combo = QComboBox()
+        for code, name in get_available_languages().items():
+            self.language_combo.addItem(str(name), code)
+        self.language_combo.setCurrentIndex(max(0, self.language_combo.findData(self.language)))
+        self.language_combo.currentIndexChanged.connect(self.change_language)
+        btn_layout.addWidget(language_label)
+        btn_layout.addWidget(self.language_combo)
+        self.layout().addLayout(btn_layout)
 
-        self.setLayout(layout)
+    def build_llm_panel(self):
+        """Build the LLM report panel"""
+        panel = QWidget()
+        llm_layout = QVBoxLayout()
+        llm_layout.setContentsMargins(0, 0, 0, 0)
+        llm_header = QHBoxLayout()
+        llm_label = QLabel()
+        self.translations.bind('llm_standup_report', llm_label.setText)
+        llm_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        
+        # Move Generate button to LLM section
+        llm_btn = QPushButton()
+        self.translations.bind('generate_llm_report', llm_btn.setText)
+        llm_btn.clicked.connect(self.generate_llm_report)
+        llm_btn.setStyleSheet("padding: 4px 12px; background-color: #4CAF50; color: white;")
+        
+        copy_llm_btn = QPushButton()
+        self.translations.bind('copy_llm_report', copy_llm_btn.setText)
+        copy_llm_btn.clicked.connect(self.copy_llm_report)
+        copy_llm_btn.setStyleSheet("padding: 4px 12px;")
+        
+        llm_header.addWidget(llm_label)
+        llm_header.addStretch()
+        llm_header.addWidget(llm_btn)
+        llm_header.addWidget(copy_llm_btn)
+        llm_layout.addLayout(llm_header)
+
+        self.llm_text = QTextEdit()
+        self.llm_text.setReadOnly(True)
+        self.translations.bind('llm_placeholder', self.llm_text.setPlaceholderText)
+        # Fix text visibility with proper colors
+        self.llm_text.setStyleSheet("font-family: system; font-size: 12px; color: black; background-color: #f8f9fa; border: 1px solid #ddd;")
+        llm_layout.addWidget(self.llm_text)
+        panel.setLayout(llm_layout)
+        return panel
 
     def is_llm_enabled(self):
         """Check if LLM is enabled in context.yml"""
-        try:
-            import yaml
-            
-            # Try multiple locations for context.yml
-            possible_locations = [
-                Path(__file__).parent.parent.parent / 'context.yml',  # Project directory
-                Path.cwd() / 'context.yml',  # Current working directory
-            ]
-            
-            for context_file in possible_locations:
-                if context_file.exists():
-                    with open(context_file, 'r') as f:
-                        data = yaml.safe_load(f) or {}
-                        llm_config = data.get('local_llm', {})
-                        return llm_config.get('enabled', False)
-                        
-        except Exception as e:
-            print(f"Error checking LLM config: {e}")
+        return bool(get_config_service().section('local_llm').get('enabled', False))
+
+    def watch_config(self):
+        """Apply edits to context.yml (e.g. via "Open context.yml") without a restart"""
+        config = get_config_service()
+        config.add_listener(self.apply_config)
+        self.destroyed.connect(lambda: config.remove_listener(self.apply_config))
+        
+        # Editors often write in several steps, wait for them to finish
+        self.config_reload_timer = QTimer(self)
+        self.config_reload_timer.setSingleShot(True)
+        self.config_reload_timer.setInterval(200)
+        self.config_reload_timer.timeout.connect(config.reload)
+        
+        self.config_watcher = QFileSystemWatcher(self)
+        if config.path is not None:
+            self.config_watcher.addPath(str(config.path))
+        self.config_watcher.fileChanged.connect(self.on_config_file_changed)
+
+    def on_config_file_changed(self, path):
+        # Files replaced by rename drop out of the watcher, add them back
+        if path not in self.config_watcher.files() and os.path.exists(path):
+            self.config_watcher.addPath(path)
+        self.config_reload_timer.start()
+
+    def apply_config(self, config):
+        """Update config-dependent widgets after context.yml changed"""
+        # Organizations, keeping the current selection
+        current_org = self.org_combo.currentText()
+        self.organizations = get_organizations()
+        self.org_combo.clear()
+        self.org_combo.addItem(tr('select_organization'))
+        self.org_combo.addItems(self.organizations)
+        self.org_combo.setCurrentIndex(max(0, self.org_combo.findText(current_org)))
+        
+        # LLM panel, built the first time it gets enabled
+        self.llm_enabled = self.is_llm_enabled()
+        if self.llm_enabled and self.llm_panel is None:
+            self.llm_panel = self.build_llm_panel()
+            self.llm_slot.addWidget(self.llm_panel)
+        if self.llm_panel is not None:
+            self.llm_panel.setVisible(self.llm_enabled)
         
-        return False
+        # ui.language edited by hand
+        self.retranslate()
+
+    def change_language(self, index):
+        """Switch the UI language from the selector and remember it in context.yml"""
+        language = self.language_combo.itemData(index)
+        if not language or language == self.language:
+            return
+        if not set_language(language):
+            # No context.yml to save to, switch for this session only
+            set_active_language(language)
+        self.retranslate()
+
+    def retranslate(self):
+        """Relabel every bound widget in the active language, keeping typed text"""
+        language = get_active_language()
+        if language == self.language:
+            return
+        self.language = language
+        self.translations.retranslate()
+        index = self.language_combo.findData(language)
+        if index >= 0 and index != self.language_combo.currentIndex():
+            self.language_combo.blockSignals(True)
+            self.language_combo.setCurrentIndex(index)
+            self.language_combo.blockSignals(False)
+
+    def set_issue_placeholder(self, text):
+        """Relabel the first Issue/PR entry without clobbering anything typed over it"""
+        typed = self.issue_combo.currentText()
+        showing_placeholder = self.issue_combo.currentIndex() == 0
+        self.issue_combo.setItemText(0, text)
+        if showing_placeholder and typed != self.issue_combo.itemText(0):
+            self.issue_combo.setEditText(typed)
 
     def create_github_tabs(self):
-        """Create GitHub data tabs with clickable links"""
+        """Create GitHub data tabs backed by list models with clickable links"""
+        self.github_models = {}
+        self.github_proxies = {}
         for key, items in self.github_data.items():
-            tab = QWidget()
-            tab_layout = QVBoxLayout()
-            
-            for item in items:
-                if isinstance(item, dict):
-                    # New format with text and URL
-                    label = ClickableLabel(item['text'], item['url'])
-                else:
-                    # Fallback for old format
-                    label = ClickableLabel(str(item))
-                tab_layout.addWidget(label)
-            
-            tab_layout.addStretch()
-            tab.setLayout(tab_layout)
-            self.github_panel.addTab(tab, key.capitalize())
+            model = GitHubItemsModel(items, self)
+            proxy = GitHubFilterProxy(self)
+            proxy.setSourceModel(model)
+            view = GitHubListView()
+            view.setModel(proxy)
+            self.github_models[key] = model
+            self.github_proxies[key] = proxy
+            index = self.github_panel.addTab(view, '')
+            self.translations.bind(f'tab_{key}', lambda text, index=index: self.github_panel.setTabText(index, text))
+            self.translations.bind('no_github_data', view.set_empty_text)
+
+        # Work log, commits and GitHub activity together, loaded a day at a time
+        self.timeline_model = TimelineModel(self)
+        self.timeline_view = TimelineView()
+        self.timeline_view.setModel(self.timeline_model)
+        self.timeline_view.more_wanted.connect(self.load_timeline_page)
+        self.timeline_tab = self.github_panel.addTab(self.timeline_view, '')
+        self.translations.bind('tab_timeline', lambda text: self.github_panel.setTabText(self.timeline_tab, text))
+        self.translations.bind('no_activity', self.timeline_view.set_empty_text)
+
+        # Any past day, with the days around it loaded in the background
+        self.history_panel = HistoryPanel(self.translations, get_data_dir())
+        self.history_tab = self.github_panel.addTab(self.history_panel, '')
+        self.translations.bind('tab_history', lambda text: self.github_panel.setTabText(self.history_tab, text))
+        self.github_panel.currentChanged.connect(self.github_tab_changed)
+
+    def github_tab_changed(self, index):
+        if index == self.timeline_tab:
+            self.reload_timeline()
+        elif index == self.history_tab:
+            self.history_panel.show_day(self.history_panel.day or datetime.now().date())
+
+    def reload_timeline(self):
+        """Start the timeline again from today; unchanged days come from the sources' caches"""
+        if self.timeline is None:
+            self.timeline = Timeline(default_sources(get_data_dir()))
+        self.timeline_generation += 1
+        self.timeline_end = None
+        self.timeline_empty = 0
+        self.timeline_model.clear()
+        self.load_timeline_page()
+
+    def reload_shown_tab(self):
+        """Show entries just saved or edited in the timeline or history tab if it's open"""
+        if self.timeline is not None and self.github_panel.currentIndex() == self.timeline_tab:
+            self.reload_timeline()
+        elif self.github_panel.currentIndex() == self.history_tab and self.history_panel.day is not None:
+            self.history_panel.show_day(self.history_panel.day)
+
+    def load_timeline_page(self):
+        """Load the window before the oldest one shown"""
+        if self.timeline is None or self.timeline_empty >= TIMELINE_EMPTY_LIMIT:
+            return
+        if self.timeline_worker is not None and self.timeline_worker.isRunning():
+            return
+        self.timeline_worker = TimelineWorker(self.timeline, self.timeline_end, self.timeline_generation, self)
+        self.timeline_worker.loaded.connect(self.on_timeline_loaded)
+        self.timeline_worker.start()
+
+    def on_timeline_loaded(self, generation, start, end, events):
+        if generation != self.timeline_generation:
+            # Loaded for a timeline that was reloaded since, start the new one
+            self.load_timeline_page()
+            return
+        self.timeline_end = start
+        self.timeline_empty = 0 if events else self.timeline_empty + 1
+        self.timeline_model.append_events(events)
+        # Keep loading until the view is filled past the bottom
+        if self.timeline_view.wants_more():
+            QTimer.singleShot(0, self.load_timeline_page)
+
+    def filter_github_items(self, text):
+        for proxy in self.github_proxies.values():
+            proxy.setFilterFixedString(text)
+
+    def sort_github_items(self, option):
+        for proxy in self.github_proxies.values():
+            proxy.apply_sort(option)
+
+    def issue_entries(self):
+        """Combo text -> fuzzy search text (number, title and repo) for every item"""
+        entries = {}
+        for key in COMBO_PREFIXES:
+            for item in self.github_data.get(key, []):
+                entries[item.combo_text] = item.search_text
+        return entries
 
-    def update_issue_combo(self):
-        """Update issue combo box with all GitHub issues and PRs"""
+    def update_issue_combo(self, entries=None):
+        """Update issue combo box and its search index with all GitHub issues and PRs"""
+        if entries is None:
+            entries = self.issue_entries()
+        current = self.issue_combo.currentText()
         self.issue_combo.clear()
-        self.issue_combo.addItem("Select issue/PR...")
+        self.issue_combo.addItem(tr('select_issue_pr'))
+        self.issue_combo.addItems(list(entries))
+        self.issue_index.update(entries)
         
-        # Add all issues and PRs
-        for item in self.github_data.get('issues', []):
-            if isinstance(item, dict):
-                if item['text'] != 'No GitHub data available':
-                    self.issue_combo.addItem(f"Issue: {item['text']}")
-            elif item != 'No GitHub data available':
-                self.issue_combo.addItem(f"Issue: {item}")
-        
-        for item in self.github_data.get('prs', []):
-            if isinstance(item, dict):
-                if item['text'] != 'No GitHub data available':
-                    self.issue_combo.addItem(f"PR: {item['text']}")
-            elif item != 'No GitHub data available':
-                self.issue_combo.addItem(f"PR: {item}")
-        
-        for item in self.github_data.get('reviews', []):
-            if isinstance(item, dict):
-                if item['text'] != 'No GitHub data available':
-                    self.issue_combo.addItem(f"Review: {item['text']}")
-            elif item != 'No GitHub data available':
-                self.issue_combo.addItem(f"Review: {item}")
+        # Keep the selection, or text typed in before the list was loaded
+        index = self.issue_combo.findText(current)
+        if index > 0:
+            self.issue_combo.setCurrentIndex(index)
+        elif current and current != self.issue_combo.itemText(0):
+            self.issue_combo.setEditText(current)
+
+    def github_items(self):
+        """Combo text -> GitHubItem for every item"""
+        return {item.combo_text: item for key in COMBO_PREFIXES for item in self.github_data.get(key, [])}
+
+    def update_issue_linker(self):
+        self.issue_linker.update(self.github_items())
+
+    def issue_selected(self):
+        return bool(picked_issue(self.issue_combo))
+
+    def suggest_issue_link(self, text):
+        """Show which issue the entry will be linked to if none is picked"""
+        linked = None if self.issue_selected() else self.issue_linker.best(text)
+        if linked:
+            self.link_hint.setText(f"{tr('linked_issue')} {linked}")
+        self.link_hint.setVisible(bool(linked))
+
+    def filter_issue_completions(self, text):
+        """Show the best fuzzy matches for what has been typed so far"""
+        self.issue_completer.model().setStringList(self.issue_index.search(text))
+        self.issue_completer.complete()
+
+    def select_issue(self, text):
+        index = self.issue_combo.findText(text)
+        if index >= 0:
+            self.issue_combo.setCurrentIndex(index)
 
     def focusInEvent(self, event):
         """When window gets focus, focus the entry field only if no other widget has focus"""
@@ -396,21 +870,27 @@ class Dashboard(QWidget):
     def copy_worklog(self):
         clipboard = QApplication.clipboard()
         clipboard.setText(self.worklog_text.toPlainText())
-        QMessageBox.information(self, 'Copied', 'Work log copied to clipboard!')
+        QMessageBox.information(self, tr('copied'), tr('work_log_copied'))
+
+    def copy_standup(self):
+        """Copy today's work log as a template standup report, no LLM needed"""
+        report = render_standup(self.worklog_text.toPlainText(), github_data=self.github_data)
+        QApplication.clipboard().setText(report)
+        QMessageBox.information(self, tr('copied'), tr('standup_copied'))
 
     def copy_llm_report(self):
         if not self.llm_enabled or not hasattr(self, 'llm_text'):
-            QMessageBox.information(self, 'LLM Disabled', 'LLM functionality is disabled in context.yml')
+            QMessageBox.information(self, tr('llm_disabled'), tr('llm_disabled_message'))
             return
             
         clipboard = QApplication.clipboard()
         clipboard.setText(self.llm_text.toPlainText())
-        QMessageBox.information(self, 'Copied', 'LLM report copied to clipboard!')
+        QMessageBox.information(self, tr('copied'), tr('llm_report_copied'))
 
     def generate_llm_report(self):
         """Generate LLM standup report from today's work log"""
         if not self.llm_enabled:
-            QMessageBox.information(self, 'LLM Disabled', 'LLM functionality is disabled in context.yml')
+            QMessageBox.information(self, tr('llm_disabled'), tr('llm_disabled_message'))
             return
             
         try:
@@ -422,16 +902,17 @@ class Dashboard(QWidget):
             worklog_content = self.worklog_text.toPlainText()
             
             if not worklog_content or "No entries yet" in worklog_content:
-                QMessageBox.warning(self, 'No Data', 'No work log entries to process.')
+                QMessageBox.warning(self, tr('no_data'), tr('no_worklog_entries'))
                 return
             
             # Show processing message
             if hasattr(self, 'llm_text'):
-                self.llm_text.setText("🤖 Processing work log with LLM... This may take a moment...")
+                self.llm_text.setText(tr('processing_llm'))
                 QApplication.processEvents()  # Update UI immediately
             
             # Process with LLM
-            llm_result = process_worklog_with_llm(worklog_content)
+            with span('llm.report'):
+                llm_result = process_worklog_with_llm(worklog_content, self.github_data)
             
             # Display result
             if hasattr(self, 'llm_text'):
@@ -439,38 +920,34 @@ class Dashboard(QWidget):
             
         except ImportError as e:
             if hasattr(self, 'llm_text'):
-                self.llm_text.setText(f"❌ LLM module not available: {e}")
+                self.llm_text.setText(f"❌ {tr('llm_module_unavailable').format(error=e)}")
             else:
-                QMessageBox.warning(self, 'Error', f"LLM module not available: {e}")
+                QMessageBox.warning(self, tr('error'), tr('llm_module_unavailable').format(error=e))
         except Exception as e:
             if hasattr(self, 'llm_text'):
-                self.llm_text.setText(f"❌ Error generating LLM report: {e}")
+                self.llm_text.setText(f"❌ {tr('error_generating_llm_report').format(error=e)}")
             else:
-                QMessageBox.warning(self, 'Error', f"Error generating LLM report: {e}")
+                QMessageBox.warning(self, tr('error'), tr('error_generating_llm_report').format(error=e))
 
     def save_entry(self):
         entry_text = self.entry_field.text().strip()
         if not entry_text:
-            QMessageBox.warning(self, 'Empty Entry', 'Please enter some work description.')
+            QMessageBox.warning(self, tr('empty_entry'), tr('enter_work_description'))
             return
 
         # Get selected organization and issue
         organization = self.org_combo.currentText()
-        if organization == "Select organization...":
+        if self.org_combo.currentIndex() == 0:
             organization = ""
         
-        issue = self.issue_combo.currentText()
-        if issue == "Select issue/PR...":
-            issue = ""
-        else:
-            # Clean up the issue text (remove "Issue: " or "PR: " prefix)
-            issue = issue.replace("Issue: ", "").replace("PR: ", "").replace("Review: ", "")
+        issue = picked_issue(self.issue_combo)
 
         # Save the entry
-        if save_worklog_entry(organization, issue, entry_text):
-            # Clear the entry field and refresh the log
+        if self.add_entry(organization, issue, entry_text):
+            # Clear the entry field
             self.entry_field.clear()
-            self.worklog_text.setText(get_today_worklog())
+            self.link_hint.hide()
+            self.reload_shown_tab()
             
             # Keep focus on entry field for next entry
             self.entry_field.setFocus()
@@ -479,65 +956,98 @@ class Dashboard(QWidget):
             # self.org_combo.setCurrentIndex(0)
             # self.issue_combo.setCurrentIndex(0)
         else:
-            QMessageBox.warning(self, 'Error', 'Failed to save entry.')
+            QMessageBox.warning(self, tr('error'), tr('failed_to_save_entry'))
+
+    def add_entry(self, organization, issue, entry_text):
+        """Save a work log entry and show it, for the entry field and entries sent by other launches"""
+        # Saving during a staged startup needs the work log panel
+        self.finish_startup()
+        if not issue:
+            # "fixed #126" or words from an issue title link the entry without using the combo
+            issue = self.issue_linker.best(entry_text) or ''
+        if issue:
+            if issue in self.issue_index:
+                self.issue_index.mark_used(issue)
+                save_recent_issues(self.issue_index.recent())
+            # Clean up the issue text (remove "Issue: " or "PR: " prefix)
+            issue = issue.replace("Issue: ", "").replace("PR: ", "").replace("Review: ", "")
+        
+        if not save_worklog_entry(organization, issue, entry_text, get_data_dir()):
+            return False
+        with span('worklog.reload'):
+            self.worklog_text.setText(get_today_worklog())
+        return True
+
+    def bring_to_front(self):
+        """Show the window when the app is launched again while already running"""
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+        self.entry_field.setFocus()
 
     def refresh_github_data(self):
-        """Refresh GitHub data by calling the github_data module directly"""
-        try:
-            # Save current user input and selections to preserve them
-            current_text = self.entry_field.text()
-            current_org = self.org_combo.currentText()
-            current_issue = self.issue_combo.currentText()
-            
-            # Import and run the github_data module directly
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            from github_data import main as github_main
-            
-            # Run the GitHub data collection
-            github_main()
-            
-            # Reload the GitHub data
-            self.github_data = get_github_data()
-            self.update_issue_combo()
-            
-            # Refresh the GitHub tabs
-            self.refresh_github_tabs()
-            
-            # Restore user input and selections
-            self.entry_field.setText(current_text)
-            
-            # Restore organization selection if it still exists
-            org_index = self.org_combo.findText(current_org)
-            if org_index >= 0:
-                self.org_combo.setCurrentIndex(org_index)
-            
-            # Restore issue selection if it still exists
-            issue_index = self.issue_combo.findText(current_issue)
-            if issue_index >= 0:
-                self.issue_combo.setCurrentIndex(issue_index)
-            
-            # Keep focus on entry field
-            self.entry_field.setFocus()
-            
-            QMessageBox.information(self, 'Success', 'GitHub data refreshed successfully!')
-                
-        except Exception as e:
-            QMessageBox.warning(self, 'Error', f'Error refreshing GitHub data: {e}')
+        """Refresh GitHub data, updating tab rows in place as `gh status` streams them"""
+        if self.github_worker is not None and self.github_worker.isRunning():
+            return
+        
+        # Remember the selected issue so it can be restored when it streams back in
+        self.pending_issue = self.issue_combo.currentText()
+        
+        # Existing rows stay visible and are updated as items arrive
+        self.github_data = {key: [] for key in COMBO_PREFIXES}
+        self.issue_combo.clear()
+        self.issue_combo.addItem(tr('select_issue_pr'))
+        for model in self.github_models.values():
+            model.begin_refresh()
+        
+        self.github_worker = GitHubFetchWorker(self)
+        self.github_worker.item_found.connect(self.add_github_item)
+        self.github_worker.failed.connect(self.on_github_refresh_failed)
+        self.github_worker.done.connect(self.on_github_refresh_done)
+        self.github_worker.start()
+        self.harvest_commits()
 
-    def refresh_github_tabs(self):
-        """Refresh the GitHub data tabs with new data"""
-        # Clear existing tabs
-        self.github_panel.clear()
+    def add_github_item(self, item):
+        """Insert or update one streamed GitHub item in its tab and the Issue/PR combo"""
+        self.github_data[item.kind].append(item)
+        self.github_models[item.kind].upsert_item(item)
         
-        # Recreate tabs with new data using clickable labels
-        self.create_github_tabs()
+        combo_text = item.combo_text
+        self.issue_combo.addItem(combo_text)
+        self.issue_index.add(combo_text, item.search_text)
+        self.issue_linker.add(combo_text, item)
+        if combo_text == self.pending_issue:
+            self.issue_combo.setCurrentIndex(self.issue_combo.count() - 1)
+
+    def on_github_refresh_done(self):
+        # Drop rows for items that are no longer assigned
+        for model in self.github_models.values():
+            model.end_refresh()
+        self.issue_index.update(self.issue_entries())
+        self.update_issue_linker()
+        self.reload_shown_tab()
+        QMessageBox.information(self, tr('success'), tr('github_data_refreshed'))
+
+    def on_github_refresh_failed(self, message):
+        # Keep whatever was shown before the refresh
+        for model in self.github_models.values():
+            model.end_refresh(prune=False)
+        self.github_data = {key: model.items() for key, model in self.github_models.items()}
+        self.update_issue_combo()
+        self.update_issue_linker()
+        QMessageBox.warning(self, tr('error'), tr('error_refreshing_github').format(error=message))
+
+    def refresh_github_tabs(self):
+        """Refresh the GitHub data tabs with new data, updating rows in place"""
+        for key, model in self.github_models.items():
+            model.set_items(self.github_data.get(key, []))
 
     def open_context_yml(self):
-        path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../context.yml'))
-        if os.path.exists(path):
+        path = get_config_service().path
+        if path is not None:
             os.system(f'open "{path}"')
         else:
-            QMessageBox.warning(self, 'Not found', 'context.yml not found.')
+            QMessageBox.warning(self, tr('not_found'), tr('context_yml_not_found'))
 
     def open_data_directory(self):
         """Open the data directory where worklog files are stored"""
@@ -550,9 +1060,9 @@ class Dashboard(QWidget):
         try:
             subprocess.run(['open', str(data_dir)], check=True)
         except subprocess.CalledProcessError:
-            QMessageBox.warning(self, 'Error', 'Could not open directory.')
+            QMessageBox.warning(self, tr('error'), tr('could_not_open_directory'))
         except Exception as e:
-            QMessageBox.warning(self, 'Error', f'Could not open directory: {e}')
+            QMessageBox.warning(self, tr('error'), f"{tr('could_not_open_directory')} {e}")
 
     def copy_data_path(self):
         """Copy the data directory path to clipboard"""
@@ -564,7 +1074,7 @@ class Dashboard(QWidget):
         # Copy the path to clipboard
         clipboard = QApplication.clipboard()
         clipboard.setText(str(data_dir))
-        QMessageBox.information(self, 'Copied', f'Data directory path copied to clipboard:\n{data_dir}')
+        QMessageBox.information(self, tr('copied'), tr('data_path_copied').format(path=data_dir))
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
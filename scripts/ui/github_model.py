@@ -0,0 +1,182 @@
+# Model/view classes for the GitHub tabs
+# One list model per tab, rows are updated in place on refresh and only the
+# visible rows are ever painted by the QListView
+
+import webbrowser
+from PyQt5.QtWidgets import QStyledItemDelegate, QListView, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel, QEvent
+from PyQt5.QtGui import QColor, QCursor, QPainter, QPalette
+
+# Custom data roles
+UrlRole = Qt.UserRole + 1
+NumberRole = Qt.UserRole + 2
+TitleRole = Qt.UserRole + 3
+
+# Sort options offered in the GitHub panel: translation key -> (role, order), role None keeps gh order
+SORT_OPTIONS = {
+    'sort_as_listed': (None, Qt.AscendingOrder),
+    'sort_newest': (NumberRole, Qt.DescendingOrder),
+    'sort_oldest': (NumberRole, Qt.AscendingOrder),
+    'sort_title': (TitleRole, Qt.AscendingOrder),
+}
+
+# Shown by an empty view
+EMPTY_TEXT = 'No GitHub data available'
+
+def item_key(item):
+    """Stable identity of an item across refreshes"""
+    return item.number, item.repo
+
+class GitHubItemsModel(QAbstractListModel):
+    """List model over the dashboard's GitHubItem objects"""
+
+    def __init__(self, items=None, parent=None):
+        super().__init__(parent)
+        self._items = []
+        self._rows = {}  # item key -> row
+        self._seen = None
+        self.set_items(items or [])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return item.text
+        if role == UrlRole:
+            return item.url
+        if role == NumberRole:
+            return int(item.number)
+        if role == TitleRole:
+            return item.title.lower()
+        return None
+
+    def items(self):
+        return list(self._items)
+
+    def set_items(self, items):
+        """Replace the contents, updating matching rows in place"""
+        if not self._items:
+            # Nothing to keep in place, load everything with a single reset
+            self.beginResetModel()
+            self._items = list(items)
+            self._rows = {item_key(item): row for row, item in enumerate(self._items)}
+            self.endResetModel()
+            return
+        self.begin_refresh()
+        for item in items:
+            self.upsert_item(item)
+        self.end_refresh()
+
+    def begin_refresh(self):
+        """Start tracking which rows are still present in the new data"""
+        self._seen = set()
+
+    def upsert_item(self, item):
+        """Update the row for this item, or append it if it is new"""
+        key = item_key(item)
+        if self._seen is not None:
+            self._seen.add(key)
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._items)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._items.append(item)
+            self._rows[key] = row
+            self.endInsertRows()
+        elif self._items[row] != item:
+            self._items[row] = item
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def end_refresh(self, prune=True):
+        """Drop rows that were not seen since begin_refresh"""
+        seen, self._seen = self._seen, None
+        if seen is None or not prune:
+            return
+        # Remove contiguous runs from the bottom up so row numbers stay valid
+        row = len(self._items) - 1
+        while row >= 0:
+            if item_key(self._items[row]) in seen:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and item_key(self._items[row]) not in seen:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._items[row + 1:last + 1]
+            self.endRemoveRows()
+        self._rows = {item_key(item): i for i, item in enumerate(self._items)}
+
+class GitHubFilterProxy(QSortFilterProxyModel):
+    """Case-insensitive text filter with selectable sort order"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setFilterRole(Qt.DisplayRole)
+        self.setDynamicSortFilter(True)
+
+    def apply_sort(self, option):
+        role, order = SORT_OPTIONS.get(option, (None, Qt.AscendingOrder))
+        if role is None:
+            self.sort(-1)
+        else:
+            self.setSortRole(role)
+            self.sort(0, order)
+
+class LinkDelegate(QStyledItemDelegate):
+    """Paints rows with a URL as links and opens them on click"""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.data(UrlRole):
+            option.font.setUnderline(True)
+            option.palette.setColor(option.palette.Text, QColor('aqua'))
+            option.palette.setColor(option.palette.HighlightedText, QColor('aqua'))
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and index.data(UrlRole)):
+            webbrowser.open(index.data(UrlRole))
+            return True
+        return super().editorEvent(event, model, option, index)
+
+class GitHubListView(QListView):
+    """Virtualized list of GitHub items, showing a hand cursor over links"""
+
+    empty_text = EMPTY_TEXT
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setTextElideMode(Qt.ElideRight)
+        self.setMouseTracking(True)
+        self.setItemDelegate(LinkDelegate(self))
+        self.setStyleSheet("QListView::item { padding: 4px; border-bottom: 1px solid #eee; }")
+
+    def mouseMoveEvent(self, event):
+        index = self.indexAt(event.pos())
+        if index.isValid() and index.data(UrlRole):
+            self.viewport().setCursor(QCursor(Qt.PointingHandCursor))
+        else:
+            self.viewport().unsetCursor()
+        super().mouseMoveEvent(event)
+
+    def set_empty_text(self, text):
+        self.empty_text = text
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.model() is not None and self.model().rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setPen(self.palette().color(QPalette.Disabled, QPalette.Text))
+            painter.drawText(self.viewport().rect().adjusted(6, 6, -6, -6),
+                             Qt.AlignLeft | Qt.AlignTop, self.empty_text)
@@ -0,0 +1,364 @@
+# History browser: any past day's entries, a day at a time
+# Days come from a DayCache; after each move the neighbouring days are loaded
+# in a background thread, so flipping back through the last weeks only ever
+# shows days that are already parsed
+# Searching waits for a pause in typing, then runs in a worker against the
+# index of all days; results are streamed into the list as they are found
+# With "By meaning" checked the query is matched against embeddings of every
+# entry instead, when numpy is installed; numpy is only imported once it's checked
+
+import html
+import importlib.util
+from datetime import date, timedelta
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QDateEdit, QLabel, QLineEdit, QStackedWidget, QCheckBox,
+    QStyledItemDelegate, QStyle, QApplication
+)
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QThread, QDate, QTimer, pyqtSignal
+from PyQt5.QtGui import QTextDocument
+from ui.github_model import GitHubListView
+from day_cache import DayCache, neighbours
+from history_search import HistoryIndex, match_spans
+from localization import tr
+
+# Pause in typing before a search runs, in ms
+SEARCH_DELAY = 200
+
+DayRole = Qt.UserRole + 10
+
+def semantic_available():
+    """Whether numpy is installed, without importing it"""
+    return importlib.util.find_spec('numpy') is not None
+
+def entry_line(entry):
+    context = ' '.join(f'[{part}]' for part in (entry['organization'], entry['issue']) if part)
+    return f"{entry['time']}  {context}  {entry['text']}" if context else f"{entry['time']}  {entry['text']}"
+
+def highlighted(text, query):
+    """HTML of text with the words of query marked"""
+    parts = []
+    position = 0
+    for start, end in match_spans(text, query):
+        parts.append(html.escape(text[position:start]))
+        parts.append(f'<span style="background-color: #fff176;">{html.escape(text[start:end])}</span>')
+        position = end
+    parts.append(html.escape(text[position:]))
+    return ''.join(parts)
+
+class DayEntriesModel(QAbstractListModel):
+    """Entries of one day, replaced with a single reset when the day changes"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return entry_line(entry)
+        if role == Qt.ToolTipRole:
+            return entry['text']
+        return None
+
+    def entries(self):
+        return list(self._entries)
+
+    def set_entries(self, entries):
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
+class SearchResultsModel(QAbstractListModel):
+    """(day, entry) search results, appended a batch at a time"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results = []
+        self.query = ''
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._results)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        day, entry = self._results[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{day.isoformat()} {entry_line(entry)}"
+        if role == Qt.ToolTipRole:
+            return entry['text']
+        if role == DayRole:
+            return day
+        return None
+
+    def result(self, row):
+        return self._results[row]
+
+    def clear(self, query=''):
+        self.beginResetModel()
+        self._results = []
+        self.query = query
+        self.endResetModel()
+
+    def append_results(self, results):
+        if not results:
+            return
+        first = len(self._results)
+        self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+        self._results.extend(results)
+        self.endInsertRows()
+
+class HighlightDelegate(QStyledItemDelegate):
+    """Paints search results with the query's words marked"""
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        text = option.text
+        option.text = ''
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+        document = QTextDocument()
+        document.setDefaultFont(option.font)
+        document.setDocumentMargin(0)
+        document.setHtml(highlighted(text, index.model().query))
+        text_rect = style.subElementRect(QStyle.SE_ItemViewItemText, option, option.widget)
+        painter.save()
+        painter.translate(text_rect.left(), text_rect.top() + (text_rect.height() - document.size().height()) / 2)
+        painter.setClipRect(0, 0, text_rect.width(), text_rect.height())
+        document.drawContents(painter)
+        painter.restore()
+
+class SearchWorker(QThread):
+    """Brings the index up to date and streams the matches of one query"""
+    found = pyqtSignal(int, object)
+    done = pyqtSignal(int)
+
+    def __init__(self, index, query, generation, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.query = query
+        self.generation = generation
+        self.cancelled = False
+
+    def run(self):
+        try:
+            self.index.refresh()
+            for batch in self.index.search(self.query, lambda: self.cancelled):
+                self.found.emit(self.generation, batch)
+        except Exception as e:
+            print(f"Error searching work logs: {e}")
+        self.done.emit(self.generation)
+
+class SemanticSearchWorker(SearchWorker):
+    """Embeds entries logged since the last search, then finds those closest in meaning to the query"""
+    failed = pyqtSignal(int)
+
+    def run(self):
+        try:
+            self.index.refresh(lambda: self.cancelled)
+            if not self.cancelled:
+                self.found.emit(self.generation, self.index.search(self.query))
+        except Exception as e:
+            print(f"Error searching work logs by meaning: {e}")
+            self.failed.emit(self.generation)
+            return
+        self.done.emit(self.generation)
+
+class DayPrefetchWorker(QThread):
+    """Parses the days around the one shown, stopping when the user moves on"""
+
+    def __init__(self, cache, days, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.days = days
+        self.cancelled = False
+
+    def run(self):
+        try:
+            self.cache.prefetch(self.days, lambda: self.cancelled)
+        except Exception as e:
+            print(f"Error prefetching work log days: {e}")
+
+class HistoryPanel(QWidget):
+    """Day navigation (previous, next, calendar, today) over a virtualized list of entries"""
+
+    def __init__(self, translations, data_dir=None, parent=None):
+        super().__init__(parent)
+        self.cache = DayCache(data_dir)
+        self.index = HistoryIndex(data_dir)
+        self.semantic_index = None
+        self.day = None
+        self.worker = None
+        self.search_worker = None
+        self.search_generation = 0
+        self.shown_search = None
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.search_field = QLineEdit()
+        self.search_field.setClearButtonEnabled(True)
+        translations.bind('search_history', self.search_field.setPlaceholderText)
+        # A keystroke only restarts the timer, the search runs once typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_field.textChanged.connect(self.search_timer.start)
+        self.search_field.returnPressed.connect(self.run_search)
+        self.meaning_box = QCheckBox()
+        translations.bind('search_by_meaning', self.meaning_box.setText)
+        self.meaning_box.setVisible(semantic_available())
+        self.meaning_box.toggled.connect(self.run_search)
+        search_row = QHBoxLayout()
+        search_row.addWidget(self.search_field)
+        search_row.addWidget(self.meaning_box)
+        layout.addLayout(search_row)
+        navigation = QHBoxLayout()
+        self.previous_btn = QPushButton('◀')
+        self.previous_btn.clicked.connect(lambda: self.show_day(self.day - timedelta(days=1)))
+        self.date_edit = QDateEdit()
+        self.date_edit.setCalendarPopup(True)
+        self.date_edit.setDisplayFormat('ddd yyyy-MM-dd')
+        self.date_edit.setMaximumDate(QDate.currentDate())
+        self.date_edit.dateChanged.connect(lambda value: self.show_day(value.toPyDate()))
+        self.next_btn = QPushButton('▶')
+        self.next_btn.clicked.connect(lambda: self.show_day(self.day + timedelta(days=1)))
+        today_btn = QPushButton()
+        translations.bind('today', today_btn.setText)
+        today_btn.clicked.connect(lambda: self.show_day(date.today()))
+        self.count_label = QLabel()
+        navigation.addWidget(self.previous_btn)
+        navigation.addWidget(self.date_edit)
+        navigation.addWidget(self.next_btn)
+        navigation.addWidget(today_btn)
+        navigation.addStretch()
+        navigation.addWidget(self.count_label)
+        layout.addLayout(navigation)
+
+        self.model = DayEntriesModel(self)
+        self.view = GitHubListView()
+        self.view.setModel(self.model)
+        translations.bind('nothing_logged', self.view.set_empty_text)
+
+        self.results_model = SearchResultsModel(self)
+        self.results_view = GitHubListView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setItemDelegate(HighlightDelegate(self.results_view))
+        self.results_view.activated.connect(self.open_result)
+        self.results_view.clicked.connect(self.open_result)
+        translations.bind('searching', self.results_view.set_empty_text)
+        self.stack = QStackedWidget()
+        self.stack.addWidget(self.view)
+        self.stack.addWidget(self.results_view)
+        layout.addWidget(self.stack)
+        self.setLayout(layout)
+
+    def keyPressEvent(self, event):
+        # Arrow keys flip through days like the buttons
+        if event.key() == Qt.Key_Escape and self.search_field.text():
+            self.search_field.clear()
+        elif event.key() == Qt.Key_Left and self.day is not None:
+            self.show_day(self.day - timedelta(days=1))
+        elif event.key() == Qt.Key_Right and self.day is not None:
+            self.show_day(self.day + timedelta(days=1))
+        else:
+            super().keyPressEvent(event)
+
+    def show_day(self, day):
+        """Show a day's entries and start loading the days around it"""
+        day = min(day, date.today())
+        if self.day is None and self.search_worker is None:
+            # Index every day in the background while the first one is looked at
+            self.search_worker = SearchWorker(self.index, '', self.search_generation, self)
+            self.search_worker.start()
+        self.stack.setCurrentWidget(self.view)
+        # Showing the same day again picks up entries added since, without prefetching
+        moved = day != self.day
+        self.day = day
+        if self.date_edit.date().toPyDate() != day:
+            self.date_edit.blockSignals(True)
+            self.date_edit.setDate(QDate(day.year, day.month, day.day))
+            self.date_edit.blockSignals(False)
+        self.next_btn.setEnabled(day < date.today())
+        entries = self.cache.get(day)
+        self.model.set_entries(entries)
+        self.count_label.setText(str(len(entries)) if entries else '')
+        if moved:
+            self.prefetch(day)
+
+    def prefetch(self, day):
+        if self.worker is not None and self.worker.isRunning():
+            # The old neighbours are no longer needed first
+            self.worker.cancelled = True
+            self.worker.finished.connect(lambda day=day: self.prefetch_if_current(day))
+            return
+        self.worker = DayPrefetchWorker(self.cache, neighbours(day), self)
+        self.worker.start()
+
+    def prefetch_if_current(self, day):
+        if day == self.day and (self.worker is None or not self.worker.isRunning()):
+            self.prefetch(day)
+
+    def run_search(self):
+        """Search for the text in the search field, dropping any search still running"""
+        self.search_timer.stop()
+        query = self.search_field.text().strip()
+        semantic = self.meaning_box.isChecked()
+        if (query, semantic) == self.shown_search and self.stack.currentWidget() is self.results_view:
+            return
+        self.shown_search = (query, semantic)
+        self.search_generation += 1
+        if self.search_worker is not None and self.search_worker.isRunning():
+            self.search_worker.cancelled = True
+        if not query:
+            self.results_model.clear()
+            self.stack.setCurrentWidget(self.view)
+            return
+        self.results_model.clear(query)
+        self.results_view.set_empty_text(tr('searching'))
+        self.stack.setCurrentWidget(self.results_view)
+        if semantic:
+            if self.semantic_index is None:
+                from semantic_search import SemanticIndex
+                self.semantic_index = SemanticIndex(self.index.data_dir, self.index)
+            self.search_worker = SemanticSearchWorker(self.semantic_index, query, self.search_generation, self)
+            self.search_worker.failed.connect(self.on_search_failed)
+        else:
+            self.search_worker = SearchWorker(self.index, query, self.search_generation, self)
+        self.search_worker.found.connect(self.on_search_found)
+        self.search_worker.done.connect(self.on_search_done)
+        self.search_worker.start()
+
+    def on_search_found(self, generation, results):
+        if generation == self.search_generation:
+            self.results_model.append_results(results)
+
+    def on_search_done(self, generation):
+        if generation == self.search_generation:
+            self.results_view.set_empty_text(tr('no_search_results'))
+
+    def on_search_failed(self, generation):
+        if generation == self.search_generation:
+            self.results_view.set_empty_text(tr('embeddings_unavailable'))
+
+    def open_result(self, index):
+        """Show the day of a search result with its entry selected"""
+        day, entry = self.results_model.result(index.row())
+        self.show_day(day)
+        for row, shown in enumerate(self.model.entries()):
+            if shown['time'] == entry['time'] and shown['text'] == entry['text']:
+                self.view.setCurrentIndex(self.model.index(row))
+                self.view.scrollTo(self.model.index(row))
+                break
+
+    def wait(self):
+        """Wait for the prefetch and search in progress, for tests and shutdown"""
+        if self.worker is not None:
+            self.worker.wait()
+        if self.search_worker is not None:
+            self.search_worker.wait()
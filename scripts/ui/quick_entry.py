@@ -0,0 +1,124 @@
+# Quick entry popup and system tray icon
+# The popup is built once at startup and kept hidden; it shares the dashboard's
+# organization and Issue/PR models and search index, so opening it only shows
+# a window that already exists and never touches the disk
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLineEdit, QCompleter,
+    QSystemTrayIcon, QMenu, QAction, QStyle, QApplication
+)
+from PyQt5.QtCore import Qt, QStringListModel
+from PyQt5.QtGui import QCursor
+from ui.dashboard import picked_issue
+
+class QuickEntryPopup(QWidget):
+    """Small always-preloaded window for logging one entry"""
+
+    def __init__(self, dashboard):
+        super().__init__(None, Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.dashboard = dashboard
+        self.setFixedWidth(480)
+        self.setStyleSheet("QuickEntryPopup { border: 1px solid #888; }")
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(8, 8, 8, 8)
+        selectors = QHBoxLayout()
+
+        # Same models as the dashboard combos, so they stay in sync without reloading
+        self.org_combo = QComboBox()
+        self.org_combo.setModel(dashboard.org_combo.model())
+        self.issue_combo = QComboBox()
+        self.issue_combo.setEditable(True)
+        self.issue_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.issue_combo.setModel(dashboard.issue_combo.model())
+        self.issue_completer = QCompleter(QStringListModel(self), self.issue_combo)
+        self.issue_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.issue_completer.setMaxVisibleItems(10)
+        self.issue_completer.activated[str].connect(self.select_issue)
+        self.issue_combo.setCompleter(self.issue_completer)
+        self.issue_combo.lineEdit().textEdited.connect(self.filter_issue_completions)
+        selectors.addWidget(self.org_combo, 1)
+        selectors.addWidget(self.issue_combo, 2)
+        layout.addLayout(selectors)
+
+        self.entry_field = QLineEdit()
+        self.entry_field.setStyleSheet("padding: 8px; font-size: 13px;")
+        dashboard.translations.bind('work_description_placeholder', self.entry_field.setPlaceholderText)
+        self.entry_field.returnPressed.connect(self.save_entry)
+        layout.addWidget(self.entry_field)
+        self.setLayout(layout)
+
+    def filter_issue_completions(self, text):
+        """Show the best fuzzy matches from the dashboard's search index"""
+        self.issue_completer.model().setStringList(self.dashboard.issue_index.search(text))
+        self.issue_completer.complete()
+
+    def select_issue(self, text):
+        index = self.issue_combo.findText(text)
+        if index >= 0:
+            self.issue_combo.setCurrentIndex(index)
+
+    def open_popup(self):
+        """Show the popup near the mouse pointer, ready for typing"""
+        screen = QApplication.screenAt(QCursor.pos()) or QApplication.primaryScreen()
+        area = screen.availableGeometry()
+        size = self.sizeHint()
+        x = min(max(QCursor.pos().x() - size.width() // 2, area.left()), area.right() - size.width())
+        y = min(max(QCursor.pos().y(), area.top()), area.bottom() - size.height())
+        self.move(x, y)
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.entry_field.setFocus()
+
+    def toggle(self):
+        if self.isVisible():
+            self.hide()
+        else:
+            self.open_popup()
+
+    def save_entry(self):
+        entry_text = self.entry_field.text().strip()
+        if not entry_text:
+            return
+        organization = self.org_combo.currentText() if self.org_combo.currentIndex() > 0 else ""
+        issue = picked_issue(self.issue_combo)
+        # Same path as the dashboard's entry field
+        if self.dashboard.add_entry(organization, issue, entry_text):
+            self.entry_field.clear()
+            self.hide()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.hide()
+            return
+        super().keyPressEvent(event)
+
+def create_tray(dashboard, popup):
+    """Tray icon opening the quick entry popup, or None if there is no system tray"""
+    if not QSystemTrayIcon.isSystemTrayAvailable():
+        return None
+
+    tray = QSystemTrayIcon(dashboard.style().standardIcon(QStyle.SP_FileDialogDetailedView), dashboard)
+    menu = QMenu(dashboard)
+    quick_action = QAction(menu)
+    dashboard.translations.bind('quick_entry', quick_action.setText)
+    quick_action.triggered.connect(popup.open_popup)
+    dashboard_action = QAction(menu)
+    dashboard.translations.bind('open_dashboard', dashboard_action.setText)
+    dashboard_action.triggered.connect(dashboard.bring_to_front)
+    quit_action = QAction(menu)
+    dashboard.translations.bind('quit', quit_action.setText)
+    quit_action.triggered.connect(QApplication.quit)
+    menu.addAction(quick_action)
+    menu.addAction(dashboard_action)
+    menu.addSeparator()
+    menu.addAction(quit_action)
+    tray.setContextMenu(menu)
+    dashboard.translations.bind('app_title', tray.setToolTip)
+
+    # Left click opens the popup, the menu is on right click
+    tray.activated.connect(
+        lambda reason: popup.toggle() if reason == QSystemTrayIcon.Trigger else None)
+    tray.show()
+    return tray
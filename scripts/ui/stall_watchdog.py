@@ -0,0 +1,112 @@
+# Event loop stall detector, turned on with `main.py --watch-stalls`
+# A heartbeat QTimer on the UI thread records when it last ran. A monitor thread
+# notices when the heartbeat is overdue and captures the UI thread's stack while
+# it is still stuck, so each freeze is logged with the code that caused it.
+
+import sys
+import time
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import profiling
+
+# Frames under this directory count as the app's own code when naming the culprit
+SCRIPTS_DIR = str(Path(__file__).parent.parent)
+
+def find_culprit(stack):
+    """Innermost app frame of a captured stack, e.g. 'dashboard.py:742 in refresh_github_data'"""
+    for frame in reversed(stack or []):
+        if frame.filename.startswith(SCRIPTS_DIR) and frame.filename != __file__:
+            return f"{Path(frame.filename).name}:{frame.lineno} in {frame.name}"
+    return 'unknown (stack not captured)' if not stack else 'outside the app'
+
+class StallWatchdog(QObject):
+    """Records every time the event loop is blocked for longer than threshold_ms"""
+    stall_detected = pyqtSignal(object)
+
+    def __init__(self, threshold_ms=100, interval_ms=50, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.stalls = []
+        self.main_thread = threading.get_ident()
+        self.last_beat = None
+        self.stack = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.monitor_thread = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.beat)
+
+    def start(self):
+        self.last_beat = time.perf_counter()
+        self.stopped.clear()
+        self.timer.start()
+        self.monitor_thread = threading.Thread(target=self.monitor, name='stall-watchdog', daemon=True)
+        self.monitor_thread.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.stopped.set()
+        if self.monitor_thread is not None:
+            self.monitor_thread.join(1)
+            self.monitor_thread = None
+
+    def beat(self):
+        """Heartbeat on the UI thread; a late beat means the loop was blocked"""
+        now = time.perf_counter()
+        with self.lock:
+            late = now - self.last_beat - self.interval
+            self.last_beat = now
+            stack, self.stack = self.stack, None
+        if late >= self.threshold:
+            self.record(late * 1000, stack)
+
+    def monitor(self):
+        """Capture the UI thread's stack once the heartbeat is overdue"""
+        poll = min(self.threshold / 2, 0.025)
+        while not self.stopped.wait(poll):
+            with self.lock:
+                overdue = time.perf_counter() - self.last_beat - self.interval
+                if overdue < self.threshold or self.stack is not None:
+                    continue
+                frame = sys._current_frames().get(self.main_thread)
+                self.stack = traceback.extract_stack(frame) if frame is not None else []
+
+    def record(self, ms, stack):
+        stall = {
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'ms': round(ms, 1),
+            'culprit': find_culprit(stack),
+            'stack': traceback.format_list(stack) if stack else [],
+        }
+        self.stalls.append(stall)
+        print(f"UI stall #{len(self.stalls)}: {stall['ms']:.0f} ms in {stall['culprit']}", file=sys.stderr)
+        if stall['stack']:
+            print(''.join(stall['stack']).rstrip(), file=sys.stderr)
+        if profiling.is_enabled():
+            profiling.write_record({'ts': round(time.time(), 3), 'op': 'ui.stall', 'ms': stall['ms'],
+                                    'thread': 'MainThread', 'culprit': stall['culprit']})
+        self.stall_detected.emit(stall)
+
+    def format_summary(self):
+        """Stall count, then stalls grouped by culprit, worst first"""
+        if not self.stalls:
+            return f"No UI stalls over {self.threshold * 1000:.0f} ms"
+        groups = {}
+        for stall in self.stalls:
+            groups.setdefault(stall['culprit'], []).append(stall['ms'])
+        lines = [f"{len(self.stalls)} UI stall(s) over {self.threshold * 1000:.0f} ms:"]
+        for culprit, durations in sorted(groups.items(), key=lambda item: max(item[1]), reverse=True):
+            lines.append(f"  {len(durations):4}x  worst {max(durations):8.0f} ms  total {sum(durations):8.0f} ms  {culprit}")
+        return "\n".join(lines)
+
+    def report(self):
+        """Stop watching and print the summary to stderr"""
+        self.stop()
+        print(self.format_summary(), file=sys.stderr)
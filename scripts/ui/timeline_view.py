@@ -0,0 +1,101 @@
+# Model/view for the activity timeline tab
+# Pages of events are appended as they are loaded, newest first, with a row
+# for each day; the view asks for the next page when scrolled near the bottom
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QFont
+from ui.github_model import GitHubListView, UrlRole
+
+# Marker shown before each event, by source
+SOURCE_MARKERS = {'worklog': '✎', 'commit': '⎇', 'github': '@'}
+
+# Rows left below the visible ones when the next page is requested
+PREFETCH_ROWS = 20
+
+EMPTY_TEXT = 'No activity yet'
+
+class TimelineModel(QAbstractListModel):
+    """Day header rows and event rows, appended a page at a time"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # ('day', date) or ('event', event)
+        self._last_day = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        kind, value = self._rows[index.row()]
+        if kind == 'day':
+            if role == Qt.DisplayRole:
+                return value.strftime('%A %Y-%m-%d')
+            if role == Qt.FontRole:
+                font = QFont()
+                font.setBold(True)
+                return font
+            return None
+        if role == Qt.DisplayRole:
+            marker = SOURCE_MARKERS.get(value['source'], '•')
+            detail = f"  {value['detail']}" if value['detail'] else ''
+            return f"{value['time']:%H:%M}  {marker} {value['text']}{detail}"
+        if role == Qt.ToolTipRole:
+            return f"{value['time']:%Y-%m-%d %H:%M} {value['source']}: {value['text']}"
+        if role == UrlRole:
+            return value['url']
+        return None
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._last_day = None
+        self.endResetModel()
+
+    def append_events(self, events):
+        """Append events, newest first, adding a header row when the day changes"""
+        rows = []
+        for item in events:
+            day = item['time'].date()
+            if day != self._last_day:
+                rows.append(('day', day))
+                self._last_day = day
+            rows.append(('event', item))
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+class TimelineView(GitHubListView):
+    """Timeline list that asks for older events as it is scrolled to the bottom"""
+
+    empty_text = EMPTY_TEXT
+    more_wanted = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Header rows use a bold font
+        self.setUniformItemSizes(False)
+        self.verticalScrollBar().valueChanged.connect(self.check_more_wanted)
+
+    def wants_more(self):
+        """True when the last rows are (nearly) on screen"""
+        model = self.model()
+        if model is None or model.rowCount() == 0:
+            return True
+        last_visible = self.indexAt(self.viewport().rect().bottomLeft())
+        if not last_visible.isValid():
+            # Rows end above the bottom of the view
+            return True
+        return last_visible.row() >= model.rowCount() - PREFETCH_ROWS
+
+    def check_more_wanted(self, *args):
+        if self.wants_more():
+            self.more_wanted.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.check_more_wanted()
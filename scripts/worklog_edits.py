@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Work log edits for Reporter app
+Day files are only ever appended to. Editing or deleting an entry appends a
+record to the day's sidecar, worklog_YYYY-MM-DD.edits, and readers apply the
+records as they read the day. A record names the entry by its line and which
+copy of that line it is, so it still applies after sync merged the file:
+
+    {"time": "2025-01-24T10:15:02.123456", "line": "2025-01-24 09:00 [Work]  - fix lgoin", "n": 0,
+     "text": "2025-01-24 09:00 [Work]  - fix login"}
+    {"time": "2025-01-24T10:16:40.654321", "line": "2025-01-24 11:00 [Work]  - oops", "n": 0, "deleted": true}
+
+Days without a sidecar are read as before, with one extra stat. Once a day is
+over, it is rewritten with its edits applied if enough of it was corrected,
+and its sidecar is removed: a record would otherwise apply again to the next
+identical line. Days that were ever synced are never compacted, as the other
+device would merge the old lines back in.
+"""
+
+import json
+from collections import Counter
+from datetime import date, datetime
+from pathlib import Path
+from yaml_io import atomic_write
+from profiling import span
+from sync import synced_names
+from worklog_io import locked_append
+
+EDITS_SUFFIX = '.edits'
+
+# Share of a day's entries that must be corrected before compaction rewrites it
+COMPACT_RATIO = 0.2
+
+def edits_path(log_file):
+    return Path(log_file).with_suffix(EDITS_SUFFIX)
+
+def load_edits(log_file):
+    """{(line, n): record}, the newest record for each entry"""
+    edits = {}
+    try:
+        with open(edits_path(log_file), 'r', encoding='utf-8') as f:
+            for raw in f:
+                try:
+                    record = json.loads(raw)
+                    edits[(record['line'], int(record.get('n', 0)))] = record
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return edits
+
+def keyed_lines(lines):
+    """(key, line) for each line, key being (line, which copy of it)"""
+    copies = Counter()
+    for line in lines:
+        line = line.rstrip('\r\n')
+        yield (line, copies[line]), line
+        copies[line] += 1
+
+def apply_edits(lines, edits):
+    """[(key, line)] with edited lines replaced and deleted ones left out"""
+    entries = []
+    for key, line in keyed_lines(lines):
+        record = edits.get(key)
+        if record is None:
+            entries.append((key, line))
+        elif not record.get('deleted'):
+            entries.append((key, record.get('text', line)))
+    return entries
+
+def read_lines(log_file):
+    try:
+        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read().splitlines()
+    except FileNotFoundError:
+        return []
+
+def read_entries(log_file):
+    """[(key, line)] of a day file with its edits applied"""
+    with span('worklog.read_edited') as timing:
+        edits = load_edits(log_file)
+        timing.set(edits=len(edits))
+        return apply_edits(read_lines(log_file), edits)
+
+def read_text(log_file):
+    """A day file's text with its edits applied, the file as-is when it has none"""
+    if not edits_path(log_file).exists():
+        try:
+            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read()
+        except FileNotFoundError:
+            return ''
+    entries = read_entries(log_file)
+    return ''.join(line + '\n' for _, line in entries)
+
+def append_record(log_file, record):
+    record = dict({'time': datetime.now().isoformat(timespec='microseconds')}, **record)
+    try:
+        # Like the day file, the sidecar is only appended to
+        with locked_append(edits_path(log_file)) as f:
+            f.write((json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8'))
+        return True
+    except Exception as e:
+        print(f"Error saving worklog edit: {e}")
+        return False
+
+def edit_entry(log_file, key, new_line):
+    """Replace an entry, key as returned by read_entries"""
+    line, n = key
+    return append_record(log_file, {'line': line, 'n': n, 'text': new_line.strip()})
+
+def delete_entry(log_file, key):
+    line, n = key
+    return append_record(log_file, {'line': line, 'n': n, 'deleted': True})
+
+def correction_ratio(log_file, edits=None):
+    """Share of a day's lines that an edit record still applies to"""
+    edits = load_edits(log_file) if edits is None else edits
+    if not edits:
+        return 0.0
+    keys = [key for key, _ in keyed_lines(read_lines(log_file))]
+    if not keys:
+        return 0.0
+    return sum(1 for key in keys if key in edits) / len(keys)
+
+def compact_day(log_file, threshold=COMPACT_RATIO):
+    """Rewrite a day file with its edits applied if enough of it was corrected, returns True if rewritten"""
+    log_file = Path(log_file)
+    edits = load_edits(log_file)
+    ratio = correction_ratio(log_file, edits)
+    # Records that match no line have nothing left to fold in
+    if ratio == 0 or ratio < threshold:
+        return False
+    with span('worklog.compact', day=log_file.name):
+        entries = apply_edits(read_lines(log_file), edits)
+        atomic_write(log_file, ''.join(line + '\n' for _, line in entries))
+        # The records are in the file now and must not apply to it again
+        edits_path(log_file).unlink(missing_ok=True)
+    return True
+
+def day_of(log_file):
+    try:
+        return date.fromisoformat(Path(log_file).stem[len('worklog_'):])
+    except ValueError:
+        return None
+
+def compact_closed_days(data_dir, today=None, threshold=COMPACT_RATIO):
+    """Compact every finished, never synced day with edits, returns the names of the rewritten files"""
+    today = today or date.today()
+    synced = synced_names(data_dir)
+    compacted = []
+    for sidecar in sorted(Path(data_dir).glob(f'worklog_*{EDITS_SUFFIX}')):
+        log_file = sidecar.with_suffix('.txt')
+        day = day_of(log_file)
+        # Today's file is still being appended to
+        if day is None or day >= today or not log_file.exists():
+            continue
+        if log_file.name in synced or sidecar.name in synced:
+            continue
+        try:
+            if compact_day(log_file, threshold):
+                compacted.append(log_file.name)
+        except Exception as e:
+            print(f"Error compacting {log_file.name}: {e}")
+    return compacted
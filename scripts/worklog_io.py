@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Saving work log entries for Reporter app
+Kept free of Qt so `main.py --add` can log a line without loading the UI
+when no instance is running; the dashboard saves through the same function.
+"""
+
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from profiling import span
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory locks, sync's size check is the only guard
+    fcntl = None
+
+def get_data_dir():
+    """Get or create the ~/.reporter data directory"""
+    data_dir = Path.home() / '.reporter'
+    data_dir.mkdir(exist_ok=True)
+    return data_dir
+
+@contextmanager
+def locked_append(path):
+    """A day file or sidecar opened for binary appending, exclusively locked
+
+    Sync rewrites these files by replacing them while it holds the lock, so a
+    file replaced while waiting for the lock is opened again.
+    """
+    while True:
+        f = open(path, 'ab')
+        try:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    replaced = os.fstat(f.fileno()).st_ino != os.stat(path).st_ino
+                except FileNotFoundError:
+                    replaced = True
+                if replaced:
+                    continue
+            yield f
+            return
+        finally:
+            # Closing releases the lock
+            f.close()
+
+def save_worklog_entry(organization, issue, entry_text, data_dir=None):
+    """Save a work log entry with organization and issue context"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    now = datetime.now().strftime('%H:%M')
+    log_file = Path(data_dir or get_data_dir()) / f'worklog_{today}.txt'
+
+    # Format: YYYY-MM-DD HH:MM [Organization] [Issue] - Entry
+    org_part = f"[{organization}]" if organization and organization != "Select organization..." else ""
+    issue_part = f"[{issue}]" if issue and issue != "Select issue/PR..." else ""
+
+    log_entry = f"{today} {now} {org_part} {issue_part} - {entry_text}\n"
+
+    try:
+        # CRITICAL: Always use append mode ('a') to preserve existing work log entries
+        # Never use 'w' mode which would overwrite/erase previous entries
+        with span('worklog.save'), locked_append(log_file) as f:
+            f.write(log_entry.encode('utf-8'))
+        return True
+    except Exception as e:
+        print(f"Error saving worklog entry: {e}")
+        return False
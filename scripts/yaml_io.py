@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Shared YAML/cache file I/O for Reporter app
+Uses the libyaml C loader/dumper when available and writes every file
+through a temp file plus atomic rename so a crash never leaves it half written
+"""
+
+import os
+import json
+import stat
+import tempfile
+from pathlib import Path
+import yaml
+
+# libyaml bindings are several times faster, fall back to pure Python
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+def atomic_write(path, content):
+    """Write str or bytes to path via a temp file in the same directory and os.replace"""
+    path = Path(path)
+    mode = 'wb' if isinstance(content, bytes) else 'w'
+    encoding = None if isinstance(content, bytes) else 'utf-8'
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        # mkstemp creates the file 0600, keep the permissions of the file being replaced
+        try:
+            os.chmod(temp_name, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+def load_yaml(path, default=None):
+    """Load a YAML file with the safe (C if available) loader"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    return default if data is None else data
+
+def dump_yaml(data, path):
+    """Atomically write data as YAML"""
+    text = yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
+    atomic_write(path, text)
+
+def cache_path(path):
+    """JSON sidecar used as the fast format for a machine-written YAML file"""
+    path = Path(path)
+    return path.with_name(f'.{path.stem}.cache.json')
+
+def write_cache(data, path):
+    """Write machine-generated data as YAML for people plus a JSON sidecar for fast loads"""
+    dump_yaml(data, path)
+    atomic_write(cache_path(path), json.dumps(data, ensure_ascii=False))
+
+def load_cache(path, default=None):
+    """Load machine-generated data, preferring the JSON sidecar unless the YAML is newer"""
+    path = Path(path)
+    sidecar = cache_path(path)
+    try:
+        if sidecar.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return default if data is None else data
+    except (OSError, ValueError):
+        pass
+    data = load_yaml(path, default)
+    # Older installs only have the YAML, create the sidecar for next time
+    try:
+        atomic_write(sidecar, json.dumps(data, ensure_ascii=False))
+    except (OSError, TypeError, ValueError):
+        pass
+    return data